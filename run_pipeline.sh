@@ -3,31 +3,46 @@
 # Stop on error
 set -e
 
+# Arrow IPC cache between stages (IPC_CACHE=0 to disable)
+# Each stage also writes an uncompressed .arrow next to its Parquet output,
+# and the next stage memory-maps it instead of decoding the Parquet file.
+STAGE_FLAGS=""
+if [ "${IPC_CACHE:-1}" != "0" ]; then
+    STAGE_FLAGS="--ipc-cache"
+fi
+
+# Worker processes for the CPU-bound stages (baseline, near-dup signatures, tagging; WORKERS=0 uses all cores)
+# Input rows are split into contiguous shards and reassembled in order, so output is unchanged.
+WORKERS="${WORKERS:-1}"
+
 echo "=== Sunblock Review Analysis Pipeline Start ==="
 
 # 1. Processing
 echo "[Step 3-0] Running Baseline Preprocessing..."
-python -m src.processing.baseline
+python -m src.processing.baseline $STAGE_FLAGS --workers $WORKERS
 
 echo "[Step 3-0.5] Running Deduplication..."
-python -m src.processing.deduplication
+python -m src.processing.deduplication $STAGE_FLAGS
+
+echo "[Step 3-0.7] Running Near-Duplicate Detection..."
+python -m src.processing.near_dedup $STAGE_FLAGS --workers $WORKERS
 
 echo "[Step 3-1] Running Tagging..."
-python -m src.processing.tagging
+python -m src.processing.tagging $STAGE_FLAGS --workers $WORKERS
 
 echo "[Step 3-2] Generating LLM Queue..."
-python -m src.processing.llm_queue
+python -m src.processing.llm_queue $STAGE_FLAGS
 
 # Note: Step 3-3 (LLM Batch) is skipped by default to avoid accidental costs.
 # Uncomment the line below to run it.
-# python -m src.processing.llm_batch
+# python -m src.processing.llm_batch $STAGE_FLAGS
 
 # 2. Analysis
 echo "[Step 4-0] Running Join & Pivot..."
-python -m src.analysis.join_pivot
+python -m src.analysis.join_pivot $STAGE_FLAGS
 
 echo "[Step 4-1] Generating Insight Report..."
-python -m src.analysis.insight_report
+python -m src.analysis.insight_report $STAGE_FLAGS
 
 # 3. Dashboard
 echo "[Step 5] Building Dashboard..."
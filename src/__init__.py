@@ -6,6 +6,7 @@ Subpackages:
     - processing: 데이터 전처리 (Deduplication, Tagging, LLM Prep)
     - analysis: 데이터 분석 (Join, Pivot, Insight)
     - dashboard: 대시보드 및 리포트 생성
+    - bench: 수집/처리 성능 벤치마크
 
 Modules:
     - catalog: 카탈로그 수집
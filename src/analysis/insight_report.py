@@ -20,6 +20,8 @@ from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
 
+from src.schema import read_stage
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -37,7 +39,8 @@ class InsightReportGenerator:
         min_n_items: int = 30,
         min_goods_any: int = 20,
         topn: int = 10,
-        topn_context: int = 15
+        topn_context: int = 15,
+        ipc_cache: bool = False
     ):
         self.analysis_dir = analysis_dir
         self.out_path = out_path
@@ -45,6 +48,7 @@ class InsightReportGenerator:
         self.min_goods_any = min_goods_any
         self.topn = topn
         self.topn_context = topn_context
+        self.ipc_cache = ipc_cache
         
         self.lines = []
     
@@ -52,12 +56,12 @@ class InsightReportGenerator:
         """데이터 로드"""
         logger.info("Loading data...")
         
-        self.master = pd.read_parquet(os.path.join(self.analysis_dir, 'step4_master_join.parquet'))
-        self.pivot_overall = pd.read_parquet(os.path.join(self.analysis_dir, 'pivot_aspect_polarity_overall.parquet'))
-        self.pivot_bucket = pd.read_parquet(os.path.join(self.analysis_dir, 'pivot_aspect_polarity_by_bucket.parquet'))
-        self.pivot_context = pd.read_parquet(os.path.join(self.analysis_dir, 'pivot_context_aspect_unmet.parquet'))
-        self.pivot_season = pd.read_parquet(os.path.join(self.analysis_dir, 'pivot_season_aspect_unmet.parquet'))
-        self.repeatability = pd.read_parquet(os.path.join(self.analysis_dir, 'repeatability_aspect_goods_count.parquet'))
+        self.master = read_stage(os.path.join(self.analysis_dir, 'step4_master_join.parquet'), ipc_cache=self.ipc_cache)
+        self.pivot_overall = read_stage(os.path.join(self.analysis_dir, 'pivot_aspect_polarity_overall.parquet'), ipc_cache=self.ipc_cache)
+        self.pivot_bucket = read_stage(os.path.join(self.analysis_dir, 'pivot_aspect_polarity_by_bucket.parquet'), ipc_cache=self.ipc_cache)
+        self.pivot_context = read_stage(os.path.join(self.analysis_dir, 'pivot_context_aspect_unmet.parquet'), ipc_cache=self.ipc_cache)
+        self.pivot_season = read_stage(os.path.join(self.analysis_dir, 'pivot_season_aspect_unmet.parquet'), ipc_cache=self.ipc_cache)
+        self.repeatability = read_stage(os.path.join(self.analysis_dir, 'repeatability_aspect_goods_count.parquet'), ipc_cache=self.ipc_cache)
         
         logger.info("Data loaded")
     
@@ -117,7 +121,7 @@ class InsightReportGenerator:
         self.lines.append("### 1.2 Bucket별 Polarity 분포")
         self.lines.append("")
         
-        bucket_pol = self.master.groupby('bucket')['polarity'].value_counts(normalize=True).unstack(fill_value=0) * 100
+        bucket_pol = self.master.groupby('bucket', observed=True)['polarity'].value_counts(normalize=True).unstack(fill_value=0) * 100
         
         self.lines.append("| Bucket | met | unmet | mixed | unknown |")
         self.lines.append("|--------|-----|-------|-------|---------|")
@@ -257,7 +261,7 @@ class InsightReportGenerator:
         gn_exploded = gn_exploded[gn_exploded['context_tag'] != 'NONE_RULE']
         
         # Group by context_tag, aspect
-        gn_ctx = gn_exploded.groupby(['context_tag', 'aspect']).agg(
+        gn_ctx = gn_exploded.groupby(['context_tag', 'aspect'], observed=True).agg(
             n=('review_id', 'nunique'),
             unmet_like=('polarity_group', lambda x: (x == 'unmet_like').sum()),
         ).reset_index()
@@ -424,6 +428,8 @@ def main():
     parser.add_argument("--min_goods_any", type=int, default=20)
     parser.add_argument("--topn", type=int, default=10)
     parser.add_argument("--topn_context", type=int, default=15)
+    parser.add_argument("--ipc-cache", action="store_true",
+                        help="분석 산출물의 Arrow IPC 캐시(.arrow)가 있으면 메모리 맵으로 읽기")
     
     args = parser.parse_args()
     
@@ -433,7 +439,8 @@ def main():
         min_n_items=args.min_n_items,
         min_goods_any=args.min_goods_any,
         topn=args.topn,
-        topn_context=args.topn_context
+        topn_context=args.topn_context,
+        ipc_cache=args.ipc_cache
     )
     generator.run()
 
@@ -17,9 +17,10 @@ import os
 from datetime import datetime
 from typing import Dict, Any, List
 
-import pandas as pd
 import numpy as np
 
+from src.schema import read_stage, write_stage, load_write_profile
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -36,13 +37,19 @@ class JoinPivotPipeline:
         tagged_path: str,
         out_dir: str,
         report_path: str,
-        min_n: int = 30
+        min_n: int = 30,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default",
+        pivot_parquet_profile: str = "default"
     ):
         self.norm_path = norm_path
         self.tagged_path = tagged_path
         self.out_dir = out_dir
         self.report_path = report_path
         self.min_n = min_n
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
+        self.pivot_parquet_profile = pivot_parquet_profile
         
         self.norm_df = None
         self.tagged_df = None
@@ -53,8 +60,8 @@ class JoinPivotPipeline:
         """데이터 로드"""
         logger.info("Loading data...")
         
-        self.norm_df = pd.read_parquet(self.norm_path)
-        self.tagged_df = pd.read_parquet(self.tagged_path)
+        self.norm_df = read_stage(self.norm_path, ipc_cache=self.ipc_cache)
+        self.tagged_df = read_stage(self.tagged_path, ipc_cache=self.ipc_cache)
         
         self.stats['norm_rows'] = len(self.norm_df)
         self.stats['norm_reviews'] = self.norm_df['review_id'].nunique()
@@ -100,7 +107,7 @@ class JoinPivotPipeline:
         
         # Save master
         master_path = os.path.join(self.out_dir, 'step4_master_join.parquet')
-        self.master_df.to_parquet(master_path, index=False)
+        write_stage(self.master_df, master_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         logger.info(f"Saved: {master_path}")
     
     def create_pivot_overall(self):
@@ -108,7 +115,7 @@ class JoinPivotPipeline:
         logger.info("Creating T1: Overall pivot...")
         
         # Group by aspect
-        pivot = self.master_df.groupby('aspect').agg(
+        pivot = self.master_df.groupby('aspect', observed=True).agg(
             n_items=('review_id', 'count'),
             met_cnt=('polarity', lambda x: (x == 'met').sum()),
             unmet_cnt=('polarity', lambda x: (x == 'unmet').sum()),
@@ -121,7 +128,7 @@ class JoinPivotPipeline:
         pivot = pivot.sort_values('unmet_like_rate', ascending=False)
         
         path = os.path.join(self.out_dir, 'pivot_aspect_polarity_overall.parquet')
-        pivot.to_parquet(path, index=False)
+        write_stage(pivot, path, ipc_cache=self.ipc_cache, profile=self.pivot_parquet_profile)
         logger.info(f"Saved: {path}")
         
         self.pivot_overall = pivot
@@ -130,7 +137,7 @@ class JoinPivotPipeline:
         """T2: Bucket별 aspect × polarity"""
         logger.info("Creating T2: By bucket pivot...")
         
-        pivot = self.master_df.groupby(['bucket', 'aspect']).agg(
+        pivot = self.master_df.groupby(['bucket', 'aspect'], observed=True).agg(
             n_items=('review_id', 'count'),
             met_cnt=('polarity', lambda x: (x == 'met').sum()),
             unmet_cnt=('polarity', lambda x: (x == 'unmet').sum()),
@@ -142,7 +149,7 @@ class JoinPivotPipeline:
         pivot['unmet_like_rate'] = pivot['unmet_like_cnt'] / pivot['n_items']
         
         path = os.path.join(self.out_dir, 'pivot_aspect_polarity_by_bucket.parquet')
-        pivot.to_parquet(path, index=False)
+        write_stage(pivot, path, ipc_cache=self.ipc_cache, profile=self.pivot_parquet_profile)
         logger.info(f"Saved: {path}")
         
         self.pivot_by_bucket = pivot
@@ -165,7 +172,7 @@ class JoinPivotPipeline:
         self.stats['context_none_rate'] = (df_dedup['context_tag'] == 'NONE_RULE').mean() * 100
         
         # Group by (context_tag, aspect)
-        pivot = df_dedup.groupby(['context_tag', 'aspect']).agg(
+        pivot = df_dedup.groupby(['context_tag', 'aspect'], observed=True).agg(
             n_reviews=('review_id', 'nunique'),
             unmet_like_cnt=('polarity_group', lambda x: (x == 'unmet_like').sum()),
             met_like_cnt=('polarity_group', lambda x: (x == 'met_like').sum()),
@@ -175,7 +182,7 @@ class JoinPivotPipeline:
         pivot = pivot.sort_values('unmet_like_cnt', ascending=False)
         
         path = os.path.join(self.out_dir, 'pivot_context_aspect_unmet.parquet')
-        pivot.to_parquet(path, index=False)
+        write_stage(pivot, path, ipc_cache=self.ipc_cache, profile=self.pivot_parquet_profile)
         logger.info(f"Saved: {path}")
         
         self.pivot_context = pivot
@@ -187,7 +194,7 @@ class JoinPivotPipeline:
         
         df = self.master_df[self.master_df['season'].notna()].copy()
         
-        pivot = df.groupby(['season', 'aspect']).agg(
+        pivot = df.groupby(['season', 'aspect'], observed=True).agg(
             n_reviews=('review_id', 'nunique'),
             unmet_like_cnt=('polarity_group', lambda x: (x == 'unmet_like').sum()),
             met_like_cnt=('polarity_group', lambda x: (x == 'met_like').sum()),
@@ -196,7 +203,7 @@ class JoinPivotPipeline:
         pivot['unmet_like_rate'] = pivot['unmet_like_cnt'] / pivot['n_reviews']
         
         path = os.path.join(self.out_dir, 'pivot_season_aspect_unmet.parquet')
-        pivot.to_parquet(path, index=False)
+        write_stage(pivot, path, ipc_cache=self.ipc_cache, profile=self.pivot_parquet_profile)
         logger.info(f"Saved: {path}")
         
         self.pivot_season = pivot
@@ -208,14 +215,14 @@ class JoinPivotPipeline:
         df = self.master_df.copy()
         
         # Aspect별 집계
-        repeat = df.groupby('aspect').agg(
+        repeat = df.groupby('aspect', observed=True).agg(
             goods_cnt_any=('goods_no', 'nunique'),
             reviews_any_cnt=('review_id', 'nunique'),
         ).reset_index()
         
         # unmet_like만 필터
         df_unmet = df[df['polarity_group'] == 'unmet_like']
-        unmet_agg = df_unmet.groupby('aspect').agg(
+        unmet_agg = df_unmet.groupby('aspect', observed=True).agg(
             goods_cnt_unmet_like=('goods_no', 'nunique'),
             reviews_unmet_like_cnt=('review_id', 'nunique'),
         ).reset_index()
@@ -229,7 +236,7 @@ class JoinPivotPipeline:
         repeat = repeat.sort_values('goods_cnt_unmet_like', ascending=False)
         
         path = os.path.join(self.out_dir, 'repeatability_aspect_goods_count.parquet')
-        repeat.to_parquet(path, index=False)
+        write_stage(repeat, path, ipc_cache=self.ipc_cache, profile=self.pivot_parquet_profile)
         logger.info(f"Saved: {path}")
         
         self.repeatability = repeat
@@ -287,7 +294,7 @@ class JoinPivotPipeline:
         
         # Context × Aspect Top 15 (GOLDEN_NUGGET)
         ctx_gn = self.context_exploded_df[self.context_exploded_df['bucket'] == 'GOLDEN_NUGGET'].copy()
-        ctx_gn_agg = ctx_gn.groupby(['context_tag', 'aspect']).agg(
+        ctx_gn_agg = ctx_gn.groupby(['context_tag', 'aspect'], observed=True).agg(
             n=('review_id', 'nunique'),
             unmet_like=('polarity_group', lambda x: (x == 'unmet_like').sum()),
         ).reset_index()
@@ -391,6 +398,10 @@ def main():
     parser.add_argument("--out_dir", default="data/analysis")
     parser.add_argument("--report", default="report/step4_0_join_pivot.md")
     parser.add_argument("--min_n", type=int, default=30)
+    parser.add_argument("--ipc-cache", action="store_true",
+                        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기")
+    parser.add_argument("--config", default="config.yaml",
+                        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일")
     
     args = parser.parse_args()
     
@@ -399,7 +410,10 @@ def main():
         tagged_path=args.tagged,
         out_dir=args.out_dir,
         report_path=args.report,
-        min_n=args.min_n
+        min_n=args.min_n,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('master_join', args.config),
+        pivot_parquet_profile=load_write_profile('pivot', args.config)
     )
     pipeline.run()
 
@@ -0,0 +1,133 @@
+"""
+Baseline 전처리 엔진 벤치마크 (행 단위 apply vs 벡터화)
+
+수집 리뷰의 review_text/review_date/rating으로 Step 3-0 파생 컬럼을 두 방식으로 만들고
+단계별 소요 시간과 결과 일치 여부를 비교합니다. 행 수를 늘릴 때는 실제 리뷰를 반복해 씁니다.
+
+- 행 단위: clean_text, parse_review_date, get_season, get_rating_bucket를 .apply로 적용 (이전 구현)
+- 벡터화: clean_texts, parse_review_dates, seasons_from_months, rating_buckets
+
+Usage:
+    python -m src.bench.baseline_engine                       # 11k, 1M 행
+    python -m src.bench.baseline_engine --rows 11528 200000 --repeat 3
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import List, Dict, Callable
+
+import numpy as np
+import pandas as pd
+
+from src.dataset import is_dataset, read_reviews
+from src.processing.baseline import (
+    DEFAULT_DATASET, DEFAULT_INPUT,
+    clean_text, parse_review_date, get_season, get_rating_bucket,
+    clean_texts, count_words, format_dates, parse_review_dates, seasons_from_months, rating_buckets,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def rowwise(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """이전 구현 (행마다 Python 함수 호출)"""
+    out = {}
+    parsed = df['review_date'].apply(parse_review_date)
+    out['review_date_parsed'] = parsed
+    out['review_month'] = parsed.apply(lambda x: x.strftime('%Y-%m') if pd.notna(x) else None)
+    out['review_year'] = parsed.apply(lambda x: x.year if pd.notna(x) else None).astype('Int64')
+    out['season'] = parsed.apply(lambda x: get_season(x.month) if pd.notna(x) else None)
+    out['rating_bucket'] = df['rating'].apply(get_rating_bucket)
+    out['review_text_clean'] = df['review_text'].apply(clean_text)
+    out['text_len_words'] = out['review_text_clean'].apply(lambda x: len(x.split()) if isinstance(x, str) and x else 0)
+    return out
+
+
+def vectorized(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """벡터화 구현 (BaselinePreprocessor와 같은 호출)"""
+    out = {}
+    parsed = parse_review_dates(df['review_date'])
+    out['review_date_parsed'] = parsed
+    out['review_month'] = format_dates(parsed, '%Y-%m')
+    out['review_year'] = parsed.dt.year.astype('Int64')
+    out['season'] = seasons_from_months(parsed.dt.month)
+    out['rating_bucket'] = rating_buckets(df['rating'])
+    out['review_text_clean'] = clean_texts(df['review_text'])
+    out['text_len_words'] = count_words(out['review_text_clean'])
+    return out
+
+
+def time_engine(engine: Callable[[pd.DataFrame], Dict[str, pd.Series]], df: pd.DataFrame, repeat: int):
+    """엔진 실행 시간 중앙값 (초)과 마지막 결과"""
+    timings = []
+    result = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = engine(df)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def same_columns(a: Dict[str, pd.Series], b: Dict[str, pd.Series]) -> List[str]:
+    """값/dtype이 다른 컬럼 이름"""
+    return [
+        name for name in a
+        if a[name].dtype != b[name].dtype or not a[name].equals(b[name])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Baseline 전처리 엔진 벤치마크 (행 단위 apply vs 벡터화)"
+    )
+    parser.add_argument(
+        "--input", "-i",
+        default=None,
+        help=f"수집 리뷰 (기본: {DEFAULT_DATASET}, 없으면 {DEFAULT_INPUT})"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs='+',
+        default=[11528, 1_000_000],
+        help="측정할 행 수 (실제 리뷰를 반복해 채움)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="반복 측정 횟수"
+    )
+
+    args = parser.parse_args()
+
+    input_path = args.input
+    if input_path is None:
+        input_path = DEFAULT_DATASET if is_dataset(DEFAULT_DATASET) else DEFAULT_INPUT
+    source = read_reviews(input_path, columns=['review_text', 'review_date', 'rating'])
+    source['rating'] = pd.to_numeric(source['rating'], errors='coerce').astype('Int64')
+    logger.info(f"Loaded {len(source)} reviews from {input_path}")
+
+    for rows in args.rows:
+        positions = np.resize(np.arange(len(source)), rows)
+        df = source.iloc[positions].reset_index(drop=True)
+
+        row_sec, row_out = time_engine(rowwise, df, args.repeat)
+        vec_sec, vec_out = time_engine(vectorized, df, args.repeat)
+        mismatched = same_columns(row_out, vec_out)
+
+        logger.info(
+            f"{rows:>9,} rows: row-wise {row_sec:7.2f} s, vectorized {vec_sec:6.2f} s "
+            f"({row_sec / vec_sec:.1f}x), identical: {not mismatched}"
+            + (f" (differs: {', '.join(mismatched)})" if mismatched else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+카탈로그 HTML 파서 벤치마크
+
+저장된 카탈로그 HTML(또는 응답 캐시, 합성 페이지)로 파서 백엔드별
+페이지당 파싱 시간을 측정하고, 백엔드 간 결과가 같은지 확인합니다.
+
+Usage:
+    # 저장된 HTML 파일 (*.html)
+    python -m src.bench.catalog_parse --html-dir data/raw/catalog_html
+
+    # 응답 캐시에 쌓인 카탈로그 페이지 (cache.enabled로 수집한 경우)
+    python -m src.bench.catalog_parse --cache-dir data/cache/http
+
+    # 합성 페이지 (입력이 없을 때)
+    python -m src.bench.catalog_parse --pages 12 --repeat 5
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import logging
+import os
+import statistics
+import time
+from typing import List, Dict, Tuple
+
+from src.catalog_parser import PARSERS, get_catalog_parser
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CATALOG_URL_MARK = 'getMCategoryList'
+
+
+def load_html_dir(html_dir: str) -> List[str]:
+    """디렉토리의 *.html 파일 로드 (파일명 순)"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(html_dir, '*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    return pages
+
+
+def load_cache_dir(cache_dir: str) -> List[str]:
+    """응답 캐시에서 카탈로그 페이지 본문 로드"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(cache_dir, '*', '*.json.gz'))):
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if CATALOG_URL_MARK in entry.get('url', ''):
+            pages.append(entry['body'])
+    return pages
+
+
+def synthetic_page(page_idx: int, rows_per_page: int = 48, total: int = 543) -> str:
+    """실제 카탈로그 마크업 구조를 흉내 낸 합성 페이지"""
+    start = (page_idx - 1) * rows_per_page
+    items = []
+    for i in range(start, min(start + rows_per_page, total)):
+        goods_no = f"A{i:012d}"
+        items.append(
+            f'<li class="flag li_result" data-ref-goodsno="{goods_no}">'
+            f'<div class="prd_info">'
+            f'<a href="https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}" class="prd_thumb">'
+            f'<img src="https://image.oliveyoung.co.kr/{goods_no}.jpg" alt="선크림 {i}"></a>'
+            f'<div class="prd_name"><a href="javascript:;"><span class="tx_brand">브랜드 {i % 37}</span>'
+            f'<p class="tx_name">데일리 선크림 {i} SPF50+ PA++++ 50ml</p></a></div>'
+            f'<p class="prd_price"><span class="tx_org"><span class="tx_num">{18000 + i * 10:,}</span>원</span>'
+            f'<span class="tx_cur"><span class="tx_num">{15000 + i * 10:,}</span>원</span></p>'
+            f'<p class="prd_flag"><span class="icon_flag sale">세일</span><span class="icon_flag coupon">쿠폰</span></p>'
+            f'<p class="prd_point_area tx_num"><span class="review_point"><span class="point" style="width:90%">4.5</span></span>({i * 3})</p>'
+            f'</div></li>'
+        )
+    return (
+        '<html><head><title>선케어</title><script>var x = "<span>";</script></head><body>'
+        f'<div class="cate_info_tx">총 <span>{total}</span>개의 상품이 등록되어 있습니다.</div>'
+        f'<ul class="cate_prd_list gtm_cate_list">{"".join(items)}</ul>'
+        '</body></html>'
+    )
+
+
+def time_parser(name: str, pages: List[str], repeat: int, rows_per_page: int) -> Tuple[List[float], List]:
+    """
+    파서 백엔드의 페이지당 파싱 시간 측정
+
+    Returns:
+        (페이지당 소요 시간 리스트 (ms), 페이지별 파싱 결과)
+    """
+    parser = get_catalog_parser(name, rows_per_page)
+    timings = []
+    results = []
+
+    for _ in range(repeat):
+        results = []
+        for page_idx, html in enumerate(pages, start=1):
+            start = time.perf_counter()
+            results.append(parser.parse_page(html, page_idx))
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return timings, results
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    """소요 시간 요약 통계"""
+    ordered = sorted(timings)
+    return {
+        'mean': statistics.mean(ordered),
+        'median': statistics.median(ordered),
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="카탈로그 HTML 파서 백엔드 벤치마크"
+    )
+    parser.add_argument(
+        "--html-dir",
+        help="저장된 카탈로그 HTML 디렉토리 (*.html)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="응답 캐시 디렉토리 (카탈로그 페이지만 사용)"
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=12,
+        help="입력이 없을 때 생성할 합성 페이지 수"
+    )
+    parser.add_argument(
+        "--rows-per-page",
+        type=int,
+        default=48,
+        help="페이지당 상품 수"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="반복 측정 횟수"
+    )
+    parser.add_argument(
+        "--backends",
+        nargs='+',
+        default=list(PARSERS),
+        choices=list(PARSERS),
+        help="측정할 파서 백엔드"
+    )
+
+    args = parser.parse_args()
+
+    if args.html_dir:
+        pages = load_html_dir(args.html_dir)
+        source = args.html_dir
+    elif args.cache_dir:
+        pages = load_cache_dir(args.cache_dir)
+        source = args.cache_dir
+    else:
+        total = args.pages * args.rows_per_page
+        pages = [synthetic_page(i, args.rows_per_page, total) for i in range(1, args.pages + 1)]
+        source = 'synthetic'
+
+    if not pages:
+        logger.error(f"No catalog pages found in {source}")
+        return
+
+    logger.info(f"Benchmarking {len(pages)} pages from {source} (repeat={args.repeat})")
+
+    stats = {}
+    outputs = {}
+    for name in args.backends:
+        timings, outputs[name] = time_parser(name, pages, args.repeat, args.rows_per_page)
+        stats[name] = summarize(timings)
+        products = sum(len(products) for _, products in outputs[name])
+        logger.info(
+            f"{name:>5}: mean {stats[name]['mean']:.2f} ms/page, "
+            f"median {stats[name]['median']:.2f} ms, p95 {stats[name]['p95']:.2f} ms "
+            f"({products} products)"
+        )
+
+    baseline = args.backends[0]
+    for name in args.backends[1:]:
+        speedup = stats[baseline]['mean'] / stats[name]['mean']
+        same = outputs[name] == outputs[baseline]
+        logger.info(f"{name} vs {baseline}: {speedup:.1f}x faster, identical output: {same}")
+        if not same:
+            for page_idx, (a, b) in enumerate(zip(outputs[baseline], outputs[name]), start=1):
+                if a != b:
+                    logger.warning(f"Output differs from page {page_idx}")
+                    break
+
+
+if __name__ == "__main__":
+    main()
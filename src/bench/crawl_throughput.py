@@ -0,0 +1,172 @@
+"""
+수집 처리량 벤치마크
+
+로컬 대역 서버(fake_server)를 띄우고 collect_catalog / collect_reviews를
+실행하여 초당 요청 수, 초당 리뷰 수, 재시도 오버헤드를 측정합니다.
+동시성/속도 조절 설정을 실제 사이트에 요청하지 않고 비교할 때 사용합니다.
+
+Usage:
+    python -m src.bench.crawl_throughput --top-n 30 --concurrency 8 --rate-limit 20
+
+    # 429 버스트와 5xx 오류가 섞인 환경에서 적응형 속도 조절 확인
+    python -m src.bench.crawl_throughput --top-n 30 --adaptive \
+        --error-rate 0.02 --burst-every 200 --burst-length 10 --retry-after 0.5
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, Any
+
+from src.bench.fake_server import FakeOliveYoungServer, add_server_arguments, server_from_args
+from src.catalog import collect_catalog
+from src.pipeline import load_config
+from src.reviews import collect_reviews
+from src.telemetry import export_crawl_metrics
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def build_config(base: Dict[str, Any], server: FakeOliveYoungServer, args: argparse.Namespace, work_dir: str) -> Dict[str, Any]:
+    """config.yaml 설정에서 URL/출력 경로/요청 제어만 벤치마크용으로 교체"""
+    config = copy.deepcopy(base)
+
+    config.setdefault('catalog', {})['base_url'] = server.catalog_url
+    config.setdefault('reviews', {})['api_url'] = server.reviews_url
+    config['reviews']['payload_store'] = {'enabled': False}
+    config['reviews']['delta'] = dict(
+        config['reviews'].get('delta', {}),
+        watermark_file=os.path.join(work_dir, 'review_watermarks.json'),
+    )
+    config['cache'] = {'enabled': False}
+    config['output'] = {
+        'raw_dir': os.path.join(work_dir, 'raw'),
+        'processed_dir': os.path.join(work_dir, 'processed'),
+        'log_dir': os.path.join(work_dir, 'logs'),
+        'report_dir': os.path.join(work_dir, 'report'),
+    }
+
+    request = config.setdefault('request', {})
+    request['concurrency'] = args.concurrency
+    request['delay_min'] = args.delay_min
+    request['delay_max'] = args.delay_max
+    request['max_retries'] = args.max_retries
+    if args.rate_limit:
+        request['rate_limit'] = args.rate_limit
+    pacing = request.setdefault('pacing', {})
+    pacing['adaptive'] = args.adaptive
+    pacing['state_file'] = os.path.join(work_dir, 'pacing_state.json')
+    if args.max_rate:
+        pacing['max_rate'] = args.max_rate
+    if args.additive_increase:
+        pacing['additive_increase'] = args.additive_increase
+
+    config['catalog']['concurrency'] = args.concurrency
+    config['catalog']['parse_workers'] = args.parse_workers
+
+    return config
+
+
+def run_benchmark(config: Dict[str, Any], server: FakeOliveYoungServer, top_n: int) -> Dict[str, Any]:
+    """카탈로그와 리뷰를 순서대로 수집하며 단계별 처리량 측정"""
+    results = {}
+
+    before = dict(server.stats)
+    start = time.perf_counter()
+    products = collect_catalog(config)
+    elapsed = time.perf_counter() - start
+    results['catalog'] = _stage_stats('catalog', server, before, elapsed, items=len(products))
+
+    before = dict(server.stats)
+    start = time.perf_counter()
+    reviews = collect_reviews(config, products, top_n=top_n)
+    elapsed = time.perf_counter() - start
+    results['reviews'] = _stage_stats('review', server, before, elapsed, items=len(reviews))
+
+    # 클라이언트 쪽 계측 (요청 지연 분포, 대기 vs I/O 시간)
+    _, results['telemetry'] = export_crawl_metrics(config)
+
+    return results
+
+
+def _stage_stats(kind: str, server: FakeOliveYoungServer, before: Dict[str, int], elapsed: float, items: int) -> Dict[str, Any]:
+    """서버 카운터 차이로 단계별 통계 계산"""
+    def delta(key: str) -> int:
+        return server.stats.get(key, 0) - before.get(key, 0)
+
+    requests_total = delta(f"{kind}_requests")
+    failed = delta('status_429') + delta('status_503')
+
+    return {
+        'seconds': round(elapsed, 2),
+        'requests': requests_total,
+        'requests_per_sec': round(requests_total / elapsed, 2) if elapsed else 0.0,
+        'items': items,
+        'items_per_sec': round(items / elapsed, 2) if elapsed else 0.0,
+        'status_429': delta('status_429'),
+        'status_5xx': delta('status_503'),
+        'retry_overhead': round(failed / requests_total, 4) if requests_total else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="로컬 대역 서버 대상 수집 처리량 벤치마크"
+    )
+    parser.add_argument("--config", default="config.yaml", help="기준 설정 파일")
+    parser.add_argument("--top-n", type=int, default=30, help="리뷰 수집 상품 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 요청 수 (카탈로그/리뷰)")
+    parser.add_argument("--parse-workers", type=int, default=0, help="카탈로그 파싱 프로세스 수")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="초당 요청 수 (0이면 config.yaml 값)")
+    parser.add_argument("--adaptive", action="store_true", help="적응형 속도 조절 사용")
+    parser.add_argument("--max-rate", type=float, default=0.0, help="적응형 최대 초당 요청 수 (0이면 config.yaml 값)")
+    parser.add_argument("--additive-increase", type=float, default=0.0, help="적응형 초당 속도 증가량 (0이면 config.yaml 값)")
+    parser.add_argument("--delay-min", type=float, default=0.0, help="순차 모드 최소 딜레이 (초)")
+    parser.add_argument("--delay-max", type=float, default=0.0, help="순차 모드 최대 딜레이 (초)")
+    parser.add_argument("--max-retries", type=int, default=3, help="요청당 최대 재시도 횟수")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    add_server_arguments(parser)
+
+    args = parser.parse_args()
+
+    base_config = load_config(args.config)
+
+    with tempfile.TemporaryDirectory() as work_dir, server_from_args(args) as server:
+        config = build_config(base_config, server, args, work_dir)
+        results = run_benchmark(config, server, args.top_n)
+
+    results['settings'] = {
+        k: v for k, v in vars(args).items() if k not in ('config', 'out')
+    }
+
+    for stage in ('catalog', 'reviews'):
+        r = results[stage]
+        logger.info(
+            f"{stage:>7}: {r['seconds']}s, {r['requests']} requests ({r['requests_per_sec']} req/s), "
+            f"{r['items']} items ({r['items_per_sec']}/s), "
+            f"429={r['status_429']} 5xx={r['status_5xx']} retry overhead={r['retry_overhead']:.1%}"
+        )
+    telemetry = results.get('telemetry')
+    if telemetry:
+        logger.info(
+            f"client: io wait {telemetry['io_wait_seconds']}s, sleep {telemetry['sleep_seconds']}s "
+            f"{telemetry['sleep_by_reason']}"
+        )
+
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        logger.info(f"Saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+중복 통합 엔진 벤치마크 (그룹별 merge_group vs 컬럼 단위 merge_groups)
+
+Baseline 출력(Step 3-0)을 읽어 review_id 그룹 통합을 두 방식으로 실행하고 소요 시간과
+결과 일치 여부(저장 타입으로 변환한 Arrow 테이블 기준)를 비교합니다. 행 수를 늘릴 때는
+실제 리뷰를 반복하되 반복마다 review_id에 접미사를 붙여 중복 구조(그룹 크기 분포)를 유지합니다.
+
+- 그룹별: groupby 그룹마다 merge_group 호출 (이전 구현, 단독 행 포함)
+- 컬럼 단위: 단독 행은 그대로, 중복 그룹만 groupby 집계 (ReviewDeduplicator.deduplicate)
+
+그룹별 방식은 느리므로 --reference-max-rows보다 큰 입력에서는 컬럼 단위 시간만 잽니다.
+
+Usage:
+    python -m src.bench.dedup_engine                              # 11k, 100k 행
+    python -m src.bench.dedup_engine --rows 11528 50000 --reference-max-rows 50000
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.processing.deduplication import ReviewDeduplicator
+from src.schema import to_table
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def per_group(deduplicator: ReviewDeduplicator, df: pd.DataFrame) -> pd.DataFrame:
+    """이전 구현 (그룹마다 merge_group)"""
+    return pd.DataFrame([deduplicator.merge_group(group) for _, group in df.groupby('review_id')])
+
+
+def scale_rows(source: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """실제 리뷰를 반복해 rows행으로 (반복마다 review_id 접미사로 중복 구조 유지)"""
+    copies = []
+    for k in range(int(np.ceil(rows / len(source)))):
+        copy = source.copy()
+        if k > 0:
+            copy['review_id'] = (copy['review_id'].astype(object) + f"_{k}").astype('str')
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True).iloc[:rows]
+
+
+def time_engine(engine: Callable[[], pd.DataFrame], repeat: int):
+    """엔진 실행 시간 중앙값 (초)과 마지막 결과"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = engine()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def same_output(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """저장 타입 기준으로 같은 결과인지 (컬럼 순서 무관)"""
+    columns = list(a.columns)
+    return set(columns) == set(b.columns) and to_table(a[columns]).equals(to_table(b[columns]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="중복 통합 엔진 벤치마크 (그룹별 merge_group vs 컬럼 단위 집계)"
+    )
+    parser.add_argument(
+        "--input", "-i",
+        default="data/processed/reviews_step3_base.parquet",
+        help="Baseline 출력 parquet"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs='+',
+        default=[11528, 100_000],
+        help="측정할 행 수 (실제 리뷰를 반복해 채움)"
+    )
+    parser.add_argument(
+        "--reference-max-rows",
+        type=int,
+        default=20000,
+        help="그룹별(이전 구현)도 측정할 최대 행 수"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="컬럼 단위 구현 반복 측정 횟수"
+    )
+
+    args = parser.parse_args()
+
+    deduplicator = ReviewDeduplicator(input_path=args.input, output_path='')
+    deduplicator.load_data()
+    source = deduplicator.df
+
+    for rows in args.rows:
+        df = scale_rows(source, rows)
+        dup_rows = int(df['review_id'].duplicated(keep=False).sum())
+
+        vec_sec, vec_out = time_engine(lambda: deduplicator.merge_groups(df), args.repeat)
+        line = f"{rows:>9,} rows ({dup_rows:,} in dup groups): vectorized {vec_sec:6.3f} s"
+        if rows <= args.reference_max_rows:
+            ref_sec, ref_out = time_engine(lambda: per_group(deduplicator, df), 1)
+            line += (
+                f", per-group {ref_sec:7.2f} s ({ref_sec / vec_sec:.0f}x), "
+                f"identical: {same_output(ref_out, vec_out)}"
+            )
+        logger.info(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""
+올리브영 카탈로그/리뷰 API 로컬 대역 서버
+
+실제 사이트 대신 수집기 처리량을 측정하기 위한 로컬 HTTP 서버입니다.
+카탈로그 페이지는 CatalogCollector가 파싱하는 HTML 구조로,
+리뷰는 ReviewCollector._parse_review가 읽는 JSON 구조로 응답합니다.
+응답 지연, 5xx 오류율, 주기적인 429 버스트, 초당 요청 수 상한을 설정할 수 있습니다.
+
+Usage:
+    python -m src.bench.fake_server --port 8765 --latency-ms 80 --error-rate 0.02
+
+    # config.yaml 대신 다음 URL 사용
+    #   catalog.base_url: http://127.0.0.1:8765/store/display/getMCategoryList.do
+    #   reviews.api_url:  http://127.0.0.1:8765/review/api/v2/reviews
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Deque
+from urllib.parse import urlparse, parse_qs
+
+from src.bench.catalog_parse import synthetic_page
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = '/store/display/getMCategoryList.do'
+REVIEWS_PATH = '/review/api/v2/reviews'
+
+SKIN_TYPES = ['건성', '지성', '복합성', '중성', '민감성']
+REVIEW_SNIPPETS = [
+    '백탁 없이 잘 발려요', '끈적임이 조금 있어요', '눈시림이 없어서 좋아요',
+    '향이 강한 편이에요', '톤업이 자연스러워요', '재구매 의사 있어요',
+    '건조해서 각질이 부각돼요', '화장 밀림이 있어요', '가볍고 산뜻해요',
+]
+
+
+class FakeCatalog:
+    """상품 목록과 상품별 리뷰를 결정적으로 생성하는 데이터 소스"""
+
+    def __init__(self, product_count: int = 543, max_reviews: int = 300, seed: int = 0):
+        """
+        Args:
+            product_count: 카탈로그 총 상품 수
+            max_reviews: 상품당 최대 리뷰 수
+            seed: 데이터 생성 시드
+        """
+        self.product_count = product_count
+        self.max_reviews = max_reviews
+        self.seed = seed
+        self._reviews: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def catalog_page(self, page_idx: int, rows_per_page: int) -> str:
+        """카탈로그 페이지 HTML"""
+        return synthetic_page(page_idx, rows_per_page, self.product_count)
+
+    def _product_reviews(self, goods_no: str) -> List[Dict[str, Any]]:
+        """상품 리뷰 전체 (최신순, 상품별 캐시)"""
+        with self._lock:
+            cached = self._reviews.get(goods_no)
+        if cached is not None:
+            return cached
+
+        rnd = random.Random(f"{self.seed}-{goods_no}")
+        count = rnd.randint(0, self.max_reviews)
+        base_date = datetime(2025, 12, 1)
+        reviews = []
+        for i in range(count):
+            photos = rnd.randint(0, 3) if rnd.random() < 0.3 else 0
+            reviews.append({
+                'reviewId': f"{goods_no}{i:05d}",
+                'content': ' '.join(rnd.sample(REVIEW_SNIPPETS, rnd.randint(1, 4))),
+                'createdDateTime': (base_date - timedelta(hours=i * 7)).strftime('%Y-%m-%dT%H:%M:%S'),
+                'reviewScore': rnd.choices([1, 2, 3, 4, 5], weights=[1, 1, 2, 4, 8])[0],
+                'recommendCount': rnd.randint(0, 50),
+                'hasPhoto': photos > 0,
+                'photoReviewList': [{'imagePath': f"/{goods_no}/{i}/{k}.jpg"} for k in range(photos)],
+                'reviewType': 'GIFT' if rnd.random() < 0.05 else 'NORMAL',
+                'profileDto': {
+                    'skinType': rnd.choice(SKIN_TYPES),
+                    'skinTone': rnd.choice(['쿨톤', '웜톤', '뉴트럴톤']),
+                    'skinTrouble': rnd.sample(['건조함', '민감성', '트러블', '각질'], rnd.randint(0, 2)),
+                },
+            })
+
+        with self._lock:
+            self._reviews[goods_no] = reviews
+        return reviews
+
+    def review_page(self, goods_no: str, sort_type: str, page: int, size: int) -> Dict[str, Any]:
+        """정렬/페이지에 해당하는 리뷰 API 응답"""
+        reviews = self._product_reviews(goods_no)
+
+        if sort_type == 'RATING_ASC':
+            ordered = sorted(reviews, key=lambda r: r['reviewScore'])
+        elif sort_type == 'RATING_DESC':
+            ordered = sorted(reviews, key=lambda r: -r['reviewScore'])
+        elif sort_type in ('RECOMMENDED_DESC', 'USEFUL_SCORE_DESC'):
+            ordered = sorted(reviews, key=lambda r: -r['recommendCount'])
+        else:
+            ordered = reviews
+
+        return {'data': ordered[page * size:(page + 1) * size], 'totalCount': len(reviews)}
+
+
+class FaultInjector:
+    """응답 지연, 5xx 오류, 429 버스트, 초당 요청 수 상한 적용"""
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 20.0,
+        error_rate: float = 0.0,
+        burst_every: int = 0,
+        burst_length: int = 0,
+        max_rps: float = 0.0,
+        retry_after: Optional[float] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            latency_ms: 평균 응답 지연 (ms)
+            jitter_ms: 지연 편차 (ms, 균등 분포)
+            error_rate: 5xx 응답 비율
+            burst_every: 요청 N개마다 429 버스트 시작 (0이면 없음)
+            burst_length: 버스트 동안 429로 응답할 요청 수
+            max_rps: 최근 1초 요청 수가 이 값을 넘으면 429 (0이면 제한 없음)
+            retry_after: 429 응답의 Retry-After 헤더 (초)
+            seed: 난수 시드
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._burst_remaining = 0
+        self._recent: Deque[float] = deque()
+
+    def decide(self) -> Dict[str, Any]:
+        """
+        요청 하나에 대한 지연과 상태 코드 결정
+
+        Returns:
+            {'delay': 초, 'status': 200/429/503}
+        """
+        with self._lock:
+            self._request_count += 1
+            now = time.monotonic()
+
+            self._recent.append(now)
+            while self._recent and now - self._recent[0] > 1.0:
+                self._recent.popleft()
+
+            if self.burst_every and self._request_count % self.burst_every == 0:
+                self._burst_remaining = self.burst_length
+
+            jitter = self._rnd.uniform(-self.jitter_ms, self.jitter_ms)
+            delay = max(0.0, self.latency_ms + jitter) / 1000
+
+            if self._burst_remaining > 0:
+                self._burst_remaining -= 1
+                status = 429
+            elif self.max_rps and len(self._recent) > self.max_rps:
+                status = 429
+            elif self._rnd.random() < self.error_rate:
+                status = 503
+            else:
+                status = 200
+
+        return {'delay': delay, 'status': status}
+
+
+class FakeOliveYoungServer:
+    """백그라운드 스레드에서 동작하는 로컬 대역 서버"""
+
+    def __init__(
+        self,
+        catalog: Optional[FakeCatalog] = None,
+        faults: Optional[FaultInjector] = None,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """
+        Args:
+            catalog: 데이터 소스 (기본: FakeCatalog())
+            faults: 장애 주입기 (기본: 지연만 있는 FaultInjector())
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.catalog = catalog or FakeCatalog()
+        self.faults = faults or FaultInjector()
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def catalog_url(self) -> str:
+        return self.base_url + CATALOG_PATH
+
+    @property
+    def reviews_url(self) -> str:
+        return self.base_url + REVIEWS_PATH
+
+    def count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                if status == 429 and server.faults.retry_after is not None:
+                    self.send_header('Retry-After', str(server.faults.retry_after))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _inject(self, kind: str) -> bool:
+                """지연/오류 주입 (오류 응답을 보냈으면 True)"""
+                decision = server.faults.decide()
+                time.sleep(decision['delay'])
+                server.count(f"{kind}_requests")
+                if decision['status'] != 200:
+                    server.count(f"status_{decision['status']}")
+                    self._send(decision['status'], b'{}', 'application/json')
+                    return True
+                server.count('status_200')
+                return False
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != CATALOG_PATH:
+                    self._send(404, b'not found', 'text/plain')
+                    return
+                if self._inject('catalog'):
+                    return
+
+                query = parse_qs(parsed.query)
+                page_idx = int(query.get('pageIdx', ['1'])[0])
+                rows = int(query.get('rowsPerPage', ['48'])[0])
+                html = server.catalog.catalog_page(page_idx, rows)
+                self._send(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                if urlparse(self.path).path != REVIEWS_PATH:
+                    self._send(404, b'not found', 'text/plain')
+                    return
+                if self._inject('review'):
+                    return
+
+                try:
+                    payload = json.loads(raw or b'{}')
+                except ValueError:
+                    self._send(400, b'{}', 'application/json')
+                    return
+
+                data = server.catalog.review_page(
+                    str(payload.get('goodsNumber')),
+                    payload.get('sortType', 'DATETIME_DESC'),
+                    int(payload.get('page', 0)),
+                    int(payload.get('size', 10)),
+                )
+                server.count('reviews_served')
+                self._send(200, json.dumps(data, ensure_ascii=False).encode('utf-8'), 'application/json')
+
+        return Handler
+
+    def start(self) -> 'FakeOliveYoungServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fake Olive Young server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeOliveYoungServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """서버/장애 주입 CLI 옵션 등록 (벤치마크와 공유)"""
+    parser.add_argument("--products", type=int, default=543, help="카탈로그 총 상품 수")
+    parser.add_argument("--max-reviews", type=int, default=300, help="상품당 최대 리뷰 수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="평균 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="응답 지연 편차 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 응답 비율")
+    parser.add_argument("--burst-every", type=int, default=0, help="요청 N개마다 429 버스트 시작")
+    parser.add_argument("--burst-length", type=int, default=0, help="429 버스트 길이 (요청 수)")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="서버 측 초당 요청 수 상한 (초과 시 429)")
+    parser.add_argument("--retry-after", type=float, default=None, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--seed", type=int, default=0, help="데이터/장애 난수 시드")
+
+
+def server_from_args(args: argparse.Namespace, port: int = 0) -> FakeOliveYoungServer:
+    """CLI 옵션으로 서버 생성"""
+    return FakeOliveYoungServer(
+        catalog=FakeCatalog(args.products, args.max_reviews, args.seed),
+        faults=FaultInjector(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            burst_every=args.burst_every,
+            burst_length=args.burst_length,
+            max_rps=args.max_rps,
+            retry_after=args.retry_after,
+            seed=args.seed,
+        ),
+        port=port,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="올리브영 카탈로그/리뷰 API 로컬 대역 서버"
+    )
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    add_server_arguments(parser)
+
+    args = parser.parse_args()
+
+    server = server_from_args(args, port=args.port)
+    logger.info(f"Catalog URL: {server.catalog_url}")
+    logger.info(f"Reviews URL: {server.reviews_url}")
+    try:
+        server.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        logger.info(f"Served: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+유사 중복 탐지(Step 3-0.7) 규모 벤치마크
+
+Dedup 출력(Step 3-0.5)의 review_text_clean을 반복해 행 수를 늘리고, 반복본마다 글자 몇 개를
+무작위로 바꿔 원본과 거의 같은(정확히 같지는 않은) 리뷰를 심은 뒤 MinHash 시그니처, LSH 후보,
+검증/클러스터 단계별 소요 시간을 잽니다. 재현율은 심은 리뷰 중 원본과의 실제 n-gram Jaccard가
+기준 이상인 것을 원본과 같은 클러스터로 묶은 비율입니다 (짧은 리뷰는 글자 몇 개만 바꿔도 기준 미만).
+
+Usage:
+    python -m src.bench.near_dedup_scale                        # 100k, 1M 행
+    python -m src.bench.near_dedup_scale --rows 200000 --edits 3 --num-perm 128 --bands 32
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.processing.near_dedup import (
+    MinHasher, lsh_candidate_pairs, signature_similarity, connected_components,
+)
+from src.schema import read_stage
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def plant_near_duplicates(source: list, rows: int, edits: int, seed: int):
+    """
+    원본 리뷰를 반복해 rows행으로 (반복본은 글자 edits개를 무작위로 바꿈)
+
+    Returns:
+        (리뷰 본문 리스트, 행별 원본 위치 배열)
+    """
+    rng = np.random.default_rng(seed)
+    origin = np.resize(np.arange(len(source)), rows)
+    texts = []
+    for k, i in enumerate(origin):
+        text = source[i]
+        if k >= len(source):
+            chars = list(text)
+            for pos in rng.integers(0, len(chars), size=edits):
+                chars[pos] = chr(0xAC00 + int(rng.integers(0, 11172)))
+            text = ''.join(chars)
+        texts.append(text)
+    return texts, origin
+
+
+def ngram_jaccard(a: str, b: str, ngram: int) -> float:
+    """두 본문의 문자 n-gram 집합 Jaccard 유사도"""
+    x = {a[i:i + ngram] for i in range(len(a) - ngram + 1)}
+    y = {b[i:i + ngram] for i in range(len(b) - ngram + 1)}
+    return len(x & y) / len(x | y)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="유사 중복 탐지 규모 벤치마크 (MinHash/LSH 단계별 시간, 심은 유사 중복 재현율)"
+    )
+    parser.add_argument(
+        "--input", "-i",
+        default="data/processed/reviews_step3_dedup.parquet",
+        help="Dedup 출력 parquet"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs='+',
+        default=[100_000, 1_000_000],
+        help="측정할 행 수 (실제 리뷰를 반복해 채움)"
+    )
+    parser.add_argument("--edits", type=int, default=2, help="반복본마다 바꿀 글자 수")
+    parser.add_argument("--ngram", type=int, default=5, help="문자 n-gram 글자 수")
+    parser.add_argument("--num-perm", type=int, default=64, help="MinHash 해시 함수 수")
+    parser.add_argument("--bands", type=int, default=16, help="LSH 밴드 수")
+    parser.add_argument("--threshold", type=float, default=0.8, help="추정 Jaccard 기준")
+    parser.add_argument("--min-chars", type=int, default=20, help="비교할 최소 글자 수")
+
+    args = parser.parse_args()
+
+    df = read_stage(args.input, columns=['review_text_clean'])
+    texts = df['review_text_clean'].astype(object).fillna('')
+    source = texts[texts.str.len() >= max(args.min_chars, args.ngram)].tolist()
+    logger.info(f"Loaded {len(source)} comparable reviews from {args.input}")
+
+    hasher = MinHasher(num_perm=args.num_perm, ngram=args.ngram)
+    for rows in args.rows:
+        texts, origin = plant_near_duplicates(source, rows, args.edits, seed=rows)
+
+        started = time.perf_counter()
+        signatures = hasher.signatures(texts)
+        sig_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        left, right = lsh_candidate_pairs(signatures, args.bands)
+        lsh_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matched = signature_similarity(signatures, left, right) >= args.threshold
+        labels = connected_components(rows, left[matched], right[matched])
+        cluster_sec = time.perf_counter() - started
+
+        # 원본(첫 등장 행)과 실제 유사도가 기준 이상인 반복본이 원본과 같은 클러스터에 들어간 비율
+        planted = np.arange(len(source), rows)
+        similar = np.array(
+            [ngram_jaccard(texts[k], texts[origin[k]], args.ngram) >= args.threshold for k in planted],
+            dtype=bool
+        )
+        planted = planted[similar]
+        recall = float((labels[planted] == labels[origin[planted]]).mean()) if len(planted) else float('nan')
+
+        total = sig_sec + lsh_sec + cluster_sec
+        logger.info(
+            f"{rows:>9,} rows: signatures {sig_sec:6.1f} s, LSH {lsh_sec:5.1f} s "
+            f"({len(left):,} pairs), clusters {cluster_sec:5.1f} s, total {total:6.1f} s, "
+            f"recall {recall:.3f} ({len(planted):,} planted pairs above threshold)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Parquet 저장 프로필 벤치마크
+
+실제 단계 출력 Parquet마다 저장 프로필(src/schema.py WRITE_PROFILES)별로 다시 저장해
+파일 크기, 저장 시간, 전체 읽기 시간, 필터 읽기 시간을 비교합니다.
+
+필터 읽기는 goods_no 하나(기본: 행이 가장 많은 상품)와, aspect 컬럼이 있으면
+aspect 하나까지 조건으로 걸어 pq.read_table(filters=...)로 읽습니다. row group 통계로
+건너뛸 수 있는 row group 수도 함께 보고합니다. 원본 파일과 data 폴더는 건드리지 않습니다.
+
+Usage:
+    # 파이프라인 기본 출력 (있는 파일만)
+    python -m src.bench.parquet_profiles
+
+    # 특정 파일/프로필
+    python -m src.bench.parquet_profiles --paths data/llm/extractions_full_normalized.parquet \\
+        --profiles default scratch analytics --repeat 10
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+import pyarrow.parquet as pq
+
+from src.schema import WRITE_PROFILES, read_stage, write_stage
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATHS = [
+    'data/processed/reviews.parquet',
+    'data/processed/reviews_step3_base.parquet',
+    'data/processed/reviews_step3_dedup.parquet',
+    'data/processed/reviews_step3_neardup.parquet',
+    'data/processed/reviews_step3_tagged.parquet',
+    'data/llm/llm_queue.parquet',
+    'data/llm/extractions_full.parquet',
+    'data/llm/extractions_full_normalized.parquet',
+    'data/analysis/step4_master_join.parquet',
+]
+
+
+def median_ms(fn, repeat: int) -> float:
+    """반복 실행 소요 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def build_filters(path: str, goods_no: Optional[str]) -> List[Tuple[str, str, Any]]:
+    """필터 조건 (goods_no, 있으면 aspect: 각각 행이 가장 많은 값)"""
+    columns = [c for c in ('goods_no', 'aspect') if c in pq.read_schema(path).names]
+    if not columns:
+        return []
+
+    df = pq.read_table(path, columns=columns).to_pandas()
+    filters = []
+    if 'goods_no' in columns:
+        value = goods_no or str(df['goods_no'].value_counts().index[0])
+        filters.append(('goods_no', '=', value))
+        df = df[df['goods_no'].astype(str) == value]
+    if 'aspect' in columns and len(df):
+        filters.append(('aspect', '=', str(df['aspect'].value_counts().index[0])))
+    return filters
+
+
+def prunable_row_groups(path: str, filters: List[Tuple[str, str, Any]]) -> Tuple[int, int]:
+    """
+    row group 통계(min/max)만으로 건너뛸 수 있는 row group 수
+
+    Returns:
+        (읽어야 하는 row group 수, 전체 row group 수)
+    """
+    metadata = pq.ParquetFile(path).metadata
+    names = metadata.schema.to_arrow_schema().names
+    needed = 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        keep = True
+        for column, _, value in filters:
+            stats = row_group.column(names.index(column)).statistics
+            if stats is not None and stats.has_min_max and not (stats.min <= value <= stats.max):
+                keep = False
+                break
+        needed += keep
+    return needed, metadata.num_row_groups
+
+
+def bench_file(path: str, profiles: List[str], work_dir: str, repeat: int, goods_no: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    파일 하나를 프로필별로 저장/읽기 측정
+
+    Args:
+        path: 단계 출력 Parquet 경로
+        profiles: 측정할 프로필 이름
+        work_dir: 결과 파일을 쓸 임시 폴더
+        repeat: 반복 측정 횟수
+        goods_no: 필터할 상품 번호 (None이면 행이 가장 많은 상품)
+
+    Returns:
+        프로필별 측정 결과
+    """
+    df = read_stage(path)
+    filters = build_filters(path, goods_no)
+    name = os.path.splitext(os.path.basename(path))[0]
+
+    results = []
+    for profile in profiles:
+        out_path = os.path.join(work_dir, f"{name}.{profile}.parquet")
+        write_ms = median_ms(lambda: write_stage(df, out_path, profile=profile), repeat)
+
+        result = {
+            'file': name,
+            'profile': profile,
+            'rows': len(df),
+            'size_mb': os.path.getsize(out_path) / 1e6,
+            'write_ms': write_ms,
+            'read_ms': median_ms(lambda: pq.read_table(out_path), repeat),
+            'filtered_read_ms': None,
+            'filtered_rows': None,
+            'row_groups': None,
+        }
+        if filters:
+            result['filtered_read_ms'] = median_ms(lambda: pq.read_table(out_path, filters=filters), repeat)
+            result['filtered_rows'] = pq.read_table(out_path, columns=['goods_no'], filters=filters).num_rows
+            needed, total = prunable_row_groups(out_path, filters)
+            result['row_groups'] = f"{needed}/{total}"
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Parquet 저장 프로필 벤치마크 (크기, 저장 시간, 필터 읽기 시간)"
+    )
+    parser.add_argument(
+        "--paths",
+        nargs='+',
+        default=DEFAULT_PATHS,
+        help="측정할 Parquet 파일 (기본: 파이프라인 출력 중 있는 파일)"
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs='+',
+        default=list(WRITE_PROFILES),
+        choices=list(WRITE_PROFILES),
+        help="측정할 저장 프로필"
+    )
+    parser.add_argument(
+        "--goods-no",
+        default=None,
+        help="필터 읽기에 쓸 상품 번호 (기본: 파일마다 행이 가장 많은 상품)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="반복 측정 횟수"
+    )
+
+    args = parser.parse_args()
+
+    paths = [p for p in args.paths if os.path.exists(p)]
+    if not paths:
+        logger.error("No Parquet files found (run the pipeline or pass --paths)")
+        return
+
+    logger.info(f"Benchmarking {len(paths)} files x {len(args.profiles)} profiles (repeat={args.repeat})")
+
+    work_dir = tempfile.mkdtemp(prefix='parquet_profiles_')
+    try:
+        for path in paths:
+            results = bench_file(path, args.profiles, work_dir, args.repeat, args.goods_no)
+            base = results[0]
+            for r in results:
+                filtered = (
+                    f"filtered read {r['filtered_read_ms']:.1f} ms ({r['filtered_rows']} rows, "
+                    f"row groups {r['row_groups']})"
+                    if r['filtered_read_ms'] is not None else "no filter column"
+                )
+                logger.info(
+                    f"{r['file']:<36} {r['profile']:<12} {r['size_mb']:6.2f} MB "
+                    f"({r['size_mb'] / base['size_mb'] * 100:4.0f}%), write {r['write_ms']:7.1f} ms, "
+                    f"read {r['read_ms']:6.1f} ms, {filtered}"
+                )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+단계 간 데이터 로드 벤치마크 (Parquet vs Arrow IPC 캐시)
+
+파이프라인 단계 출력 Parquet마다 압축하지 않은 IPC 캐시를 임시 폴더에 만들고,
+다음 단계가 입력을 읽는 비용을 두 방식으로 측정합니다.
+
+- Parquet: pq.read_table (압축 해제 + 디코딩)
+- IPC: 메모리 맵 (복사/디코딩 없음, 읽은 페이지만 디스크에서 올라옴)
+
+Arrow 테이블까지의 로드 시간과 DataFrame 변환(read_stage 전체) 시간을 따로 보고하고,
+두 방식의 DataFrame이 같은지 확인합니다. 원본 Parquet와 data 폴더는 건드리지 않습니다.
+
+Usage:
+    # 파이프라인 기본 출력 (있는 파일만)
+    python -m src.bench.stage_io
+
+    # 특정 파일, 일부 컬럼만 읽는 경우도 측정
+    python -m src.bench.stage_io --paths data/processed/reviews_step3_tagged.parquet \\
+        --columns review_id goods_no rating_bucket --repeat 10
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import List, Dict, Optional, Callable
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.schema import conform, read_ipc_cache, write_ipc_cache
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# run_pipeline.sh 단계 순서대로 다음 단계가 읽는 파일
+DEFAULT_PATHS = [
+    'data/processed/reviews_step3_base.parquet',
+    'data/processed/reviews_step3_dedup.parquet',
+    'data/processed/reviews_step3_neardup.parquet',
+    'data/processed/reviews_step3_tagged.parquet',
+    'data/llm/llm_queue.parquet',
+    'data/llm/extractions_full_normalized.parquet',
+    'data/analysis/step4_master_join.parquet',
+]
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> float:
+    """반복 실행 소요 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def bench_file(path: str, work_dir: str, repeat: int, columns: Optional[List[str]]) -> Dict[str, float]:
+    """
+    파일 하나의 Parquet/IPC 로드 시간 측정
+
+    Args:
+        path: 단계 출력 Parquet 경로
+        work_dir: 복사본과 IPC 캐시를 둘 임시 폴더
+        repeat: 반복 측정 횟수
+        columns: 읽을 컬럼 (None이면 전체)
+
+    Returns:
+        측정 결과 (ms, 크기, 일치 여부)
+    """
+    local = os.path.join(work_dir, os.path.basename(path))
+    shutil.copy2(path, local)
+
+    table = pq.read_table(local)
+    start = time.perf_counter()
+    ipc_path = write_ipc_cache(table, local)
+    write_ms = (time.perf_counter() - start) * 1000
+
+    if columns is not None:
+        columns = [c for c in columns if c in table.column_names]
+
+    parquet_df = conform(pq.read_table(local, columns=columns).to_pandas())
+    ipc_df = conform(read_ipc_cache(local, columns).to_pandas())
+
+    return {
+        'rows': table.num_rows,
+        'parquet_mb': os.path.getsize(local) / 1e6,
+        'ipc_mb': os.path.getsize(ipc_path) / 1e6,
+        'ipc_write_ms': write_ms,
+        'parquet_load_ms': time_call(lambda: pq.read_table(local, columns=columns), repeat),
+        'ipc_load_ms': time_call(lambda: read_ipc_cache(local, columns), repeat),
+        'parquet_df_ms': time_call(lambda: conform(pq.read_table(local, columns=columns).to_pandas()), repeat),
+        'ipc_df_ms': time_call(lambda: conform(read_ipc_cache(local, columns).to_pandas()), repeat),
+        'identical': parquet_df.equals(ipc_df) and (parquet_df.dtypes == ipc_df.dtypes).all(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="단계 간 데이터 로드 벤치마크 (Parquet vs Arrow IPC 캐시)"
+    )
+    parser.add_argument(
+        "--paths",
+        nargs='+',
+        default=DEFAULT_PATHS,
+        help="측정할 단계 출력 Parquet 파일 (기본: 파이프라인 출력 중 있는 파일)"
+    )
+    parser.add_argument(
+        "--columns",
+        nargs='+',
+        default=None,
+        help="읽을 컬럼 (기본: 전체, 파일에 없는 컬럼은 무시)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="반복 측정 횟수"
+    )
+
+    args = parser.parse_args()
+
+    paths = [p for p in args.paths if os.path.exists(p)]
+    if not paths:
+        logger.error("No stage outputs found (run the pipeline or pass --paths)")
+        return
+
+    logger.info(f"Benchmarking {len(paths)} stage files (repeat={args.repeat}, columns={args.columns or 'all'})")
+
+    rows = []
+    work_dir = tempfile.mkdtemp(prefix='stage_io_')
+    try:
+        for path in paths:
+            result = bench_file(path, work_dir, args.repeat, args.columns)
+            rows.append({'file': os.path.basename(path), **result})
+            logger.info(
+                f"{os.path.basename(path)}: {result['rows']} rows, "
+                f"parquet {result['parquet_mb']:.1f} MB / ipc {result['ipc_mb']:.1f} MB, "
+                f"load {result['parquet_load_ms']:.1f} -> {result['ipc_load_ms']:.2f} ms, "
+                f"DataFrame {result['parquet_df_ms']:.1f} -> {result['ipc_df_ms']:.1f} ms, "
+                f"identical: {result['identical']}"
+            )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary = pd.DataFrame(rows)
+    saved = summary['parquet_df_ms'].sum() - summary['ipc_df_ms'].sum()
+    logger.info(
+        f"Total per pipeline run: decode {summary['parquet_load_ms'].sum():.1f} -> "
+        f"{summary['ipc_load_ms'].sum():.1f} ms, DataFrame load saved {saved:.1f} ms "
+        f"(IPC write cost {summary['ipc_write_ms'].sum():.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
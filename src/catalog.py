@@ -1,29 +1,42 @@
 """
 카탈로그 수집 모듈
 
-올리브영 선크림 카테고리 페이지에서 전체 상품 목록을 수집합니다.
+올리브영 카테고리 페이지에서 전체 상품 목록을 수집합니다.
+catalog.disp_cat_no에 여러 카테고리를 두면 카테고리마다 수집기를 따로 만들어
+스케줄러(scheduler.py)가 함께 실행합니다.
 """
 
-import re
+import math
 import time
 import random
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import RateLimiter, get_rate_limiter, needs_rate_limiter
+from .pacing import record_response
+from .telemetry import CrawlMetrics, get_crawl_metrics, failure_cause
+from .catalog_parser import CatalogParser, get_catalog_parser
+from .http_cache import ResponseCache, get_response_cache
 
 logger = logging.getLogger(__name__)
 
+# 기본 카테고리 (선크림)
+DEFAULT_DISP_CAT_NO = '100000100110006'
+
 
 class CatalogCollector:
     """올리브영 카탈로그 수집기"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], disp_cat_no: Optional[str] = None):
         """
         Args:
             config: 설정 딕셔너리 (config.yaml에서 로드)
+            disp_cat_no: 수집할 카테고리 번호 (기본: catalog.disp_cat_no의 첫 카테고리)
         """
         self.config = config
         self.catalog_config = config.get('catalog', {})
@@ -34,16 +47,40 @@ class CatalogCollector:
             'base_url', 
             'https://www.oliveyoung.co.kr/store/display/getMCategoryList.do'
         )
-        self.disp_cat_no = self.catalog_config.get('disp_cat_no', '100000100110006')
+        self.disp_cat_no = disp_cat_no or get_categories(config)[0]['disp_cat_no']
         self.prd_sort = self.catalog_config.get('prd_sort', '03')
         self.rows_per_page = self.catalog_config.get('rows_per_page', 48)
         
+        # HTML 파서 백엔드 (bs4: BeautifulSoup, lxml: 미리 컴파일한 XPath)
+        self.parser: CatalogParser = get_catalog_parser(
+            self.catalog_config.get('parser', 'lxml'), self.rows_per_page
+        )
+        
         self.delay_min = self.request_config.get('delay_min', 1.0)
         self.delay_max = self.request_config.get('delay_max', 2.0)
         self.max_retries = self.request_config.get('max_retries', 3)
         self.timeout = self.request_config.get('timeout', 30)
         
+        # 총 상품 수를 안 뒤 나머지 페이지 동시 요청 수 / HTML 파싱 프로세스 수
+        self.concurrency = max(1, self.catalog_config.get(
+            'concurrency', self.request_config.get('concurrency', 1)
+        ))
+        self.parse_workers = self.catalog_config.get('parse_workers', 0)
+        self.rate_limiter: Optional[RateLimiter] = None
+        if needs_rate_limiter(config, self.concurrency):
+            self.rate_limiter = get_rate_limiter(config, self.base_url)
+        
+        # 수집 텔레메트리 (요청 지연/바이트/재시도 원인/대기 시간)
+        self.metrics: Optional[CrawlMetrics] = get_crawl_metrics(config)
+        
+        # 응답 캐시 (replay 모드면 네트워크 없이 캐시만 사용)
+        self.cache: Optional[ResponseCache] = get_response_cache(config)
+        self.replay = bool(self.cache and self.cache.replay)
+        
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': self.headers_config.get(
                 'user_agent',
@@ -53,10 +90,15 @@ class CatalogCollector:
             'Accept-Language': self.headers_config.get('accept_language', 'ko-KR,ko;q=0.9'),
         })
     
-    def _random_delay(self) -> None:
-        """랜덤 딜레이 적용"""
+    def _random_delay(self, reason: str = 'delay') -> None:
+        """랜덤 딜레이 적용 (reason: 텔레메트리 대기 사유, 재시도 전이면 retry)"""
+        if self.rate_limiter is not None or self.replay:
+            # 동시 모드에서는 요청 직전 토큰 버킷이 간격을 제어, replay는 요청 없음
+            return
         delay = random.uniform(self.delay_min, self.delay_max)
         time.sleep(delay)
+        if self.metrics is not None:
+            self.metrics.add_sleep(reason, delay)
     
     def _fetch_page(self, page_idx: int) -> Optional[str]:
         """
@@ -75,156 +117,229 @@ class CatalogCollector:
             'rowsPerPage': self.rows_per_page,
         }
         
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key('GET', self.base_url, params=params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.record_cache_hit('catalog')
+                return cached
+            if self.replay:
+                logger.info(f"페이지 {page_idx} 캐시 없음 (replay 모드)")
+                return None
+        
         for attempt in range(self.max_retries):
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if self.metrics is not None:
+                    self.metrics.add_sleep('pacing', waited)
+            started = time.monotonic()
+            response = None
             try:
                 response = self.session.get(
                     self.base_url,
                     params=params,
                     timeout=self.timeout
                 )
+                latency = time.monotonic() - started
+                if self.metrics is not None:
+                    self.metrics.observe_request('catalog', latency, response.status_code, len(response.content))
+                if self.rate_limiter is not None:
+                    record_response(self.rate_limiter, latency, response)
                 response.raise_for_status()
+                if cache_key is not None:
+                    self.cache.put(cache_key, response.url, response.text)
                 return response.text
             except requests.RequestException as e:
+                if response is None:
+                    # 응답 없이 실패 (타임아웃, 연결 오류)
+                    latency = time.monotonic() - started
+                    if self.metrics is not None:
+                        self.metrics.observe_request('catalog', latency, None)
+                    if self.rate_limiter is not None:
+                        record_response(self.rate_limiter, latency, None)
+                if self.metrics is not None:
+                    self.metrics.record_failure('catalog', failure_cause(e), attempt < self.max_retries - 1)
                 logger.warning(f"페이지 {page_idx} 요청 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
-                    self._random_delay()
+                    self._random_delay('retry')
         
         logger.error(f"페이지 {page_idx} 수집 실패")
         return None
     
-    def _parse_products(self, html: str, page_idx: int) -> List[Dict[str, Any]]:
+    def _parse_page(self, html: str, page_idx: int) -> Tuple[int, List[Dict[str, Any]]]:
         """
-        HTML에서 상품 정보 파싱
+        페이지 HTML을 한 번 파싱하여 총 상품 수와 상품 정보 추출
         
         Args:
             html: 페이지 HTML
             page_idx: 현재 페이지 번호
             
         Returns:
-            상품 정보 리스트
+            (총 상품 수, 상품 정보 리스트)
         """
-        soup = BeautifulSoup(html, 'lxml')
-        products = []
-        
-        # 상품 카드 선택
-        items = soup.select('ul.cate_prd_list li, ul.main-four-guide-list li, div.prd_info')
-        
-        if not items:
-            # 대체 셀렉터 시도
-            items = soup.select('[data-ref-goodsno], .prd_info')
-        
-        for idx, item in enumerate(items):
-            try:
-                product = self._extract_product_info(item, page_idx, idx)
-                if product and product.get('goods_no'):
-                    products.append(product)
-            except Exception as e:
-                logger.debug(f"상품 파싱 오류: {e}")
-                continue
-        
-        return products
+        return self.parser.parse_page(html, page_idx)
+    
+    def _parse_products(self, html: str, page_idx: int) -> List[Dict[str, Any]]:
+        """HTML에서 상품 정보 파싱"""
+        return self._parse_page(html, page_idx)[1]
     
-    def _extract_product_info(
-        self, 
-        item, 
-        page_idx: int, 
-        index: int
-    ) -> Optional[Dict[str, Any]]:
+    def _get_total_count(self, html: str) -> int:
+        """총 상품 수 추출"""
+        return self._parse_page(html, 1)[0]
+    
+    def _fetch_pages(
+        self,
+        page_indices: List[int],
+        parse_pool: Optional[ProcessPoolExecutor]
+    ) -> List[Tuple[int, Optional[Future]]]:
         """
-        개별 상품 정보 추출
+        여러 페이지를 동시에 가져와 도착 순서대로 파싱 작업 예약
+        
+        요청은 최대 concurrency개가 동시에 진행되며 간격은 호스트별 토큰 버킷
+        (순차 모드는 페이지 사이 랜덤 딜레이)이 제어합니다. 파싱은 parse_pool이
+        있으면 프로세스 풀에서, 없으면 현재 프로세스에서 수행합니다.
         
         Args:
-            item: BeautifulSoup 요소
-            page_idx: 페이지 번호
-            index: 페이지 내 순서
+            page_indices: 페이지 번호 리스트 (오름차순)
+            parse_pool: HTML 파싱용 프로세스 풀 (None이면 직접 파싱)
             
         Returns:
-            상품 정보 딕셔너리
+            (페이지 번호, 파싱 결과 Future) 리스트 (요청 실패 페이지는 Future가 None)
         """
-        # goodsNo 추출
-        goods_no = None
-        
-        # data 속성에서 추출
-        goods_no = item.get('data-ref-goodsno')
-        
-        # 링크에서 추출
-        if not goods_no:
-            link_elem = item.select_one('a[href*="goodsNo="]')
-            if link_elem:
-                href = link_elem.get('href', '')
-                match = re.search(r'goodsNo=([A-Z0-9]+)', href)
-                if match:
-                    goods_no = match.group(1)
-        
-        if not goods_no:
-            return None
-        
-        # 브랜드명
-        brand_elem = item.select_one('.tx_brand, .brand, span[class*="brand"]')
-        brand = brand_elem.get_text(strip=True) if brand_elem else ''
-        
-        # 상품명
-        name_elem = item.select_one('.tx_name, .name, p[class*="name"], a[class*="name"]')
-        name = name_elem.get_text(strip=True) if name_elem else ''
-        
-        # 가격
-        price_elem = item.select_one('.tx_cur .tx_num, .price .num, span[class*="price"]')
-        price_text = price_elem.get_text(strip=True) if price_elem else ''
-        price = self._parse_price(price_text)
-        
-        # 상품 URL 생성
-        product_url = f"https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}"
-        
-        # list_rank 계산 (페이지 * 페이지당개수 + 순서)
-        list_rank = (page_idx - 1) * self.rows_per_page + index + 1
-        
-        return {
-            'goods_no': goods_no,
-            'product_id': goods_no,  # alias
-            'brand': brand,
-            'product_name': name,
-            'price': price,
-            'product_url': product_url,
-            'list_rank': list_rank,
-            'rating_avg': None,  # 카탈로그에서는 제공되지 않음
-            'review_count': None,  # 카탈로그에서는 제공되지 않음
-        }
-    
-    def _parse_price(self, price_text: str) -> Optional[int]:
-        """가격 문자열을 정수로 변환"""
-        if not price_text:
-            return None
-        # 숫자만 추출
-        numbers = re.sub(r'[^\d]', '', price_text)
-        return int(numbers) if numbers else None
-    
-    def _get_total_count(self, html: str) -> int:
-        """총 상품 수 추출"""
-        soup = BeautifulSoup(html, 'lxml')
+        def fetch(page_idx: int) -> Optional[str]:
+            self._random_delay()
+            logger.info(f"페이지 {page_idx} 수집 중...")
+            return self._fetch_page(page_idx)
+        
+        results: List[Tuple[int, Optional[Future]]] = []
         
-        # "543개" 형태의 텍스트 찾기
-        count_elem = soup.select_one('.cate_info_tx span, .total_count, [class*="count"]')
-        if count_elem:
-            text = count_elem.get_text()
-            match = re.search(r'(\d+)', text)
-            if match:
-                return int(match.group(1))
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for page_idx, html in zip(page_indices, executor.map(fetch, page_indices)):
+                if not html:
+                    results.append((page_idx, None))
+                    continue
+                
+                if parse_pool is not None:
+                    future = parse_pool.submit(_parse_page_in_worker, html, page_idx)
+                else:
+                    future = Future()
+                    future.set_result(self._parse_products(html, page_idx))
+                results.append((page_idx, future))
         
-        return 0
+        return results
     
     def collect_all(self) -> List[Dict[str, Any]]:
         """
         전체 카탈로그 수집
         
+        첫 페이지에서 총 상품 수를 알면 나머지 페이지를 동시에 요청하고
+        프로세스 풀에서 파싱합니다. 결과는 페이지 순서대로 합쳐지므로
+        순차 수집과 같은 list_rank가 만들어집니다.
+        
         Returns:
             모든 상품 정보 리스트 (중복 제거됨)
         """
         all_products = []
-        page_idx = 1
-        total_count = 0
         
-        logger.info("카탈로그 수집 시작...")
+        logger.info(f"카탈로그 수집 시작 (카테고리 {self.disp_cat_no})...")
+        logger.info("페이지 1 수집 중...")
+        
+        html = self._fetch_page(1)
+        if not html:
+            logger.error("페이지 1 수집 실패, 중단")
+            return []
+        
+        # 첫 페이지에서 총 개수 확인
+        total_count, products = self._parse_page(html, 1)
+        logger.info(f"총 상품 수: {total_count}")
+        
+        if not products:
+            logger.info("페이지 1에서 상품 없음, 수집 완료")
+            return []
+        
+        all_products.extend(products)
+        logger.info(f"페이지 1: {len(products)}개 수집 (누적: {len(all_products)}개)")
+        
+        # 다음 페이지 확인 (총 개수를 모르면 첫 페이지만 사용)
+        if total_count and len(products) >= self.rows_per_page:
+            self._collect_remaining_pages(all_products, total_count)
+        
+        # 중복 제거 (goods_no 기준, 먼저 등장한 것 유지)
+        seen = set()
+        unique_products = []
+        for product in all_products:
+            goods_no = product.get('goods_no')
+            if goods_no and goods_no not in seen:
+                seen.add(goods_no)
+                unique_products.append(product)
+        
+        # list_rank 재계산 (중복 제거 후 순서대로), 수집 카테고리 기록
+        for idx, product in enumerate(unique_products):
+            product['list_rank'] = idx + 1
+            product['disp_cat_no'] = self.disp_cat_no
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.save()
+        
+        logger.info(f"카탈로그 수집 완료: 총 {len(unique_products)}개 상품 (중복 제거 후)")
+        return unique_products
+    
+    def _collect_remaining_pages(self, all_products: List[Dict[str, Any]], total_count: int) -> None:
+        """총 상품 수로 계산한 2페이지 이후를 동시에 수집하여 all_products에 추가"""
+        num_pages = math.ceil(total_count / self.rows_per_page)
+        page_indices = list(range(2, num_pages + 1))
+        if not page_indices:
+            return
+        
+        logger.info(
+            f"나머지 {len(page_indices)}개 페이지 수집 "
+            f"(concurrency={self.concurrency}, parse_workers={self.parse_workers})"
+        )
+        
+        parse_pool = None
+        if self.parse_workers and self.parse_workers > 1:
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                initializer=_init_parse_worker,
+                initargs=({'catalog': self.catalog_config},),
+            )
+        
+        try:
+            results = self._fetch_pages(page_indices, parse_pool)
+            
+            # 순차 수집과 같은 종료 조건을 페이지 순서대로 적용
+            for page_idx, future in results:
+                if future is None:
+                    logger.error(f"페이지 {page_idx} 수집 실패, 중단")
+                    return
+                
+                products = future.result()
+                if not products:
+                    logger.info(f"페이지 {page_idx}에서 상품 없음, 수집 완료")
+                    return
+                
+                all_products.extend(products)
+                logger.info(f"페이지 {page_idx}: {len(products)}개 수집 (누적: {len(all_products)}개)")
+                
+                if len(all_products) >= total_count * 2 or len(products) < self.rows_per_page:
+                    return
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
         
+        # 총 상품 수가 실제보다 적게 표시된 경우 이어서 순차 수집
+        self._random_delay()
+        self._collect_sequential(all_products, num_pages + 1, total_count)
+    
+    def _collect_sequential(
+        self,
+        all_products: List[Dict[str, Any]],
+        page_idx: int,
+        total_count: int
+    ) -> None:
+        """page_idx부터 한 페이지씩 수집하여 all_products에 추가"""
         while True:
             logger.info(f"페이지 {page_idx} 수집 중...")
             
@@ -233,11 +348,6 @@ class CatalogCollector:
                 logger.error(f"페이지 {page_idx} 수집 실패, 중단")
                 break
             
-            # 첫 페이지에서 총 개수 확인
-            if page_idx == 1:
-                total_count = self._get_total_count(html)
-                logger.info(f"총 상품 수: {total_count}")
-            
             products = self._parse_products(html, page_idx)
             
             if not products:
@@ -253,33 +363,74 @@ class CatalogCollector:
             
             page_idx += 1
             self._random_delay()
+
+
+# 파싱 프로세스별 수집기 (HTML 파싱 전용, 네트워크 사용 안 함)
+_WORKER_COLLECTOR: Optional[CatalogCollector] = None
+
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """파싱 프로세스 초기화: 카탈로그 설정으로 수집기 생성"""
+    global _WORKER_COLLECTOR
+    _WORKER_COLLECTOR = CatalogCollector(config)
+
+
+def _parse_page_in_worker(html: str, page_idx: int) -> List[Dict[str, Any]]:
+    """파싱 프로세스에서 페이지 HTML을 상품 리스트로 변환"""
+    return _WORKER_COLLECTOR._parse_products(html, page_idx)
+
+
+def get_categories(config: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    catalog.disp_cat_no 설정을 카테고리 목록으로 정리
+    
+    disp_cat_no에는 카테고리 번호 하나, 번호 목록, 또는 {name, disp_cat_no} 목록을
+    쓸 수 있습니다. name은 출력 파티션(category=<name>) 이름이 되며, 없으면 번호를 씁니다.
+    
+    Args:
+        config: 설정 딕셔너리
         
-        # 중복 제거 (goods_no 기준, 먼저 등장한 것 유지)
-        seen = set()
-        unique_products = []
-        for product in all_products:
-            goods_no = product.get('goods_no')
-            if goods_no and goods_no not in seen:
-                seen.add(goods_no)
-                unique_products.append(product)
+    Returns:
+        [{'name': 파티션 이름, 'disp_cat_no': 카테고리 번호}, ...] (설정 순서)
+    """
+    value = config.get('catalog', {}).get('disp_cat_no', DEFAULT_DISP_CAT_NO)
+    entries = value if isinstance(value, list) else [value]
+    
+    categories = []
+    seen = set()
+    for entry in entries:
+        if isinstance(entry, dict):
+            disp_cat_no = str(entry.get('disp_cat_no', '')).strip()
+            name = str(entry.get('name') or disp_cat_no).strip()
+        else:
+            disp_cat_no = name = str(entry).strip()
         
-        # list_rank 재계산 (중복 제거 후 순서대로)
-        for idx, product in enumerate(unique_products):
-            product['list_rank'] = idx + 1
+        if not disp_cat_no:
+            raise ValueError(f"disp_cat_no가 없는 카테고리 설정: {entry}")
+        if '/' in name or '=' in name or name.startswith('.'):
+            raise ValueError(f"카테고리 이름은 경로로 쓰이므로 '/', '='를 포함하거나 '.'으로 시작할 수 없습니다: {name}")
+        if disp_cat_no in seen or name in {c['name'] for c in categories}:
+            logger.warning(f"중복 카테고리 설정 무시: {name} ({disp_cat_no})")
+            continue
         
-        logger.info(f"카탈로그 수집 완료: 총 {len(unique_products)}개 상품 (중복 제거 후)")
-        return unique_products
+        seen.add(disp_cat_no)
+        categories.append({'name': name, 'disp_cat_no': disp_cat_no})
+    
+    if not categories:
+        raise ValueError("catalog.disp_cat_no에 카테고리가 없습니다")
+    return categories
 
 
-def collect_catalog(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def collect_catalog(config: Dict[str, Any], disp_cat_no: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     카탈로그 수집 헬퍼 함수
     
     Args:
         config: 설정 딕셔너리
+        disp_cat_no: 수집할 카테고리 번호 (기본: 설정의 첫 카테고리)
         
     Returns:
         상품 정보 리스트
     """
-    collector = CatalogCollector(config)
+    collector = CatalogCollector(config, disp_cat_no)
     return collector.collect_all()
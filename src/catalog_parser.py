@@ -0,0 +1,339 @@
+"""
+카탈로그 HTML 파서 모듈
+
+카탈로그 페이지 HTML에서 총 상품 수와 상품 목록을 추출합니다.
+페이지당 한 번만 파싱하며, 두 가지 백엔드를 제공합니다.
+
+- bs4: BeautifulSoup + CSS 셀렉터 (기존 방식)
+- lxml: lxml 트리 + 미리 컴파일한 XPath / 필드 셀렉터 (같은 셀렉터를 옮긴 것)
+
+두 백엔드는 같은 HTML에 대해 같은 결과를 내도록 맞춰져 있습니다.
+"""
+
+import re
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_URL = "https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}"
+GOODS_NO_PATTERN = re.compile(r'goodsNo=([A-Z0-9]+)')
+
+
+def _parse_price(price_text: str) -> Optional[int]:
+    """가격 문자열을 정수로 변환"""
+    if not price_text:
+        return None
+    # 숫자만 추출
+    numbers = re.sub(r'[^\d]', '', price_text)
+    return int(numbers) if numbers else None
+
+
+def _parse_count(text: str) -> int:
+    """"543개" 형태의 텍스트에서 숫자 추출"""
+    match = re.search(r'(\d+)', text)
+    return int(match.group(1)) if match else 0
+
+
+class CatalogParser:
+    """카탈로그 파서 공통 로직 (백엔드별로 parse_page 구현)"""
+
+    name = ''
+
+    def __init__(self, rows_per_page: int = 48):
+        """
+        Args:
+            rows_per_page: 페이지당 상품 수 (list_rank 계산용)
+        """
+        self.rows_per_page = rows_per_page
+
+    def parse_page(self, html: str, page_idx: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        페이지 HTML을 한 번 파싱하여 총 상품 수와 상품 목록 추출
+
+        Args:
+            html: 페이지 HTML
+            page_idx: 현재 페이지 번호
+
+        Returns:
+            (총 상품 수 (없으면 0), 상품 정보 리스트)
+        """
+        raise NotImplementedError
+
+    def _build_product(
+        self,
+        goods_no: str,
+        brand: str,
+        name: str,
+        price_text: str,
+        page_idx: int,
+        index: int
+    ) -> Dict[str, Any]:
+        """추출한 필드로 상품 딕셔너리 생성"""
+        return {
+            'goods_no': goods_no,
+            'product_id': goods_no,  # alias
+            'brand': brand,
+            'product_name': name,
+            'price': _parse_price(price_text),
+            'product_url': PRODUCT_URL.format(goods_no=goods_no),
+            # list_rank 계산 (페이지 * 페이지당개수 + 순서)
+            'list_rank': (page_idx - 1) * self.rows_per_page + index + 1,
+            'rating_avg': None,  # 카탈로그에서는 제공되지 않음
+            'review_count': None,  # 카탈로그에서는 제공되지 않음
+        }
+
+
+class Bs4CatalogParser(CatalogParser):
+    """BeautifulSoup + CSS 셀렉터 파서"""
+
+    name = 'bs4'
+
+    def parse_page(self, html: str, page_idx: int) -> Tuple[int, List[Dict[str, Any]]]:
+        soup = BeautifulSoup(html, 'lxml')
+        return self._total_count(soup), self._products(soup, page_idx)
+
+    def _total_count(self, soup: BeautifulSoup) -> int:
+        count_elem = soup.select_one('.cate_info_tx span, .total_count, [class*="count"]')
+        return _parse_count(count_elem.get_text()) if count_elem else 0
+
+    def _products(self, soup: BeautifulSoup, page_idx: int) -> List[Dict[str, Any]]:
+        # 상품 카드 선택
+        items = soup.select('ul.cate_prd_list li, ul.main-four-guide-list li, div.prd_info')
+
+        if not items:
+            # 대체 셀렉터 시도
+            items = soup.select('[data-ref-goodsno], .prd_info')
+
+        products = []
+        for idx, item in enumerate(items):
+            try:
+                product = self._extract_product_info(item, page_idx, idx)
+                if product and product.get('goods_no'):
+                    products.append(product)
+            except Exception as e:
+                logger.debug(f"상품 파싱 오류: {e}")
+                continue
+
+        return products
+
+    def _extract_product_info(self, item, page_idx: int, index: int) -> Optional[Dict[str, Any]]:
+        # data 속성에서 추출
+        goods_no = item.get('data-ref-goodsno')
+
+        # 링크에서 추출
+        if not goods_no:
+            link_elem = item.select_one('a[href*="goodsNo="]')
+            if link_elem:
+                match = GOODS_NO_PATTERN.search(link_elem.get('href', ''))
+                if match:
+                    goods_no = match.group(1)
+
+        if not goods_no:
+            return None
+
+        brand_elem = item.select_one('.tx_brand, .brand, span[class*="brand"]')
+        name_elem = item.select_one('.tx_name, .name, p[class*="name"], a[class*="name"]')
+        price_elem = item.select_one('.tx_cur .tx_num, .price .num, span[class*="price"]')
+
+        return self._build_product(
+            goods_no,
+            brand_elem.get_text(strip=True) if brand_elem else '',
+            name_elem.get_text(strip=True) if name_elem else '',
+            price_elem.get_text(strip=True) if price_elem else '',
+            page_idx,
+            index,
+        )
+
+
+def _has_class(name: str) -> str:
+    """CSS 클래스 셀렉터(.name)에 대응하는 XPath 조건 (부분 문자열 검사로 먼저 거름)"""
+    return (
+        f"contains(@class, '{name}')"
+        f" and contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+    )
+
+
+# CSS 셀렉터를 옮긴 XPath (모듈 로드 시 한 번 컴파일)
+# 합집합 결과는 문서 순서이므로 select / select_one과 같은 순서를 가짐
+_XP_ITEMS = etree.XPath(
+    f"//li[ancestor::ul[{_has_class('cate_prd_list')}]]"
+    f" | //li[ancestor::ul[{_has_class('main-four-guide-list')}]]"
+    f" | //div[{_has_class('prd_info')}]"
+)
+_XP_ITEMS_FALLBACK = etree.XPath(
+    f"//*[@data-ref-goodsno] | //*[{_has_class('prd_info')}]"
+)
+_XP_TOTAL_COUNT = etree.XPath(
+    f"(//span[ancestor::*[{_has_class('cate_info_tx')}]]"
+    f" | //*[{_has_class('total_count')}]"
+    f" | //*[contains(@class, 'count')])[1]"
+)
+_XP_GOODS_LINK = etree.XPath(".//a[contains(@href, 'goodsNo=')][1]")
+
+# 상품 카드 내부 필드 셀렉터: (태그, 클래스, 클래스 부분 문자열, 조상 클래스)
+# 예) '.tx_cur .tx_num' -> (None, 'tx_num', None, 'tx_cur'), 'span[class*="price"]' -> ('span', None, 'price', None)
+# 카드마다 XPath를 여러 번 평가하는 대신, 하위 요소를 문서 순서로 한 번 훑으며
+# 필드별로 처음 일치하는 요소를 고르므로 select_one의 합집합 셀렉터와 결과가 같음
+Selector = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+
+_FIELD_SELECTORS: Dict[str, Tuple[Selector, ...]] = {
+    # .tx_brand, .brand, span[class*="brand"]
+    'brand': (
+        (None, 'tx_brand', None, None),
+        (None, 'brand', None, None),
+        ('span', None, 'brand', None),
+    ),
+    # .tx_name, .name, p[class*="name"], a[class*="name"]
+    'name': (
+        (None, 'tx_name', None, None),
+        (None, 'name', None, None),
+        ('p', None, 'name', None),
+        ('a', None, 'name', None),
+    ),
+    # .tx_cur .tx_num, .price .num, span[class*="price"]
+    'price': (
+        (None, 'tx_num', None, 'tx_cur'),
+        (None, 'num', None, 'price'),
+        ('span', None, 'price', None),
+    ),
+}
+
+
+def _has_ancestor_class(elem, class_name: str) -> bool:
+    for ancestor in elem.iterancestors():
+        ancestor_class = ancestor.get('class')
+        if ancestor_class and class_name in ancestor_class.split():
+            return True
+    return False
+
+
+def _matches(elem, raw_class: str, classes: List[str], selectors: Tuple[Selector, ...]) -> bool:
+    """요소가 셀렉터 중 하나와 일치하는지 확인"""
+    for tag, class_name, class_part, ancestor_class in selectors:
+        if tag is not None and elem.tag != tag:
+            continue
+        if class_name is not None and class_name not in classes:
+            continue
+        if class_part is not None and class_part not in raw_class:
+            continue
+        if ancestor_class is not None and not _has_ancestor_class(elem, ancestor_class):
+            continue
+        return True
+    return False
+
+
+def _select_fields(item) -> Dict[str, Any]:
+    """카드 하위 요소를 한 번 훑어 필드별 첫 일치 요소 선택"""
+    found: Dict[str, Any] = {}
+
+    for elem in item.iterdescendants():
+        raw_class = elem.get('class') if isinstance(elem.tag, str) else None
+        if not raw_class:
+            continue
+
+        classes = raw_class.split()
+        for field, selectors in _FIELD_SELECTORS.items():
+            if field not in found and _matches(elem, raw_class, classes, selectors):
+                found[field] = elem
+
+        if len(found) == len(_FIELD_SELECTORS):
+            break
+
+    return found
+
+# get_text와 같이 주석과 script/style/template 내부 문자열은 제외
+_XP_TEXT = etree.XPath(
+    ".//text()[not(parent::script or parent::style or ancestor::template)]"
+)
+
+
+def _text(elem, strip: bool = False) -> str:
+    """요소의 텍스트 (get_text와 동일, strip이면 조각별 공백 제거 후 결합)"""
+    if strip:
+        return ''.join(s.strip() for s in _XP_TEXT(elem))
+    return ''.join(_XP_TEXT(elem))
+
+
+def _first(nodes: List[Any]) -> Optional[Any]:
+    return nodes[0] if nodes else None
+
+
+class LxmlCatalogParser(CatalogParser):
+    """lxml + 미리 컴파일한 XPath / 필드 셀렉터 파서"""
+
+    name = 'lxml'
+
+    def parse_page(self, html: str, page_idx: int) -> Tuple[int, List[Dict[str, Any]]]:
+        root = etree.HTML(html) if html else None
+        if root is None:
+            return 0, []
+
+        count_elem = _first(_XP_TOTAL_COUNT(root))
+        total_count = _parse_count(_text(count_elem)) if count_elem is not None else 0
+
+        items = _XP_ITEMS(root) or _XP_ITEMS_FALLBACK(root)
+
+        products = []
+        for idx, item in enumerate(items):
+            try:
+                product = self._extract_product_info(item, page_idx, idx)
+                if product:
+                    products.append(product)
+            except Exception as e:
+                logger.debug(f"상품 파싱 오류: {e}")
+                continue
+
+        return total_count, products
+
+    def _extract_product_info(self, item, page_idx: int, index: int) -> Optional[Dict[str, Any]]:
+        goods_no = item.get('data-ref-goodsno')
+
+        if not goods_no:
+            link_elem = _first(_XP_GOODS_LINK(item))
+            if link_elem is not None:
+                match = GOODS_NO_PATTERN.search(link_elem.get('href', ''))
+                if match:
+                    goods_no = match.group(1)
+
+        if not goods_no:
+            return None
+
+        fields = _select_fields(item)
+        brand_elem = fields.get('brand')
+        name_elem = fields.get('name')
+        price_elem = fields.get('price')
+
+        return self._build_product(
+            goods_no,
+            _text(brand_elem, strip=True) if brand_elem is not None else '',
+            _text(name_elem, strip=True) if name_elem is not None else '',
+            _text(price_elem, strip=True) if price_elem is not None else '',
+            page_idx,
+            index,
+        )
+
+
+PARSERS = {
+    Bs4CatalogParser.name: Bs4CatalogParser,
+    LxmlCatalogParser.name: LxmlCatalogParser,
+}
+
+
+def get_catalog_parser(name: str = 'lxml', rows_per_page: int = 48) -> CatalogParser:
+    """
+    이름으로 카탈로그 파서 생성
+
+    Args:
+        name: 백엔드 이름 (bs4, lxml)
+        rows_per_page: 페이지당 상품 수
+
+    Returns:
+        CatalogParser 인스턴스
+    """
+    if name not in PARSERS:
+        raise ValueError(f"지원하지 않는 카탈로그 파서: {name} (가능: {', '.join(PARSERS)})")
+    return PARSERS[name](rows_per_page)
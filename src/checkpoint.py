@@ -0,0 +1,118 @@
+"""
+수집 체크포인트 저널 모듈
+
+완료된 (goods_no, sort_source, page) 수집 단위와 파싱된 리뷰를
+append-only JSONL 파일에 기록합니다. 수집이 중간에 중단되어도
+재실행 시 기록된 단위는 네트워크 요청 없이 저널에서 재생합니다.
+"""
+
+import os
+import json
+import threading
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PageKey = Tuple[str, str, int]
+
+
+class CrawlJournal:
+    """리뷰 수집 체크포인트 저널 (append-only JSONL, 스레드 안전)"""
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Args:
+            path: 저널 파일 경로
+            resume: True면 기존 저널을 이어서 사용, False면 새로 시작
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._offsets: Dict[PageKey, int] = {}  # 수집 단위 -> 파일 오프셋
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        if resume and os.path.exists(path):
+            self._load_index()
+            logger.info(f"체크포인트 저널 재개: {path} ({len(self._offsets)}개 단위 완료)")
+        else:
+            open(path, 'wb').close()
+            logger.info(f"체크포인트 저널 시작: {path}")
+
+        self._writer = open(path, 'ab')
+        self._reader = open(path, 'rb')
+
+    def _load_index(self) -> None:
+        """저널을 훑어 단위별 오프셋 인덱스 구성 (깨진 마지막 줄은 잘라냄)"""
+        valid_end = 0
+
+        with open(self.path, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if not line.endswith(b'\n'):
+                    # 기록 도중 중단된 줄
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+
+                key = (entry['goods_no'], entry['sort_source'], int(entry['page']))
+                self._offsets[key] = offset
+                valid_end = f.tell()
+
+        if valid_end < os.path.getsize(self.path):
+            logger.warning(f"저널 끝의 불완전한 기록 제거: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    def get_page(self, goods_no: str, sort_source: str, page: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        완료된 수집 단위의 리뷰 조회
+
+        Returns:
+            파싱된 리뷰 리스트 (기록이 없으면 None)
+        """
+        with self._lock:
+            offset = self._offsets.get((goods_no, sort_source, page))
+            if offset is None:
+                return None
+            self._reader.seek(offset)
+            line = self._reader.readline()
+
+        return json.loads(line)['reviews']
+
+    def record_page(
+        self,
+        goods_no: str,
+        sort_source: str,
+        page: int,
+        reviews: List[Dict[str, Any]]
+    ) -> None:
+        """수집 단위 완료 기록 (내부 필드 제외, 즉시 디스크 동기화)"""
+        entry = {
+            'goods_no': goods_no,
+            'sort_source': sort_source,
+            'page': page,
+            'reviews': [
+                {k: v for k, v in review.items() if not k.startswith('_')}
+                for review in reviews
+            ],
+        }
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+        with self._lock:
+            offset = self._writer.tell()
+            self._writer.write(line)
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._offsets[(goods_no, sort_source, page)] = offset
+
+    def close(self) -> None:
+        """파일 핸들 정리"""
+        with self._lock:
+            self._writer.close()
+            self._reader.close()
@@ -9,6 +9,8 @@ import json
 import pandas as pd
 import logging
 
+from src.schema import read_stage
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -65,8 +67,8 @@ def build_data():
     }
 
     # 1. Bucket Polarity (Trust Signal)
-    df_bucket = pd.read_parquet(os.path.join(ANALYSIS_DIR, "pivot_aspect_polarity_by_bucket.parquet"))
-    grp = df_bucket.groupby("bucket")[["met_cnt", "unmet_cnt", "mixed_cnt", "unknown_cnt", "n_items"]].sum().reset_index()
+    df_bucket = read_stage(os.path.join(ANALYSIS_DIR, "pivot_aspect_polarity_by_bucket.parquet"))
+    grp = df_bucket.groupby("bucket", observed=True)[["met_cnt", "unmet_cnt", "mixed_cnt", "unknown_cnt", "n_items"]].sum().reset_index()
     
     # Calculate rates
     grp['met_rate'] = grp['met_cnt'] / grp['n_items']
@@ -84,7 +86,7 @@ def build_data():
     }
 
     # 2. Opportunity Map (Repeatability)
-    df_rep = pd.read_parquet(os.path.join(ANALYSIS_DIR, "repeatability_aspect_goods_count.parquet"))
+    df_rep = read_stage(os.path.join(ANALYSIS_DIR, "repeatability_aspect_goods_count.parquet"))
     df_rep['aspect_kr'] = df_rep['aspect'].apply(get_kr)
     
     data['opportunity_map'] = {
@@ -128,7 +130,7 @@ def build_data():
     }
 
     # 5. Context
-    df_ctx = pd.read_parquet(os.path.join(ANALYSIS_DIR, "pivot_context_aspect_unmet.parquet"))
+    df_ctx = read_stage(os.path.join(ANALYSIS_DIR, "pivot_context_aspect_unmet.parquet"))
     df_ctx['aspect_kr'] = df_ctx['aspect'].apply(get_kr)
     ctx_top = df_ctx[df_ctx['n_reviews'] >= 20].copy()
     
@@ -142,7 +144,7 @@ def build_data():
     }
 
     # 6. Seasonality
-    df_season = pd.read_parquet(os.path.join(ANALYSIS_DIR, "pivot_season_aspect_unmet.parquet"))
+    df_season = read_stage(os.path.join(ANALYSIS_DIR, "pivot_season_aspect_unmet.parquet"))
     df_season['aspect_kr'] = df_season['aspect'].apply(get_kr)
     
     data['seasonality'] = {
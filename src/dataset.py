@@ -0,0 +1,400 @@
+"""
+리뷰 Parquet 데이터셋 모듈
+
+수집한 리뷰를 crawl_date/category로 나눈 Hive 형식 폴더에 실행마다 새 파일로 추가합니다.
+기존 reviews.parquet 전체를 다시 쓰지 않으므로 저장 비용은 새 리뷰 수에 비례합니다.
+
+    <root>/crawl_date=2025-01-15/category=100000100110006/reviews-<run_id>.parquet
+    <root>/crawl_date=2025-01-15/category=100000100110006/refs-<run_id>.parquet
+    <root>/_manifest.json
+
+- 파일은 임시 이름으로 다 쓴 뒤 이름을 바꾸고, _manifest.json에 등록(커밋)되어야 읽기 대상이 됩니다.
+  중단된 실행이 남긴 파일은 매니페스트에 없으므로 읽히지 않습니다.
+- 매니페스트는 임시 파일 + os.replace로 교체하고, 여러 프로세스의 커밋은 잠금 파일로 순서를 맞춥니다.
+- 전체 수집(full)은 같은 (crawl_date, category)의 이전 전체 수집 파일을 대체하고,
+  증분 수집(delta)은 파일을 추가만 합니다.
+- 읽을 때는 매니페스트의 파티션 값으로 필요한 파일만 골라 읽습니다.
+"""
+
+import os
+import json
+import uuid
+import fcntl
+import threading
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .schema import conform, conform_table, read_stage
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = '_manifest.json'
+LOCK_NAME = '_manifest.lock'
+
+# 파일 내용에는 없고 폴더 이름으로만 저장되는 파티션 컬럼
+PARTITION_COLUMNS = ('crawl_date', 'category')
+
+
+def new_run_id() -> str:
+    """실행 식별자 (시각 + 임의 8자리, 파일명 충돌 방지)"""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+class ReviewDataset:
+    """매니페스트로 커밋을 관리하는 파티션 Parquet 데이터셋 (프로세스/스레드 안전)"""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: 데이터셋 루트 폴더
+        """
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST_NAME)
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """커밋된 매니페스트가 있는지 여부"""
+        return os.path.exists(self.manifest_path)
+
+    def _load(self) -> Dict[str, Any]:
+        """매니페스트 로드 (없으면 빈 매니페스트)"""
+        if not self.exists():
+            return {'version': 1, 'files': []}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """매니페스트 갱신 잠금 (같은 프로세스의 스레드 + 다른 프로세스)"""
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, open(os.path.join(self.root, LOCK_NAME), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def part_path(self, kind: str, crawl_date: str, category: str, run_id: str) -> str:
+        """
+        새 파일 경로 (파티션 폴더는 생성)
+
+        Args:
+            kind: 파일 종류 (reviews: 리뷰, refs: 반복 리뷰 참조 행)
+            crawl_date: 수집일 (YYYY-MM-DD)
+            category: 카테고리 이름
+            run_id: 실행 식별자
+
+        Returns:
+            파티션 폴더 안의 파일 경로
+        """
+        directory = os.path.join(self.root, f"crawl_date={crawl_date}", f"category={category}")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{kind}-{run_id}.parquet")
+
+    def commit(self, files: List[Dict[str, Any]], replace: bool = False) -> None:
+        """
+        다 쓴 파일을 매니페스트에 등록
+
+        Args:
+            files: 등록할 파일 항목 리스트
+                ({'kind', 'path', 'crawl_date', 'category', 'rows', 'mode'},
+                path는 part_path가 돌려준 경로)
+            replace: True면 같은 파티션의 이전 전체 수집(mode=full) 항목을 매니페스트에서 빼고 파일 삭제
+        """
+        entries = [
+            {**entry, 'path': os.path.relpath(entry['path'], self.root), 'committed_at': datetime.now().isoformat()}
+            for entry in files
+        ]
+        removed: List[Dict[str, Any]] = []
+
+        with self._locked():
+            manifest = self._load()
+            if replace:
+                partitions = {(e['crawl_date'], e['category']) for e in entries}
+                kept = []
+                for entry in manifest['files']:
+                    if entry.get('mode') == 'full' and (entry['crawl_date'], entry['category']) in partitions:
+                        removed.append(entry)
+                    else:
+                        kept.append(entry)
+                manifest['files'] = kept
+
+            manifest['files'].extend(entries)
+            manifest['updated_at'] = datetime.now().isoformat()
+
+            tmp_path = f"{self.manifest_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+
+        # 커밋 이후에는 읽기 대상이 아니므로 잠금 밖에서 삭제
+        for entry in removed:
+            try:
+                os.remove(os.path.join(self.root, entry['path']))
+            except FileNotFoundError:
+                pass
+
+        rows = sum(e.get('rows', 0) for e in entries)
+        logger.info(
+            f"데이터셋 커밋: {self.root} (+{len(entries)}개 파일, {rows}행"
+            + (f", 대체 {len(removed)}개 파일)" if removed else ")")
+        )
+
+    def entries(
+        self,
+        kind: str = 'reviews',
+        crawl_dates: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        파티션 조건에 맞는 커밋된 파일 항목
+
+        Args:
+            kind: 파일 종류 (reviews, refs)
+            crawl_dates: 수집일 목록 ('latest'는 카테고리별 최신 스냅샷, None이면 전체)
+            categories: 카테고리 이름 목록 (None이면 전체)
+
+        Returns:
+            매니페스트 항목 리스트 (커밋 순서)
+        """
+        files = [
+            e for e in self._load()['files']
+            if not categories or e['category'] in categories
+        ]
+        selected = [e for e in files if e['kind'] == kind]
+        if crawl_dates:
+            dates = set(crawl_dates)
+            snapshots = latest_snapshots(files) if 'latest' in dates else {}
+            selected = [
+                e for e in selected
+                if e['crawl_date'] in dates
+                or (e['category'] in snapshots and e['crawl_date'] >= snapshots[e['category']])
+            ]
+        return selected
+
+    def read(
+        self,
+        kind: str = 'reviews',
+        columns: Optional[List[str]] = None,
+        crawl_dates: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        조건에 맞는 파티션만 읽어 DataFrame으로 합치기
+
+        파티션 값(crawl_date, category)은 컬럼으로 붙입니다 (columns를 지정하면 포함된 경우만).
+
+        Args:
+            kind: 파일 종류 (reviews, refs)
+            columns: 읽을 컬럼 (기본: 전체, 파일에 없는 컬럼은 무시)
+            crawl_dates: 수집일 목록 ('latest' 가능)
+            categories: 카테고리 이름 목록
+
+        Returns:
+            DataFrame (파일이 없으면 빈 DataFrame)
+        """
+        tables = []
+        for entry in self.entries(kind, crawl_dates, categories):
+            path = os.path.join(self.root, entry['path'])
+            read_columns = None
+            if columns is not None:
+                available = set(pq.read_schema(path).names)
+                read_columns = [c for c in columns if c in available]
+
+            table = pq.read_table(path, columns=read_columns)
+            for col in PARTITION_COLUMNS:
+                if columns is None or col in columns:
+                    table = table.append_column(col, pa.array([entry[col]] * table.num_rows, pa.string()))
+            # 이전 형식(string/int64) 파일과 섞여도 같은 타입으로 합쳐지도록 레지스트리 타입 적용
+            tables.append(conform_table(table))
+
+        if not tables:
+            return pd.DataFrame()
+
+        return conform(pa.concat_tables(tables, promote_options='default').to_pandas())
+
+    def iter_batches(
+        self,
+        kind: str = 'reviews',
+        batch_size: int = 100000,
+        columns: Optional[List[str]] = None,
+        crawl_dates: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        조건에 맞는 파티션을 batch_size행씩 나눠 읽기 (read와 같은 행 순서/컬럼)
+
+        파일마다 컬럼이 달라도 read의 concat 결과와 같은 컬럼 순서/타입으로 맞추고,
+        파일에 없는 컬럼은 null로 채웁니다.
+
+        Args:
+            kind: 파일 종류 (reviews, refs)
+            batch_size: 배치 최대 행 수 (파일 경계에서는 더 작을 수 있음)
+            columns: 읽을 컬럼 (기본: 전체, 파일에 없는 컬럼은 무시)
+            crawl_dates: 수집일 목록 ('latest' 가능)
+            categories: 카테고리 이름 목록
+
+        Yields:
+            배치 DataFrame
+        """
+        parts = []
+        schemas = []
+        for entry in self.entries(kind, crawl_dates, categories):
+            path = os.path.join(self.root, entry['path'])
+            schema = pq.read_schema(path)
+            read_columns = None
+            if columns is not None:
+                read_columns = [c for c in columns if c in schema.names]
+                schema = pa.schema([schema.field(c) for c in read_columns])
+            for col in PARTITION_COLUMNS:
+                if columns is None or col in columns:
+                    schema = schema.append(pa.field(col, pa.string()))
+            parts.append((entry, path, read_columns))
+            # 전체 파일을 concat한 read 결과와 같은 컬럼 순서/타입
+            schemas.append(conform_table(schema.empty_table()).schema)
+        if not schemas:
+            return
+        schema = pa.unify_schemas(schemas, promote_options='default')
+
+        for entry, path, read_columns in parts:
+            for batch in pq.ParquetFile(path, pre_buffer=False).iter_batches(batch_size=batch_size, columns=read_columns):
+                table = pa.Table.from_batches([batch])
+                for col in PARTITION_COLUMNS:
+                    if columns is None or col in columns:
+                        table = table.append_column(col, pa.array([entry[col]] * table.num_rows, pa.string()))
+                table = conform_table(table)
+                for field in schema:
+                    if field.name not in table.column_names:
+                        table = table.append_column(field, pa.nulls(table.num_rows, field.type))
+                yield conform(table.select(schema.names).cast(schema).to_pandas())
+
+
+def latest_snapshots(entries: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    카테고리별 최신 스냅샷 시작 수집일
+
+    전체 수집은 수집일마다 같은 리뷰를 다시 저장하므로, 여러 날의 전체 수집을 함께 읽으면
+    리뷰마다 스냅샷 수만큼 중복됩니다. 카테고리마다 가장 최근 전체 수집일(전체 수집이 없으면
+    가장 이른 수집일)을 돌려주며, 그 날짜 이후의 증분 수집 파일도 같은 스냅샷에 속합니다.
+
+    Args:
+        entries: 매니페스트 항목 리스트 (종류 무관)
+
+    Returns:
+        카테고리 -> 스냅샷 시작 수집일
+    """
+    latest_full: Dict[str, str] = {}
+    earliest: Dict[str, str] = {}
+    for entry in entries:
+        category, crawl_date = entry['category'], entry['crawl_date']
+        earliest[category] = min(earliest.get(category, crawl_date), crawl_date)
+        if entry.get('mode') == 'full':
+            latest_full[category] = max(latest_full.get(category, crawl_date), crawl_date)
+    return {category: latest_full.get(category, first) for category, first in earliest.items()}
+
+
+def is_dataset(path: str) -> bool:
+    """경로가 커밋된 데이터셋 폴더인지 여부"""
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_NAME))
+
+
+def resolve_crawl_dates(path: str, crawl_dates: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    처리 단계의 수집일 조건 결정 (지정하지 않으면 데이터셋은 최신 스냅샷만)
+
+    Args:
+        path: 데이터셋 루트 폴더 또는 Parquet 파일 경로
+        crawl_dates: 명령행에서 지정한 수집일 목록 ('all'이면 전체 수집일)
+
+    Returns:
+        read_reviews/iter_reviews에 넘길 수집일 목록 (None이면 전체)
+    """
+    if crawl_dates is None:
+        return ['latest'] if is_dataset(path) else None
+    if 'all' in crawl_dates:
+        return None
+    return crawl_dates
+
+
+def read_reviews(
+    path: str,
+    columns: Optional[List[str]] = None,
+    crawl_dates: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    kind: str = 'reviews'
+) -> pd.DataFrame:
+    """
+    리뷰 읽기 헬퍼 함수 (데이터셋 폴더 또는 단일 Parquet 파일)
+
+    Args:
+        path: 데이터셋 루트 폴더 또는 Parquet 파일 경로
+        columns: 읽을 컬럼
+        crawl_dates: 수집일 목록 (데이터셋만 해당)
+        categories: 카테고리 이름 목록 (데이터셋만 해당)
+        kind: 파일 종류 (데이터셋만 해당)
+
+    Returns:
+        리뷰 DataFrame
+    """
+    if is_dataset(path):
+        return ReviewDataset(path).read(kind, columns, crawl_dates, categories)
+    if crawl_dates or categories:
+        logger.warning(f"단일 파일은 파티션 조건을 적용하지 않음: {path}")
+    return read_stage(path, columns=columns)
+
+
+def iter_reviews(
+    path: str,
+    batch_size: int = 100000,
+    columns: Optional[List[str]] = None,
+    crawl_dates: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    kind: str = 'reviews'
+) -> Iterator[pd.DataFrame]:
+    """
+    리뷰를 batch_size행씩 나눠 읽는 헬퍼 함수 (데이터셋 폴더 또는 단일 Parquet 파일)
+
+    Args:
+        path: 데이터셋 루트 폴더 또는 Parquet 파일 경로
+        batch_size: 배치 최대 행 수
+        columns: 읽을 컬럼
+        crawl_dates: 수집일 목록 (데이터셋만 해당)
+        categories: 카테고리 이름 목록 (데이터셋만 해당)
+        kind: 파일 종류 (데이터셋만 해당)
+
+    Yields:
+        배치 DataFrame (read_reviews와 같은 행 순서/타입)
+    """
+    if is_dataset(path):
+        yield from ReviewDataset(path).iter_batches(kind, batch_size, columns, crawl_dates, categories)
+        return
+    if crawl_dates or categories:
+        logger.warning(f"단일 파일은 파티션 조건을 적용하지 않음: {path}")
+    # pre_buffer를 켜면 읽은 row group 버퍼가 파일을 다 읽을 때까지 남아 메모리가 입력 크기만큼 늘어남
+    for batch in pq.ParquetFile(path, pre_buffer=False).iter_batches(batch_size=batch_size, columns=columns):
+        yield conform(conform_table(pa.Table.from_batches([batch])).to_pandas())
+
+
+def get_review_dataset(config: Dict[str, Any]) -> Optional[ReviewDataset]:
+    """
+    설정에 따라 리뷰 데이터셋 생성
+
+    Args:
+        config: 설정 딕셔너리 (output.dataset 블록 사용)
+
+    Returns:
+        ReviewDataset 인스턴스 (비활성 시 None, 기존 reviews.parquet 단일 파일 사용)
+    """
+    output_config = config.get('output', {})
+    dataset_config = output_config.get('dataset', {})
+    if not dataset_config.get('enabled', False):
+        return None
+
+    processed_dir = output_config.get('processed_dir', 'data/processed')
+    return ReviewDataset(dataset_config.get('dir') or os.path.join(processed_dir, 'reviews'))
@@ -7,7 +7,7 @@
 
 import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +103,32 @@ class NoiseFilter:
         
         return 0
     
+    def tag_review(self, review: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        단일 리뷰에 노이즈 태그 적용
+        
+        Args:
+            review: 리뷰 딕셔너리
+            
+        Returns:
+            태그가 적용된 리뷰 (원본 수정)
+        """
+        review['is_trial'] = self.tag_trial(review)
+        review['is_low_info'] = self.tag_low_info(review)
+        return review
+    
+    def _log_summary(self, total: int, trial_count: int, low_info_count: int) -> None:
+        """태깅 결과 요약 로그"""
+        if total == 0:
+            logger.info("노이즈 태깅 완료: 리뷰 없음")
+            return
+        
+        logger.info(
+            f"노이즈 태깅 완료: 총 {total}개 리뷰 중 "
+            f"is_trial={trial_count}개 ({trial_count/total*100:.1f}%), "
+            f"is_low_info={low_info_count}개 ({low_info_count/total*100:.1f}%)"
+        )
+    
     def apply_tags(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         리뷰 리스트에 노이즈 태그 적용
@@ -113,27 +139,33 @@ class NoiseFilter:
         Returns:
             태그가 적용된 리뷰 리스트 (원본 수정)
         """
+        for _ in self.iter_tags(reviews):
+            pass
+        
+        return reviews
+    
+    def iter_tags(self, reviews: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        스트리밍 리뷰에 노이즈 태그를 적용하며 그대로 내보냄
+        
+        Args:
+            reviews: 리뷰 이터러블 (제너레이터 가능)
+            
+        Yields:
+            태그가 적용된 리뷰 (원본 수정)
+        """
+        total = 0
         trial_count = 0
         low_info_count = 0
         
         for review in reviews:
-            # is_trial 태깅
-            is_trial = self.tag_trial(review)
-            review['is_trial'] = is_trial
-            trial_count += is_trial
-            
-            # is_low_info 태깅
-            is_low_info = self.tag_low_info(review)
-            review['is_low_info'] = is_low_info
-            low_info_count += is_low_info
+            self.tag_review(review)
+            total += 1
+            trial_count += review['is_trial']
+            low_info_count += review['is_low_info']
+            yield review
         
-        logger.info(
-            f"노이즈 태깅 완료: 총 {len(reviews)}개 리뷰 중 "
-            f"is_trial={trial_count}개 ({trial_count/len(reviews)*100:.1f}%), "
-            f"is_low_info={low_info_count}개 ({low_info_count/len(reviews)*100:.1f}%)"
-        )
-        
-        return reviews
+        self._log_summary(total, trial_count, low_info_count)
 
 
 def apply_noise_tags(
@@ -152,3 +184,21 @@ def apply_noise_tags(
     """
     noise_filter = NoiseFilter(config)
     return noise_filter.apply_tags(reviews)
+
+
+def iter_noise_tags(
+    config: Dict[str, Any],
+    reviews: Iterable[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    스트리밍 노이즈 태깅 헬퍼 함수
+    
+    Args:
+        config: 설정 딕셔너리
+        reviews: 리뷰 이터러블
+        
+    Yields:
+        태그가 적용된 리뷰
+    """
+    noise_filter = NoiseFilter(config)
+    yield from noise_filter.iter_tags(reviews)
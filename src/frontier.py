@@ -0,0 +1,376 @@
+"""
+수집 프론티어 모듈
+
+(goods_no, sort_source, page) 수집 단위를 SQLite 파일에 보관하고, 여러 워커
+프로세스가 임대(lease) 방식으로 나눠 가져가도록 합니다.
+
+- 워커는 대기 중이거나 임대가 만료된 단위를 임대하여 수집하고, 파싱된 리뷰와
+  다음 페이지 단위를 한 트랜잭션으로 기록합니다. 다음 페이지는 상품별로 완료된
+  페이지를 순차 수집 규칙(정렬 순서대로 앞 정렬과 겹치지 않는 리뷰 수)으로 재생해
+  정하므로, 정렬 간 중복으로 한도가 모자란 추가 페이지도 워커가 등록합니다.
+- 워커가 중단되면 임대가 만료된 뒤 다른 워커가 같은 단위를 다시 가져갑니다.
+- 완료된 단위는 CrawlJournal과 같은 get_page/record_page 인터페이스로 조회되므로,
+  모든 단위가 끝난 뒤 기존 스트리밍 저장 경로로 결과를 조립합니다 (조립 중에는
+  요청하지 않음).
+
+같은 호스트의 여러 프로세스는 WAL 모드로 동시에 접근합니다. 여러 호스트가
+네트워크 파일 시스템의 파일을 공유하는 경우 WAL이 동작하지 않으므로
+frontier.journal_mode를 DELETE로 둡니다.
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+import logging
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work (
+    goods_no TEXT NOT NULL,
+    sort_source TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    list_rank INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    reviews TEXT,
+    updated_at REAL,
+    PRIMARY KEY (goods_no, sort_source, page)
+);
+CREATE INDEX IF NOT EXISTS work_status ON work (status, list_rank);
+"""
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    """임대한 수집 단위"""
+
+    goods_no: str
+    sort_source: str
+    page: int
+    list_rank: Optional[int]
+    attempts: int
+
+
+def plan_pages(
+    pages: Dict[Tuple[str, int], Optional[List[str]]],
+    limits: Dict[str, int],
+    page_size: int
+) -> List[Tuple[str, int]]:
+    """
+    상품 하나의 페이지를 순차 수집 규칙으로 재생하여 아직 없는 다음 단위 계산
+
+    정렬(limits 순서)마다 앞 정렬에서 이미 나온 리뷰를 제외한 고유 리뷰 수가
+    한도에 못 미치고 마지막 페이지가 가득 차 있으면 다음 페이지가 필요합니다.
+    앞 정렬의 페이지가 늘어날수록 뒤 정렬의 고유 리뷰 수는 줄어들기만 하므로,
+    단위가 완료될 때마다 다시 계산하면 순차 수집과 같은 페이지가 등록됩니다.
+
+    Args:
+        pages: (정렬, 페이지) -> 완료된 단위의 review_id 리스트 (미완료면 None)
+        limits: 정렬 소스 -> 정렬별 한도 (수집 순서대로)
+        page_size: API 페이지당 리뷰 수
+
+    Returns:
+        등록해야 할 (정렬, 페이지) 리스트
+    """
+    seen: Set[str] = set()
+    missing = []
+    for sort_source, limit in limits.items():
+        collected = 0
+        page = 0
+        while collected < limit:
+            key = (sort_source, page)
+            review_ids = pages.get(key)
+            if review_ids is None:
+                if key not in pages:
+                    missing.append(key)
+                # 미완료 단위 이후는 결과를 알 수 없으므로 다음 정렬로
+                break
+            for review_id in review_ids:
+                if collected >= limit:
+                    break
+                if review_id not in seen:
+                    seen.add(review_id)
+                    collected += 1
+            if len(review_ids) < page_size:
+                break
+            page += 1
+    return missing
+
+
+class CrawlFrontier:
+    """SQLite 기반 수집 단위 임대 큐 (프로세스/스레드 안전)"""
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 5,
+        journal_mode: str = 'WAL'
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            lease_seconds: 임대 유지 시간 (초과 시 다른 워커가 다시 임대)
+            max_attempts: 단위별 최대 시도 횟수 (넘으면 failed 처리)
+            journal_mode: SQLite 저널 모드 (WAL 또는 네트워크 파일 시스템용 DELETE)
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # 조립 단계에서는 완료되지 않은 단위를 요청하지 않고 빈 페이지로 취급
+        self.replay_only = False
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _transaction(self, steps):
+        """BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고 steps(cursor) 실행"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result = steps(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return result
+
+    def seed(self, products: List[Dict[str, Any]], sort_sources: List[str]) -> int:
+        """
+        상품 x 정렬의 첫 페이지 단위 등록 (이미 있는 단위는 유지)
+
+        Args:
+            products: 상품 정보 리스트 (goods_no, list_rank)
+            sort_sources: 수집할 정렬 소스 리스트
+
+        Returns:
+            새로 등록된 단위 수
+        """
+        now = time.time()
+        rows = [
+            (product['goods_no'], sort_source, 0, product.get('list_rank', idx + 1), now)
+            for idx, product in enumerate(products) if product.get('goods_no')
+            for sort_source in sort_sources
+        ]
+
+        def steps(cursor):
+            before = self._conn.total_changes
+            cursor.executemany(
+                "INSERT OR IGNORE INTO work (goods_no, sort_source, page, list_rank, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+        added = self._transaction(steps)
+        logger.info(f"수집 프론티어 등록: {self.path} (+{added}개 단위)")
+        return added
+
+    def lease(self, worker_id: str, limit: int = 1) -> List[WorkItem]:
+        """
+        대기 중이거나 임대가 만료된 단위를 list_rank 순으로 임대
+
+        Args:
+            worker_id: 워커 식별자
+            limit: 한 번에 임대할 최대 단위 수
+
+        Returns:
+            임대한 단위 리스트 (없으면 빈 리스트)
+        """
+        def steps(cursor):
+            now = time.time()
+            # 시도 횟수를 다 쓴 채 만료된 임대는 실패 처리
+            cursor.execute(
+                "UPDATE work SET status = 'failed', lease_owner = NULL, lease_expires = NULL, "
+                "last_error = COALESCE(last_error, '임대 만료'), updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            rows = cursor.execute(
+                "SELECT goods_no, sort_source, page, list_rank, attempts FROM work "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY list_rank, goods_no, sort_source, page LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            cursor.executemany(
+                "UPDATE work SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? "
+                "WHERE goods_no = ? AND sort_source = ? AND page = ?",
+                [(worker_id, now + self.lease_seconds, now, g, s, p) for g, s, p, _, _ in rows],
+            )
+            return [WorkItem(g, s, p, rank, attempts + 1) for g, s, p, rank, attempts in rows]
+
+        return self._transaction(steps)
+
+    def complete(
+        self,
+        item: WorkItem,
+        reviews: List[Dict[str, Any]],
+        limits: Dict[str, int],
+        page_size: int
+    ) -> bool:
+        """
+        단위 완료 기록 (상품의 다음 페이지 단위 등록을 같은 트랜잭션으로)
+
+        Args:
+            item: 완료한 단위
+            reviews: 파싱된 리뷰 리스트 (내부 필드 제외하고 저장)
+            limits: 정렬 소스 -> 정렬별 한도 (수집 순서대로, plan_pages 참고)
+            page_size: API 페이지당 리뷰 수
+
+        Returns:
+            기록했으면 True, 다른 워커가 먼저 완료했으면 False
+        """
+        payload = json.dumps(
+            [{k: v for k, v in review.items() if not k.startswith('_')} for review in reviews],
+            ensure_ascii=False,
+        )
+
+        def steps(cursor):
+            now = time.time()
+            cursor.execute(
+                "UPDATE work SET status = 'done', reviews = ?, lease_owner = NULL, "
+                "lease_expires = NULL, last_error = NULL, updated_at = ? "
+                "WHERE goods_no = ? AND sort_source = ? AND page = ? AND status != 'done'",
+                (payload, now, item.goods_no, item.sort_source, item.page),
+            )
+            if cursor.rowcount == 0:
+                return False
+            pages = {
+                (sort_source, page): (
+                    [review['review_id'] for review in json.loads(stored)] if status == 'done' else None
+                )
+                for sort_source, page, status, stored in cursor.execute(
+                    "SELECT sort_source, page, status, reviews FROM work WHERE goods_no = ?",
+                    (item.goods_no,),
+                ).fetchall()
+            }
+            cursor.executemany(
+                "INSERT OR IGNORE INTO work (goods_no, sort_source, page, list_rank, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (item.goods_no, sort_source, page, item.list_rank, now)
+                    for sort_source, page in plan_pages(pages, limits, page_size)
+                ],
+            )
+            return True
+
+        return self._transaction(steps)
+
+    def fail(self, item: WorkItem, worker_id: str, error: str) -> None:
+        """단위 실패 기록 (시도 횟수가 남았으면 다시 대기 상태로, 임대를 잃었으면 무시)"""
+        def steps(cursor):
+            cursor.execute(
+                "UPDATE work SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ? "
+                "WHERE goods_no = ? AND sort_source = ? AND page = ? "
+                "AND status = 'leased' AND lease_owner = ?",
+                (self.max_attempts, error, time.time(), item.goods_no, item.sort_source, item.page, worker_id),
+            )
+
+        self._transaction(steps)
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 단위 수 (pending, leased, done, failed)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM work GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def active_count(self) -> int:
+        """아직 끝나지 않은 단위 수 (대기 + 임대 중)"""
+        stats = self.stats()
+        return stats.get('pending', 0) + stats.get('leased', 0)
+
+    def seeded_goods(self) -> List[Dict[str, Any]]:
+        """등록된 상품 목록 (goods_no, list_rank), list_rank 순"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT goods_no, MIN(list_rank) AS rank FROM work GROUP BY goods_no ORDER BY rank, goods_no"
+            ).fetchall()
+        return [{'goods_no': goods_no, 'list_rank': rank} for goods_no, rank in rows]
+
+    def get_page(self, goods_no: str, sort_source: str, page: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        완료된 수집 단위의 리뷰 조회 (CrawlJournal.get_page와 같은 인터페이스)
+
+        Returns:
+            파싱된 리뷰 리스트 (완료 기록이 없으면 None, replay_only면 빈 리스트)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reviews FROM work WHERE goods_no = ? AND sort_source = ? AND page = ? "
+                "AND status = 'done'",
+                (goods_no, sort_source, page),
+            ).fetchone()
+        if row:
+            return json.loads(row[0])
+        return [] if self.replay_only else None
+
+    def record_page(
+        self,
+        goods_no: str,
+        sort_source: str,
+        page: int,
+        reviews: List[Dict[str, Any]]
+    ) -> None:
+        """조립 중 직접 수집한 단위 기록 (CrawlJournal.record_page와 같은 인터페이스)"""
+        payload = json.dumps(
+            [{k: v for k, v in review.items() if not k.startswith('_')} for review in reviews],
+            ensure_ascii=False,
+        )
+
+        def steps(cursor):
+            cursor.execute(
+                "INSERT INTO work (goods_no, sort_source, page, status, reviews, updated_at) "
+                "VALUES (?, ?, ?, 'done', ?, ?) "
+                "ON CONFLICT (goods_no, sort_source, page) DO UPDATE SET "
+                "status = 'done', reviews = excluded.reviews, updated_at = excluded.updated_at",
+                (goods_no, sort_source, page, payload, time.time()),
+            )
+
+        self._transaction(steps)
+
+    def close(self) -> None:
+        """연결 정리"""
+        with self._lock:
+            self._conn.close()
+
+
+def default_worker_id() -> str:
+    """호스트명-프로세스 ID 형식의 워커 식별자"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def open_frontier(config: Dict[str, Any], path: Optional[str] = None) -> CrawlFrontier:
+    """
+    설정에 따라 수집 프론티어 열기
+
+    Args:
+        config: 설정 딕셔너리 (frontier 블록 사용)
+        path: SQLite 파일 경로 (기본: frontier.file 또는 raw_dir/crawl_frontier.sqlite)
+
+    Returns:
+        CrawlFrontier 인스턴스
+    """
+    frontier_config = config.get('frontier', {})
+    raw_dir = config.get('output', {}).get('raw_dir', 'data/raw')
+    return CrawlFrontier(
+        path or frontier_config.get('file', os.path.join(raw_dir, 'crawl_frontier.sqlite')),
+        lease_seconds=frontier_config.get('lease_seconds', 300),
+        max_attempts=frontier_config.get('max_attempts', 5),
+        journal_mode=frontier_config.get('journal_mode', 'WAL'),
+    )
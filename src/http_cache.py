@@ -0,0 +1,221 @@
+"""
+HTTP 응답 캐시 모듈
+
+요청 URL과 파라미터/페이로드로 키를 만들어 응답 본문을 gzip 압축해 디스크에 저장합니다.
+TTL이 지난 항목과 용량 상한을 넘는 오래된 항목은 정리합니다.
+replay 모드에서는 네트워크 없이 캐시만으로 수집을 재현합니다.
+"""
+
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+import logging
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """콘텐츠 주소 기반 HTTP 응답 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        replay: bool = False
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+            max_bytes: 캐시 최대 용량 (None이면 제한 없음)
+            replay: True면 만료된 항목도 그대로 사용 (오프라인 재현용)
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.replay = replay
+
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.evict()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """요청 내용으로 캐시 키 생성 (SHA-256)"""
+        key_source = json.dumps(
+            {'method': method.upper(), 'url': url, 'params': params, 'payload': payload},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """캐시 키에 대응하는 파일 경로"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def _is_expired(self, mtime: float) -> bool:
+        """TTL 만료 여부"""
+        if self.replay or not self.ttl_seconds:
+            return False
+        return time.time() - mtime > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 본문 조회
+
+        Returns:
+            응답 본문 문자열 (없거나 만료되면 None)
+        """
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if self._is_expired(stat.st_mtime):
+            self._remove(path, stat.st_size)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"손상된 캐시 항목 제거: {path} ({e})")
+            self._remove(path, stat.st_size)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry['body']
+
+    def put(self, key: str, url: str, body: str) -> None:
+        """응답 본문 저장 (임시 파일 교체 방식)"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        entry = {'url': url, 'fetched_at': time.time(), 'body': body}
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes += os.path.getsize(path) - old_size
+            over_limit = self.max_bytes is not None and self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self.evict()
+
+    def _remove(self, path: str, size: int) -> None:
+        """캐시 파일 삭제"""
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes -= size
+
+    @staticmethod
+    def _unlink(path: str) -> int:
+        """파일 삭제 (다른 스레드가 먼저 지운 경우 무시), 삭제 수 반환"""
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+    def evict(self) -> int:
+        """
+        만료 항목 삭제 후 용량 상한을 넘으면 오래된 항목부터 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        entries: List[Tuple[float, int, str]] = []
+        removed = 0
+
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.tmp'):
+                    # 다른 스레드가 기록 중인 임시 파일
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if self._is_expired(stat.st_mtime):
+                    removed += self._unlink(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        if self.max_bytes is not None and total > self.max_bytes:
+            # 용량 상한의 90%까지 오래된 순으로 삭제
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                removed += self._unlink(path)
+                total -= size
+
+        with self._lock:
+            self._total_bytes = total
+
+        if removed:
+            logger.info(f"응답 캐시 정리: {removed}개 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+
+def get_response_cache(config: Dict[str, Any]) -> Optional[ResponseCache]:
+    """
+    설정에 따라 응답 캐시 생성
+
+    Args:
+        config: 설정 딕셔너리 (cache 블록 사용)
+
+    Returns:
+        ResponseCache 인스턴스 (캐시 비활성 시 None)
+    """
+    cache_config = config.get('cache', {})
+    replay = cache_config.get('replay', False)
+
+    if not (cache_config.get('enabled', False) or replay):
+        return None
+
+    ttl_hours = cache_config.get('ttl_hours')
+    max_size_mb = cache_config.get('max_size_mb')
+
+    return ResponseCache(
+        cache_dir=cache_config.get('dir', 'data/cache/http'),
+        ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+        max_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+        replay=replay,
+    )
@@ -2,18 +2,32 @@
 데이터 저장 모듈
 
 수집된 데이터를 raw/processed 형식으로 저장합니다.
+output.dataset이 켜져 있으면 리뷰 Parquet는 reviews.parquet 단일 파일 대신
+crawl_date/category 파티션 데이터셋(dataset.py)에 실행마다 파일을 추가합니다.
 """
 
 import os
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Set, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .catalog import get_categories
+from .dataset import ReviewDataset, get_review_dataset, new_run_id
+from .schema import stage_schema, to_table, read_stage, write_stage, writer_options, get_write_profile
 
 logger = logging.getLogger(__name__)
 
+# 수집 리뷰 Parquet 스키마 (스트리밍 저장 시 row group 간 타입 고정, 컬럼 타입은 schema.py 레지스트리)
+REVIEW_SCHEMA = stage_schema('reviews')
+
+# 상품 간 반복 리뷰 참조 행 스키마 (본문 없이 중복 통합에 필요한 필드만)
+REVIEW_REF_SCHEMA = stage_schema('refs')
+
 
 class DataIO:
     """데이터 입출력 관리자"""
@@ -36,6 +50,13 @@ class DataIO:
             os.makedirs(dir_path, exist_ok=True)
         
         self.date_str = datetime.now().strftime('%Y%m%d')
+        self.row_group_size = output_config.get('parquet_row_group_size', 10000)
+        self.parquet_profile = get_write_profile(config, 'reviews')
+        
+        # 파티션 데이터셋 (None이면 reviews.parquet 단일 파일)
+        self.dataset: Optional[ReviewDataset] = get_review_dataset(config)
+        self.crawl_date = datetime.now().strftime('%Y-%m-%d')
+        self.category = get_categories(config)[0]['name']
     
     def save_products_jsonl(
         self, 
@@ -103,18 +124,31 @@ class DataIO:
         """
         리뷰를 Parquet으로 저장 (분석용)
         
+        데이터셋 모드에서는 오늘 파티션의 이전 전체 수집 파일을 대체하는 새 파일로 커밋합니다.
+        
         Args:
             reviews: 리뷰 정보 리스트
-            filename: 파일명 (기본: reviews.parquet)
+            filename: 파일명 (기본: reviews.parquet, 데이터셋 모드에서 지정하면 단일 파일로 저장)
             
         Returns:
             저장된 파일 경로
         """
+        if filename is None and self.dataset is not None:
+            return self._write_dataset_part(self._reviews_to_dataframe(reviews), mode='full')
+        
         if filename is None:
             filename = "reviews.parquet"
         
         filepath = os.path.join(self.processed_dir, filename)
         
+        df = self._reviews_to_dataframe(reviews)
+        write_stage(df, filepath, profile=self.parquet_profile)
+        
+        logger.info(f"리뷰 Parquet 저장: {filepath} ({len(reviews)}개)")
+        return filepath
+    
+    def _reviews_to_dataframe(self, reviews: List[Dict[str, Any]]) -> pd.DataFrame:
+        """리뷰 리스트를 저장용 DataFrame으로 변환 (내부 필드 제외, 타입 정리)"""
         # 저장용 데이터 정리
         clean_reviews = []
         for review in reviews:
@@ -123,23 +157,254 @@ class DataIO:
         
         df = pd.DataFrame(clean_reviews)
         
-        # 데이터 타입 정리
+        # 값 정리 (저장 타입은 REVIEW_SCHEMA / schema.py 레지스트리에서 적용)
         if 'rating' in df.columns:
             df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
-        if 'helpful_count' in df.columns:
-            df['helpful_count'] = pd.to_numeric(df['helpful_count'], errors='coerce').fillna(0).astype(int)
-        if 'image_count' in df.columns:
-            df['image_count'] = pd.to_numeric(df['image_count'], errors='coerce').fillna(0).astype(int)
-        if 'is_trial' in df.columns:
-            df['is_trial'] = df['is_trial'].astype(int)
-        if 'is_low_info' in df.columns:
-            df['is_low_info'] = df['is_low_info'].astype(int)
+        for col in ('helpful_count', 'image_count'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
         
-        df.to_parquet(filepath, index=False, engine='pyarrow')
+        return df
+    
+    def _reviews_to_table(self, df: pd.DataFrame) -> pa.Table:
+        """저장용 DataFrame을 REVIEW_SCHEMA 테이블로 변환 (없는 컬럼은 null, 스키마 밖 컬럼 제외)"""
+        df = df.copy()
+        for col in REVIEW_SCHEMA.names:
+            if col not in df.columns:
+                df[col] = pd.Series([None] * len(df), dtype=object)
+        return to_table(df[REVIEW_SCHEMA.names])
+    
+    def _write_dataset_part(self, df: pd.DataFrame, mode: str) -> str:
+        """
+        리뷰를 오늘/현재 카테고리 파티션에 새 파일로 쓰고 커밋
         
-        logger.info(f"리뷰 Parquet 저장: {filepath} ({len(reviews)}개)")
+        Args:
+            df: 저장용 리뷰 DataFrame
+            mode: full (같은 파티션의 이전 전체 수집 대체) 또는 delta (추가)
+            
+        Returns:
+            저장된 파일 경로
+        """
+        path = self.dataset.part_path('reviews', self.crawl_date, self.category, new_run_id())
+        tmp_path = f"{path}.tmp"
+        pq.write_table(
+            self._reviews_to_table(df), tmp_path,
+            row_group_size=self.row_group_size, **writer_options(self.parquet_profile)
+        )
+        os.replace(tmp_path, path)
+        
+        self.dataset.commit([{
+            'kind': 'reviews', 'path': path, 'crawl_date': self.crawl_date,
+            'category': self.category, 'rows': len(df), 'mode': mode,
+        }], replace=(mode == 'full'))
+        logger.info(f"리뷰 Parquet 저장: {path} ({len(df)}개, {mode})")
+        return path
+    
+    def _latest_file(self, directory: str, prefix: str, suffix: str) -> Optional[str]:
+        """접두사/확장자가 일치하는 가장 최근 파일명 반환"""
+        files = [f for f in os.listdir(directory) if f.startswith(prefix) and f.endswith(suffix)]
+        if not files:
+            return None
+        return sorted(files)[-1]
+    
+    def append_reviews_jsonl(
+        self,
+        reviews: List[Dict[str, Any]],
+        filename: Optional[str] = None
+    ) -> str:
+        """
+        신규 리뷰를 기존 JSONL 파일 끝에 추가 (증분 수집용, 이미 있는 review_id/goods_no 조합은 제외)
+        
+        재개된 수집이 저널의 리뷰를 다시 넘겨도 같은 리뷰가 두 번 쌓이지 않도록,
+        파일에 이미 기록된 키를 읽어 append_reviews_parquet와 같은 기준으로 거릅니다.
+        
+        Args:
+            reviews: 신규 리뷰 리스트
+            filename: 파일명 (기본: 가장 최근 reviews_*.jsonl, 없으면 오늘 날짜 파일)
+            
+        Returns:
+            저장된 파일 경로
+        """
+        if filename is None:
+            filename = self._latest_file(self.raw_dir, 'reviews_', '.jsonl') or f"reviews_{self.date_str}.jsonl"
+        
+        filepath = os.path.join(self.raw_dir, filename)
+        existing_keys = self._jsonl_review_keys(filepath)
+        
+        added = 0
+        with open(filepath, 'a', encoding='utf-8') as f:
+            for review in reviews:
+                key = (str(review.get('review_id')), str(review.get('goods_no')))
+                if key in existing_keys:
+                    continue
+                existing_keys.add(key)
+                save_data = {k: v for k, v in review.items() if not k.startswith('_')}
+                f.write(json.dumps(save_data, ensure_ascii=False) + '\n')
+                added += 1
+        
+        logger.info(f"리뷰 추가 저장: {filepath} (+{added}개, 중복 {len(reviews) - added}개 제외)")
+        return filepath
+    
+    @staticmethod
+    def _jsonl_review_keys(filepath: str) -> Set[Tuple[str, str]]:
+        """JSONL에 이미 기록된 (review_id, goods_no) 조합 (파일이 없으면 빈 집합)"""
+        keys: Set[Tuple[str, str]] = set()
+        if not os.path.exists(filepath):
+            return keys
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                review = json.loads(line)
+                keys.add((str(review.get('review_id')), str(review.get('goods_no'))))
+        return keys
+    
+    def append_reviews_parquet(
+        self,
+        reviews: List[Dict[str, Any]],
+        filename: Optional[str] = None
+    ) -> str:
+        """
+        신규 리뷰를 기존 Parquet에 추가 (이미 있는 review_id/goods_no 조합은 제외)
+        
+        데이터셋 모드에서는 기존 파일을 다시 쓰지 않고, 현재 카테고리의 (review_id, goods_no)
+        두 컬럼만 읽어 제외한 뒤 신규 리뷰만 새 파일로 추가합니다.
+        
+        Args:
+            reviews: 신규 리뷰 리스트
+            filename: 파일명 (기본: reviews.parquet)
+            
+        Returns:
+            저장된 파일 경로
+        """
+        if filename is None and self.dataset is not None:
+            if not reviews:
+                return self.dataset.root
+            new_df = self._reviews_to_dataframe(reviews)
+            existing = self.dataset.read('reviews', ['review_id', 'goods_no'], categories=[self.category])
+            if not existing.empty:
+                existing_keys = set(zip(existing['review_id'].astype(str), existing['goods_no'].astype(str)))
+                is_new = [
+                    (str(rid), str(gno)) not in existing_keys
+                    for rid, gno in zip(new_df['review_id'], new_df['goods_no'])
+                ]
+                new_df = new_df[is_new]
+            if new_df.empty:
+                logger.info("데이터셋에 추가할 신규 리뷰 없음")
+                return self.dataset.root
+            return self._write_dataset_part(new_df, mode='delta')
+        
+        if filename is None:
+            filename = "reviews.parquet"
+        
+        filepath = os.path.join(self.processed_dir, filename)
+        
+        if not os.path.exists(filepath):
+            return self.save_reviews_parquet(reviews, filename)
+        
+        if not reviews:
+            return filepath
+        
+        existing_df = read_stage(filepath)
+        new_df = self._reviews_to_dataframe(reviews)
+        
+        # 이미 저장된 리뷰 제외
+        existing_keys = set(zip(existing_df['review_id'].astype(str), existing_df['goods_no'].astype(str)))
+        is_new = [
+            (str(rid), str(gno)) not in existing_keys
+            for rid, gno in zip(new_df['review_id'], new_df['goods_no'])
+        ]
+        new_df = new_df[is_new]
+        
+        df = pd.concat([existing_df, new_df], ignore_index=True)
+        write_stage(df, filepath, profile=self.parquet_profile)
+        
+        logger.info(f"리뷰 Parquet 추가 저장: {filepath} (+{len(new_df)}개, 총 {len(df)}개)")
         return filepath
     
+    def open_review_stream(
+        self,
+        jsonl_filename: Optional[str] = None,
+        parquet_filename: Optional[str] = None
+    ) -> 'ReviewStreamWriter':
+        """
+        리뷰 스트리밍 저장기 열기
+        
+        Args:
+            jsonl_filename: JSONL 파일명 (기본: reviews_YYYYMMDD.jsonl)
+            parquet_filename: Parquet 파일명 (기본: reviews.parquet, 데이터셋 모드면 오늘 파티션의 새 파일)
+            
+        Returns:
+            ReviewStreamWriter 인스턴스
+        """
+        jsonl_path = os.path.join(self.raw_dir, jsonl_filename or f"reviews_{self.date_str}.jsonl")
+        
+        if parquet_filename is None and self.dataset is not None:
+            run_id = new_run_id()
+            return ReviewStreamWriter(
+                self, jsonl_path,
+                self.dataset.part_path('reviews', self.crawl_date, self.category, run_id),
+                self.row_group_size,
+                refs_path=self.dataset.part_path('refs', self.crawl_date, self.category, run_id),
+                dataset=self.dataset,
+            )
+        
+        parquet_path = os.path.join(self.processed_dir, parquet_filename or "reviews.parquet")
+        return ReviewStreamWriter(self, jsonl_path, parquet_path, self.row_group_size)
+    
+    def save_reviews_stream(self, reviews: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, str], int]:
+        """
+        리뷰 스트림을 JSONL/Parquet로 점진 저장
+        
+        Args:
+            reviews: 리뷰 이터러블 (제너레이터 가능)
+            
+        Returns:
+            (저장된 파일 경로 딕셔너리, 저장된 리뷰 수)
+        """
+        with self.open_review_stream() as writer:
+            for review in reviews:
+                writer.write(review)
+        
+        return writer.paths, writer.count
+    
+    def load_reviews_parquet(
+        self,
+        filename: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        리뷰 Parquet 로드
+        
+        Args:
+            filename: processed_dir 기준 파일명 또는 저장 시 돌려받은 경로 (절대 경로나 존재하는 경로는 그대로 사용,
+                기본: reviews.parquet, 데이터셋 모드면 현재 카테고리의 전체 파티션)
+            columns: 읽을 컬럼 (기본: 전체)
+            
+        Returns:
+            리뷰 DataFrame (파일 없으면 빈 DataFrame)
+        """
+        if filename is None and self.dataset is not None:
+            return self.dataset.read('reviews', columns, categories=[self.category])
+        
+        filename = filename or "reviews.parquet"
+        if os.path.isabs(filename) or os.path.exists(filename):
+            # 저장 함수가 돌려준 경로는 이미 processed_dir을 포함
+            filepath = filename
+        else:
+            filepath = os.path.join(self.processed_dir, filename)
+        
+        if not os.path.exists(filepath):
+            return pd.DataFrame()
+        
+        if columns is not None:
+            available = set(pq.read_schema(filepath).names)
+            columns = [c for c in columns if c in available]
+        
+        return read_stage(filepath, columns=columns)
+    
     def load_products_jsonl(self, filename: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         상품 카탈로그 JSONL 로드
@@ -152,10 +417,9 @@ class DataIO:
         """
         if filename is None:
             # 가장 최근 파일 찾기
-            files = [f for f in os.listdir(self.raw_dir) if f.startswith('products_') and f.endswith('.jsonl')]
-            if not files:
+            filename = self._latest_file(self.raw_dir, 'products_', '.jsonl')
+            if filename is None:
                 return []
-            filename = sorted(files)[-1]
         
         filepath = os.path.join(self.raw_dir, filename)
         
@@ -183,10 +447,9 @@ class DataIO:
         """
         if filename is None:
             # 가장 최근 파일 찾기
-            files = [f for f in os.listdir(self.raw_dir) if f.startswith('reviews_') and f.endswith('.jsonl')]
-            if not files:
+            filename = self._latest_file(self.raw_dir, 'reviews_', '.jsonl')
+            if filename is None:
                 return []
-            filename = sorted(files)[-1]
         
         filepath = os.path.join(self.raw_dir, filename)
         
@@ -203,6 +466,160 @@ class DataIO:
         return reviews
 
 
+class ReviewStreamWriter:
+    """
+    리뷰 스트리밍 저장기
+    
+    리뷰를 받는 즉시 JSONL에 한 줄씩 쓰고, Parquet는 row_group_size개씩 모아
+    row group 단위로 기록합니다. JSONL과 Parquet 모두 임시 파일에 쓴 뒤 정상 종료 시
+    교체하므로, 중단되더라도 같은 날의 기존 JSONL과 reviews.parquet는 그대로 남습니다.
+    데이터셋 모드에서는 교체 대신 새 파티션 파일을 매니페스트에 커밋합니다.
+    
+    상품 간 반복 리뷰의 참조 행(write_ref)은 review_refs.parquet에 따로 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        io: DataIO,
+        jsonl_path: str,
+        parquet_path: str,
+        row_group_size: int = 10000,
+        refs_path: Optional[str] = None,
+        dataset: Optional[ReviewDataset] = None
+    ):
+        """
+        Args:
+            io: DataIO 인스턴스 (DataFrame 변환 규칙 공유)
+            jsonl_path: JSONL 저장 경로
+            parquet_path: Parquet 저장 경로
+            row_group_size: Parquet row group 크기
+            refs_path: 참조 행 Parquet 저장 경로 (기본: parquet_path와 같은 디렉토리의 review_refs.parquet)
+            dataset: 지정하면 종료 시 두 파일을 데이터셋 전체 수집(full) 파일로 커밋
+        """
+        self.io = io
+        self.jsonl_path = jsonl_path
+        self.parquet_path = parquet_path
+        self.refs_path = refs_path or os.path.join(os.path.dirname(parquet_path), 'review_refs.parquet')
+        self.row_group_size = row_group_size
+        self.dataset = dataset
+        
+        self.count = 0
+        self.ref_count = 0
+        self.paths: Dict[str, str] = {}
+        self._buffer: List[Dict[str, Any]] = []
+        self._ref_buffer: List[Dict[str, Any]] = []
+        self._tmp_parquet_path = f"{parquet_path}.tmp"
+        self._tmp_refs_path = f"{self.refs_path}.tmp"
+        self._tmp_jsonl_path = f"{jsonl_path}.tmp"
+        self._jsonl = open(self._tmp_jsonl_path, 'w', encoding='utf-8')
+        self._writer = pq.ParquetWriter(
+            self._tmp_parquet_path, REVIEW_SCHEMA, **writer_options(io.parquet_profile)
+        )
+        self._ref_writer: Optional[pq.ParquetWriter] = None
+        self._extra_columns_warned = False
+    
+    def __enter__(self) -> 'ReviewStreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(success=exc_type is None)
+    
+    def write(self, review: Dict[str, Any]) -> None:
+        """리뷰 1건 기록 (내부 필드 제외)"""
+        save_data = {k: v for k, v in review.items() if not k.startswith('_')}
+        self._jsonl.write(json.dumps(save_data, ensure_ascii=False) + '\n')
+        self._buffer.append(save_data)
+        self.count += 1
+        
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+    
+    def write_ref(self, ref: Dict[str, Any]) -> None:
+        """반복 리뷰 참조 행 1건 기록"""
+        self._ref_buffer.append(ref)
+        self.ref_count += 1
+        
+        if len(self._ref_buffer) >= self.row_group_size:
+            self._flush_refs()
+    
+    def _flush_refs(self) -> None:
+        """참조 행 버퍼를 Parquet row group으로 기록 (첫 기록 시 파일 생성)"""
+        if not self._ref_buffer:
+            return
+        
+        table = pa.Table.from_pylist(self._ref_buffer, schema=REVIEW_REF_SCHEMA)
+        self._ref_buffer = []
+        
+        if self._ref_writer is None:
+            self._ref_writer = pq.ParquetWriter(
+                self._tmp_refs_path, REVIEW_REF_SCHEMA, **writer_options(self.io.parquet_profile)
+            )
+        self._ref_writer.write_table(table)
+    
+    def _flush(self) -> None:
+        """버퍼를 Parquet row group으로 기록"""
+        if not self._buffer:
+            return
+        
+        df = self.io._reviews_to_dataframe(self._buffer)
+        self._buffer = []
+        
+        extra = [c for c in df.columns if c not in REVIEW_SCHEMA.names]
+        if extra and not self._extra_columns_warned:
+            logger.warning(f"스키마에 없는 컬럼은 Parquet에서 제외: {extra}")
+            self._extra_columns_warned = True
+        
+        self._writer.write_table(self.io._reviews_to_table(df))
+        self._jsonl.flush()
+    
+    def close(self, success: bool = True) -> None:
+        """
+        남은 버퍼 기록 후 파일 정리
+        
+        Args:
+            success: False면 JSONL/Parquet 임시 파일을 버리고 기존 파일 유지
+        """
+        if success:
+            self._flush()
+            self._flush_refs()
+        self._writer.close()
+        self._jsonl.close()
+        if self._ref_writer is not None:
+            self._ref_writer.close()
+        
+        if not (success and self.count > 0):
+            os.remove(self._tmp_parquet_path)
+            os.remove(self._tmp_jsonl_path)
+            if self._ref_writer is not None:
+                os.remove(self._tmp_refs_path)
+            return
+        
+        os.replace(self._tmp_jsonl_path, self.jsonl_path)
+        os.replace(self._tmp_parquet_path, self.parquet_path)
+        self.paths = {'reviews_jsonl': self.jsonl_path, 'reviews_parquet': self.parquet_path}
+        logger.info(f"리뷰 저장: {self.jsonl_path} ({self.count}개)")
+        logger.info(f"리뷰 Parquet 저장: {self.parquet_path} ({self.count}개)")
+        
+        if self._ref_writer is not None:
+            os.replace(self._tmp_refs_path, self.refs_path)
+            self.paths['review_refs_parquet'] = self.refs_path
+            logger.info(f"반복 리뷰 참조 저장: {self.refs_path} ({self.ref_count}개)")
+        elif self.dataset is None and os.path.exists(self.refs_path):
+            # 이번 실행에 참조 행이 없으면 이전 실행의 참조 파일이 섞이지 않도록 제거
+            os.remove(self.refs_path)
+        
+        if self.dataset is not None:
+            self._commit()
+    
+    def _commit(self) -> None:
+        """리뷰/참조 파일을 데이터셋에 전체 수집(full)으로 커밋 (같은 파티션의 이전 전체 수집 대체)"""
+        partition = {'crawl_date': self.io.crawl_date, 'category': self.io.category, 'mode': 'full'}
+        files = [{'kind': 'reviews', 'path': self.parquet_path, 'rows': self.count, **partition}]
+        if self._ref_writer is not None:
+            files.append({'kind': 'refs', 'path': self.refs_path, 'rows': self.ref_count, **partition})
+        self.dataset.commit(files, replace=True)
+
+
 def save_data(
     config: Dict[str, Any],
     products: Optional[List[Dict[str, Any]]] = None,
@@ -230,3 +647,42 @@ def save_data(
         paths['reviews_parquet'] = io.save_reviews_parquet(reviews)
     
     return paths
+
+
+def save_review_stream(
+    config: Dict[str, Any],
+    reviews: Iterable[Dict[str, Any]]
+) -> Tuple[Dict[str, str], int]:
+    """
+    리뷰 스트리밍 저장 헬퍼 함수
+    
+    Args:
+        config: 설정 딕셔너리
+        reviews: 리뷰 이터러블 (제너레이터 가능)
+        
+    Returns:
+        (저장된 파일 경로 딕셔너리, 저장된 리뷰 수)
+    """
+    io = DataIO(config)
+    return io.save_reviews_stream(reviews)
+
+
+def append_data(
+    config: Dict[str, Any],
+    reviews: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    증분 수집 결과 추가 저장 헬퍼 함수
+    
+    Args:
+        config: 설정 딕셔너리
+        reviews: 신규 리뷰 리스트
+        
+    Returns:
+        저장된 파일 경로 딕셔너리
+    """
+    io = DataIO(config)
+    return {
+        'reviews_jsonl': io.append_reviews_jsonl(reviews),
+        'reviews_parquet': io.append_reviews_parquet(reviews),
+    }
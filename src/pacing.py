@@ -0,0 +1,233 @@
+"""
+적응형 요청 속도 조절 모듈
+
+응답 지연과 오류 신호로 호스트별 요청 속도를 AIMD 방식으로 조절합니다.
+정상 응답이 이어지면 속도를 조금씩(가산) 올리고, 429/5xx/네트워크 오류나
+지연 급증이 나타나면 속도를 비율로(승산) 낮춥니다. 학습된 속도는 파일에
+저장되어 다음 실행이 그 속도에서 시작합니다.
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 상태 파일을 여러 제어기가 공유하므로 파일 단위 잠금
+_STATE_LOCK = threading.Lock()
+
+
+class AdaptivePacer:
+    """AIMD 요청 속도 제어기 (스레드 안전, TokenBucket과 같은 acquire 인터페이스)"""
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 0.2,
+        max_rate: float = 5.0,
+        additive_increase: float = 0.05,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        state_path: Optional[str] = None,
+        state_key: str = ''
+    ):
+        """
+        Args:
+            rate: 시작 초당 요청 수 (저장된 상태가 있으면 그 값 사용)
+            min_rate: 최소 초당 요청 수
+            max_rate: 최대 초당 요청 수
+            additive_increase: 정상 응답이 이어질 때 1초마다 늘리는 초당 요청 수
+            decrease_factor: 오류/지연 급증 시 속도에 곱하는 계수 (0~1)
+            latency_spike_factor: 평균 지연의 몇 배를 넘으면 지연 급증으로 볼지
+            state_path: 상태 저장 파일 경로 (None이면 저장 안 함)
+            state_key: 상태 파일 내 키 (호스트명)
+        """
+        if not 0 < min_rate <= max_rate:
+            raise ValueError(f"0 < min_rate <= max_rate 이어야 합니다: {min_rate}, {max_rate}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor는 0과 1 사이여야 합니다: {decrease_factor}")
+
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.additive_increase = float(additive_increase)
+        self.decrease_factor = float(decrease_factor)
+        self.latency_spike_factor = float(latency_spike_factor)
+        self.state_path = state_path
+        self.state_key = state_key
+
+        self.rate = float(rate)
+        self.latency_avg: Optional[float] = None  # 정상 응답 지연의 지수 이동 평균 (초)
+
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._last_saved = time.monotonic()
+
+        # 신호별 집계 (리포트/로그용)
+        self.increases = 0
+        self.decreases = 0
+
+        self._load_state()
+        self.rate = min(self.max_rate, max(self.min_rate, self.rate))
+
+    def _load_state(self) -> None:
+        """저장된 속도/지연 평균 로드"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = (json.load(f) or {}).get(self.state_key)
+        except (OSError, ValueError) as e:
+            logger.warning(f"속도 상태 파일 로드 실패, 기본값 사용: {e}")
+            return
+
+        if state:
+            self.rate = float(state.get('rate', self.rate))
+            self.latency_avg = state.get('latency_avg')
+            logger.info(f"저장된 요청 속도에서 시작: {self.state_key} ({self.rate:.2f} req/s)")
+
+    def acquire(self) -> float:
+        """
+        다음 요청 시점까지 대기
+
+        현재 속도의 요청 간격(1/rate)으로 시점을 예약하고 잠금 밖에서 대기하므로,
+        동시에 호출한 스레드들은 도착 순서대로 간격을 두고 통과합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot, self._blocked_until)
+            self._next_slot = start + 1.0 / self.rate
+            wait = start - now
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(
+        self,
+        latency: float,
+        status: Optional[int],
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        응답 결과를 반영하여 속도 조절
+
+        Args:
+            latency: 요청 소요 시간 (초)
+            status: HTTP 상태 코드 (네트워크 오류/타임아웃이면 None)
+            retry_after: 서버가 지정한 재시도 대기 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            error = status is None or status == 429 or status >= 500
+            spike = (
+                not error
+                and self.latency_avg is not None
+                and latency > self.latency_avg * self.latency_spike_factor
+            )
+
+            if error or spike:
+                # 이미 보낸 요청들의 응답으로 연달아 줄이지 않도록 한 주기에 한 번만 감소
+                cooldown = max(1.0 / self.rate, self.latency_avg or 0.0)
+                if self.rate > self.min_rate and now - self._last_decrease >= cooldown:
+                    old_rate = self.rate
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                    self._next_slot = max(self._next_slot, now + 1.0 / self.rate)
+                    self._last_decrease = now
+                    self.decreases += 1
+                    reason = '지연 급증' if spike else (f"HTTP {status}" if status else '네트워크 오류')
+                    logger.info(f"요청 속도 감소 ({reason}): {old_rate:.2f} -> {self.rate:.2f} req/s")
+            elif status < 400:
+                # 초당 additive_increase씩 오르도록 요청 1회당 increase / rate 만큼 증가
+                self.rate = min(self.max_rate, self.rate + self.additive_increase / self.rate)
+                self.increases += 1
+
+            if not error and status is not None and status < 400:
+                self.latency_avg = (
+                    latency if self.latency_avg is None
+                    else 0.8 * self.latency_avg + 0.2 * latency
+                )
+
+            save_due = self.state_path is not None and now - self._last_saved > 30
+            if save_due:
+                self._last_saved = now
+
+        if save_due:
+            self.save()
+
+    def save(self) -> Optional[str]:
+        """
+        현재 속도/지연 평균을 상태 파일에 저장 (다른 호스트 항목은 유지)
+
+        Returns:
+            저장된 파일 경로 (state_path가 없으면 None)
+        """
+        if not self.state_path:
+            return None
+
+        with self._lock:
+            entry = {
+                'rate': round(self.rate, 4),
+                'latency_avg': round(self.latency_avg, 4) if self.latency_avg is not None else None,
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+
+        with _STATE_LOCK:
+            state: Dict[str, Any] = {}
+            if os.path.exists(self.state_path):
+                try:
+                    with open(self.state_path, 'r', encoding='utf-8') as f:
+                        state = json.load(f) or {}
+                except (OSError, ValueError):
+                    state = {}
+            state[self.state_key] = entry
+
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.state_path)
+
+        return self.state_path
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 숫자로 변환 (HTTP 날짜 형식은 무시)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def record_response(limiter: Any, latency: float, response: Any) -> None:
+    """
+    요청 결과를 속도 제한기에 전달
+
+    Args:
+        limiter: TokenBucket 또는 AdaptivePacer
+        latency: 요청 소요 시간 (초)
+        response: requests.Response (네트워크 오류면 None)
+    """
+    if response is None:
+        limiter.record(latency, None)
+        return
+
+    limiter.record(
+        latency,
+        response.status_code,
+        parse_retry_after(response.headers.get('Retry-After')),
+    )
@@ -0,0 +1,242 @@
+"""
+적응형 페이지 예산 모듈
+
+상품/정렬별 고정 수량(sort_limits) 대신, 페이지마다 새로 얻은 정보량을 보고
+다음 페이지를 요청할지 정합니다. 전체 요청 수(request_budget) 안에서 요청당
+서로 다른, 정보량 있는 리뷰 수를 늘리는 것이 목표입니다.
+
+페이지 수익률(yield) = 새 리뷰의 가치 합 / 페이지 리뷰 수
+- 다른 정렬에서 이미 수집한 리뷰(중복): 0
+- is_low_info 리뷰: 0
+- 그 외: 1, 상품 내 비중이 1/3 미만인 평점 구간(부정/중립/긍정)이면 +rating_bonus
+
+정렬별 규칙
+- min_pages까지는 항상 요청
+- 직전 페이지 수익률이 min_yield 미만이면 중단
+- sort_limits 수량을 채운 뒤에도 수익률이 extend_yield 이상이면 max_pages까지 연장
+- 상품별 예산(남은 전체 예산 / 남은 상품 수)을 다 쓰면 중단, 남은 몫은 다음 상품으로 이월
+"""
+
+import threading
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable
+
+from .filters import NoiseFilter
+
+logger = logging.getLogger(__name__)
+
+
+def rating_bucket(rating: Optional[int]) -> Optional[str]:
+    """평점 구간 (1~2: negative, 3: neutral, 4~5: positive)"""
+    if rating is None:
+        return None
+    if rating <= 2:
+        return 'negative'
+    return 'neutral' if rating == 3 else 'positive'
+
+
+class ProductBudget:
+    """단일 상품의 페이지 예산과 정보량 신호"""
+
+    def __init__(self, budget: 'PageBudget', goods_no: str, pages_allowed: float):
+        self.budget = budget
+        self.goods_no = goods_no
+        self.pages_allowed = pages_allowed
+        self.pages_used = 0
+
+        # 신호: 정렬 간 중복률, 저정보 비율, 평점 분포
+        self.reviews_seen = 0
+        self.duplicates = 0
+        self.low_info = 0
+        self.informative = 0
+        self.ratings: Counter = Counter()
+        self.last_yield: Dict[str, float] = {}
+
+    def allow_page(self, sort_source: str, page: int, collected: int, limit: int) -> bool:
+        """
+        다음 페이지 요청 여부
+
+        Args:
+            sort_source: 정렬 소스
+            page: 요청할 페이지 번호 (0부터)
+            collected: 이 정렬에서 새로 수집한 리뷰 수
+            limit: 이 정렬의 기본 수량 (sort_limits)
+        """
+        if self.pages_used >= self.pages_allowed:
+            return False
+        if page < self.budget.min_pages:
+            return True
+        if page >= self.budget.max_pages:
+            return False
+
+        last_yield = self.last_yield.get(sort_source, 1.0)
+        if last_yield < self.budget.min_yield:
+            return False
+        if collected < limit:
+            return True
+        return last_yield >= self.budget.extend_yield
+
+    def observe_page(
+        self,
+        sort_source: str,
+        page_reviews: List[Dict[str, Any]],
+        new_reviews: List[Dict[str, Any]],
+        fetched: bool = True
+    ) -> float:
+        """
+        요청한 페이지 결과 반영
+
+        Args:
+            sort_source: 정렬 소스
+            page_reviews: 페이지의 전체 리뷰
+            new_reviews: 그중 이 상품에서 처음 나온 리뷰
+            fetched: False면 저널/캐시에서 재생한 페이지 (신호만 반영하고 예산은 차감하지 않음)
+
+        Returns:
+            페이지 수익률 (0~1+rating_bonus)
+        """
+        if fetched:
+            self.pages_used += 1
+        self.reviews_seen += len(page_reviews)
+        self.duplicates += len(page_reviews) - len(new_reviews)
+
+        value = 0.0
+        for review in new_reviews:
+            bucket = rating_bucket(review.get('rating'))
+            if self.budget.is_low_info(review):
+                self.low_info += 1
+            else:
+                self.informative += 1
+                value += 1.0
+                total = sum(self.ratings.values())
+                if bucket and total and self.ratings[bucket] / total < 1 / 3:
+                    value += self.budget.rating_bonus
+            if bucket:
+                self.ratings[bucket] += 1
+
+        page_yield = value / len(page_reviews) if page_reviews else 0.0
+        self.last_yield[sort_source] = page_yield
+        return page_yield
+
+    def signals(self) -> Dict[str, Any]:
+        """상품 정보량 신호 요약"""
+        new = self.reviews_seen - self.duplicates
+        return {
+            'pages': self.pages_used,
+            'dup_rate': self.duplicates / self.reviews_seen if self.reviews_seen else 0.0,
+            'low_info_share': self.low_info / new if new else 0.0,
+            'rating_buckets': len(self.ratings),
+            'informative': self.informative,
+        }
+
+
+class PageBudget:
+    """전체 요청 예산을 상품에 나눠 주는 적응형 페이지 예산 (스레드 안전)"""
+
+    def __init__(
+        self,
+        request_budget: Optional[int],
+        is_low_info: Callable[[Dict[str, Any]], int],
+        min_pages: int = 1,
+        max_pages: int = 10,
+        min_yield: float = 0.3,
+        extend_yield: float = 0.7,
+        rating_bonus: float = 0.5
+    ):
+        """
+        Args:
+            request_budget: 전체 리뷰 페이지 요청 수 (None이면 상품별 제한 없음)
+            is_low_info: 리뷰 저정보 판정 함수 (NoiseFilter.tag_low_info)
+            min_pages: 정렬별 최소 페이지 수
+            max_pages: 정렬별 최대 페이지 수 (연장 포함)
+            min_yield: 이보다 수익률이 낮으면 정렬 중단
+            extend_yield: 기본 수량을 채운 뒤 이 이상이면 연장
+            rating_bonus: 상품 내 드문 평점 구간 리뷰의 추가 가치
+        """
+        self.request_budget = request_budget
+        self.is_low_info = is_low_info
+        self.min_pages = min_pages
+        self.max_pages = max_pages
+        self.min_yield = min_yield
+        self.extend_yield = extend_yield
+        self.rating_bonus = rating_bonus
+
+        self._lock = threading.Lock()
+        self._remaining_pages = float(request_budget or 0)
+        self._remaining_products = 0
+
+        self.pages_used = 0
+        self.informative = 0
+        self.reviews_new = 0
+        self.products = 0
+
+    def start(self, product_count: int) -> None:
+        """수집 대상 상품 수 설정 (상품별 몫 계산 기준)"""
+        with self._lock:
+            self._remaining_products = product_count
+
+    def open_product(self, goods_no: str) -> ProductBudget:
+        """상품 예산 할당 (남은 예산 / 남은 상품 수)"""
+        if not self.request_budget:
+            return ProductBudget(self, goods_no, float('inf'))
+
+        with self._lock:
+            share = self._remaining_pages / max(1, self._remaining_products)
+            self._remaining_products = max(0, self._remaining_products - 1)
+            self._remaining_pages -= share
+        return ProductBudget(self, goods_no, share)
+
+    def close_product(self, product: ProductBudget) -> None:
+        """상품 수집 종료 (쓰지 않은 몫은 다음 상품으로 이월)"""
+        signals = product.signals()
+        with self._lock:
+            if self.request_budget:
+                self._remaining_pages += product.pages_allowed - product.pages_used
+            self.pages_used += product.pages_used
+            self.informative += product.informative
+            self.reviews_new += product.reviews_seen - product.duplicates
+            self.products += 1
+
+        logger.debug(
+            f"상품 {product.goods_no} 페이지 예산: {signals['pages']}페이지, "
+            f"중복률 {signals['dup_rate']:.0%}, 저정보 {signals['low_info_share']:.0%}, "
+            f"평점 구간 {signals['rating_buckets']}개"
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """예산 사용 요약"""
+        with self._lock:
+            return {
+                'products': self.products,
+                'pages_used': self.pages_used,
+                'request_budget': self.request_budget,
+                'reviews_new': self.reviews_new,
+                'informative': self.informative,
+                'informative_per_request': self.informative / self.pages_used if self.pages_used else 0.0,
+            }
+
+
+def get_page_budget(config: Dict[str, Any]) -> Optional[PageBudget]:
+    """
+    설정에 따라 적응형 페이지 예산 생성
+
+    Args:
+        config: 설정 딕셔너리 (reviews.adaptive_budget 블록 사용)
+
+    Returns:
+        PageBudget 인스턴스 (비활성 시 None)
+    """
+    budget_config = config.get('reviews', {}).get('adaptive_budget', {})
+    if not budget_config.get('enabled', False):
+        return None
+
+    return PageBudget(
+        budget_config.get('request_budget'),
+        NoiseFilter(config).tag_low_info,
+        min_pages=budget_config.get('min_pages', 1),
+        max_pages=budget_config.get('max_pages', 10),
+        min_yield=budget_config.get('min_yield', 0.3),
+        extend_yield=budget_config.get('extend_yield', 0.7),
+        rating_bonus=budget_config.get('rating_bonus', 0.5),
+    )
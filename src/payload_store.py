@@ -0,0 +1,286 @@
+"""
+리뷰 원본 페이로드 저장소 모듈
+
+API 원본 리뷰 데이터(_raw)를 review_id 기준으로 압축해 append-only 파일에
+기록합니다. 수집기는 파싱 직후 원본을 저장소로 넘기고 메모리에서 해제하며,
+이후 단계에서는 재수집 없이 review_id로 원본 필드를 조회할 수 있습니다.
+
+레코드 형식 (빅엔디언):
+    [review_id 길이 (2바이트)][review_id][본문 길이 (4바이트)][zlib 압축 JSON 본문]
+
+인덱스는 파일을 열 때 헤더만 훑어 구성하므로 본문은 압축 해제하지 않습니다.
+zstd 등 추가 의존성 없이 표준 라이브러리 zlib만 사용합니다.
+"""
+
+import os
+import glob
+import json
+import zlib
+import struct
+import threading
+import logging
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+_ID_HEADER = struct.Struct('>H')
+_BODY_HEADER = struct.Struct('>I')
+
+
+class PayloadStore:
+    """review_id 인덱스를 가진 압축 원본 페이로드 저장소 (append-only, 스레드 안전)"""
+
+    def __init__(self, path: str, compress_level: int = 6):
+        """
+        Args:
+            path: 저장소 파일 경로
+            compress_level: zlib 압축 레벨 (1~9)
+        """
+        self.path = path
+        self.compress_level = compress_level
+
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, int] = {}  # review_id -> 본문 길이 헤더 오프셋
+        self._writer = None
+        self._reader = None
+        self.written = 0  # 이번 실행에서 새로 기록한 페이로드 수
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if os.path.exists(path):
+            self._load_index()
+            logger.info(f"원본 페이로드 저장소 로드: {path} ({len(self._offsets)}개)")
+
+    def _load_index(self) -> None:
+        """레코드 헤더를 훑어 review_id 인덱스 구성 (깨진 마지막 레코드는 잘라냄)"""
+        file_size = os.path.getsize(self.path)
+        valid_end = 0
+
+        with open(self.path, 'rb') as f:
+            while True:
+                header = f.read(_ID_HEADER.size)
+                if len(header) < _ID_HEADER.size:
+                    break
+                (id_len,) = _ID_HEADER.unpack(header)
+                review_id = f.read(id_len)
+                body_offset = f.tell()
+                body_header = f.read(_BODY_HEADER.size)
+                if len(review_id) < id_len or len(body_header) < _BODY_HEADER.size:
+                    break
+                (body_len,) = _BODY_HEADER.unpack(body_header)
+                end = body_offset + _BODY_HEADER.size + body_len
+                if end > file_size:
+                    # 기록 도중 중단된 레코드
+                    break
+
+                self._offsets.setdefault(review_id.decode('utf-8'), body_offset)
+                f.seek(end)
+                valid_end = end
+
+        if valid_end < file_size:
+            logger.warning(f"저장소 끝의 불완전한 레코드 제거: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    def __contains__(self, review_id: str) -> bool:
+        with self._lock:
+            return review_id in self._offsets
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._offsets)
+
+    def put(self, review_id: str, payload: Dict[str, Any]) -> bool:
+        """
+        원본 페이로드 기록 (이미 저장된 review_id는 건너뜀)
+
+        Returns:
+            새로 기록했으면 True
+        """
+        id_bytes = review_id.encode('utf-8')
+
+        with self._lock:
+            if review_id in self._offsets:
+                return False
+
+        # 압축은 잠금 밖에서 수행
+        body = zlib.compress(
+            json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+            self.compress_level
+        )
+
+        with self._lock:
+            if review_id in self._offsets:
+                return False
+            if self._writer is None:
+                self._writer = open(self.path, 'ab')
+
+            self._writer.write(_ID_HEADER.pack(len(id_bytes)) + id_bytes)
+            self._offsets[review_id] = self._writer.tell()
+            self._writer.write(_BODY_HEADER.pack(len(body)) + body)
+            self.written += 1
+
+        return True
+
+    def _read_at(self, offset: int) -> Dict[str, Any]:
+        """오프셋 위치의 본문 읽기 (잠금 보유 상태에서 호출)"""
+        if self._writer is not None:
+            self._writer.flush()
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+
+        self._reader.seek(offset)
+        (body_len,) = _BODY_HEADER.unpack(self._reader.read(_BODY_HEADER.size))
+        return json.loads(zlib.decompress(self._reader.read(body_len)))
+
+    def get(self, review_id: str) -> Optional[Dict[str, Any]]:
+        """
+        원본 페이로드 조회
+
+        Returns:
+            API 원본 리뷰 딕셔너리 (없으면 None)
+        """
+        with self._lock:
+            offset = self._offsets.get(review_id)
+            if offset is None:
+                return None
+            return self._read_at(offset)
+
+    def get_many(self, review_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 review_id의 원본 페이로드 조회 (파일 순서로 읽음)
+
+        Returns:
+            {review_id: 원본 딕셔너리} (없는 id는 제외)
+        """
+        with self._lock:
+            targets = sorted(
+                (self._offsets[rid], rid) for rid in set(review_ids) if rid in self._offsets
+            )
+            return {rid: self._read_at(offset) for offset, rid in targets}
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """저장된 모든 (review_id, 원본) 순회 (기록 순서)"""
+        with self._lock:
+            targets = sorted((offset, rid) for rid, offset in self._offsets.items())
+
+        for offset, rid in targets:
+            with self._lock:
+                payload = self._read_at(offset)
+            yield rid, payload
+
+    def flush(self) -> None:
+        """버퍼된 레코드를 파일에 반영"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+
+    def close(self) -> None:
+        """파일 핸들 정리 (이후 put/get 시 다시 열림)"""
+        with self._lock:
+            for handle in (self._writer, self._reader):
+                if handle is not None:
+                    handle.close()
+            self._writer = None
+            self._reader = None
+
+        if self.written:
+            size_mb = os.path.getsize(self.path) / 1024 / 1024
+            logger.info(
+                f"원본 페이로드 저장: {self.path} (+{self.written}개, 총 {len(self._offsets)}개, {size_mb:.1f}MB)"
+            )
+            self.written = 0
+
+
+def payload_store_path(config: Dict[str, Any], worker_id: Optional[str] = None) -> str:
+    """
+    원본 페이로드 저장소 파일 경로
+
+    Args:
+        config: 설정 딕셔너리 (reviews.payload_store 블록 사용)
+        worker_id: 프론티어 워커 식별자 (지정 시 워커 전용 파일 경로)
+
+    Returns:
+        저장소 파일 경로
+    """
+    store_config = config.get('reviews', {}).get('payload_store', {})
+    raw_dir = config.get('output', {}).get('raw_dir', 'data/raw')
+    path = store_config.get('file', os.path.join(raw_dir, 'review_payloads.bin'))
+    if worker_id is None:
+        return path
+
+    # 여러 프로세스가 한 파일에 이어 쓰지 않도록 워커별 파일 사용 (조립 시 병합)
+    stem, ext = os.path.splitext(path)
+    safe_id = ''.join(c if c.isalnum() or c in '-_' else '_' for c in worker_id)
+    return f"{stem}.worker-{safe_id}{ext}"
+
+
+def get_payload_store(config: Dict[str, Any], worker_id: Optional[str] = None) -> Optional[PayloadStore]:
+    """
+    설정에 따라 원본 페이로드 저장소 생성
+
+    Args:
+        config: 설정 딕셔너리 (reviews.payload_store 블록 사용)
+        worker_id: 프론티어 워커 식별자 (지정 시 워커 전용 파일)
+
+    Returns:
+        PayloadStore 인스턴스 (비활성 시 None)
+    """
+    store_config = config.get('reviews', {}).get('payload_store', {})
+    if not store_config.get('enabled', True):
+        return None
+
+    return PayloadStore(
+        payload_store_path(config, worker_id),
+        compress_level=store_config.get('compress_level', 6),
+    )
+
+
+def merge_worker_payloads(config: Dict[str, Any]) -> int:
+    """
+    프론티어 워커별 저장소를 기본 저장소로 병합하고 워커 파일 삭제
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        새로 병합된 페이로드 수
+    """
+    store = get_payload_store(config)
+    if store is None:
+        return 0
+
+    stem, ext = os.path.splitext(store.path)
+    merged = 0
+    try:
+        for path in sorted(glob.glob(f"{glob.escape(stem)}.worker-*{ext}")):
+            worker_store = PayloadStore(path, compress_level=store.compress_level)
+            for review_id, payload in worker_store.items():
+                merged += store.put(review_id, payload)
+            worker_store.close()
+            store.flush()
+            os.remove(path)
+    finally:
+        store.close()
+
+    return merged
+
+
+def load_payloads(config: Dict[str, Any], review_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    review_id 목록의 API 원본 리뷰 조회 헬퍼 함수
+
+    Args:
+        config: 설정 딕셔너리
+        review_ids: 조회할 review_id 목록
+
+    Returns:
+        {review_id: 원본 딕셔너리} (저장소가 없거나 id가 없으면 제외)
+    """
+    store = get_payload_store(config)
+    if store is None:
+        return {}
+
+    try:
+        return store.get_many(review_ids)
+    finally:
+        store.close()
@@ -9,15 +9,20 @@ import sys
 import argparse
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 import yaml
 
-from .catalog import collect_catalog
-from .reviews import collect_reviews
-from .filters import apply_noise_tags
-from .io import DataIO, save_data
+from .catalog import collect_catalog, get_categories
+from .reviews import ReviewCollector, collect_reviews, iter_reviews
+from .filters import apply_noise_tags, iter_noise_tags
+from .io import DataIO, append_data
 from .report import generate_report
+from .checkpoint import CrawlJournal
+from .frontier import CrawlFrontier, default_worker_id, open_frontier
+from .payload_store import merge_worker_payloads
+from .telemetry import export_crawl_metrics
+from .scheduler import CategoryRun, category_config, get_scheduler
 
 # 로깅 설정
 def setup_logging(config: Dict[str, Any]) -> None:
@@ -52,11 +57,59 @@ def load_config(config_path: str = 'config.yaml') -> Dict[str, Any]:
     return config or {}
 
 
+def open_journal(config: Dict[str, Any], resume: bool = False) -> CrawlJournal:
+    """리뷰 수집 체크포인트 저널 열기 (resume=False면 새로 시작)"""
+    raw_dir = config.get('output', {}).get('raw_dir', 'data/raw')
+    path = config.get('reviews', {}).get(
+        'checkpoint_file', os.path.join(raw_dir, 'crawl_checkpoint.jsonl')
+    )
+    return CrawlJournal(path, resume=resume)
+
+
+# 수집 요약 리포트에 필요한 리뷰 컬럼
+REPORT_COLUMNS = [
+    'goods_no', 'sort_source', 'rating', 'review_date',
+    'is_trial', 'is_low_info', 'has_images',
+]
+
+
+def stream_reviews_to_disk(
+    config: Dict[str, Any],
+    products: List[Dict[str, Any]],
+    top_n: Optional[int],
+    concurrency: Optional[int],
+    journal: Union[CrawlJournal, CrawlFrontier]
+) -> Tuple[Dict[str, str], int]:
+    """
+    리뷰 수집 → 노이즈 태깅 → 저장을 하나의 스트림으로 실행
+    
+    리뷰는 상품 단위로 수집되는 즉시 태깅되어 JSONL 줄과 Parquet row group으로
+    기록되므로, 전체 리뷰 리스트를 메모리에 올리지 않습니다.
+    다른 상품에서 이미 기록한 리뷰는 참조 행(review_refs.parquet)으로만 남깁니다.
+    
+    Returns:
+        (저장된 파일 경로 딕셔너리, 저장된 리뷰 수)
+    """
+    io = DataIO(config)
+    try:
+        with io.open_review_stream() as writer:
+            reviews = iter_reviews(
+                config, products, top_n, concurrency,
+                journal=journal, ref_sink=writer.write_ref
+            )
+            for review in iter_noise_tags(config, reviews):
+                writer.write(review)
+        return writer.paths, writer.count
+    finally:
+        journal.close()
+
+
 def crawl_catalog_only(config: Dict[str, Any]) -> None:
     """카탈로그만 수집"""
     logger.info("=== 카탈로그 수집 시작 ===")
     
     products = collect_catalog(config)
+    export_crawl_metrics(config)
     
     if products:
         io = DataIO(config)
@@ -69,9 +122,17 @@ def crawl_catalog_only(config: Dict[str, Any]) -> None:
 def crawl_reviews_only(
     config: Dict[str, Any], 
     top_n: Optional[int] = None,
-    products_file: Optional[str] = None
+    products_file: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    delta: bool = False,
+    resume: bool = False
 ) -> None:
-    """리뷰만 수집 (기존 카탈로그 사용)"""
+    """
+    리뷰만 수집 (기존 카탈로그 사용)
+    
+    delta=True면 신규 리뷰만 추가 수집하고,
+    resume=True면 체크포인트 저널의 완료 단위를 건너뛰고 이어서 수집합니다.
+    """
     logger.info("=== 리뷰 수집 시작 ===")
     
     # 카탈로그 로드
@@ -88,24 +149,123 @@ def crawl_reviews_only(
     
     logger.info(f"상위 {top_n}개 상품 리뷰 수집")
     
-    # 리뷰 수집
-    reviews = collect_reviews(config, products, top_n)
-    
-    if reviews:
-        # 노이즈 태깅
-        reviews = apply_noise_tags(config, reviews)
-        
-        # 저장
-        paths = save_data(config, reviews=reviews)
+    # 증분 수집: 신규 리뷰만 기존 파일에 추가
+    if delta:
+        reviews = collect_reviews(config, products, top_n, concurrency, delta=True)
+        metrics_paths, metrics = export_crawl_metrics(config)
+        if not reviews:
+            logger.info("신규 리뷰 없음")
+            return
         
+        reviews = apply_noise_tags(config, reviews)
+        paths = {**append_data(config, reviews), **metrics_paths}
+        report_path = generate_report(config, products, reviews, paths, metrics)
+        logger.info(f"리포트 생성 완료: {report_path}")
+        return
+    
+    # 전체 수집: 체크포인트 저널에 수집 단위별로 기록하며 스트리밍 저장
+    paths, count = stream_reviews_to_disk(
+        config, products, top_n, concurrency, open_journal(config, resume)
+    )
+    metrics_paths, metrics = export_crawl_metrics(config)
+    
+    if count:
         # 리포트 생성
-        report_path = generate_report(config, products, reviews, paths)
+        reviews_df = io.load_reviews_parquet(paths['reviews_parquet'], columns=REPORT_COLUMNS)
+        report_path = generate_report(config, products, reviews_df, {**paths, **metrics_paths}, metrics)
         logger.info(f"리포트 생성 완료: {report_path}")
     else:
         logger.error("리뷰 수집 실패")
 
 
-def crawl_all(config: Dict[str, Any], top_n: Optional[int] = None) -> None:
+def crawl_worker(
+    config: Dict[str, Any],
+    frontier_path: Optional[str] = None,
+    worker_id: Optional[str] = None,
+    seed: bool = False,
+    top_n: Optional[int] = None,
+    products_file: Optional[str] = None,
+    finalize: bool = False
+) -> None:
+    """
+    수집 프론티어 워커 실행
+    
+    seed=True면 카탈로그 상위 top_n개 상품의 (상품, 정렬, 첫 페이지) 단위를 등록한 뒤
+    작업하고, finalize=True면 작업 대신 완료된 단위를 리뷰 파일과 리포트로 조립합니다.
+    여러 프로세스(또는 같은 파일을 공유하는 여러 호스트)에서 동시에 실행할 수 있습니다.
+    """
+    frontier = open_frontier(config, frontier_path)
+    worker_id = worker_id or default_worker_id()
+    collector = ReviewCollector(config, concurrency=1, worker_id=worker_id)
+    
+    if seed:
+        products = DataIO(config).load_products_jsonl(products_file)
+        if not products:
+            logger.error("카탈로그 파일 없음. 먼저 카탈로그를 수집하세요.")
+            frontier.close()
+            return
+        if top_n is None:
+            top_n = config.get('reviews', {}).get('top_n', 150)
+        collector.seed_frontier(frontier, products, top_n)
+    
+    if finalize:
+        finalize_frontier(config, frontier, products_file)
+        return
+    
+    try:
+        collector.work_frontier(frontier, config.get('frontier', {}).get('poll_interval', 5.0))
+        logger.info(f"프론티어 상태: {frontier.stats()}")
+    finally:
+        frontier.close()
+        export_crawl_metrics(config)
+
+
+def finalize_frontier(
+    config: Dict[str, Any],
+    frontier: CrawlFrontier,
+    products_file: Optional[str] = None
+) -> None:
+    """
+    완료된 프론티어 단위를 순차 수집과 같은 규칙으로 조립하여 저장
+    
+    상품/정렬 순서대로 프론티어의 페이지를 재생합니다. 정렬 간 중복을 채우는
+    추가 페이지는 워커가 이미 등록/수집했으므로 조립 중에는 요청하지 않습니다.
+    """
+    stats = frontier.stats()
+    if frontier.active_count():
+        logger.error(f"아직 끝나지 않은 프론티어 단위가 있어 조립하지 않음: {stats}")
+        frontier.close()
+        return
+    if stats.get('failed'):
+        logger.warning(f"실패한 프론티어 단위 {stats['failed']}개는 제외하고 조립합니다")
+    
+    merged = merge_worker_payloads(config)
+    if merged:
+        logger.info(f"워커 원본 페이로드 병합: {merged}개")
+    
+    io = DataIO(config)
+    seeded = frontier.seeded_goods()
+    catalog = {p.get('goods_no'): p for p in io.load_products_jsonl(products_file)}
+    products = [{**catalog.get(p['goods_no'], {}), **p} for p in seeded]
+    
+    logger.info(f"=== 프론티어 조립 시작: {len(products)}개 상품 ===")
+    frontier.replay_only = True
+    paths, count = stream_reviews_to_disk(config, products, None, 1, frontier)
+    metrics_paths, metrics = export_crawl_metrics(config)
+    
+    if count:
+        reviews_df = io.load_reviews_parquet(paths['reviews_parquet'], columns=REPORT_COLUMNS)
+        report_path = generate_report(config, products, reviews_df, {**paths, **metrics_paths}, metrics)
+        logger.info(f"리포트 생성 완료: {report_path}")
+    else:
+        logger.error("조립할 리뷰 없음")
+
+
+def crawl_all(
+    config: Dict[str, Any],
+    top_n: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> None:
     """전체 파이프라인 실행"""
     logger.info("=== 전체 파이프라인 시작 ===")
     
@@ -115,35 +275,32 @@ def crawl_all(config: Dict[str, Any], top_n: Optional[int] = None) -> None:
     
     if not products:
         logger.error("카탈로그 수집 실패, 파이프라인 중단")
+        export_crawl_metrics(config)
         return
     
     # 카탈로그 저장
     io = DataIO(config)
     products_path = io.save_products_jsonl(products)
     
-    # 2. 리뷰 수집
-    logger.info("--- 단계 2: 리뷰 수집 ---")
     if top_n is None:
         top_n = config.get('reviews', {}).get('top_n', 150)
     
-    reviews = collect_reviews(config, products, top_n)
+    # 2~4. 리뷰 수집 → 노이즈 태깅 → 저장 (스트리밍)
+    logger.info("--- 단계 2-4: 리뷰 수집 / 노이즈 태깅 / 저장 (스트리밍) ---")
+    paths, count = stream_reviews_to_disk(config, products, top_n, concurrency, open_journal(config))
+    metrics_paths, metrics = export_crawl_metrics(config)
     
-    if not reviews:
+    if not count:
         logger.warning("리뷰 수집 실패, 카탈로그만 저장됨")
-        generate_report(config, products, [], {'products_jsonl': products_path})
+        generate_report(config, products, [], {'products_jsonl': products_path, **metrics_paths}, metrics)
         return
     
-    # 3. 노이즈 태깅
-    logger.info("--- 단계 3: 노이즈 태깅 ---")
-    reviews = apply_noise_tags(config, reviews)
-    
-    # 4. 저장
-    logger.info("--- 단계 4: 데이터 저장 ---")
-    paths = save_data(config, products=products, reviews=reviews)
+    paths = {'products_jsonl': products_path, **paths, **metrics_paths}
+    reviews = io.load_reviews_parquet(paths['reviews_parquet'], columns=REPORT_COLUMNS)
     
     # 5. 리포트 생성
     logger.info("--- 단계 5: 리포트 생성 ---")
-    report_path = generate_report(config, products, reviews, paths)
+    report_path = generate_report(config, products, reviews, paths, metrics)
     
     logger.info("=== 파이프라인 완료 ===")
     logger.info(f"- 상품: {len(products)}개")
@@ -151,6 +308,59 @@ def crawl_all(config: Dict[str, Any], top_n: Optional[int] = None) -> None:
     logger.info(f"- 리포트: {report_path}")
 
 
+def crawl_categories(
+    config: Dict[str, Any],
+    categories: List[Dict[str, str]],
+    top_n: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    with_reviews: bool = True
+) -> None:
+    """
+    여러 카테고리를 스케줄러로 함께 수집
+    
+    카테고리마다 카탈로그 수집 → (with_reviews면) 리뷰 스트리밍 저장을 하나의 레인으로
+    실행하고, 모든 레인이 끝나면 카테고리별 리포트를 만듭니다.
+    출력은 category=<이름> 하위 폴더에 저장됩니다.
+    """
+    if top_n is None:
+        top_n = config.get('reviews', {}).get('top_n', 150)
+    
+    def run_category(lane_config: Dict[str, Any], run: CategoryRun) -> Dict[str, Any]:
+        products = collect_catalog(lane_config, run.disp_cat_no)
+        if not products:
+            raise RuntimeError("카탈로그 수집 실패")
+        
+        io = DataIO(lane_config)
+        paths = {'products_jsonl': io.save_products_jsonl(products)}
+        count = 0
+        if with_reviews:
+            review_paths, count = stream_reviews_to_disk(
+                lane_config, products, top_n, concurrency, open_journal(lane_config)
+            )
+            paths.update(review_paths)
+        return {'products': products, 'paths': paths, 'reviews': count}
+    
+    logger.info(f"=== 다중 카테고리 파이프라인 시작: {', '.join(c['name'] for c in categories)} ===")
+    runs = get_scheduler(config, categories).run(run_category)
+    metrics_paths, metrics = export_crawl_metrics(config)
+    
+    if not with_reviews:
+        return
+    
+    # 카테고리별 리포트 (텔레메트리는 전체 실행 기준)
+    for run in runs:
+        if run.result is None:
+            continue
+        products, paths = run.result['products'], {**run.result['paths'], **metrics_paths}
+        if run.result['reviews']:
+            reviews = DataIO(run.config).load_reviews_parquet(paths['reviews_parquet'], columns=REPORT_COLUMNS)
+        else:
+            logger.warning(f"[{run.name}] 리뷰 수집 실패, 카탈로그만 저장됨")
+            reviews = []
+        report_path = generate_report(run.config, products, reviews, paths, metrics)
+        logger.info(f"[{run.name}] 상품 {len(products)}개, 리뷰 {run.result['reviews']}개, 리포트: {report_path}")
+
+
 def main():
     """CLI 진입점"""
     parser = argparse.ArgumentParser(
@@ -159,12 +369,29 @@ def main():
     
     subparsers = parser.add_subparsers(dest='command', help='실행할 명령')
     
+    CATEGORY_HELP = (
+        '수집할 카테고리 이름 또는 dispCatNo (여러 번 지정 가능, 기본: catalog.disp_cat_no 전체). '
+        '카테고리가 여러 개인 설정에서 crawl_reviews/crawl_worker는 하나를 지정해야 함'
+    )
+    
     # crawl_all 명령
     all_parser = subparsers.add_parser('crawl_all', help='전체 파이프라인 실행')
     all_parser.add_argument(
         '--top_n', type=int, default=None,
         help='리뷰 수집 대상 상품 수 (기본: config.yaml 값)'
     )
+    all_parser.add_argument(
+        '--concurrency', type=int, default=None,
+        help='리뷰 동시 요청 수 (기본: config.yaml request.concurrency)'
+    )
+    all_parser.add_argument(
+        '--replay', action='store_true',
+        help='응답 캐시만으로 전체 수집 재현 (네트워크 요청 없음, 파싱 변경 검증용)'
+    )
+    all_parser.add_argument(
+        '--category', action='append', default=None,
+        help=CATEGORY_HELP
+    )
     all_parser.add_argument(
         '--config', type=str, default='config.yaml',
         help='설정 파일 경로'
@@ -172,6 +399,14 @@ def main():
     
     # crawl_catalog 명령
     catalog_parser = subparsers.add_parser('crawl_catalog', help='카탈로그만 수집')
+    catalog_parser.add_argument(
+        '--replay', action='store_true',
+        help='응답 캐시만으로 수집 재현 (네트워크 요청 없음)'
+    )
+    catalog_parser.add_argument(
+        '--category', action='append', default=None,
+        help=CATEGORY_HELP
+    )
     catalog_parser.add_argument(
         '--config', type=str, default='config.yaml',
         help='설정 파일 경로'
@@ -188,6 +423,63 @@ def main():
         help='카탈로그 파일명 (기본: 가장 최근 파일)'
     )
     reviews_parser.add_argument(
+        '--concurrency', type=int, default=None,
+        help='리뷰 동시 요청 수 (기본: config.yaml request.concurrency)'
+    )
+    reviews_parser.add_argument(
+        '--delta', action='store_true',
+        help='증분 수집: 상품별 워터마크 이후 신규 리뷰만 수집해 기존 파일에 추가'
+    )
+    reviews_parser.add_argument(
+        '--replay', action='store_true',
+        help='응답 캐시만으로 수집 재현 (네트워크 요청 없음)'
+    )
+    reviews_parser.add_argument(
+        '--resume', action='store_true',
+        help='중단된 수집 재개: 체크포인트 저널에 기록된 (상품, 정렬, 페이지)는 요청 없이 재생'
+    )
+    reviews_parser.add_argument(
+        '--category', action='append', default=None,
+        help=CATEGORY_HELP
+    )
+    reviews_parser.add_argument(
+        '--config', type=str, default='config.yaml',
+        help='설정 파일 경로'
+    )
+    
+    # crawl_worker 명령
+    worker_parser = subparsers.add_parser(
+        'crawl_worker', help='수집 프론티어 워커 (여러 프로세스에서 동시 실행 가능)'
+    )
+    worker_parser.add_argument(
+        '--frontier', type=str, default=None,
+        help='프론티어 SQLite 파일 (기본: config.yaml frontier.file)'
+    )
+    worker_parser.add_argument(
+        '--worker_id', type=str, default=None,
+        help='워커 식별자 (기본: 호스트명-PID)'
+    )
+    worker_parser.add_argument(
+        '--seed', action='store_true',
+        help='카탈로그 상위 top_n개 상품의 수집 단위를 등록한 뒤 작업 (이미 있는 단위는 유지)'
+    )
+    worker_parser.add_argument(
+        '--top_n', type=int, default=None,
+        help='--seed 시 리뷰 수집 대상 상품 수'
+    )
+    worker_parser.add_argument(
+        '--products_file', type=str, default=None,
+        help='카탈로그 파일명 (기본: 가장 최근 파일)'
+    )
+    worker_parser.add_argument(
+        '--finalize', action='store_true',
+        help='작업 대신 모든 단위가 끝난 프론티어를 리뷰 파일/리포트로 조립'
+    )
+    worker_parser.add_argument(
+        '--category', action='append', default=None,
+        help=CATEGORY_HELP
+    )
+    worker_parser.add_argument(
         '--config', type=str, default='config.yaml',
         help='설정 파일 경로'
     )
@@ -202,16 +494,48 @@ def main():
     config_path = getattr(args, 'config', 'config.yaml')
     config = load_config(config_path)
     
+    # replay 모드: 응답 캐시만 사용
+    if getattr(args, 'replay', False):
+        config.setdefault('cache', {})['replay'] = True
+    
     # 로깅 설정
     setup_logging(config)
     
+    # 카테고리 선택: 설정에 카테고리가 여러 개면 출력은 category=<이름> 파티션
+    categories = get_categories(config)
+    multi_category = len(categories) > 1
+    if args.category:
+        selected = [c for c in categories if c['name'] in args.category or c['disp_cat_no'] in args.category]
+        unknown = set(args.category) - {v for c in selected for v in (c['name'], c['disp_cat_no'])}
+        if unknown:
+            logger.error(f"설정에 없는 카테고리: {', '.join(sorted(unknown))}")
+            return
+        categories = selected
+    
+    if multi_category and args.command in ('crawl_reviews', 'crawl_worker'):
+        if len(categories) != 1:
+            logger.error(f"{args.command}는 --category로 카테고리 하나를 지정해야 합니다")
+            return
+        config = category_config(config, categories[0])
+    
     # 명령 실행
-    if args.command == 'crawl_all':
-        crawl_all(config, args.top_n)
+    if multi_category and args.command == 'crawl_all':
+        crawl_categories(config, categories, args.top_n, args.concurrency)
+    elif multi_category and args.command == 'crawl_catalog':
+        crawl_categories(config, categories, with_reviews=False)
+    elif args.command == 'crawl_all':
+        crawl_all(config, args.top_n, args.concurrency)
     elif args.command == 'crawl_catalog':
         crawl_catalog_only(config)
     elif args.command == 'crawl_reviews':
-        crawl_reviews_only(config, args.top_n, args.products_file)
+        crawl_reviews_only(
+            config, args.top_n, args.products_file, args.concurrency, args.delta, args.resume
+        )
+    elif args.command == 'crawl_worker':
+        crawl_worker(
+            config, args.frontier, args.worker_id, args.seed,
+            args.top_n, args.products_file, args.finalize
+        )
     else:
         parser.print_help()
 
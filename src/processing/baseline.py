@@ -1,11 +1,20 @@
 """
 Step 3-0: Baseline 전처리 스크립트
 
-기존 reviews.parquet를 분석 가능한 베이스 테이블로 변환합니다.
+수집 리뷰(파티션 데이터셋 또는 reviews.parquet)를 분석 가능한 베이스 테이블로 변환합니다.
 원문(review_text)은 절대 수정하지 않고, 분석용 파생 컬럼만 추가합니다.
 
 Usage:
-    python -m src.processing.baseline --input data/processed/reviews.parquet --out data/processed/reviews_step3_base.parquet
+    python -m src.processing.baseline --input data/processed/reviews --out data/processed/reviews_step3_base.parquet
+
+    # 데이터셋에서 필요한 파티션만 읽기
+    python -m src.processing.baseline --crawl-date latest --category 100000100110006
+
+    # 스트리밍 모드 (10만 행씩 처리, 입력 크기와 무관한 최대 메모리)
+    python -m src.processing.baseline --chunk-rows 100000
+
+    # 변환을 워커 프로세스 4개로 나눠 실행
+    python -m src.processing.baseline --workers 4
 """
 
 import argparse
@@ -14,10 +23,17 @@ import logging
 import os
 import re
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src.dataset import is_dataset, read_reviews, iter_reviews, resolve_crawl_dates
+from src.schema import write_stage, load_write_profile, to_table, writer_options, ipc_cache_path, WRITE_PROFILES
+from src.processing.sharding import ShardExecutor, resolve_workers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +41,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 기본 입력: 파티션 데이터셋, 없으면 기존 단일 파일
+DEFAULT_DATASET = "data/processed/reviews"
+DEFAULT_INPUT = "data/processed/reviews.parquet"
+
 
 # =============================================================================
 # Text Cleaning Functions
@@ -123,6 +143,324 @@ def get_rating_bucket(rating: Optional[int]) -> Optional[str]:
         return "high"
 
 
+# =============================================================================
+# Vectorized Functions (위 함수들과 같은 규칙을 컬럼 단위로 적용)
+# =============================================================================
+
+# Python str.isspace() 문자 (clean_text의 strip(), 단어 수의 split()과 같은 공백 기준)
+WHITESPACE = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# clean_text 1-4단계가 바꿀 수 있는 문자 (없으면 trim만 하면 됨)
+_DIRTY_PATTERN = "[&\r\t]|  |\n\n\n"
+
+DATE_FORMATS = ["%Y.%m.%d", "%Y-%m-%d", "%Y/%m/%d"]
+
+# 월(0: 날짜 없음) -> 계절, 평점(0: 없음) -> 구간
+SEASON_BY_MONTH = np.array(
+    [None, "winter", "winter", "spring", "spring", "spring", "summer",
+     "summer", "summer", "fall", "fall", "fall", "winter"],
+    dtype=object
+)
+RATING_BUCKET_BY_RATING = np.array([None, "low", "low", "mid", "high", "high"], dtype=object)
+
+
+def _clean_subset(arr: pa.Array) -> pa.Array:
+    """clean_text 1-4단계 (HTML entity, 제어문자, 연속 공백/줄바꿈) 적용"""
+    # 1. HTML entity 디코딩 ('&' 포함 행만)
+    has_entity = pc.match_substring(arr, "&")
+    if pc.any(has_entity).as_py():
+        unescaped = [html.unescape(t) for t in pc.filter(arr, has_entity).to_pylist()]
+        arr = pc.replace_with_mask(arr, has_entity, pa.array(unescaped, type=pa.string()))
+    
+    # 2. 제어문자 정리 (\r -> \n, \t -> space)
+    arr = pc.replace_substring(arr, "\r\n", "\n")
+    arr = pc.replace_substring(arr, "\r", "\n")
+    arr = pc.replace_substring(arr, "\t", " ")
+    
+    # 3-4. 연속 공백/줄바꿈 정리
+    arr = pc.replace_substring_regex(arr, " {2,}", " ")
+    return pc.replace_substring_regex(arr, "\n{3,}", "\n\n")
+
+
+def clean_texts(texts: pd.Series) -> pd.Series:
+    """
+    텍스트 정제 (clean_text와 같은 결과, Arrow 문자열 커널로 컬럼 단위 처리)
+    
+    1-4단계는 바꿀 문자('&', \\r, \\t, 연속 공백/줄바꿈)가 있는 행에만 적용하고, html.unescape는
+    그중 '&'가 있는 행에만 적용합니다 ('&'가 없으면 unescape 결과가 원문과 같음).
+    문자열이 아닌 값이 섞여 있으면 행 단위 clean_text로 처리합니다.
+    """
+    try:
+        arr = pa.array(texts.where(texts.notna(), ""), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return texts.map(clean_text).astype("str")
+    if isinstance(arr, pa.ChunkedArray):
+        # 여러 파일을 합친 입력은 ChunkedArray로 오므로 replace_with_mask 전에 하나로 합침
+        arr = arr.combine_chunks()
+    
+    # 1-4단계가 바꿀 문자가 있는 행만 골라 처리 (나머지 행은 trim만 적용)
+    dirty = pc.match_substring_regex(arr, _DIRTY_PATTERN)
+    if pc.any(dirty).as_py():
+        arr = pc.replace_with_mask(arr, dirty, _clean_subset(pc.filter(arr, dirty)))
+    
+    # 5. 앞뒤 공백 trim (str.strip()과 같은 공백 문자)
+    arr = pc.utf8_trim(arr, characters=WHITESPACE)
+    
+    return pd.Series(arr, index=texts.index, dtype="str")
+
+
+def count_words(texts: pd.Series) -> pd.Series:
+    """
+    공백 기준 단어 수 (len(text.split())과 같은 결과, 빈 값은 0)
+    
+    Arrow utf8_split_whitespace의 공백 문자는 str.isspace()와 같고, 앞뒤/연속 공백에서
+    생기는 빈 조각만 빼고 셉니다.
+    """
+    arr = pa.array(texts.where(texts.notna(), ""), type=pa.string(), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        # list_parent_indices는 chunk마다 0부터 시작하므로 하나로 합쳐서 계산
+        arr = arr.combine_chunks()
+    pieces = pc.utf8_split_whitespace(arr)
+    non_empty = pc.greater(pc.binary_length(pc.list_flatten(pieces)), 0).to_numpy(zero_copy_only=False)
+    parents = pc.list_parent_indices(pieces).to_numpy()
+    counts = np.bincount(parents[non_empty], minlength=len(arr))
+    return pd.Series(counts.astype(np.int64), index=texts.index)
+
+
+def format_dates(dates: pd.Series, fmt: str) -> pd.Series:
+    """날짜 -> 문자열 (strftime을 고유 날짜에만 적용, 없는 값은 NaN)"""
+    codes, uniques = pd.factorize(dates)
+    labels = np.array([d.strftime(fmt) for d in uniques] + [None], dtype=object)
+    return pd.Series(labels[codes], index=dates.index, dtype="str")
+
+
+def parse_review_dates(dates: pd.Series) -> pd.Series:
+    """
+    리뷰 날짜 파싱 (parse_review_date와 같은 결과)
+    
+    DATE_FORMATS를 순서대로 pd.to_datetime(format=...)에 적용하고, 앞 형식에서 실패한 행만
+    다음 형식으로 파싱합니다. 모든 형식에서 실패한 문자열은 행 단위 parse_review_date로
+    한 번 더 확인합니다.
+    """
+    if isinstance(dates.dtype, pd.StringDtype):
+        is_str = dates.notna().to_numpy()
+    else:
+        is_str = dates.map(lambda x: isinstance(x, str)).to_numpy(dtype=bool)
+    
+    values = np.full(len(dates), None, dtype=object)
+    if is_str.any():
+        arr = pa.array(dates[is_str], type=pa.string(), from_pandas=True)
+        values[is_str] = pc.utf8_trim(arr, characters=WHITESPACE).to_pylist()
+    stripped = pd.Series(values, index=dates.index, dtype="str")
+    
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[us]")
+    remaining = is_str.copy()
+    for fmt in DATE_FORMATS:
+        if not remaining.any():
+            break
+        attempt = pd.to_datetime(stripped[remaining], format=fmt, errors="coerce")
+        parsed[remaining] = attempt.astype("datetime64[us]").to_numpy()
+        remaining &= parsed.isna().to_numpy()
+    
+    if remaining.any():
+        parsed[remaining] = pd.to_datetime(dates[remaining].map(parse_review_date)).to_numpy()
+    
+    return parsed
+
+
+def seasons_from_months(months: pd.Series) -> pd.Series:
+    """월 -> 계절 (get_season과 같은 결과, 없는 값은 NaN)"""
+    index = months.fillna(0).astype(np.int64).to_numpy()
+    return pd.Series(SEASON_BY_MONTH[index], index=months.index, dtype="str")
+
+
+def rating_buckets(ratings: pd.Series) -> pd.Series:
+    """평점 -> 구간 (get_rating_bucket과 같은 결과, 없는 값은 NaN)"""
+    values = pd.to_numeric(ratings, errors="coerce")
+    index = np.where(values.isna(), 0, np.clip(values.fillna(0), 1, 5)).astype(np.int64)
+    return pd.Series(RATING_BUCKET_BY_RATING[index], index=ratings.index, dtype="str")
+
+
+def _linear_quantile(histogram: np.ndarray, q: float) -> float:
+    """
+    값별 건수(histogram[v] = v의 건수)에서 분위수 계산 (Series.quantile 기본 linear 보간과 같은 값)
+
+    Args:
+        histogram: 0 이상 정수 값의 건수 배열 (np.bincount 결과)
+        q: 분위 (0~1)
+
+    Returns:
+        분위수 (값이 없으면 NaN)
+    """
+    n = int(histogram.sum())
+    if n == 0:
+        return float('nan')
+    
+    # np.percentile(method='linear')와 같은 순서로 계산해야 int() 절삭 결과까지 같음
+    virtual = (n - 1) * np.true_divide(q * 100, 100)
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+    cumulative = np.cumsum(histogram)
+    a = float(np.searchsorted(cumulative, int(previous), side='right'))
+    b = float(np.searchsorted(cumulative, min(int(previous) + 1, n - 1), side='right'))
+    if gamma >= 0.5:
+        return float(b - (b - a) * (1 - gamma))
+    return float(a + (b - a) * gamma)
+
+
+class QualityStats:
+    """
+    QA 통계 누적기 (배치마다 update, 마지막에 summary)
+    
+    전체 데이터를 메모리에 두지 않고 run_qa_checks와 같은 통계를 만듭니다.
+    review_id는 64bit 해시와 첫 등장 위치만 보관하고, 텍스트 길이는 길이별 건수로 보관합니다.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.date_parsed = 0
+        self.goods: set = set()
+        # review_id 해시 (정렬), 건수, 첫 등장 위치
+        self.id_hashes = np.empty(0, dtype=np.uint64)
+        self.id_counts = np.empty(0, dtype=np.int64)
+        self.id_first = np.empty(0, dtype=np.int64)
+        # 중복 review_id 후보: 해시 -> (첫 등장 위치, review_id), 첫 등장 순 20개만 유지
+        self.dup_examples: Dict[int, tuple] = {}
+        # 통계 이름 -> 결측 건수를 셀 컬럼
+        self.missing_columns = {'rating': 'rating', 'review_text': 'review_text', 'date_parsed': 'review_date_parsed'}
+        self.missing = {name: 0 for name in self.missing_columns}
+        self.ratings: Dict[Any, int] = {}
+        self.rating_missing = 0
+        self.date_min = None
+        self.date_max = None
+        self.months: Dict[str, int] = {}
+        self.text_len_hist = np.zeros(1, dtype=np.int64)
+        self.has_text = 0
+        self.short_reviews = 0
+        # 계절은 value_counts(dropna=False)처럼 첫 등장 순서를 유지 (None = 결측)
+        self.seasons: Dict[Optional[str], int] = {}
+    
+    def _update_ids(self, review_ids: pd.Series) -> None:
+        """review_id 해시 건수/첫 등장 위치 갱신"""
+        hashes = pd.util.hash_array(review_ids.to_numpy(dtype=object))
+        positions = np.arange(self.total, self.total + len(hashes), dtype=np.int64)
+        
+        uniques, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        found = np.searchsorted(self.id_hashes, uniques)
+        known = found < len(self.id_hashes)
+        known[known] = self.id_hashes[found[known]] == uniques[known]
+        
+        # 이미 본 해시는 건수만 더하고, 새 해시는 정렬 위치에 끼워 넣음
+        self.id_counts[found[known]] += counts[known]
+        new = ~known
+        insert_at = found[new]
+        self.id_hashes = np.insert(self.id_hashes, insert_at, uniques[new])
+        self.id_counts = np.insert(self.id_counts, insert_at, counts[new])
+        self.id_first = np.insert(self.id_first, insert_at, positions[first[new]])
+        
+        # 이번 배치에서 중복이 된 review_id 예시 기록
+        index = np.searchsorted(self.id_hashes, uniques)
+        duplicated = (self.id_counts[index] > 1)
+        values = review_ids.to_numpy(dtype=object)
+        for h, i, at in zip(uniques[duplicated], index[duplicated], first[duplicated]):
+            self.dup_examples.setdefault(int(h), (int(self.id_first[i]), values[at]))
+        if len(self.dup_examples) > 20:
+            kept = sorted(self.dup_examples.items(), key=lambda x: x[1][0])[:20]
+            self.dup_examples = dict(kept)
+    
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        배치 통계 누적 (Baseline 파생 컬럼까지 만든 DataFrame)
+
+        Args:
+            df: 배치 DataFrame
+        """
+        self._update_ids(df['review_id'])
+        self.total += len(df)
+        self.goods.update(df['goods_no'].dropna().unique().tolist())
+        
+        parsed = df['review_date_parsed']
+        self.date_parsed += int(parsed.notna().sum())
+        for name, col in self.missing_columns.items():
+            self.missing[name] += int(df[col].isna().sum())
+        
+        ratings = df['rating']
+        self.rating_missing += int(ratings.isna().sum())
+        for rating, count in ratings.dropna().value_counts().items():
+            self.ratings[rating] = self.ratings.get(rating, 0) + int(count)
+        
+        valid_dates = parsed.dropna()
+        if len(valid_dates) > 0:
+            low, high = valid_dates.min(), valid_dates.max()
+            self.date_min = low if self.date_min is None else min(self.date_min, low)
+            self.date_max = high if self.date_max is None else max(self.date_max, high)
+        for month, count in df['review_month'].value_counts().items():
+            self.months[month] = self.months.get(month, 0) + int(count)
+        
+        text_lens = df['text_len_chars'].to_numpy(dtype=np.int64)
+        hist = np.bincount(text_lens) if len(text_lens) else np.zeros(1, dtype=np.int64)
+        if len(hist) > len(self.text_len_hist):
+            hist[:len(self.text_len_hist)] += self.text_len_hist
+            self.text_len_hist = hist
+        else:
+            self.text_len_hist[:len(hist)] += hist
+        self.has_text += int(df['has_text'].sum())
+        self.short_reviews += int((text_lens < 15).sum())
+        
+        for season, count in df['season'].value_counts(dropna=False, sort=False).items():
+            key = None if pd.isna(season) else season
+            self.seasons[key] = self.seasons.get(key, 0) + int(count)
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        누적 통계를 run_qa_checks 통계 항목으로 변환
+
+        Returns:
+            stats 딕셔너리 항목
+        """
+        total = self.total
+        stats: Dict[str, Any] = {
+            'total_reviews': total,
+            'unique_goods': len(self.goods),
+            'duplicate_review_ids': int(self.id_counts[self.id_counts > 1].sum()),
+        }
+        if self.dup_examples:
+            examples = sorted(self.dup_examples.values())
+            stats['duplicate_review_id_list'] = [review_id for _, review_id in examples]
+        
+        for name, count in self.missing.items():
+            stats[f'missing_{name}'] = count
+            stats[f'missing_{name}_rate'] = count / total * 100
+        
+        rating_dist = dict(sorted(self.ratings.items()))
+        if self.rating_missing:
+            rating_dist[pd.NA] = self.rating_missing
+        stats['rating_distribution'] = rating_dist
+        
+        if self.date_min is not None:
+            stats['date_min'] = self.date_min.strftime('%Y-%m-%d')
+            stats['date_max'] = self.date_max.strftime('%Y-%m-%d')
+            monthly = sorted(self.months.items())
+            stats['monthly_top5'] = dict(monthly[-5:])
+            stats['monthly_bottom5'] = dict(monthly[:5])
+        
+        stats['text_len_p50'] = int(_linear_quantile(self.text_len_hist, 0.5))
+        stats['text_len_p90'] = int(_linear_quantile(self.text_len_hist, 0.9))
+        stats['text_len_p99'] = int(_linear_quantile(self.text_len_hist, 0.99))
+        stats['has_text_rate'] = self.has_text / total * 100
+        stats['short_reviews_count'] = self.short_reviews
+        stats['short_reviews_rate'] = self.short_reviews / total * 100
+        
+        # 건수 내림차순, 같은 건수는 첫 등장 순서 (안정 정렬)
+        seasons = sorted(self.seasons.items(), key=lambda x: -x[1])
+        stats['season_distribution'] = {(np.nan if k is None else k): v for k, v in seasons}
+        return stats
+
+
 # =============================================================================
 # Main Preprocessing Class
 # =============================================================================
@@ -130,17 +468,36 @@ def get_rating_bucket(rating: Optional[int]) -> Optional[str]:
 class BaselinePreprocessor:
     """Baseline 전처리기"""
     
-    def __init__(self, input_path: str, output_path: str, report_dir: str = "report"):
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        report_dir: str = "report",
+        crawl_dates: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default",
+        chunk_rows: int = 0,
+        workers: int = 1
+    ):
         self.input_path = input_path
         self.output_path = output_path
         self.report_dir = report_dir
+        self.crawl_dates = crawl_dates
+        self.categories = categories
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
+        self.chunk_rows = chunk_rows
+        self.workers = resolve_workers(workers)
         self.df: Optional[pd.DataFrame] = None
         self.stats: Dict[str, Any] = {}
     
     def load_data(self) -> None:
         """데이터 로드"""
         logger.info(f"Loading data from {self.input_path}")
-        self.df = pd.read_parquet(self.input_path)
+        if self.crawl_dates or self.categories:
+            logger.info(f"Partition filter: crawl_date={self.crawl_dates or 'all'}, category={self.categories or 'all'}")
+        self.df = read_reviews(self.input_path, crawl_dates=self.crawl_dates, categories=self.categories)
         logger.info(f"Loaded {len(self.df)} reviews")
     
     def normalize_schema(self) -> None:
@@ -176,107 +533,71 @@ class BaselinePreprocessor:
         logger.info("Parsing dates...")
         
         # review_date_parsed 생성
-        self.df['review_date_parsed'] = self.df['review_date'].apply(parse_review_date)
+        self.df['review_date_parsed'] = parse_review_dates(self.df['review_date'])
         
         # 파싱 성공률 계산
-        total = len(self.df)
-        parsed = self.df['review_date_parsed'].notna().sum()
-        failed = total - parsed
+        self._set_date_parse_stats(self.df['review_date_parsed'].notna().sum(), len(self.df))
+        logger.info(
+            f"Date parsing: {self.stats['date_parse_success']}/{len(self.df)} succeeded "
+            f"({self.stats['date_parse_success_rate']:.1f}%)"
+        )
         
+        # 시간 파생 컬럼
+        parsed = self.df['review_date_parsed']
+        self.df['review_month'] = format_dates(parsed, '%Y-%m')
+        self.df['review_year'] = parsed.dt.year.astype('Int64')
+        self.df['season'] = seasons_from_months(parsed.dt.month)
+    
+    def _set_date_parse_stats(self, parsed: int, total: int) -> None:
+        """날짜 파싱 성공/실패 통계 기록"""
         self.stats['date_parse_success'] = parsed
-        self.stats['date_parse_failed'] = failed
+        self.stats['date_parse_failed'] = total - parsed
         self.stats['date_parse_success_rate'] = parsed / total * 100 if total > 0 else 0
-        
-        logger.info(f"Date parsing: {parsed}/{total} succeeded ({self.stats['date_parse_success_rate']:.1f}%)")
-        
-        # 시간 파생 컬럼
-        self.df['review_month'] = self.df['review_date_parsed'].apply(
-            lambda x: x.strftime('%Y-%m') if pd.notna(x) else None
-        )
-        
-        self.df['review_year'] = self.df['review_date_parsed'].apply(
-            lambda x: x.year if pd.notna(x) else None
-        ).astype('Int64')
-        
-        self.df['season'] = self.df['review_date_parsed'].apply(
-            lambda x: get_season(x.month) if pd.notna(x) else None
-        )
     
     def create_rating_bucket(self) -> None:
         """평점 파생 컬럼 생성"""
         logger.info("Creating rating bucket...")
-        self.df['rating_bucket'] = self.df['rating'].apply(get_rating_bucket)
+        self.df['rating_bucket'] = rating_buckets(self.df['rating'])
     
     def clean_text_column(self) -> None:
         """텍스트 정제 컬럼 생성"""
         logger.info("Cleaning text...")
         
         # review_text_clean 생성 (원문 보존)
-        self.df['review_text_clean'] = self.df['review_text'].apply(clean_text)
+        self.df['review_text_clean'] = clean_texts(self.df['review_text'])
         
         # 텍스트 길이/기초 지표
         self.df['text_len_chars'] = self.df['review_text_clean'].str.len().fillna(0).astype(int)
-        self.df['text_len_words'] = self.df['review_text_clean'].apply(
-            lambda x: len(x.split()) if isinstance(x, str) and x else 0
-        )
+        self.df['text_len_words'] = count_words(self.df['review_text_clean'])
         self.df['has_text'] = self.df['text_len_chars'] > 0
     
+    def transform(self) -> None:
+        """파생 컬럼 생성 (스키마 정규화 ~ 텍스트 정제)"""
+        self.normalize_schema()
+        self.parse_dates()
+        self.create_rating_bucket()
+        self.clean_text_column()
+    
+    def transform_in_shards(self, executor: ShardExecutor) -> None:
+        """self.df를 연속 행 범위로 나눠 워커 프로세스에서 변환 (결과는 transform과 같음)"""
+        total = len(self.df)
+        self.df = pd.concat(executor.map(transform_shard, self.df))
+        self._set_date_parse_stats(self.df['review_date_parsed'].notna().sum(), total)
+        logger.info(f"Transformed {total} rows in {executor.workers} worker processes")
+    
     def run_qa_checks(self) -> None:
-        """QA 체크 실행"""
+        """QA 체크 실행 (QualityStats 누적 통계, 스트리밍 모드와 같은 계산)"""
         logger.info("Running QA checks...")
         
-        total = len(self.df)
-        
-        # 1. 총 리뷰 수, goods_no 수
-        self.stats['total_reviews'] = total
-        self.stats['unique_goods'] = self.df['goods_no'].nunique()
-        
-        # 2. review_id 중복 확인
-        dup_ids = self.df[self.df.duplicated(subset=['review_id'], keep=False)]
-        self.stats['duplicate_review_ids'] = len(dup_ids)
-        if len(dup_ids) > 0:
-            self.stats['duplicate_review_id_list'] = dup_ids['review_id'].unique().tolist()[:20]
-            logger.warning(f"Found {len(dup_ids)} duplicate review_ids")
-        
-        # 3. 핵심 컬럼 결측률
-        self.stats['missing_rating'] = self.df['rating'].isna().sum()
-        self.stats['missing_rating_rate'] = self.stats['missing_rating'] / total * 100
-        
-        self.stats['missing_review_text'] = self.df['review_text'].isna().sum()
-        self.stats['missing_review_text_rate'] = self.stats['missing_review_text'] / total * 100
-        
-        self.stats['missing_date_parsed'] = self.df['review_date_parsed'].isna().sum()
-        self.stats['missing_date_parsed_rate'] = self.stats['missing_date_parsed'] / total * 100
-        
-        # 4. rating 분포
-        rating_dist = self.df['rating'].value_counts(dropna=False).sort_index()
-        self.stats['rating_distribution'] = rating_dist.to_dict()
-        
-        # 5. 날짜 범위
-        valid_dates = self.df['review_date_parsed'].dropna()
-        if len(valid_dates) > 0:
-            self.stats['date_min'] = valid_dates.min().strftime('%Y-%m-%d')
-            self.stats['date_max'] = valid_dates.max().strftime('%Y-%m-%d')
-            
-            # 월별 카운트
-            monthly = self.df['review_month'].value_counts().sort_index()
-            self.stats['monthly_top5'] = monthly.tail(5).to_dict()
-            self.stats['monthly_bottom5'] = monthly.head(5).to_dict()
-        
-        # 6. 텍스트 길이 분포
-        text_lens = self.df['text_len_chars']
-        self.stats['text_len_p50'] = int(text_lens.quantile(0.5))
-        self.stats['text_len_p90'] = int(text_lens.quantile(0.9))
-        self.stats['text_len_p99'] = int(text_lens.quantile(0.99))
-        self.stats['has_text_rate'] = self.df['has_text'].sum() / total * 100
-        
-        # 7. 짧은 리뷰 비율 (15자 미만)
-        short_reviews = (text_lens < 15).sum()
-        self.stats['short_reviews_count'] = short_reviews
-        self.stats['short_reviews_rate'] = short_reviews / total * 100
-        
-        # 8. 계절 분포
-        self.stats['season_distribution'] = self.df['season'].value_counts(dropna=False).to_dict()
+        quality = QualityStats()
+        quality.update(self.df)
+        self._apply_quality_stats(quality)
+    
+    def _apply_quality_stats(self, quality: QualityStats) -> None:
+        """누적 통계를 self.stats에 반영"""
+        self.stats.update(quality.summary())
+        if self.stats['duplicate_review_ids'] > 0:
+            logger.warning(f"Found {self.stats['duplicate_review_ids']} duplicate review_ids")
     
     def save_output(self) -> None:
         """결과 저장"""
@@ -285,9 +606,72 @@ class BaselinePreprocessor:
         # review_date_parsed를 date 타입으로 변환
         self.df['review_date_parsed'] = pd.to_datetime(self.df['review_date_parsed']).dt.date
         
-        self.df.to_parquet(self.output_path, index=False, engine='pyarrow')
+        write_stage(self.df, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         logger.info(f"Saved preprocessed data to {self.output_path}")
     
+    def process_in_chunks(self) -> None:
+        """
+        스트리밍 모드: chunk_rows행씩 읽어 변환하고 row group 단위로 바로 저장
+        
+        전체 결과를 메모리에 올리지 않으므로 최대 메모리가 입력 크기와 무관하게 배치 크기에 비례합니다.
+        QA 통계는 QualityStats로 누적해 전체 로드 모드와 같은 리포트를 만듭니다.
+        """
+        logger.info(f"Streaming {self.input_path} in chunks of {self.chunk_rows} rows")
+        if self.crawl_dates or self.categories:
+            logger.info(f"Partition filter: crawl_date={self.crawl_dates or 'all'}, category={self.categories or 'all'}")
+        if WRITE_PROFILES[self.parquet_profile].get('sort_by'):
+            logger.warning(f"Profile '{self.parquet_profile}' sorting is not applied in streaming mode (input order kept)")
+        
+        os.makedirs(os.path.dirname(self.output_path) or '.', exist_ok=True)
+        tmp_path = f"{self.output_path}.tmp"
+        row_group_size = WRITE_PROFILES[self.parquet_profile].get('row_group_size')
+        quality = QualityStats()
+        writer: Optional[pq.ParquetWriter] = None
+        batches = 0
+        try:
+            with ShardExecutor(self.workers) as executor:
+                for batch in iter_reviews(
+                    self.input_path, self.chunk_rows, crawl_dates=self.crawl_dates, categories=self.categories
+                ):
+                    self.df = batch
+                    if executor.workers > 1:
+                        self.transform_in_shards(executor)
+                    else:
+                        self.transform()
+                    quality.update(self.df)
+                    
+                    self.df['review_date_parsed'] = pd.to_datetime(self.df['review_date_parsed']).dt.date
+                    table = to_table(self.df)
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp_path, table.schema, **writer_options(self.parquet_profile))
+                    writer.write_table(table.cast(writer.schema), row_group_size=row_group_size)
+                    batches += 1
+                    logger.info(f"Chunk {batches}: {quality.total} rows processed")
+        except Exception:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        if writer is None:
+            raise ValueError(f"No reviews to process in {self.input_path}")
+        writer.close()
+        os.replace(tmp_path, self.output_path)
+        self.df = None
+        
+        # 배치 통계로 덮어쓴 값을 전체 누적값으로 다시 계산
+        total = quality.total
+        self._set_date_parse_stats(quality.date_parsed, total)
+        self._apply_quality_stats(quality)
+        
+        if self.ipc_cache:
+            logger.warning("IPC cache is not written in streaming mode (next stage reads Parquet)")
+        if os.path.exists(ipc_cache_path(self.output_path)):
+            # 이전 실행의 캐시는 새 Parquet와 맞지 않으므로 제거
+            os.remove(ipc_cache_path(self.output_path))
+        logger.info(f"Saved preprocessed data to {self.output_path} ({total} rows, {batches} row groups)")
+    
     def generate_report(self) -> str:
         """QA 리포트 생성"""
         os.makedirs(self.report_dir, exist_ok=True)
@@ -318,9 +702,13 @@ class BaselinePreprocessor:
         ]
         
         total = self.stats['total_reviews']
-        for rating, count in sorted(self.stats['rating_distribution'].items(), key=lambda x: (x[0] is None, x[0])):
+        # 결측 평점(pd.NA 키)은 비교할 수 없으므로 맨 뒤로
+        for rating, count in sorted(
+            self.stats['rating_distribution'].items(),
+            key=lambda x: (True, 0) if pd.isna(x[0]) else (False, x[0])
+        ):
             rate = count / total * 100 if total > 0 else 0
-            rating_str = str(rating) if rating is not None else "null"
+            rating_str = "null" if pd.isna(rating) else str(rating)
             lines.append(f"| {rating_str} | {count:,} | {rate:.1f}% |")
         
         lines.extend([
@@ -417,13 +805,17 @@ class BaselinePreprocessor:
     def run(self) -> None:
         """전체 파이프라인 실행"""
         try:
-            self.load_data()
-            self.normalize_schema()
-            self.parse_dates()
-            self.create_rating_bucket()
-            self.clean_text_column()
-            self.run_qa_checks()
-            self.save_output()
+            if self.chunk_rows > 0:
+                self.process_in_chunks()
+            else:
+                self.load_data()
+                if self.workers > 1:
+                    with ShardExecutor(self.workers) as executor:
+                        self.transform_in_shards(executor)
+                else:
+                    self.transform()
+                self.run_qa_checks()
+                self.save_output()
             self.generate_report()
             
             logger.info("=" * 50)
@@ -433,8 +825,8 @@ class BaselinePreprocessor:
             
         except Exception as e:
             logger.error(f"Error during preprocessing: {e}")
-            # 가능한 범위까지 저장 시도
-            if self.df is not None and len(self.df) > 0:
+            # 가능한 범위까지 저장 시도 (스트리밍 모드는 현재 배치뿐이므로 제외)
+            if not self.chunk_rows and self.df is not None and len(self.df) > 0:
                 try:
                     emergency_path = self.output_path.replace('.parquet', '_partial.parquet')
                     self.df.to_parquet(emergency_path, index=False)
@@ -444,14 +836,30 @@ class BaselinePreprocessor:
             raise
 
 
+def transform_shard(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    샤드 워커 함수: 행 범위 하나에 Baseline 변환 적용 (ShardExecutor.map용)
+
+    Args:
+        df: 입력 샤드
+
+    Returns:
+        파생 컬럼을 추가한 샤드 (인덱스 유지)
+    """
+    preprocessor = BaselinePreprocessor(input_path='', output_path='')
+    preprocessor.df = df.copy()
+    preprocessor.transform()
+    return preprocessor.df
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Step 3-0: Baseline 전처리 스크립트"
     )
     parser.add_argument(
         "--input", "-i",
-        default="data/processed/reviews.parquet",
-        help="입력 parquet 파일 경로"
+        default=None,
+        help=f"입력 데이터셋 폴더 또는 parquet 파일 경로 (기본: {DEFAULT_DATASET}, 없으면 {DEFAULT_INPUT})"
     )
     parser.add_argument(
         "--out", "-o",
@@ -463,13 +871,58 @@ def main():
         default="report",
         help="리포트 출력 디렉토리"
     )
+    parser.add_argument(
+        "--crawl-date",
+        action="append",
+        default=None,
+        help="읽을 수집일 파티션 (YYYY-MM-DD, latest 또는 all, 여러 번 지정 가능, 데이터셋 입력만 해당, "
+             "기본: latest = 카테고리별 최근 전체 수집과 그 이후 증분 수집)"
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        default=None,
+        help="읽을 카테고리 파티션 (여러 번 지정 가능, 데이터셋 입력만 해당)"
+    )
+    parser.add_argument(
+        "--ipc-cache",
+        action="store_true",
+        help="다음 단계용 Arrow IPC 캐시(.arrow)도 함께 저장"
+    )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일"
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=0,
+        help="스트리밍 모드: N행씩 읽고 변환해 row group 단위로 저장 (기본 0: 전체 로드)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="변환을 나눠 실행할 워커 프로세스 수 (기본 1, 0이면 CPU 수)"
+    )
     
     args = parser.parse_args()
     
+    input_path = args.input
+    if input_path is None:
+        input_path = DEFAULT_DATASET if is_dataset(DEFAULT_DATASET) else DEFAULT_INPUT
+    
     preprocessor = BaselinePreprocessor(
-        input_path=args.input,
+        input_path=input_path,
         output_path=args.out,
-        report_dir=args.report_dir
+        report_dir=args.report_dir,
+        crawl_dates=resolve_crawl_dates(input_path, args.crawl_date),
+        categories=args.category,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('base', args.config),
+        chunk_rows=args.chunk_rows,
+        workers=args.workers
     )
     preprocessor.run()
 
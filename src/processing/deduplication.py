@@ -4,6 +4,9 @@ Step 3-0.5: Review Deduplication 스크립트
 동일 review_id가 여러 goods_no에 걸쳐 중복된 경우를 통합합니다.
 원문 보존, 메타데이터는 merge 규칙에 따라 통합.
 
+수집 단계에서 상품 간 반복 리뷰를 참조 행(데이터셋의 refs 파일 또는
+review_refs.parquet)으로만 기록한 경우, 참조 행을 원본 행 뒤에 붙여 같은 규칙으로 통합합니다.
+
 Usage:
     python -m src.processing.deduplication \
         --input data/processed/reviews_step3_base.parquet \
@@ -19,12 +22,19 @@ from typing import List, Dict, Any, Optional
 import pandas as pd
 import numpy as np
 
+from src.dataset import is_dataset, read_reviews
+from src.schema import read_stage, write_stage, load_write_profile
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# 기본 참조 행 위치: 파티션 데이터셋, 없으면 기존 단일 파일
+DEFAULT_DATASET = "data/processed/reviews"
+DEFAULT_REFS = "data/processed/review_refs.parquet"
+
 # Primary sort 우선순위 (낮을수록 높음)
 SORT_PRIORITY = {
     'low_rating': 1,
@@ -78,13 +88,94 @@ def get_primary_sort(sort_sources: List[str]) -> Optional[str]:
     return best
 
 
+def group_modes(df: pd.DataFrame, group_ids: np.ndarray, col: str) -> pd.Series:
+    """
+    그룹별 최빈값 (get_mode와 같은 결과: 동률이면 정렬 순서상 가장 작은 값, 전부 결측인 그룹은 제외)
+
+    Args:
+        df: 입력 행
+        group_ids: 행별 그룹 번호
+        col: 대상 컬럼
+
+    Returns:
+        그룹 번호 -> 최빈값 Series
+    """
+    values = pd.DataFrame({'group': group_ids, 'value': df[col].reset_index(drop=True)}).dropna(subset=['value'])
+    counts = values.value_counts(sort=False).rename('n').reset_index()
+    top = counts[counts['n'] == counts.groupby('group')['n'].transform('max')]
+    top = top.sort_values(['group', 'value'], kind='stable').drop_duplicates('group')
+    return top.set_index('group')['value']
+
+
+def sort_source_sets(df: pd.DataFrame, group_ids: np.ndarray, n_groups: int) -> pd.DataFrame:
+    """
+    그룹별 정렬 출처 통합 (merge_group의 sort_sources_all/str/count, primary_sort와 같은 결과)
+
+    sort_source 문자열과 sort_sources_all의 list/str 값만 모읍니다 (Parquet에서 읽은 배열 값은
+    기존 규칙대로 제외). 그룹 x 출처 존재 여부 행렬을 만든 뒤 고유 조합마다 한 번만 목록을 만듭니다.
+
+    Args:
+        df: 입력 행
+        group_ids: 행별 그룹 번호 (0 ~ n_groups-1)
+        n_groups: 그룹 수
+
+    Returns:
+        그룹 번호 순서의 sort_sources_all, sort_sources_str, sort_count, primary_sort
+    """
+    groups = [group_ids]
+    sources = [df['sort_source'].to_numpy(dtype=object)]
+    if 'sort_sources_all' in df.columns:
+        for i, value in enumerate(df['sort_sources_all'].to_numpy(dtype=object)):
+            if isinstance(value, list):
+                groups.append(np.full(len(value), group_ids[i]))
+                sources.append(np.array(value, dtype=object))
+            elif isinstance(value, str):
+                groups.append(group_ids[i:i + 1])
+                sources.append(np.array([value], dtype=object))
+    
+    group = np.concatenate(groups)
+    source = np.concatenate(sources)
+    is_str = np.array([isinstance(v, str) for v in source], dtype=bool)
+    codes, names = pd.factorize(source[is_str], sort=True)
+    
+    present = np.zeros((n_groups, len(names)), dtype=bool)
+    present[group[is_str], codes] = True
+    if len(names) <= 63:
+        # 출처 조합을 비트마스크 정수 하나로 (np.unique(axis=0)보다 훨씬 빠름)
+        keys = present.astype(np.int64) @ (np.int64(1) << np.arange(len(names), dtype=np.int64))
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        combos = present[first]
+    else:
+        combos, inverse = np.unique(present, axis=0, return_inverse=True)
+    
+    combo_lists = [list(names[row]) for row in combos]
+    inverse = inverse.ravel()
+    return pd.DataFrame({
+        'sort_sources_all': [combo_lists[i] for i in inverse],
+        'sort_sources_str': np.array([('|'.join(c) if c else None) for c in combo_lists], dtype=object)[inverse],
+        'sort_count': np.array([len(c) for c in combo_lists], dtype=np.int64)[inverse],
+        'primary_sort': np.array([get_primary_sort(c) for c in combo_lists], dtype=object)[inverse],
+    })
+
+
 class ReviewDeduplicator:
     """리뷰 중복 통합기"""
     
-    def __init__(self, input_path: str, output_path: str, report_dir: str = "report"):
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        report_dir: str = "report",
+        refs_path: Optional[str] = None,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default"
+    ):
         self.input_path = input_path
         self.output_path = output_path
         self.report_dir = report_dir
+        self.refs_path = refs_path
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
         self.df: Optional[pd.DataFrame] = None
         self.df_dedup: Optional[pd.DataFrame] = None
         self.stats: Dict[str, Any] = {}
@@ -93,11 +184,65 @@ class ReviewDeduplicator:
     def load_data(self) -> None:
         """데이터 로드"""
         logger.info(f"Loading data from {self.input_path}")
-        self.df = pd.read_parquet(self.input_path)
+        self.df = read_stage(self.input_path, ipc_cache=self.ipc_cache)
+        self._attach_refs()
         self.stats['rows_before'] = len(self.df)
         self.stats['unique_review_ids'] = self.df['review_id'].nunique()
         logger.info(f"Loaded {len(self.df)} reviews, {self.stats['unique_review_ids']} unique review_ids")
     
+    def _attach_refs(self) -> None:
+        """반복 리뷰 참조 행을 원본 행 뒤에 붙임 (그룹의 첫 행은 항상 원본)"""
+        self.stats['ref_rows'] = 0
+        self.stats['orphan_refs'] = 0
+        
+        if not self.refs_path or not os.path.exists(self.refs_path):
+            return
+        
+        refs = self._read_refs()
+        if refs.empty:
+            return
+        refs['review_id'] = refs['review_id'].astype(str)
+        refs['goods_no'] = refs['goods_no'].astype(str)
+        refs['rating'] = pd.to_numeric(refs['rating'], errors='coerce')
+        refs.loc[~refs['rating'].between(1, 5, inclusive='both'), 'rating'] = np.nan
+        refs['rating'] = refs['rating'].astype('Int64')
+        
+        # 원본 행이 없는 참조는 블룸 필터 오탐 등으로 원본이 누락된 경우
+        known = refs['review_id'].isin(set(self.df['review_id']))
+        self.stats['orphan_refs'] = int((~known).sum())
+        if self.stats['orphan_refs']:
+            logger.warning(f"Dropping {self.stats['orphan_refs']} refs without a full review row")
+        
+        refs = refs[known]
+        self.stats['ref_rows'] = len(refs)
+        self.df = pd.concat([self.df, refs], ignore_index=True)
+        logger.info(f"Attached {len(refs)} cross-product refs from {self.refs_path}")
+    
+    def _read_refs(self) -> pd.DataFrame:
+        """
+        참조 행 읽기 (데이터셋이면 입력과 같은 (crawl_date, category) 파티션만)
+
+        입력이 최신 스냅샷만 읽은 경우 다른 수집일의 참조 행을 붙이면 리뷰마다 중복이 생기므로,
+        Baseline 출력에 남아 있는 파티션 컬럼으로 읽을 파티션을 제한합니다.
+        """
+        if not is_dataset(self.refs_path) or not {'crawl_date', 'category'} <= set(self.df.columns):
+            return read_reviews(self.refs_path, kind='refs')
+
+        partitions = self.df[['crawl_date', 'category']].dropna().astype(str).drop_duplicates()
+        if partitions.empty:
+            return pd.DataFrame()
+        refs = read_reviews(
+            self.refs_path,
+            crawl_dates=sorted(partitions['crawl_date']),
+            categories=sorted(partitions['category']),
+            kind='refs',
+        )
+        if refs.empty:
+            return refs
+        # 수집일/카테고리 조건은 각각 적용되므로 실제 입력에 있는 조합만 남김
+        keys = pd.MultiIndex.from_frame(refs[['crawl_date', 'category']].astype(str))
+        return refs[keys.isin(pd.MultiIndex.from_frame(partitions))].reset_index(drop=True)
+    
     def analyze_duplicates(self) -> None:
         """중복 분석"""
         logger.info("Analyzing duplicates...")
@@ -111,7 +256,7 @@ class ReviewDeduplicator:
         logger.info(f"Found {self.stats['dup_groups']} duplicate groups ({self.stats['rows_in_dup_groups']} rows)")
     
     def merge_group(self, group: pd.DataFrame) -> Dict[str, Any]:
-        """그룹 병합"""
+        """그룹 병합 (그룹 하나씩 처리하는 기준 구현, merge_groups와 같은 결과)"""
         result = {}
         
         # 기본 정보 (첫 번째 값)
@@ -191,12 +336,132 @@ class ReviewDeduplicator:
         
         return result
     
+    def merge_groups(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        전체 review_id 그룹 병합 (모든 그룹에 merge_group을 적용한 것과 같은 결과, review_id 정렬 순서)
+        
+        단독 행(대부분)은 첫 행 값을 그대로 쓰고, 중복 그룹의 행만 groupby 집계
+        (최빈값, max, any, nunique 충돌 검사)로 통합합니다.
+
+        Args:
+            df: 통합 전 행 (참조 행 포함)
+
+        Returns:
+            통합 결과 DataFrame
+        """
+        # 그룹 번호는 groupby 정렬 순서, 대표 행은 그룹의 첫 행
+        group_ids = df.groupby('review_id', sort=True).ngroup().to_numpy()
+        first = ~df['review_id'].duplicated().to_numpy()
+        first_pos = np.flatnonzero(first)[np.argsort(group_ids[first], kind='stable')]
+        base = df.iloc[first_pos].reset_index(drop=True)
+        n_groups = len(base)
+        # merge_group 결과처럼 값 기준 문자열로 (입력 category의 안 쓰이는 카테고리는 버림)
+        for col in base.columns:
+            if isinstance(base[col].dtype, pd.CategoricalDtype):
+                base[col] = base[col].astype('str')
+        
+        sizes = np.bincount(group_ids, minlength=n_groups)
+        in_dup = sizes[group_ids] > 1
+        dups = df[in_dup]
+        dup_groups = group_ids[in_dup]
+        
+        def dup_agg(values: pd.Series, how: str) -> pd.Series:
+            """중복 그룹 행만 집계 (그룹 번호 -> 값)"""
+            return values.reset_index(drop=True).groupby(dup_groups).agg(how)
+        
+        def with_dups(column: pd.Series, merged: pd.Series) -> pd.Series:
+            """단독 그룹은 대표 행 값, 중복 그룹은 통합 값"""
+            column = column.copy()
+            column.iloc[merged.index.to_numpy()] = merged.to_numpy()
+            return column
+        
+        result = {}
+        
+        # 기본 정보 (첫 번째 값)
+        for col in ['review_id', 'goods_no', 'product_id']:
+            result[col] = base[col]
+        
+        # goods_no_all (그룹 내 등장 순서, 상품이 2개 이상일 때만)
+        goods_all = np.full(n_groups, None, dtype=object)
+        pairs = pd.DataFrame({'group': dup_groups, 'goods_no': dups['goods_no'].to_numpy(dtype=object)}).drop_duplicates()
+        pairs = pairs.sort_values('group', kind='stable')
+        groups = pairs['group'].to_numpy()
+        goods = pairs['goods_no'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        ends = np.r_[starts[1:], len(groups)]
+        multi = ends - starts > 1
+        for start, end in zip(starts[multi], ends[multi]):
+            goods_all[groups[start]] = goods[start:end].tolist()
+        result['goods_no_all'] = goods_all
+        
+        # 중복 카운트
+        result['dup_count'] = sizes
+        
+        # 충돌 체크 (결측 제외 고유값 2개 이상) + 최빈값
+        conflicts = {}
+        for col in ['rating', 'review_date', 'review_text']:
+            if col in df.columns:
+                conflict = np.zeros(n_groups, dtype=bool)
+                unique_counts = dup_agg(dups[col], 'nunique')
+                conflict[unique_counts.index.to_numpy()] = unique_counts.to_numpy() > 1
+                conflicts[col] = conflict
+                result[col] = with_dups(base[col], group_modes(dups, dup_groups, col))
+        
+        dup_conflict = np.zeros(n_groups, dtype=bool)
+        for conflict in conflicts.values():
+            dup_conflict |= conflict
+        conflict_cols = np.full(n_groups, None, dtype=object)
+        for group in np.flatnonzero(dup_conflict):
+            conflict_cols[group] = [col for col, conflict in conflicts.items() if conflict[group]]
+        result['dup_conflict'] = dup_conflict
+        result['conflict_cols'] = conflict_cols
+        
+        if 'review_text_clean' in df.columns:
+            result['review_text_clean'] = with_dups(
+                base['review_text_clean'], group_modes(dups, dup_groups, 'review_text_clean')
+            )
+        
+        # Max 통합
+        for col in ['helpful_count', 'image_count']:
+            if col in df.columns:
+                result[col] = with_dups(base[col], dup_agg(dups[col], 'max'))
+        
+        # Bool max (OR)
+        for col in ['has_images']:
+            if col in df.columns:
+                flags = df[col].fillna(False).astype(bool)
+                result[col] = with_dups(flags.iloc[first_pos].reset_index(drop=True), dup_agg(flags[in_dup], 'any'))
+        
+        # OR 통합 (is_trial, is_low_info)
+        for col in ['is_trial', 'is_low_info']:
+            if col in df.columns:
+                hits = (df[col] == 1).fillna(False).astype(bool)
+                merged = with_dups(hits.iloc[first_pos].reset_index(drop=True), dup_agg(hits[in_dup], 'any'))
+                result[col] = merged.astype(np.int64)
+        
+        # Sort 메타 통합
+        for col, values in sort_source_sets(df, group_ids, n_groups).items():
+            result[col] = values.to_numpy()
+        
+        # 기타 컬럼 (첫 번째 값)
+        other_cols = [
+            'skin_type_raw', 'skin_tone_raw', 'skin_trouble_raw',
+            'review_type', 'source',
+            'review_date_parsed', 'review_month', 'review_year', 'season',
+            'rating_bucket', 'text_len_chars', 'text_len_words', 'has_text'
+        ]
+        for col in other_cols:
+            if col in df.columns:
+                result[col] = base[col]
+        
+        return pd.DataFrame({col: pd.Series(values).reset_index(drop=True) for col, values in result.items()})
+    
     def deduplicate(self) -> None:
         """중복 통합 실행"""
         logger.info("Deduplicating reviews...")
         
         # 샘플 수집 (통합 전)
-        dup_ids = self.df.groupby('review_id').filter(lambda x: len(x) > 1)['review_id'].unique()[:10]
+        dup_ids = self.df.loc[self.df['review_id'].duplicated(keep=False), 'review_id'].unique()[:10]
         
         for rid in dup_ids:
             sample_before = self.df[self.df['review_id'] == rid][
@@ -204,13 +469,8 @@ class ReviewDeduplicator:
             ].to_dict('records')
             self.samples.append({'review_id': rid, 'before': sample_before})
         
-        # 그룹별 병합
-        merged_rows = []
-        for review_id, group in self.df.groupby('review_id'):
-            merged = self.merge_group(group)
-            merged_rows.append(merged)
-        
-        self.df_dedup = pd.DataFrame(merged_rows)
+        # 그룹 병합 (단독 행은 그대로, 중복 그룹만 집계)
+        self.df_dedup = self.merge_groups(self.df)
         
         # 샘플에 통합 후 정보 추가
         for sample in self.samples:
@@ -257,7 +517,7 @@ class ReviewDeduplicator:
         final_cols = existing_cols + other_cols
         
         self.df_dedup = self.df_dedup[final_cols]
-        self.df_dedup.to_parquet(self.output_path, index=False, engine='pyarrow')
+        write_stage(self.df_dedup, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         
         logger.info(f"Saved deduplicated data to {self.output_path}")
     
@@ -281,6 +541,8 @@ class ReviewDeduplicator:
             f"| 통합 후 행 수 | {self.stats['rows_after']:,} |",
             f"| 제거된 중복 행 | {self.stats['rows_before'] - self.stats['rows_after']:,} |",
             f"| 중복 그룹 수 | {self.stats['dup_groups']:,} |",
+            f"| 수집 참조 행 (통합 전 행 수에 포함) | {self.stats['ref_rows']:,} |",
+            f"| 원본 없는 참조 행 (제외) | {self.stats['orphan_refs']:,} |",
             "",
             "---",
             "",
@@ -408,13 +670,36 @@ def main():
         default="report",
         help="리포트 출력 디렉토리"
     )
+    parser.add_argument(
+        "--refs",
+        default=None,
+        help="수집 단계의 상품 간 반복 리뷰 참조 (데이터셋 폴더 또는 parquet, "
+             "기본: data/processed/reviews 데이터셋, 없으면 data/processed/review_refs.parquet)"
+    )
+    parser.add_argument(
+        "--ipc-cache",
+        action="store_true",
+        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기"
+    )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일"
+    )
     
     args = parser.parse_args()
     
+    refs_path = args.refs
+    if refs_path is None:
+        refs_path = DEFAULT_DATASET if is_dataset(DEFAULT_DATASET) else DEFAULT_REFS
+    
     deduplicator = ReviewDeduplicator(
         input_path=args.input,
         output_path=args.out,
-        report_dir=args.report_dir
+        report_dir=args.report_dir,
+        refs_path=refs_path,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('dedup', args.config)
     )
     deduplicator.run()
 
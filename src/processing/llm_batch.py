@@ -33,6 +33,8 @@ except ImportError:
 from google import genai
 from google.genai import types
 
+from src.schema import read_stage, write_stage, load_write_profile
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -96,7 +98,10 @@ class FullBatchExtractor:
         rpm: int = 10,
         max_retries: int = 5,
         save_every: int = 50,
-        force: bool = False
+        force: bool = False,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default",
+        norm_parquet_profile: str = "default"
     ):
         self.input_path = input_path
         self.output_path = output_path
@@ -109,6 +114,9 @@ class FullBatchExtractor:
         self.max_retries = max_retries
         self.save_every = save_every
         self.force = force
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
+        self.norm_parquet_profile = norm_parquet_profile
         
         self.sleep_time = 60.0 / rpm
         
@@ -142,12 +150,12 @@ class FullBatchExtractor:
     def load_data(self):
         """데이터 로드 (기존 결과 이어받기)"""
         logger.info(f"Loading queue from {self.input_path}")
-        self.queue_df = pd.read_parquet(self.input_path)
+        self.queue_df = read_stage(self.input_path, ipc_cache=self.ipc_cache)
         logger.info(f"Total queue: {len(self.queue_df)}")
         
         # 기존 결과가 있으면 로드하고 이어서 처리
         if not self.force and os.path.exists(self.output_path):
-            existing_df = pd.read_parquet(self.output_path)
+            existing_df = read_stage(self.output_path)
             self.processed_ids = set(existing_df['review_id'].tolist())
             self.results = existing_df.to_dict('records')
             
@@ -328,13 +336,13 @@ class FullBatchExtractor:
     def _save_intermediate(self):
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
         df = pd.DataFrame(self.results)
-        df.to_parquet(self.output_path, index=False)
+        write_stage(df, self.output_path, profile=self.parquet_profile)
         logger.info(f"Saved checkpoint: {len(self.results)} results")
     
     def save_output(self):
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
         df = pd.DataFrame(self.results)
-        df.to_parquet(self.output_path, index=False)
+        write_stage(df, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         logger.info(f"Saved: {self.output_path}")
         
         # Normalized
@@ -362,7 +370,7 @@ class FullBatchExtractor:
         
         if rows:
             norm_df = pd.DataFrame(rows)
-            norm_df.to_parquet(self.output_norm_path, index=False)
+            write_stage(norm_df, self.output_norm_path, ipc_cache=self.ipc_cache, profile=self.norm_parquet_profile)
             logger.info(f"Saved normalized: {len(norm_df)} items")
             self.stats['normalized_items'] = len(norm_df)
             self.norm_df = norm_df
@@ -453,6 +461,10 @@ def main():
     parser.add_argument("--max_retries", type=int, default=5)
     parser.add_argument("--save_every", type=int, default=50)
     parser.add_argument("--force", action="store_true")
+    parser.add_argument("--ipc-cache", action="store_true",
+                        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기")
+    parser.add_argument("--config", default="config.yaml",
+                        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일")
     
     args = parser.parse_args()
     
@@ -467,7 +479,10 @@ def main():
         rpm=args.rpm,
         max_retries=args.max_retries,
         save_every=args.save_every,
-        force=args.force
+        force=args.force,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('extractions', args.config),
+        norm_parquet_profile=load_write_profile('extractions_normalized', args.config)
     )
     extractor.run()
 
@@ -21,6 +21,8 @@ from typing import Dict, Any, Optional
 import pandas as pd
 import numpy as np
 
+from src.schema import read_stage, write_stage, load_write_profile
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -41,7 +43,9 @@ class LLMQueueBuilder:
         max_helpful: int = 1000,
         max_random: int = 300,
         max_chars: int = 1200,
-        seed: int = 42
+        seed: int = 42,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default"
     ):
         self.input_path = input_path
         self.output_path = output_path
@@ -52,6 +56,8 @@ class LLMQueueBuilder:
         self.max_random = max_random
         self.max_chars = max_chars
         self.seed = seed
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
         
         self.df: Optional[pd.DataFrame] = None
         self.queue_df: Optional[pd.DataFrame] = None
@@ -62,8 +68,16 @@ class LLMQueueBuilder:
     def load_data(self):
         """데이터 로드"""
         logger.info(f"Loading data from {self.input_path}")
-        self.df = pd.read_parquet(self.input_path)
+        self.df = read_stage(self.input_path, ipc_cache=self.ipc_cache)
         logger.info(f"Loaded {len(self.df)} reviews")
+        
+        # 유사 중복 클러스터(Step 3-0.7)는 대표 리뷰만 추출 대상 (같은 본문에 LLM을 여러 번 호출하지 않음)
+        self.stats['near_dup_skipped'] = 0
+        if 'near_dup_cluster_id' in self.df.columns:
+            representative = (self.df['near_dup_cluster_id'] == self.df['review_id']).to_numpy()
+            self.stats['near_dup_skipped'] = int((~representative).sum())
+            self.df = self.df[representative]
+            logger.info(f"Skipped {self.stats['near_dup_skipped']} near-duplicate reviews (non-representative)")
     
     def calculate_priority_score(self, row: pd.Series, bucket: str) -> float:
         """우선순위 점수 계산"""
@@ -278,7 +292,7 @@ class LLMQueueBuilder:
     def save_output(self):
         """결과 저장"""
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        self.queue_df.to_parquet(self.output_path, index=False, engine='pyarrow')
+        write_stage(self.queue_df, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         logger.info(f"Saved queue to {self.output_path}")
     
     def generate_report(self):
@@ -299,6 +313,7 @@ class LLMQueueBuilder:
             "|------|-----|",
             f"| 총 Queue 건수 | {self.stats['total_queue']:,} |",
             f"| 중복 review_id | {self.stats['duplicate_review_ids']} |",
+            f"| 제외한 유사 중복 리뷰 (클러스터 대표 외) | {self.stats['near_dup_skipped']:,} |",
             "",
             "### 버킷별 건수",
             "",
@@ -374,6 +389,10 @@ def main():
     parser.add_argument("--max_random", type=int, default=300)
     parser.add_argument("--max_chars", type=int, default=1200)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--ipc-cache", action="store_true",
+                        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기")
+    parser.add_argument("--config", default="config.yaml",
+                        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일")
     
     args = parser.parse_args()
     
@@ -386,7 +405,9 @@ def main():
         max_helpful=args.max_helpful,
         max_random=args.max_random,
         max_chars=args.max_chars,
-        seed=args.seed
+        seed=args.seed,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('llm_queue', args.config)
     )
     builder.run()
 
@@ -0,0 +1,562 @@
+"""
+Step 3-0.7: Near-Duplicate Review Detection 스크립트
+
+review_id가 달라도 본문이 거의 같은 리뷰(상품 옵션/기획 세트 간 복사 리뷰, 체험단 템플릿 리뷰 등)를
+MinHash + LSH로 찾아 클러스터로 묶습니다. 행은 지우지 않고 다음 컬럼만 추가합니다.
+
+- near_dup_cluster_id: 클러스터 대표 리뷰(파일 순서상 첫 행)의 review_id (단독 리뷰는 자기 review_id)
+- near_dup_size: 클러스터 리뷰 수 (단독 리뷰는 1)
+
+처리 순서
+    1. review_text_clean의 문자 n-gram을 64비트 해시로 (min_chars보다 짧은 리뷰는 비교하지 않음)
+    2. 해시 함수 num_perm개로 리뷰마다 최솟값을 골라 MinHash 시그니처 생성
+       (두 시그니처에서 같은 값의 비율이 n-gram 집합 Jaccard 유사도의 추정치)
+    3. 시그니처를 bands개 구간으로 나눠 구간 값이 같은 리뷰끼리 후보 쌍 생성 (LSH)
+       같은 버킷의 리뷰는 버킷 안에서 뒤따르는 bucket_window개 리뷰와 짝지으므로, 작은 버킷은
+       모든 쌍을 비교하고 후보 수는 리뷰 수 x bands x bucket_window를 넘지 않음
+    4. 후보 쌍의 시그니처 일치 비율이 threshold 이상이면 연결, 연결 요소를 클러스터로
+
+모든 단계가 리뷰 수에 선형(정렬 제외)이라 100만 리뷰도 한 대에서 수 분 안에 끝납니다.
+시그니처 계산은 --workers로 행 범위 샤드를 여러 프로세스에서 나눠 실행할 수 있습니다.
+
+Usage:
+    python -m src.processing.near_dedup \
+        --input data/processed/reviews_step3_dedup.parquet \
+        --out data/processed/reviews_step3_neardup.parquet
+"""
+
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.processing.sharding import ShardExecutor
+from src.schema import read_stage, write_stage, load_write_profile
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 시그니처를 계산할 때 한 번에 처리할 리뷰 수 (n-gram 해시 배열 메모리 상한)
+BLOCK_ROWS = 50_000
+
+# 검증할 때 한 번에 비교할 후보 쌍 수
+PAIR_BLOCK = 200_000
+
+# 버킷 안에서 리뷰마다 짝지을 뒤따르는 리뷰 수 (버킷 크기가 이하면 모든 쌍)
+BUCKET_WINDOW = 32
+
+# n-gram 롤링 해시 / 밴드 키 결합용 상수 (64비트 곱셈은 2^64로 자연스럽게 잘림)
+_ROLL = np.uint64(0x100000001B3)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 마무리 함수 (uint64 배열, 제자리 연산)"""
+    x ^= x >> np.uint64(30)
+    x *= _MIX1
+    x ^= x >> np.uint64(27)
+    x *= _MIX2
+    x ^= x >> np.uint64(31)
+    return x
+
+
+def shingle_hashes(texts: List[str], ngram: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    리뷰별 문자 n-gram 해시 (모든 리뷰를 이어 붙인 코드포인트 배열에서 한 번에 계산)
+
+    Args:
+        texts: 리뷰 본문 (모두 ngram 글자 이상)
+        ngram: n-gram 글자 수
+
+    Returns:
+        (n-gram 해시 uint64 배열, 리뷰별 n-gram 수)
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+
+    # 위치 i에서 시작하는 n-gram의 다항식 해시 (리뷰 경계를 넘는 위치는 아래에서 버림)
+    windows = len(codes) - ngram + 1
+    rolled = codes[:windows].copy()
+    for k in range(1, ngram):
+        rolled *= _ROLL
+        rolled += codes[k:k + windows]
+
+    counts = lengths - ngram + 1
+    starts = np.cumsum(lengths) - lengths
+    # 리뷰마다 [시작, 시작 + n-gram 수) 위치만 남김
+    keep = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    return _mix64(rolled[keep]), counts
+
+
+class MinHasher:
+    """문자 n-gram MinHash 시그니처 생성기"""
+
+    def __init__(self, num_perm: int = 64, ngram: int = 5, seed: int = 42):
+        """
+        Args:
+            num_perm: 해시 함수 수 (시그니처 길이)
+            ngram: 문자 n-gram 글자 수
+            seed: 해시 함수 계수 시드 (같은 시드면 실행마다 같은 시그니처)
+        """
+        self.num_perm = num_perm
+        self.ngram = ngram
+        rng = np.random.default_rng(seed)
+        # 곱셈-시프트 해시 (a*x + b) >> 32, a는 홀수
+        self.mul = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.add = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        리뷰별 MinHash 시그니처
+
+        Args:
+            texts: 리뷰 본문 (모두 ngram 글자 이상)
+
+        Returns:
+            (리뷰 수, num_perm) uint32 배열
+        """
+        out = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        shift = np.uint64(32)
+        for start in range(0, len(texts), BLOCK_ROWS):
+            block = texts[start:start + BLOCK_ROWS]
+            hashes, counts = shingle_hashes(block, self.ngram)
+            offsets = np.cumsum(counts) - counts
+            values = np.empty_like(hashes)
+            for k in range(self.num_perm):
+                np.multiply(hashes, self.mul[k], out=values)
+                values += self.add[k]
+                values >>= shift
+                out[start:start + len(block), k] = np.minimum.reduceat(values, offsets)
+        return out
+
+
+def lsh_candidate_pairs(
+    signatures: np.ndarray,
+    bands: int,
+    window: int = BUCKET_WINDOW
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LSH 후보 쌍 (밴드 값이 같은 버킷 안의 리뷰 쌍, 중복 쌍 제거)
+
+    버킷 리뷰를 행 순서로 놓고 리뷰마다 뒤따르는 window개 리뷰와 짝지으므로, 크기가
+    window + 1 이하인 버킷은 모든 쌍이 후보가 됩니다. 템플릿 리뷰처럼 큰 버킷도 이웃끼리는
+    비교하므로 후보 수가 버킷 크기의 제곱으로 늘지 않습니다.
+
+    Args:
+        signatures: (리뷰 수, num_perm) 시그니처
+        bands: 밴드 수 (num_perm의 약수)
+        window: 버킷 안에서 리뷰마다 짝지을 뒤따르는 리뷰 수
+
+    Returns:
+        (앞 리뷰 위치, 뒤 리뷰 위치) 배열, 앞 < 뒤
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    keys = []
+    for b in range(bands):
+        band = signatures[:, b * rows:(b + 1) * rows].astype(np.uint64)
+        key = np.zeros(n, dtype=np.uint64)
+        for j in range(rows):
+            key *= _ROLL
+            key += band[:, j]
+        key = _mix64(key)
+
+        # 안정 정렬이므로 버킷 안에서는 원래 순서 (앞 리뷰가 항상 더 앞선 행)
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        for offset in range(1, min(window, n - 1) + 1):
+            same = np.flatnonzero(sorted_key[offset:] == sorted_key[:-offset])
+            if not len(same):
+                # offset 거리에 같은 버킷이 없으면 더 먼 거리에도 없음
+                break
+            keys.append(
+                order[same].astype(np.uint64) << np.uint64(32) | order[same + offset].astype(np.uint64)
+            )
+
+    if not keys:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(np.concatenate(keys))
+    return (pairs >> np.uint64(32)).astype(np.int64), (pairs & np.uint64(0xFFFFFFFF)).astype(np.int64)
+
+
+def signature_similarity(signatures: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    후보 쌍의 추정 Jaccard 유사도 (시그니처 값이 같은 비율)
+
+    Args:
+        signatures: (리뷰 수, num_perm) 시그니처
+        left, right: 후보 쌍 위치
+
+    Returns:
+        쌍별 유사도 float32 배열
+    """
+    out = np.empty(len(left), dtype=np.float32)
+    for start in range(0, len(left), PAIR_BLOCK):
+        end = start + PAIR_BLOCK
+        same = signatures[left[start:end]] == signatures[right[start:end]]
+        out[start:end] = same.mean(axis=1)
+    return out
+
+
+def connected_components(n: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    연결 요소 라벨 (요소에서 가장 앞선 위치, 최솟값 전파 + 포인터 점프)
+
+    Args:
+        n: 노드 수
+        left, right: 간선 양 끝 위치
+
+    Returns:
+        노드별 라벨 int64 배열
+    """
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        before = labels.copy()
+        np.minimum.at(labels, left, low)
+        np.minimum.at(labels, right, low)
+        # 라벨이 가리키는 노드의 라벨로 건너뛰기 (트리 높이를 줄임)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, before):
+            return labels
+
+
+# 워커 프로세스별 시그니처 생성기 (init_minhash_worker로 한 번만 생성)
+_worker_hasher: Optional[MinHasher] = None
+
+
+def init_minhash_worker(num_perm: int, ngram: int, seed: int) -> None:
+    """워커 초기화: MinHasher 생성"""
+    global _worker_hasher
+    _worker_hasher = MinHasher(num_perm=num_perm, ngram=ngram, seed=seed)
+
+
+def minhash_shard(texts: pd.DataFrame) -> np.ndarray:
+    """샤드 시그니처 계산 (ShardExecutor 단계 함수, texts: review_text_clean 컬럼)"""
+    return _worker_hasher.signatures(texts['review_text_clean'].tolist())
+
+
+class NearDuplicateDetector:
+    """MinHash/LSH 유사 중복 리뷰 탐지기"""
+
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        report_dir: str = "report",
+        ngram: int = 5,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8,
+        min_chars: int = 20,
+        bucket_window: int = BUCKET_WINDOW,
+        seed: int = 42,
+        workers: int = 1,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default"
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다")
+        self.input_path = input_path
+        self.output_path = output_path
+        self.report_dir = report_dir
+        self.ngram = ngram
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.min_chars = max(min_chars, ngram)
+        self.bucket_window = bucket_window
+        self.seed = seed
+        self.workers = workers
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
+        self.df: Optional[pd.DataFrame] = None
+        self.stats: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+
+    def load_data(self) -> None:
+        """데이터 로드"""
+        logger.info(f"Loading data from {self.input_path}")
+        self.df = read_stage(self.input_path, ipc_cache=self.ipc_cache)
+        self.stats['rows'] = len(self.df)
+        logger.info(f"Loaded {len(self.df)} reviews")
+
+    def compute_signatures(self, texts: pd.Series) -> np.ndarray:
+        """비교 대상 리뷰의 MinHash 시그니처 (workers > 1이면 행 범위 샤드로 나눠 계산)"""
+        initargs = (self.num_perm, self.ngram, self.seed)
+        with ShardExecutor(self.workers, initializer=init_minhash_worker, initargs=initargs) as executor:
+            parts = executor.map(minhash_shard, texts.to_frame('review_text_clean'))
+        if not parts:
+            return np.empty((0, self.num_perm), dtype=np.uint32)
+        return np.concatenate(parts)
+
+    def detect(self) -> None:
+        """유사 중복 클러스터 탐지"""
+        logger.info(
+            f"Detecting near-duplicates (ngram={self.ngram}, num_perm={self.num_perm}, "
+            f"bands={self.bands}, threshold={self.threshold})..."
+        )
+        texts = self.df['review_text_clean'].astype(object).fillna('')
+        eligible = np.flatnonzero(texts.str.len().to_numpy() >= self.min_chars)
+        self.stats['eligible'] = len(eligible)
+
+        started = time.perf_counter()
+        signatures = self.compute_signatures(texts.iloc[eligible].reset_index(drop=True))
+        self.timings['signatures'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        left, right = lsh_candidate_pairs(signatures, self.bands, self.bucket_window)
+        self.timings['lsh'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        similarity = signature_similarity(signatures, left, right)
+        matched = similarity >= self.threshold
+        labels = connected_components(len(eligible), left[matched], right[matched])
+        self.timings['clusters'] = time.perf_counter() - started
+
+        self.stats['candidate_pairs'] = len(left)
+        self.stats['matched_pairs'] = int(matched.sum())
+
+        # 비교 대상 위치 -> 전체 행 위치 (라벨은 클러스터에서 가장 앞선 행)
+        cluster_row = np.arange(len(self.df))
+        cluster_row[eligible] = eligible[labels]
+        review_ids = self.df['review_id'].astype(object).to_numpy()
+        sizes = np.bincount(cluster_row, minlength=len(self.df))[cluster_row]
+
+        self.df['near_dup_cluster_id'] = pd.Series(review_ids[cluster_row], index=self.df.index, dtype='str')
+        self.df['near_dup_size'] = sizes.astype(np.int32)
+
+        in_cluster = sizes > 1
+        self.stats['clusters'] = int(np.unique(cluster_row[in_cluster]).size)
+        self.stats['rows_in_clusters'] = int(in_cluster.sum())
+        self.stats['redundant_rows'] = self.stats['rows_in_clusters'] - self.stats['clusters']
+        self.stats['max_cluster_size'] = int(sizes.max()) if len(sizes) else 0
+
+        logger.info(
+            f"Candidate pairs: {len(left):,}, matched: {self.stats['matched_pairs']:,} "
+            f"(signatures {self.timings['signatures']:.1f}s, LSH {self.timings['lsh']:.1f}s, "
+            f"clusters {self.timings['clusters']:.1f}s)"
+        )
+        logger.info(
+            f"Found {self.stats['clusters']} near-duplicate clusters "
+            f"({self.stats['rows_in_clusters']} rows, {self.stats['redundant_rows']} redundant)"
+        )
+
+    def save_output(self) -> None:
+        """결과 저장"""
+        os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+        write_stage(self.df, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
+        logger.info(f"Saved near-duplicate clusters to {self.output_path}")
+
+    def generate_report(self) -> str:
+        """QA 리포트 생성"""
+        os.makedirs(self.report_dir, exist_ok=True)
+        report_path = os.path.join(self.report_dir, "step3_0_7_near_dedup.md")
+
+        rows = self.stats['rows']
+        lines = [
+            "# Step 3-0.7: Near-Duplicate Review Detection 리포트",
+            "",
+            f"생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "---",
+            "",
+            "## 1. 설정",
+            "",
+            "| 항목 | 값 |",
+            "|------|-----|",
+            f"| 문자 n-gram | {self.ngram} |",
+            f"| MinHash 해시 수 | {self.num_perm} |",
+            f"| LSH 밴드 수 (밴드당 행) | {self.bands} ({self.num_perm // self.bands}) |",
+            f"| 유사도 기준 (추정 Jaccard) | {self.threshold} |",
+            f"| 비교 최소 글자 수 | {self.min_chars} |",
+            f"| 버킷 내 비교 이웃 수 | {self.bucket_window} |",
+            "",
+            "---",
+            "",
+            "## 2. 탐지 결과 요약",
+            "",
+            "| 항목 | 값 |",
+            "|------|-----|",
+            f"| 전체 리뷰 | {rows:,} |",
+            f"| 비교 대상 리뷰 | {self.stats['eligible']:,} |",
+            f"| LSH 후보 쌍 | {self.stats['candidate_pairs']:,} |",
+            f"| 기준 통과 쌍 | {self.stats['matched_pairs']:,} |",
+            f"| 유사 중복 클러스터 | {self.stats['clusters']:,} |",
+            f"| 클러스터 소속 리뷰 | {self.stats['rows_in_clusters']:,} |",
+            f"| 대표 외 리뷰 (중복분) | {self.stats['redundant_rows']:,} "
+            f"({self.stats['redundant_rows'] / rows * 100 if rows else 0:.2f}%) |",
+            f"| 최대 클러스터 크기 | {self.stats['max_cluster_size']:,} |",
+            "",
+            "| 단계 | 소요 시간 (초) |",
+            "|------|---------------|",
+            f"| 시그니처 | {self.timings['signatures']:.1f} |",
+            f"| LSH 후보 | {self.timings['lsh']:.1f} |",
+            f"| 검증/클러스터 | {self.timings['clusters']:.1f} |",
+            "",
+            "---",
+            "",
+            "## 3. 큰 클러스터 샘플",
+            "",
+        ]
+
+        clustered = self.df[self.df['near_dup_size'] > 1]
+        top_ids = (
+            clustered.drop_duplicates('near_dup_cluster_id')
+            .sort_values('near_dup_size', ascending=False, kind='stable')['near_dup_cluster_id']
+            .head(5)
+        )
+        if top_ids.empty:
+            lines.append("유사 중복 클러스터가 없습니다.")
+        for i, cluster_id in enumerate(top_ids, 1):
+            members = clustered[clustered['near_dup_cluster_id'] == cluster_id]
+            lines.extend([
+                f"### 샘플 {i}: near_dup_cluster_id={cluster_id} ({len(members)}건, "
+                f"상품 {members['goods_no'].nunique()}개)",
+                "",
+                "| review_id | goods_no | rating | 본문 (앞 80자) |",
+                "|-----------|----------|--------|----------------|",
+            ])
+            for _, row in members.head(5).iterrows():
+                text = str(row['review_text_clean'])[:80].replace('|', '/').replace('\n', ' ')
+                lines.append(f"| {row['review_id']} | {row['goods_no']} | {row['rating']} | {text} |")
+            lines.append("")
+
+        report_content = "\n".join(lines)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report_content)
+
+        logger.info(f"Generated report: {report_path}")
+        return report_path
+
+    def run(self) -> None:
+        """전체 파이프라인 실행"""
+        try:
+            self.load_data()
+            self.detect()
+            self.save_output()
+            self.generate_report()
+
+            logger.info("=" * 50)
+            logger.info("Near-duplicate detection completed successfully!")
+            logger.info(f"Output: {self.output_path}")
+            logger.info(f"Report: {os.path.join(self.report_dir, 'step3_0_7_near_dedup.md')}")
+
+        except Exception as e:
+            logger.error(f"Error during near-duplicate detection: {e}")
+            raise
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Step 3-0.7: Near-Duplicate Review Detection 스크립트 (MinHash/LSH)"
+    )
+    parser.add_argument(
+        "--input", "-i",
+        default="data/processed/reviews_step3_dedup.parquet",
+        help="입력 parquet 파일 경로 (Step 3-0.5 출력)"
+    )
+    parser.add_argument(
+        "--out", "-o",
+        default="data/processed/reviews_step3_neardup.parquet",
+        help="출력 parquet 파일 경로"
+    )
+    parser.add_argument(
+        "--report-dir",
+        default="report",
+        help="리포트 출력 디렉토리"
+    )
+    parser.add_argument(
+        "--ngram",
+        type=int,
+        default=5,
+        help="문자 n-gram 글자 수"
+    )
+    parser.add_argument(
+        "--num-perm",
+        type=int,
+        default=64,
+        help="MinHash 해시 함수 수 (시그니처 길이)"
+    )
+    parser.add_argument(
+        "--bands",
+        type=int,
+        default=16,
+        help="LSH 밴드 수 (num-perm의 약수, 많을수록 낮은 유사도 쌍도 후보가 됨)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.8,
+        help="같은 클러스터로 묶을 최소 추정 Jaccard 유사도"
+    )
+    parser.add_argument(
+        "--min-chars",
+        type=int,
+        default=20,
+        help="비교할 최소 글자 수 (짧은 정형 리뷰가 한 클러스터로 묶이지 않게)"
+    )
+    parser.add_argument(
+        "--bucket-window",
+        type=int,
+        default=BUCKET_WINDOW,
+        help="LSH 버킷 안에서 리뷰마다 비교할 뒤따르는 리뷰 수 (버킷이 이보다 작으면 모든 쌍 비교)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="MinHash 해시 함수 시드"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="시그니처 계산 워커 프로세스 수 (0이면 CPU 수, 결과는 워커 수와 무관)"
+    )
+    parser.add_argument(
+        "--ipc-cache",
+        action="store_true",
+        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기"
+    )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일"
+    )
+
+    args = parser.parse_args()
+
+    detector = NearDuplicateDetector(
+        input_path=args.input,
+        output_path=args.out,
+        report_dir=args.report_dir,
+        ngram=args.ngram,
+        num_perm=args.num_perm,
+        bands=args.bands,
+        threshold=args.threshold,
+        min_chars=args.min_chars,
+        bucket_window=args.bucket_window,
+        seed=args.seed,
+        workers=args.workers,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('neardup', args.config)
+    )
+    detector.run()
+
+
+if __name__ == "__main__":
+    main()
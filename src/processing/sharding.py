@@ -0,0 +1,117 @@
+"""
+단계 함수 멀티프로세스 실행기 (연속 행 범위 샤딩)
+
+입력 DataFrame을 연속된 행 범위(shard)로 나눠 ProcessPoolExecutor 워커에서 단계 함수를 실행하고,
+결과를 원래 행 순서대로 돌려줍니다. 사전/설정처럼 로드 비용이 큰 상태는 initializer로
+워커마다 한 번만 만들고, 단계 함수는 모듈 최상위 함수(pickle 가능)여야 합니다.
+
+Usage:
+    with ShardExecutor(workers=4, initializer=init_worker, initargs=(lexicon_path,)) as executor:
+        parts = executor.map(process_shard, df)
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    워커 수 결정
+
+    Args:
+        workers: 요청한 워커 수 (0 이하면 CPU 수)
+
+    Returns:
+        1 이상의 워커 수
+    """
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def shard_ranges(total: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    행 수를 연속된 범위로 균등 분할 (범위 크기 차이는 최대 1행, 빈 범위 없음)
+
+    Args:
+        total: 전체 행 수
+        shards: 나눌 개수
+
+    Returns:
+        (시작, 끝) 범위 리스트 (끝 미포함, 원래 순서)
+    """
+    shards = max(1, min(shards, total))
+    size, extra = divmod(total, shards)
+    ranges = []
+    start = 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class ShardExecutor:
+    """행 범위 샤드 실행기 (workers가 1이면 프로세스를 만들지 않고 현재 프로세스에서 실행)"""
+
+    def __init__(
+        self,
+        workers: int = 1,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = ()
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수 (0 이하면 CPU 수)
+            initializer: 워커마다 한 번 실행할 초기화 함수 (사전/설정 로드)
+            initargs: initializer 인자
+        """
+        self.workers = resolve_workers(workers)
+        self.initializer = initializer
+        self.initargs = initargs
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ShardExecutor':
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=self.initializer, initargs=self.initargs
+            )
+        elif self.initializer is not None:
+            self.initializer(*self.initargs)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=exc_type is not None)
+            self._pool = None
+
+    def map(
+        self,
+        fn: Callable[[pd.DataFrame], Any],
+        df: pd.DataFrame,
+        shards: Optional[int] = None
+    ) -> List[Any]:
+        """
+        DataFrame을 연속 행 범위로 나눠 단계 함수 실행
+
+        Args:
+            fn: 샤드 DataFrame을 받는 단계 함수 (모듈 최상위 함수)
+            df: 입력 DataFrame
+            shards: 샤드 수 (기본: 워커 수)
+
+        Returns:
+            샤드별 결과 리스트 (원래 행 순서)
+        """
+        ranges = shard_ranges(len(df), shards or self.workers)
+        parts = [df.iloc[start:end] for start, end in ranges]
+        if self._pool is None:
+            return [fn(part) for part in parts]
+
+        logger.info(f"Running {fn.__name__} on {len(df)} rows in {len(parts)} shards ({self.workers} workers)")
+        return list(self._pool.map(fn, parts))
@@ -6,9 +6,12 @@ Attribute/Context/Skin 태깅, Conditional 탐지, Negation handling, Golden Nug
 
 Usage:
     python -m src.processing.tagging \
-        --input data/processed/reviews_step3_dedup.parquet \
+        --input data/processed/reviews_step3_neardup.parquet \
         --out data/processed/reviews_step3_tagged.parquet \
         --lexicon config/tag_lexicon_v2.yaml
+
+    # 워커 프로세스 4개로 나눠 태깅
+    python -m src.processing.tagging --workers 4
 """
 
 import argparse
@@ -24,6 +27,9 @@ import pandas as pd
 import numpy as np
 import yaml
 
+from src.schema import read_stage, write_stage, load_write_profile
+from src.processing.sharding import ShardExecutor, resolve_workers
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -262,14 +268,41 @@ class ReviewTagger:
         }
 
 
+# 샤드 워커 프로세스의 태거 (init_tagging_worker가 워커마다 한 번 생성)
+_worker_tagger: Optional[ReviewTagger] = None
+
+
+def init_tagging_worker(lexicon_path: str) -> None:
+    """샤드 워커 초기화: 태그 사전 로드 및 패턴 컴파일"""
+    global _worker_tagger
+    _worker_tagger = ReviewTagger(TagLexicon(lexicon_path))
+
+
+def tag_shard(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """샤드 워커 함수: 행 범위 하나를 태깅 (process_review 결과 리스트, 행 순서 유지)"""
+    return [_worker_tagger.process_review(row) for _, row in df.iterrows()]
+
+
 class TaggingPipeline:
     """태깅 파이프라인"""
     
-    def __init__(self, input_path: str, output_path: str, lexicon_path: str, report_dir: str):
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        lexicon_path: str,
+        report_dir: str,
+        ipc_cache: bool = False,
+        parquet_profile: str = "default",
+        workers: int = 1
+    ):
         self.input_path = input_path
         self.output_path = output_path
         self.lexicon_path = lexicon_path
         self.report_dir = report_dir
+        self.ipc_cache = ipc_cache
+        self.parquet_profile = parquet_profile
+        self.workers = resolve_workers(workers)
         
         self.df: Optional[pd.DataFrame] = None
         self.lexicon: Optional[TagLexicon] = None
@@ -283,7 +316,7 @@ class TaggingPipeline:
         self.tagger = ReviewTagger(self.lexicon)
         
         logger.info(f"Loading data from {self.input_path}")
-        self.df = pd.read_parquet(self.input_path)
+        self.df = read_stage(self.input_path, ipc_cache=self.ipc_cache)
         logger.info(f"Loaded {len(self.df)} reviews")
     
     def run_tagging(self):
@@ -293,12 +326,18 @@ class TaggingPipeline:
         results = []
         total = len(self.df)
         
-        for idx, row in self.df.iterrows():
-            if idx % 1000 == 0:
-                logger.info(f"Processing {idx}/{total}...")
-            
-            result = self.tagger.process_review(row)
-            results.append(result)
+        if self.workers > 1:
+            # 연속 행 범위로 나눠 워커마다 사전을 한 번 로드하고, 결과는 원래 순서로 이어 붙임
+            with ShardExecutor(self.workers, initializer=init_tagging_worker, initargs=(self.lexicon_path,)) as executor:
+                for part in executor.map(tag_shard, self.df):
+                    results.extend(part)
+        else:
+            for idx, row in self.df.iterrows():
+                if idx % 1000 == 0:
+                    logger.info(f"Processing {idx}/{total}...")
+                
+                result = self.tagger.process_review(row)
+                results.append(result)
         
         # 결과 병합
         result_df = pd.DataFrame(results)
@@ -323,7 +362,7 @@ class TaggingPipeline:
         self.stats['conditional_rate'] = self.df['has_conditional'].sum() / total * 100
         
         # Rating별 conditional
-        cond_by_rating = self.df.groupby('rating_bucket')['has_conditional'].mean() * 100
+        cond_by_rating = self.df.groupby('rating_bucket', observed=True)['has_conditional'].mean() * 100
         self.stats['conditional_by_rating'] = cond_by_rating.to_dict()
         
         # Golden nugget
@@ -414,7 +453,7 @@ class TaggingPipeline:
     def save_output(self):
         """결과 저장"""
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        self.df.to_parquet(self.output_path, index=False, engine='pyarrow')
+        write_stage(self.df, self.output_path, ipc_cache=self.ipc_cache, profile=self.parquet_profile)
         logger.info(f"Saved tagged data to {self.output_path}")
     
     def generate_report(self):
@@ -490,7 +529,7 @@ class TaggingPipeline:
         
         negated_samples = []
         for idx, row in self.df.iterrows():
-            if row['attribute_polarity']:
+            if isinstance(row['attribute_polarity'], str):
                 pol = json.loads(row['attribute_polarity'])
                 if pol.get('WHITECAST') == 'negated':
                     text = row['review_text_clean'][:100] if row['review_text_clean'] else ''
@@ -639,10 +678,16 @@ class TaggingPipeline:
 
 def main():
     parser = argparse.ArgumentParser(description="Step 3-1 v2: Advanced Tagging")
-    parser.add_argument("--input", "-i", default="data/processed/reviews_step3_dedup.parquet")
+    parser.add_argument("--input", "-i", default="data/processed/reviews_step3_neardup.parquet")
     parser.add_argument("--out", "-o", default="data/processed/reviews_step3_tagged.parquet")
     parser.add_argument("--lexicon", "-l", default="config/tag_lexicon_v2.yaml")
     parser.add_argument("--report-dir", default="report")
+    parser.add_argument("--ipc-cache", action="store_true",
+                        help="다음 단계용 Arrow IPC 캐시(.arrow)를 함께 쓰고, 입력의 캐시가 있으면 메모리 맵으로 읽기")
+    parser.add_argument("--config", default="config.yaml",
+                        help="Parquet 저장 프로필(output.parquet_profiles)을 읽을 설정 파일")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="태깅을 나눠 실행할 워커 프로세스 수 (기본 1, 0이면 CPU 수)")
     
     args = parser.parse_args()
     
@@ -650,7 +695,10 @@ def main():
         input_path=args.input,
         output_path=args.out,
         lexicon_path=args.lexicon,
-        report_dir=args.report_dir
+        report_dir=args.report_dir,
+        ipc_cache=args.ipc_cache,
+        parquet_profile=load_write_profile('tagged', args.config),
+        workers=args.workers
     )
     pipeline.run()
 
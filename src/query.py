@@ -0,0 +1,271 @@
+"""
+DuckDB 조회 모듈
+
+data/ 아래 파이프라인 산출물(수집 리뷰, 전처리/중복 제거/태깅 결과, LLM 큐와 추출 결과,
+data/analysis 피벗)을 DuckDB 뷰로 등록하여 pandas로 파일 전체를 읽지 않고 SQL로 조회합니다.
+
+- 뷰는 Parquet 파일을 직접 스캔하므로 SELECT한 컬럼만 읽고(projection pushdown),
+  WHERE 조건은 row group 통계(min/max)로 필요 없는 구간을 건너뜁니다(predicate pushdown).
+- 리뷰 데이터셋(output.dataset)은 매니페스트에 커밋된 파일만 등록하고,
+  crawl_date/category 파티션 값은 폴더 이름에서 컬럼으로 붙입니다.
+- 없는 산출물은 건너뛰므로 파이프라인 중간 단계까지만 실행한 상태에서도 쓸 수 있습니다.
+
+Usage:
+    python -m src.query --list
+    python -m src.query "SELECT aspect, COUNT(*) AS n FROM extractions_normalized GROUP BY 1 ORDER BY n DESC"
+    python -m src.query --file query.sql --out result.parquet
+
+    from src.query import connect
+    with connect() as db:
+        df = db.sql("SELECT goods_no, AVG(rating) FROM reviews_dedup GROUP BY 1")
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+from .dataset import ReviewDataset, is_dataset
+
+logger = logging.getLogger(__name__)
+
+# 뷰 이름 -> data_dir 기준 Parquet 경로 (Step 3 ~ Step 4 산출물)
+PARQUET_ARTIFACTS: Dict[str, str] = {
+    'reviews_base': 'processed/reviews_step3_base.parquet',
+    'reviews_dedup': 'processed/reviews_step3_dedup.parquet',
+    'reviews_neardup': 'processed/reviews_step3_neardup.parquet',
+    'reviews_tagged': 'processed/reviews_step3_tagged.parquet',
+    'llm_queue': 'llm/llm_queue.parquet',
+    'extractions': 'llm/extractions_full.parquet',
+    'extractions_normalized': 'llm/extractions_full_normalized.parquet',
+    'master_join': 'analysis/step4_master_join.parquet',
+    'pivot_aspect_polarity_overall': 'analysis/pivot_aspect_polarity_overall.parquet',
+    'pivot_aspect_polarity_by_bucket': 'analysis/pivot_aspect_polarity_by_bucket.parquet',
+    'pivot_context_aspect_unmet': 'analysis/pivot_context_aspect_unmet.parquet',
+    'pivot_season_aspect_unmet': 'analysis/pivot_season_aspect_unmet.parquet',
+    'repeatability_aspect_goods_count': 'analysis/repeatability_aspect_goods_count.parquet',
+}
+
+# 수집 리뷰: 파티션 데이터셋, 없으면 단일 파일
+REVIEW_DATASET = 'processed/reviews'
+REVIEW_FILES = {
+    'reviews': 'processed/reviews.parquet',
+    'review_refs': 'processed/review_refs.parquet',
+}
+
+# 데이터셋 파티션 컬럼 타입 (dataset.PARTITION_COLUMNS)
+HIVE_TYPES = "{'crawl_date': DATE, 'category': VARCHAR}"
+
+# 원본 JSONL (수집 실행별 파일)
+RAW_REVIEWS_GLOB = 'raw/reviews_*.jsonl'
+
+
+def _sql_list(paths: List[str]) -> str:
+    """경로 리스트를 SQL 문자열 리스트 리터럴로 변환"""
+    return '[' + ', '.join("'" + p.replace("'", "''") + "'" for p in paths) + ']'
+
+
+class PipelineQuery:
+    """파이프라인 산출물 뷰를 등록한 DuckDB 연결"""
+
+    def __init__(
+        self,
+        data_dir: str = 'data',
+        database: str = ':memory:',
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None
+    ):
+        """
+        Args:
+            data_dir: 산출물 루트 폴더
+            database: DuckDB 파일 경로 (기본: 메모리, 뷰만 만들므로 데이터는 복사하지 않음)
+            threads: DuckDB 스레드 수 (기본: CPU 수)
+            memory_limit: DuckDB 메모리 상한 (예: '4GB', 넘으면 디스크로 내려 씀)
+        """
+        self.data_dir = data_dir
+        config: Dict[str, Any] = {}
+        if threads:
+            config['threads'] = threads
+        if memory_limit:
+            config['memory_limit'] = memory_limit
+
+        self.con = duckdb.connect(database, config=config)
+        self.views: Dict[str, str] = {}
+        self.register_artifacts()
+
+    def __enter__(self) -> 'PipelineQuery':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def register_parquet(self, name: str, paths: List[str], hive_partitioning: bool = False) -> bool:
+        """
+        Parquet 파일들을 뷰로 등록 (파일마다 컬럼이 달라도 이름 기준으로 합침)
+
+        Args:
+            name: 뷰 이름
+            paths: Parquet 파일 경로 리스트
+            hive_partitioning: True면 key=value 폴더 이름을 컬럼으로 추가 (HIVE_TYPES 타입)
+
+        Returns:
+            등록했으면 True (파일이 없으면 False)
+        """
+        paths = [p for p in paths if os.path.exists(p)]
+        if not paths:
+            return False
+
+        options = 'union_by_name = true'
+        if hive_partitioning:
+            # 자동 추론하면 숫자로만 된 카테고리 이름이 BIGINT가 되어 문자열 조건/조인이 깨짐
+            options += f", hive_partitioning = true, hive_types = {HIVE_TYPES}"
+        self.con.execute(
+            f'CREATE OR REPLACE VIEW "{name}" AS SELECT * FROM read_parquet({_sql_list(paths)}, {options})'
+        )
+        self.views[name] = paths[0] if len(paths) == 1 else f"{os.path.dirname(paths[0])} 외 {len(paths)}개 파일"
+        return True
+
+    def register_artifacts(self) -> None:
+        """data_dir 아래 파이프라인 산출물을 모두 뷰로 등록 (없는 산출물은 건너뜀)"""
+        dataset_root = os.path.join(self.data_dir, REVIEW_DATASET)
+        if is_dataset(dataset_root):
+            dataset = ReviewDataset(dataset_root)
+            for name, kind in (('reviews', 'reviews'), ('review_refs', 'refs')):
+                paths = [os.path.join(dataset_root, e['path']) for e in dataset.entries(kind)]
+                if self.register_parquet(name, paths, hive_partitioning=True):
+                    self.views[name] = f"{dataset_root} ({len(paths)}개 파일)"
+        else:
+            for name, path in REVIEW_FILES.items():
+                self.register_parquet(name, [os.path.join(self.data_dir, path)])
+
+        raw_files = sorted(glob.glob(os.path.join(self.data_dir, RAW_REVIEWS_GLOB)))
+        if raw_files:
+            self.con.execute(
+                f"CREATE OR REPLACE VIEW raw_reviews AS SELECT * FROM read_json_auto("
+                f"{_sql_list(raw_files)}, format = 'newline_delimited', union_by_name = true, filename = true)"
+            )
+            self.views['raw_reviews'] = f"{os.path.join(self.data_dir, RAW_REVIEWS_GLOB)} ({len(raw_files)}개 파일)"
+
+        for name, path in PARQUET_ARTIFACTS.items():
+            self.register_parquet(name, [os.path.join(self.data_dir, path)])
+
+        logger.info(f"DuckDB 뷰 등록: {len(self.views)}개 ({self.data_dir})")
+
+    def relation(self, query: str) -> Optional[duckdb.DuckDBPyRelation]:
+        """SQL 실행 (SELECT 계열은 결과를 아직 가져오지 않은 relation, 그 외는 None)"""
+        return self.con.sql(query)
+
+    def sql(self, query: str, params: Optional[List[Any]] = None) -> pd.DataFrame:
+        """
+        SQL 실행 결과를 DataFrame으로 반환
+
+        Args:
+            query: SQL (뷰 이름으로 산출물 참조)
+            params: ? 자리에 바인딩할 값
+
+        Returns:
+            결과 DataFrame
+        """
+        return self.con.execute(query, params or []).df()
+
+    def arrow(self, query: str, params: Optional[List[Any]] = None) -> pa.Table:
+        """SQL 실행 결과를 Arrow 테이블로 반환"""
+        return self.con.execute(query, params or []).arrow()
+
+    def explain(self, query: str) -> str:
+        """실행 계획 (스캔 컬럼과 필터 pushdown 확인용)"""
+        rows = self.con.execute(f"EXPLAIN {query}").fetchall()
+        return '\n'.join(row[1] for row in rows)
+
+    def columns(self, name: str) -> List[str]:
+        """뷰 컬럼 이름"""
+        return [row[0] for row in self.con.execute(f'DESCRIBE "{name}"').fetchall()]
+
+    def close(self) -> None:
+        """연결 종료"""
+        self.con.close()
+
+
+def connect(data_dir: str = 'data', **kwargs: Any) -> PipelineQuery:
+    """
+    산출물 뷰를 등록한 DuckDB 연결 생성 헬퍼 함수
+
+    Args:
+        data_dir: 산출물 루트 폴더
+        **kwargs: PipelineQuery 옵션 (database, threads, memory_limit)
+
+    Returns:
+        PipelineQuery 인스턴스
+    """
+    return PipelineQuery(data_dir, **kwargs)
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="파이프라인 산출물 SQL 조회 (DuckDB)")
+    parser.add_argument('query', nargs='?', help="실행할 SQL (뷰 이름으로 산출물 참조)")
+    parser.add_argument('--file', '-f', help="SQL 파일 경로 (query 대신)")
+    parser.add_argument('--data-dir', default='data', help="산출물 루트 폴더")
+    parser.add_argument('--list', action='store_true', help="등록된 뷰 목록 출력")
+    parser.add_argument('--explain', action='store_true', help="결과 대신 실행 계획 출력")
+    parser.add_argument('--out', '-o', help="결과 저장 경로 (.parquet 또는 .csv, 지정하면 전체 결과 저장)")
+    parser.add_argument('--max-rows', type=int, default=50, help="화면에 출력할 최대 행 수")
+    parser.add_argument('--threads', type=int, default=None, help="DuckDB 스레드 수")
+    parser.add_argument('--memory-limit', default=None, help="DuckDB 메모리 상한 (예: 4GB)")
+
+    args = parser.parse_args()
+
+    query = args.query
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            query = f.read()
+    if not query and not args.list:
+        parser.error("query, --file, --list 중 하나가 필요합니다")
+
+    with connect(args.data_dir, threads=args.threads, memory_limit=args.memory_limit) as db:
+        if args.list:
+            for name, source in db.views.items():
+                print(f"{name:36s} {len(db.columns(name)):3d} cols  {source}")
+            if not query:
+                return
+
+        if args.explain:
+            print(db.explain(query))
+            return
+
+        started = time.perf_counter()
+        relation = db.relation(query)
+        if relation is None:
+            logger.info(f"실행 완료 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+            return
+
+        if args.out:
+            os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+            if args.out.endswith('.csv'):
+                relation.write_csv(args.out)
+            else:
+                relation.write_parquet(args.out)
+            logger.info(f"결과 저장: {args.out} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+            return
+
+        df = relation.limit(args.max_rows + 1).df()
+        elapsed = (time.perf_counter() - started) * 1000
+        with pd.option_context('display.width', 200, 'display.max_columns', 50):
+            print(df.head(args.max_rows).to_string(index=False))
+        more = " (이후 생략)" if len(df) > args.max_rows else ""
+        print(f"\n{min(len(df), args.max_rows)}행{more}, {elapsed:.0f}ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
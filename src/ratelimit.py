@@ -0,0 +1,153 @@
+"""
+요청 속도 제한 모듈
+
+호스트별로 공유되는 토큰 버킷 기반 속도 제한기를 제공합니다.
+동시 수집 모드에서 여러 워커 스레드가 같은 제한기를 공유하여
+전체 초당 요청 수가 설정값을 넘지 않도록 합니다.
+request.pacing.adaptive가 켜져 있으면 응답 신호로 속도를 조절하는
+AdaptivePacer를 대신 사용합니다.
+"""
+
+import os
+import time
+import threading
+import logging
+from typing import Dict, Any, Optional, Union
+from urllib.parse import urlparse
+
+from .pacing import AdaptivePacer
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 토큰 충전 수 (= 초당 최대 요청 수)
+            burst: 버킷 최대 용량 (순간적으로 허용되는 연속 요청 수)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = max(1, int(burst))
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (부족하면 충전될 때까지 대기)
+
+        토큰이 모자라면 음수로 예약해 두고 잠금 밖에서 대기하므로,
+        동시에 호출한 스레드들은 도착 순서대로 간격을 두고 통과합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, latency: float, status: Optional[int], retry_after: Optional[float] = None) -> None:
+        """응답 결과 반영 (고정 속도이므로 무시)"""
+
+    def save(self) -> Optional[str]:
+        """상태 저장 (고정 속도이므로 저장할 상태 없음)"""
+        return None
+
+
+RateLimiter = Union[TokenBucket, AdaptivePacer]
+
+# 호스트별 공유 제한기
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def is_adaptive_pacing(config: Dict[str, Any]) -> bool:
+    """적응형 속도 조절 사용 여부 (켜져 있으면 순차 모드도 제한기로 간격 제어)"""
+    return bool(config.get('request', {}).get('pacing', {}).get('adaptive', False))
+
+
+def needs_rate_limiter(config: Dict[str, Any], concurrency: int) -> bool:
+    """
+    랜덤 딜레이 대신 호스트별 공유 제한기를 쓸지 여부
+
+    동시 요청, 적응형 속도 조절, 또는 여러 수집기가 같은 호스트로 함께 요청하는
+    경우(request.shared_limiter, 다중 카테고리 스케줄러가 설정)에 사용합니다.
+    """
+    request_config = config.get('request', {})
+    return concurrency > 1 or is_adaptive_pacing(config) or bool(request_config.get('shared_limiter', False))
+
+
+def get_rate_limiter(config: Dict[str, Any], url: str) -> RateLimiter:
+    """
+    URL 호스트에 대응하는 공유 속도 제한기 반환
+
+    같은 호스트로 요청하는 수집기는 동일한 제한기를 공유합니다.
+    rate_limit이 설정되지 않으면 기존 순차 모드의 평균 딜레이
+    (delay_min, delay_max의 중간값)에서 초당 요청 수를 계산합니다.
+    적응형 모드에서는 이 값이 시작 속도가 되고 (저장된 상태가 있으면 그 값),
+    고정 간격보다 느려지지 않도록 pacing.min_rate가 더 낮아도 이 값을 최소 속도로 씁니다.
+
+    Args:
+        config: 설정 딕셔너리 (config.yaml에서 로드)
+        url: 요청 대상 URL
+
+    Returns:
+        TokenBucket 또는 AdaptivePacer 인스턴스
+    """
+    request_config = config.get('request', {})
+    host = urlparse(url).netloc
+
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            rate = request_config.get('rate_limit')
+            if not rate:
+                delay_min = request_config.get('delay_min', 1.0)
+                delay_max = request_config.get('delay_max', 2.0)
+                rate = 2.0 / max(delay_min + delay_max, 0.01)
+
+            if is_adaptive_pacing(config):
+                pacing_config = request_config.get('pacing', {})
+                raw_dir = config.get('output', {}).get('raw_dir', 'data/raw')
+                min_rate = max(pacing_config.get('min_rate') or rate, rate)
+                limiter = AdaptivePacer(
+                    rate,
+                    min_rate=min_rate,
+                    max_rate=max(pacing_config.get('max_rate', 5.0), min_rate),
+                    additive_increase=pacing_config.get('additive_increase', 0.05),
+                    decrease_factor=pacing_config.get('decrease_factor', 0.5),
+                    latency_spike_factor=pacing_config.get('latency_spike_factor', 3.0),
+                    state_path=pacing_config.get(
+                        'state_file', os.path.join(raw_dir, 'pacing_state.json')
+                    ),
+                    state_key=host,
+                )
+                logger.info(
+                    f"적응형 속도 조절기 생성: {host} ({limiter.rate:.2f} req/s, "
+                    f"범위 {limiter.min_rate:.2f}~{limiter.max_rate:.2f})"
+                )
+            else:
+                burst = request_config.get('burst', 1)
+                limiter = TokenBucket(rate, burst)
+                logger.info(f"속도 제한기 생성: {host} ({rate:.2f} req/s, burst={burst})")
+
+            _LIMITERS[host] = limiter
+
+    return limiter
@@ -7,7 +7,7 @@
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from collections import Counter
 
 import pandas as pd
@@ -31,16 +31,18 @@ class ReportGenerator:
     def generate_summary(
         self,
         products: List[Dict[str, Any]],
-        reviews: List[Dict[str, Any]],
-        output_paths: Optional[Dict[str, str]] = None
+        reviews: Union[List[Dict[str, Any]], pd.DataFrame],
+        output_paths: Optional[Dict[str, str]] = None,
+        metrics: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         수집 요약 리포트 생성
         
         Args:
             products: 상품 정보 리스트
-            reviews: 리뷰 정보 리스트
+            reviews: 리뷰 정보 리스트 또는 DataFrame (스트리밍 저장 후 Parquet에서 로드)
             output_paths: 저장된 파일 경로 딕셔너리
+            metrics: 수집 텔레메트리 스냅샷 (telemetry.export_crawl_metrics 결과)
             
         Returns:
             리포트 파일 경로
@@ -48,7 +50,10 @@ class ReportGenerator:
         now = datetime.now()
         
         # 리뷰 DataFrame 생성
-        reviews_df = pd.DataFrame(reviews) if reviews else pd.DataFrame()
+        if isinstance(reviews, pd.DataFrame):
+            reviews_df = reviews
+        else:
+            reviews_df = pd.DataFrame(reviews) if reviews else pd.DataFrame()
         
         # 리포트 내용 생성
         lines = [
@@ -173,6 +178,9 @@ class ReportGenerator:
             for key, path in output_paths.items():
                 lines.append(f"- `{key}`: `{path}`")
         
+        if metrics:
+            lines.extend(self._telemetry_section(metrics))
+        
         # 리포트 저장
         report_content = '\n'.join(lines)
         report_path = os.path.join(self.report_dir, 'data_summary.md')
@@ -182,13 +190,66 @@ class ReportGenerator:
         
         logger.info(f"리포트 생성: {report_path}")
         return report_path
+    
+    def _telemetry_section(self, metrics: Dict[str, Any]) -> List[str]:
+        """수집 텔레메트리 섹션 (실행 시간 구성과 엔드포인트별 요청 통계)"""
+        lines = [
+            "",
+            "---",
+            "",
+            "## 6. 수집 텔레메트리",
+            "",
+            f"- **실행 시간**: {metrics['elapsed_seconds']:,.1f}초",
+            f"- **I/O 대기 (요청 지연 합계)**: {metrics['io_wait_seconds']:,.1f}초",
+            f"- **대기 (sleep 합계)**: {metrics['sleep_seconds']:,.1f}초",
+        ]
+        for reason, seconds in metrics.get('sleep_by_reason', {}).items():
+            lines.append(f"  - {reason}: {seconds:,.1f}초")
+        lines.append("")
+        lines.append("동시 모드에서는 스레드별 시간이 합산되어 실행 시간보다 클 수 있습니다.")
+        
+        endpoints = metrics.get('endpoints', {})
+        if endpoints:
+            lines.extend([
+                "",
+                "| 엔드포인트 | 요청 수 | 평균 지연 | p95 지연 | 최대 지연 | 다운로드 | 재시도 | 캐시 적중 |",
+                "|------------|---------|-----------|----------|-----------|----------|--------|-----------|",
+            ])
+            for endpoint, data in endpoints.items():
+                latency = data['latency']
+                mean = f"{latency['mean_seconds']:.3f}s" if latency['mean_seconds'] is not None else "-"
+                p95 = f"≤{latency['p95_seconds']:.3f}s" if latency['p95_seconds'] is not None else "-"
+                lines.append(
+                    f"| {endpoint} | {latency['count']:,} | {mean} | {p95} | {latency['max_seconds']:.3f}s | "
+                    f"{data['bytes_downloaded'] / 1024 / 1024:,.1f}MB | "
+                    f"{sum(data['retries_by_cause'].values()):,} | {data['cache_hits']:,} |"
+                )
+            
+            failures = [
+                (endpoint, cause, count, data['retries_by_cause'].get(cause, 0))
+                for endpoint, data in endpoints.items()
+                for cause, count in data['failures_by_cause'].items()
+            ]
+            if failures:
+                lines.extend([
+                    "",
+                    "### 요청 실패 원인",
+                    "",
+                    "| 엔드포인트 | 원인 | 실패 | 재시도 |",
+                    "|------------|------|------|--------|",
+                ])
+                for endpoint, cause, count, retried in failures:
+                    lines.append(f"| {endpoint} | {cause} | {count:,} | {retried:,} |")
+        
+        return lines
 
 
 def generate_report(
     config: Dict[str, Any],
     products: List[Dict[str, Any]],
-    reviews: List[Dict[str, Any]],
-    output_paths: Optional[Dict[str, str]] = None
+    reviews: Union[List[Dict[str, Any]], pd.DataFrame],
+    output_paths: Optional[Dict[str, str]] = None,
+    metrics: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     리포트 생성 헬퍼 함수
@@ -196,11 +257,12 @@ def generate_report(
     Args:
         config: 설정 딕셔너리
         products: 상품 정보 리스트
-        reviews: 리뷰 정보 리스트
+        reviews: 리뷰 정보 리스트 또는 DataFrame
         output_paths: 저장된 파일 경로 딕셔너리
+        metrics: 수집 텔레메트리 스냅샷
         
     Returns:
         리포트 파일 경로
     """
     generator = ReportGenerator(config)
-    return generator.generate_summary(products, reviews, output_paths)
+    return generator.generate_summary(products, reviews, output_paths, metrics)
@@ -0,0 +1,137 @@
+"""
+리뷰 ID 멤버십 인덱스 모듈
+
+한 번의 수집 실행에서 이미 내보낸 review_id를 기록합니다.
+다른 상품에서 같은 리뷰가 다시 나오면 전체 레코드 대신 참조(ref) 행만
+남기도록 수집기가 이 인덱스를 조회합니다.
+
+- exact: 파이썬 set (오탐 없음, 리뷰당 100바이트 내외)
+- bloom: 블룸 필터 (리뷰당 수십 비트, error_rate 확률로 오탐)
+
+블룸 필터의 오탐은 처음 보는 리뷰를 반복으로 판정하여 참조 행만 남기므로,
+대규모 수집에서 메모리가 부족할 때만 사용하고 error_rate를 충분히 낮게 둡니다.
+"""
+
+import math
+import hashlib
+import threading
+import logging
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class ExactReviewIndex:
+    """set 기반 review_id 인덱스 (스레드 안전)"""
+
+    def __init__(self):
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def add(self, review_id: str) -> bool:
+        """
+        review_id 추가
+
+        Returns:
+            이미 있었으면 True (반복), 처음이면 False
+        """
+        with self._lock:
+            if review_id in self._ids:
+                return True
+            self._ids.add(review_id)
+            return False
+
+    def __contains__(self, review_id: str) -> bool:
+        with self._lock:
+            return review_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class BloomReviewIndex:
+    """블룸 필터 기반 review_id 인덱스 (스레드 안전)"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6):
+        """
+        Args:
+            capacity: 예상 리뷰 수
+            error_rate: 목표 오탐 확률
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError(f"잘못된 블룸 필터 설정: capacity={capacity}, error_rate={error_rate}")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"블룸 필터 인덱스 생성: {capacity:,}개 / 오탐 {error_rate:g} "
+            f"({len(self._bits) / 1024 / 1024:.1f}MB, 해시 {self.num_hashes}개)"
+        )
+
+    def _positions(self, review_id: str):
+        """이중 해싱으로 비트 위치 계산"""
+        digest = hashlib.blake2b(review_id.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, review_id: str) -> bool:
+        """
+        review_id 추가
+
+        Returns:
+            이미 있었을 가능성이 있으면 True (반복), 확실히 처음이면 False
+        """
+        positions = self._positions(review_id)
+        with self._lock:
+            seen = True
+            for pos in positions:
+                byte, bit = divmod(pos, 8)
+                if not self._bits[byte] & (1 << bit):
+                    seen = False
+                    self._bits[byte] |= 1 << bit
+            if not seen:
+                self._count += 1
+                if self._count == self.capacity + 1:
+                    logger.warning(
+                        f"블룸 필터 용량 초과 ({self.capacity:,}개), 오탐 확률이 목표보다 커집니다"
+                    )
+            return seen
+
+    def __contains__(self, review_id: str) -> bool:
+        positions = self._positions(review_id)
+        with self._lock:
+            return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def make_review_index(config: Dict[str, Any]):
+    """
+    설정에 따라 review_id 인덱스 생성
+
+    Args:
+        config: 설정 딕셔너리 (reviews.dedup_index 블록 사용)
+
+    Returns:
+        ExactReviewIndex 또는 BloomReviewIndex
+    """
+    index_config = config.get('reviews', {}).get('dedup_index', {})
+    kind = index_config.get('type', 'exact')
+
+    if kind == 'bloom':
+        return BloomReviewIndex(
+            capacity=index_config.get('capacity', 1_000_000),
+            error_rate=index_config.get('error_rate', 1e-6),
+        )
+    if kind != 'exact':
+        raise ValueError(f"지원하지 않는 dedup_index 타입: {kind} (exact, bloom)")
+    return ExactReviewIndex()
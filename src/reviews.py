@@ -4,25 +4,57 @@
 올리브영 리뷰 API를 호출하여 정렬 기반 층화 표본으로 리뷰를 수집합니다.
 """
 
+import os
+import json
 import time
 import random
+import asyncio
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Set
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Iterator, AsyncIterator, Deque, Tuple, Callable
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import RateLimiter, get_rate_limiter, needs_rate_limiter
+from .pacing import record_response
+from .telemetry import CrawlMetrics, get_crawl_metrics, failure_cause
+from .watermarks import WatermarkStore
+from .checkpoint import CrawlJournal
+from .http_cache import ResponseCache, get_response_cache
+from .payload_store import PayloadStore, get_payload_store
+from .review_index import make_review_index
+from .frontier import CrawlFrontier
+from .page_budget import PageBudget, get_page_budget
 
 logger = logging.getLogger(__name__)
 
+# 기본 수집 정렬 순서 (앞 정렬에서 나온 리뷰는 뒤 정렬의 수량에 포함되지 않음)
+DEFAULT_SORT_SOURCES = ['helpful', 'newest', 'low_rating', 'high_rating']
+
 
 class ReviewCollector:
     """올리브영 리뷰 수집기"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        concurrency: Optional[int] = None,
+        journal: Optional[CrawlJournal] = None,
+        ref_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+        worker_id: Optional[str] = None
+    ):
         """
         Args:
             config: 설정 딕셔너리 (config.yaml에서 로드)
+            concurrency: 동시 요청 수 (기본: request.concurrency, 1이면 순차 수집)
+            journal: 체크포인트 저널 (지정 시 완료 단위 기록/재생, CrawlFrontier도 가능)
+            ref_sink: 다른 상품에서 이미 나온 리뷰의 참조 행을 받을 함수
+                (지정하지 않으면 반복 리뷰도 전체 레코드로 내보냄)
+            worker_id: 프론티어 워커 식별자 (지정 시 원본 페이로드를 워커 전용 파일에 기록)
         """
         self.config = config
         self.reviews_config = config.get('reviews', {})
@@ -57,7 +89,47 @@ class ReviewCollector:
         self.max_retries = self.request_config.get('max_retries', 3)
         self.timeout = self.request_config.get('timeout', 30)
         
+        # 동시 수집 모드 (호스트별 토큰 버킷으로 전체 요청 속도 제한)
+        # 적응형 속도 조절이 켜져 있으면 순차 모드도 랜덤 딜레이 대신 제한기 사용
+        self.concurrency = max(1, concurrency or self.request_config.get('concurrency', 1))
+        self.rate_limiter: Optional[RateLimiter] = None
+        if needs_rate_limiter(config, self.concurrency):
+            self.rate_limiter = get_rate_limiter(config, self.api_url)
+        
+        # 수집 텔레메트리 (요청 지연/바이트/재시도 원인/대기 시간)
+        self.metrics: Optional[CrawlMetrics] = get_crawl_metrics(config)
+        
+        # 응답 캐시 (replay 모드면 네트워크 없이 캐시만 사용)
+        self.cache: Optional[ResponseCache] = get_response_cache(config)
+        self.replay = bool(self.cache and self.cache.replay)
+        
+        # 체크포인트 저널 (완료된 수집 단위는 재실행 시 요청 없이 재생)
+        self.journal = journal
+        self._pages_fetched = 0  # 실제 네트워크로 수집한 페이지 수
+        
+        # API 원본 리뷰 저장소 (파싱 직후 원본을 넘기고 메모리에서 해제)
+        self.worker_id = worker_id
+        self.payloads: Optional[PayloadStore] = get_payload_store(config, worker_id)
+        
+        # 실행 단위 review_id 인덱스: 상품 간 반복 리뷰는 참조 행으로만 기록
+        self.ref_sink = ref_sink
+        self.review_index = make_review_index(config) if ref_sink is not None else None
+        
+        # 적응형 페이지 예산 (켜져 있으면 sort_limits는 기본 수량으로만 사용)
+        self.page_budget: Optional[PageBudget] = get_page_budget(config)
+        
+        # 증분 수집용 상품별 워터마크 (최신순 기준 가장 최근 리뷰)
+        delta_config = self.reviews_config.get('delta', {})
+        raw_dir = config.get('output', {}).get('raw_dir', 'data/raw')
+        self.delta_max_pages = delta_config.get('max_pages', 20)
+        self.watermarks = WatermarkStore(
+            delta_config.get('watermark_file', os.path.join(raw_dir, 'review_watermarks.json'))
+        )
+        
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': self.headers_config.get(
                 'user_agent',
@@ -70,10 +142,15 @@ class ReviewCollector:
             'Referer': 'https://www.oliveyoung.co.kr/',
         })
     
-    def _random_delay(self) -> None:
-        """랜덤 딜레이 적용"""
+    def _random_delay(self, reason: str = 'delay') -> None:
+        """랜덤 딜레이 적용 (reason: 텔레메트리 대기 사유, 재시도 전이면 retry)"""
+        if self.rate_limiter is not None or self.replay:
+            # 동시 모드에서는 요청 직전 토큰 버킷이 간격을 제어, replay는 요청 없음
+            return
         delay = random.uniform(self.delay_min, self.delay_max)
         time.sleep(delay)
+        if self.metrics is not None:
+            self.metrics.add_sleep(reason, delay)
     
     def _generate_review_id(self, review_data: Dict[str, Any], goods_no: str) -> str:
         """
@@ -121,23 +198,65 @@ class ReviewCollector:
             'reviewType': 'ALL',
         }
         
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key('POST', self.api_url, payload=payload)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.record_cache_hit('reviews')
+                try:
+                    return json.loads(cached)
+                except ValueError as e:
+                    logger.error(f"캐시 JSON 파싱 오류: {e}")
+                    return None
+            if self.replay:
+                logger.debug(f"리뷰 캐시 없음 (goods_no={goods_no}, sort={sort_type}, page={page})")
+                return None
+        
+        self._pages_fetched += 1
         for attempt in range(self.max_retries):
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if self.metrics is not None:
+                    self.metrics.add_sleep('pacing', waited)
+            started = time.monotonic()
+            response = None
             try:
                 response = self.session.post(
                     self.api_url,
                     json=payload,
                     timeout=self.timeout
                 )
+                latency = time.monotonic() - started
+                if self.metrics is not None:
+                    self.metrics.observe_request('reviews', latency, response.status_code, len(response.content))
+                if self.rate_limiter is not None:
+                    record_response(self.rate_limiter, latency, response)
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                if cache_key is not None:
+                    self.cache.put(cache_key, self.api_url, response.text)
+                return data
             except requests.RequestException as e:
+                if response is None:
+                    # 응답 없이 실패 (타임아웃, 연결 오류)
+                    latency = time.monotonic() - started
+                    if self.metrics is not None:
+                        self.metrics.observe_request('reviews', latency, None)
+                    if self.rate_limiter is not None:
+                        record_response(self.rate_limiter, latency, None)
+                if self.metrics is not None:
+                    self.metrics.record_failure('reviews', failure_cause(e), attempt < self.max_retries - 1)
                 logger.warning(
                     f"리뷰 요청 실패 (goods_no={goods_no}, sort={sort_type}, "
                     f"시도 {attempt + 1}/{self.max_retries}): {e}"
                 )
                 if attempt < self.max_retries - 1:
-                    self._random_delay()
+                    self._random_delay('retry')
             except ValueError as e:
+                if self.metrics is not None:
+                    self.metrics.record_failure('reviews', 'invalid_json', False)
                 logger.error(f"JSON 파싱 오류: {e}")
                 return None
         
@@ -147,7 +266,8 @@ class ReviewCollector:
         self, 
         review_data: Dict[str, Any], 
         goods_no: str,
-        sort_source: str
+        sort_source: str,
+        review_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         리뷰 데이터를 표준 스키마로 변환
@@ -156,6 +276,7 @@ class ReviewCollector:
             review_data: API 원본 리뷰 데이터
             goods_no: 상품 번호
             sort_source: 정렬 소스 (helpful, newest, etc.)
+            review_id: 미리 계산한 리뷰 ID (없으면 생성)
             
         Returns:
             표준화된 리뷰 딕셔너리
@@ -168,7 +289,7 @@ class ReviewCollector:
         has_images = review_data.get('hasPhoto', False) or len(photo_list) > 0
         
         return {
-            'review_id': self._generate_review_id(review_data, goods_no),
+            'review_id': review_id or self._generate_review_id(review_data, goods_no),
             'goods_no': goods_no,
             'product_id': goods_no,  # alias
             'sort_source': sort_source,
@@ -185,13 +306,165 @@ class ReviewCollector:
             'is_trial': 0,  # 후처리에서 설정
             'is_low_info': 0,  # 후처리에서 설정
             'source': 'oliveyoung',
-            '_raw': review_data,  # 원본 보존 (저장 시 제외 가능)
+            '_raw': review_data,  # 원본 (수집 단위에서 페이로드 저장소로 이동)
         }
     
+    def _update_watermark(self, goods_no: str, review_id: str, created_at: Optional[str]) -> None:
+        """최신순 첫 리뷰로 상품 워터마크 갱신"""
+        self.watermarks.update(goods_no, review_id, created_at)
+    
+    def _store_payloads(self, reviews: List[Dict[str, Any]]) -> None:
+        """원본은 페이로드 저장소에 기록하고 레코드에서 제거 (일반/증분 수집 공통)"""
+        for review in reviews:
+            raw = review.pop('_raw', None)
+            if self.payloads is not None and raw is not None:
+                self.payloads.put(review['review_id'], raw)
+    
+    def _collect_page(
+        self,
+        goods_no: str,
+        sort_source: str,
+        sort_type: str,
+        page: int,
+        known: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        단일 수집 단위 (goods_no, sort_source, page)의 리뷰 수집
+        
+        체크포인트 저널에 이미 기록된 단위는 요청 없이 저널에서 재생하고,
+        새로 수집한 단위는 파싱 직후 저널에 기록합니다.
+        review_id를 먼저 계산하여 같은 상품의 다른 정렬에서 이미 파싱한
+        리뷰는 다시 파싱하지 않고 기존 레코드를 그대로 돌려줍니다.
+        
+        Args:
+            goods_no: 상품 번호
+            sort_source: 정렬 소스 (helpful, newest, etc.)
+            sort_type: 정렬 타입 (API 값)
+            page: 페이지 번호 (0부터 시작)
+            known: 이 상품에서 이미 수집한 리뷰 (review_id -> 리뷰)
+            
+        Returns:
+            파싱된 리뷰 리스트 (요청 실패 시 None)
+        """
+        if self.journal is not None:
+            journaled = self.journal.get_page(goods_no, sort_source, page)
+            if journaled is not None:
+                return journaled
+        
+        response = self._fetch_reviews(goods_no, sort_type, page)
+        
+        if not response:
+            return None
+        
+        # 응답 구조에 따라 리뷰 리스트 추출
+        reviews_data = response.get('data', [])
+        if not reviews_data:
+            reviews_data = response.get('content', [])
+        
+        page_reviews = []
+        for review_data in reviews_data:
+            review_id = self._generate_review_id(review_data, goods_no)
+            existing = known.get(review_id) if known else None
+            if existing is not None:
+                page_reviews.append(existing)
+            else:
+                page_reviews.append(self._parse_review(review_data, goods_no, sort_source, review_id))
+        del response, reviews_data
+        
+        self._store_payloads(page_reviews)
+        
+        if self.journal is not None:
+            if self.payloads is not None:
+                # 저널에 기록된 단위의 원본이 재개 시 누락되지 않도록 먼저 반영
+                self.payloads.flush()
+            self.journal.record_page(goods_no, sort_source, page, page_reviews)
+        
+        return page_reviews
+    
+    def collect_new_reviews_for_product(self, goods_no: str) -> List[Dict[str, Any]]:
+        """
+        단일 상품의 신규 리뷰만 수집 (증분 모드)
+        
+        최신순(newest) 정렬을 앞에서부터 탐색하다가 워터마크 리뷰가 나오거나
+        워터마크보다 오래된 작성일이 나오면 즉시 멈춥니다.
+        워터마크가 없는 상품은 일반 층화 수집으로 기준선을 만듭니다.
+        
+        Args:
+            goods_no: 상품 번호
+            
+        Returns:
+            워터마크 이후 새로 작성된 리뷰 리스트
+        """
+        mark = self.watermarks.get(goods_no)
+        if mark is None:
+            logger.info(f"상품 {goods_no}: 워터마크 없음, 전체 수집")
+            return self.collect_reviews_for_product(goods_no)
+        
+        sort_type = self.sort_types.get('newest', 'DATETIME_DESC')
+        new_reviews: List[Dict[str, Any]] = []
+        newest_data: Optional[Dict[str, Any]] = None
+        seen_ids: Set[str] = set()
+        
+        for page in range(self.delta_max_pages):
+            response = self._fetch_reviews(goods_no, sort_type, page)
+            
+            if not response:
+                break
+            
+            reviews_data = response.get('data', [])
+            if not reviews_data:
+                reviews_data = response.get('content', [])
+            if not reviews_data:
+                break
+            
+            if newest_data is None:
+                newest_data = reviews_data[0]
+            
+            reached_mark = False
+            page_reviews = []
+            for review_data in reviews_data:
+                review_id = self._generate_review_id(review_data, goods_no)
+                created_at = review_data.get('createdDateTime')
+                
+                # 워터마크 도달 (기준 리뷰 또는 더 오래된 작성일)
+                if review_id == mark['review_id'] or (
+                    created_at and mark.get('created_at') and created_at < mark['created_at']
+                ):
+                    reached_mark = True
+                    break
+                
+                if review_id not in seen_ids:
+                    seen_ids.add(review_id)
+                    page_reviews.append(self._parse_review(review_data, goods_no, 'newest', review_id))
+            
+            self._store_payloads(page_reviews)
+            new_reviews.extend(page_reviews)
+            
+            if reached_mark or len(reviews_data) < self.page_size:
+                break
+            
+            self._random_delay()
+        else:
+            logger.warning(
+                f"상품 {goods_no}: {self.delta_max_pages}페이지 내에서 워터마크 미도달 "
+                f"(신규 리뷰 일부 누락 가능)"
+            )
+        
+        if newest_data is not None:
+            self._update_watermark(
+                goods_no,
+                self._generate_review_id(newest_data, goods_no),
+                newest_data.get('createdDateTime'),
+            )
+        
+        logger.debug(f"상품 {goods_no}: 신규 리뷰 {len(new_reviews)}개")
+        return new_reviews
+    
     def collect_reviews_for_product(
         self, 
         goods_no: str,
-        sort_sources: Optional[List[str]] = None
+        sort_sources: Optional[List[str]] = None,
+        delta: bool = False
     ) -> List[Dict[str, Any]]:
         """
         단일 상품의 리뷰 수집 (정렬별 층화 표본)
@@ -199,98 +472,204 @@ class ReviewCollector:
         Args:
             goods_no: 상품 번호
             sort_sources: 수집할 정렬 소스 리스트 (기본: 전체)
+            delta: True면 워터마크 이후 신규 리뷰만 수집
             
         Returns:
             수집된 리뷰 리스트 (중복 제거)
         """
+        if delta:
+            return self.collect_new_reviews_for_product(goods_no)
+        
         if sort_sources is None:
-            sort_sources = ['helpful', 'newest', 'low_rating', 'high_rating']
+            sort_sources = DEFAULT_SORT_SOURCES
         
         all_reviews: Dict[str, Dict[str, Any]] = {}  # review_id -> review
+        budget = self.page_budget.open_product(goods_no) if self.page_budget is not None else None
         
-        for sort_source in sort_sources:
-            if sort_source not in self.sort_types:
-                logger.warning(f"알 수 없는 정렬 소스: {sort_source}")
-                continue
-            
-            sort_type = self.sort_types[sort_source]
-            limit = self.sort_limits.get(sort_source, 20)
-            
-            logger.debug(f"상품 {goods_no}: {sort_source} ({sort_type}) 수집 중...")
-            
-            collected = 0
-            page = 0
-            
-            while collected < limit:
-                response = self._fetch_reviews(goods_no, sort_type, page)
+        try:
+            for sort_source in sort_sources:
+                if sort_source not in self.sort_types:
+                    logger.warning(f"알 수 없는 정렬 소스: {sort_source}")
+                    continue
                 
-                if not response:
-                    break
+                sort_type = self.sort_types[sort_source]
+                limit = self.sort_limits.get(sort_source, 20)
                 
-                # 응답 구조에 따라 리뷰 리스트 추출
-                reviews_data = response.get('data', [])
-                if not reviews_data:
-                    reviews_data = response.get('content', [])
-                if not reviews_data:
-                    break
+                logger.debug(f"상품 {goods_no}: {sort_source} ({sort_type}) 수집 중...")
+                
+                collected = 0
+                page = 0
+                fetched_before = self._pages_fetched
                 
-                for review_data in reviews_data:
-                    if collected >= limit:
+                while (
+                    collected < limit if budget is None
+                    else budget.allow_page(sort_source, page, collected, limit)
+                ):
+                    pages_before = self._pages_fetched
+                    page_reviews = self._collect_page(goods_no, sort_source, sort_type, page, all_reviews)
+                    # 저널/캐시에서 재생한 페이지는 요청 예산에서 차감하지 않음
+                    fetched = self._pages_fetched > pages_before
+                    
+                    if not page_reviews:
+                        if budget is not None:
+                            budget.observe_page(sort_source, [], [], fetched)
                         break
                     
-                    review = self._parse_review(review_data, goods_no, sort_source)
-                    review_id = review['review_id']
+                    # 최신순 첫 리뷰로 워터마크 기록 (이후 증분 수집 기준)
+                    if sort_type == self.sort_types.get('newest') and page == 0:
+                        first = page_reviews[0]
+                        self._update_watermark(goods_no, first['review_id'], first['review_date'])
                     
-                    # 중복 체크 (이미 수집된 리뷰면 sort_source 추가)
-                    if review_id not in all_reviews:
-                        all_reviews[review_id] = review
-                        collected += 1
-                    else:
-                        # 다른 정렬에서도 등장한 리뷰 표시
-                        existing = all_reviews[review_id]
-                        if sort_source not in existing.get('sort_sources_all', [existing['sort_source']]):
-                            existing.setdefault('sort_sources_all', [existing['sort_source']])
-                            existing['sort_sources_all'].append(sort_source)
-                
-                # 다음 페이지
-                if len(reviews_data) < self.page_size:
-                    break
+                    new_reviews = []
+                    for review in page_reviews:
+                        # 예산 모드에서는 요청한 페이지의 새 리뷰를 모두 사용
+                        if budget is None and collected >= limit:
+                            break
+                        
+                        review_id = review['review_id']
+                        
+                        # 중복 체크 (이미 수집된 리뷰면 sort_source 추가)
+                        if review_id not in all_reviews:
+                            all_reviews[review_id] = review
+                            new_reviews.append(review)
+                            collected += 1
+                        else:
+                            # 다른 정렬에서도 등장한 리뷰 표시
+                            existing = all_reviews[review_id]
+                            if sort_source not in existing.get('sort_sources_all', [existing['sort_source']]):
+                                existing.setdefault('sort_sources_all', [existing['sort_source']])
+                                existing['sort_sources_all'].append(sort_source)
+                    
+                    if budget is not None:
+                        budget.observe_page(sort_source, page_reviews, new_reviews, fetched)
+                    
+                    # 다음 페이지
+                    if len(page_reviews) < self.page_size:
+                        break
+                    
+                    page += 1
+                    if self._pages_fetched > fetched_before:
+                        self._random_delay()
                 
-                page += 1
-                self._random_delay()
-            
-            logger.debug(f"상품 {goods_no}: {sort_source} 완료 ({collected}개)")
-            self._random_delay()
+                logger.debug(f"상품 {goods_no}: {sort_source} 완료 ({collected}개)")
+                if self._pages_fetched > fetched_before:
+                    self._random_delay()
+        finally:
+            if budget is not None:
+                self.page_budget.close_product(budget)
         
         return list(all_reviews.values())
     
-    def collect_reviews_for_products(
+    def _select_products(
         self,
         products: List[Dict[str, Any]],
-        top_n: Optional[int] = None,
-        sort_sources: Optional[List[str]] = None
+        top_n: Optional[int] = None
     ) -> List[Dict[str, Any]]:
+        """list_rank 기준 정렬 후 상위 N개 상품 선택"""
+        sorted_products = sorted(products, key=lambda x: x.get('list_rank', float('inf')))
+        
+        if top_n:
+            sorted_products = sorted_products[:top_n]
+        
+        return sorted_products
+    
+    def iter_reviews_for_products(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int] = None,
+        sort_sources: Optional[List[str]] = None,
+        delta: bool = False
+    ) -> Iterator[Dict[str, Any]]:
         """
-        여러 상품의 리뷰 수집
+        여러 상품의 리뷰를 상품 단위로 수집하며 순서대로 내보내는 제너레이터
+        
+        한 번에 메모리에 머무는 리뷰는 수집 중인 상품(동시 모드는 작업 창)의
+        리뷰뿐이므로, 수집 규모와 무관하게 메모리 사용량이 일정합니다.
         
         Args:
             products: 상품 정보 리스트 (goods_no 포함)
             top_n: 상위 N개 상품만 수집 (list_rank 기준)
             sort_sources: 수집할 정렬 소스 리스트
+            delta: True면 워터마크 이후 신규 리뷰만 수집
             
-        Returns:
-            모든 수집된 리뷰 리스트
+        Yields:
+            수집된 리뷰 (상품 순서는 list_rank 순)
         """
-        # list_rank로 정렬
-        sorted_products = sorted(products, key=lambda x: x.get('list_rank', float('inf')))
+        total_reviews = 0
+        total_refs = 0
         
-        if top_n:
-            sorted_products = sorted_products[:top_n]
+        if self.concurrency > 1:
+            batches = self._iter_product_batches_concurrent(products, top_n, sort_sources, delta)
+        else:
+            batches = self._iter_product_batches(products, top_n, sort_sources, delta)
+        
+        for reviews in batches:
+            if self.review_index is None:
+                total_reviews += len(reviews)
+                yield from reviews
+                continue
+            
+            # 상품 순서대로 판정하므로 동시 모드에서도 어느 상품이 전체 레코드를 갖는지 동일
+            for review in reviews:
+                if self.review_index.add(review['review_id']):
+                    self.ref_sink(self._to_ref(review))
+                    total_refs += 1
+                else:
+                    total_reviews += 1
+                    yield review
         
-        all_reviews = []
+        if total_refs:
+            logger.info(f"상품 간 반복 리뷰 {total_refs}개는 참조 행으로 기록")
+        
+        self._finish_run()
+        logger.info(f"리뷰 수집 완료: 총 {total_reviews}개 리뷰")
+    
+    def _finish_run(self) -> None:
+        """수집 종료 시 워터마크/원본/속도 상태 저장과 페이지 예산 요약"""
+        self.watermarks.save()
+        if self.payloads is not None:
+            self.payloads.close()
+        if self.rate_limiter is not None:
+            self.rate_limiter.save()
+        if self.page_budget is not None:
+            summary = self.page_budget.summary()
+            budget = f"/{summary['request_budget']}" if summary['request_budget'] else ''
+            logger.info(
+                f"적응형 페이지 예산: {summary['pages_used']}{budget}페이지, "
+                f"새 리뷰 {summary['reviews_new']}개 중 정보성 {summary['informative']}개 "
+                f"(요청당 {summary['informative_per_request']:.2f}개)"
+            )
+    
+    @staticmethod
+    def _to_ref(review: Dict[str, Any]) -> Dict[str, Any]:
+        """반복 리뷰의 참조 행 (중복 통합에 필요한 필드만)"""
+        return {
+            'review_id': review['review_id'],
+            'goods_no': review['goods_no'],
+            'product_id': review.get('product_id'),
+            'sort_source': review.get('sort_source'),
+            'sort_sources_all': review.get('sort_sources_all'),
+            'rating': review.get('rating'),
+            'review_date': review.get('review_date'),
+            'helpful_count': review.get('helpful_count'),
+            'has_images': review.get('has_images'),
+            'image_count': review.get('image_count'),
+        }
+    
+    def _iter_product_batches(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int],
+        sort_sources: Optional[List[str]],
+        delta: bool
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """상품별 리뷰 리스트를 순차 수집"""
+        sorted_products = self._select_products(products, top_n)
         total = len(sorted_products)
         
         logger.info(f"리뷰 수집 시작: {total}개 상품")
+        if self.page_budget is not None:
+            self.page_budget.start(total)
         
         for idx, product in enumerate(sorted_products):
             goods_no = product.get('goods_no')
@@ -298,25 +677,273 @@ class ReviewCollector:
                 continue
             
             logger.info(f"[{idx + 1}/{total}] 상품 {goods_no} 리뷰 수집 중...")
+            fetched_before = self._pages_fetched
             
             try:
-                reviews = self.collect_reviews_for_product(goods_no, sort_sources)
-                all_reviews.extend(reviews)
+                reviews = self.collect_reviews_for_product(goods_no, sort_sources, delta)
                 logger.info(f"[{idx + 1}/{total}] 상품 {goods_no}: {len(reviews)}개 리뷰 수집")
             except Exception as e:
                 logger.error(f"상품 {goods_no} 리뷰 수집 실패: {e}")
                 continue
             
-            self._random_delay()
+            yield reviews
+            
+            # 저널에서 재생만 한 상품은 대기 불필요
+            if self._pages_fetched > fetched_before:
+                self._random_delay()
+    
+    def _iter_product_batches_concurrent(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int],
+        sort_sources: Optional[List[str]],
+        delta: bool
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """비동기 수집기를 전용 이벤트 루프에서 구동하여 상품별 리뷰 리스트를 내보냄"""
+        loop = asyncio.new_event_loop()
+        batches = self.aiter_product_batches(products, top_n, sort_sources, delta)
+        
+        try:
+            while True:
+                try:
+                    reviews = loop.run_until_complete(batches.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield reviews
+        finally:
+            loop.run_until_complete(batches.aclose())
+            loop.close()
+    
+    async def aiter_product_batches(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int] = None,
+        sort_sources: Optional[List[str]] = None,
+        delta: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        여러 상품의 리뷰 동시 수집 (비동기 제너레이터)
+        
+        상품 단위 작업을 최대 concurrency개까지 동시에 실행합니다.
+        상품 내부의 정렬/페이지 순서는 순차 모드와 같아서 동일한 레코드가
+        만들어지고, 요청 간격은 호스트별 토큰 버킷이 제어합니다.
+        앞선 상품이 끝나기를 기다리는 동안 스레드가 놀지 않도록
+        concurrency의 2배까지 작업을 미리 예약하고, 결과는 상품 순서대로 내보냅니다.
+        
+        Args:
+            products: 상품 정보 리스트 (goods_no 포함)
+            top_n: 상위 N개 상품만 수집 (list_rank 기준)
+            sort_sources: 수집할 정렬 소스 리스트
+            delta: True면 워터마크 이후 신규 리뷰만 수집
+            
+        Yields:
+            상품별 리뷰 리스트 (상품 순서는 순차 모드와 동일)
+        """
+        sorted_products = [
+            p for p in self._select_products(products, top_n) if p.get('goods_no')
+        ]
+        total = len(sorted_products)
+        
+        logger.info(f"리뷰 동시 수집 시작: {total}개 상품 (concurrency={self.concurrency})")
+        if self.page_budget is not None:
+            self.page_budget.start(total)
+        
+        loop = asyncio.get_running_loop()
+        queue = iter(enumerate(sorted_products))
+        pending: Deque[Tuple[int, str, asyncio.Future]] = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            def schedule_next() -> None:
+                for idx, product in queue:
+                    goods_no = product['goods_no']
+                    future = loop.run_in_executor(
+                        executor, self.collect_reviews_for_product, goods_no, sort_sources, delta
+                    )
+                    pending.append((idx, goods_no, future))
+                    return
+            
+            for _ in range(self.concurrency * 2):
+                schedule_next()
+            
+            try:
+                while pending:
+                    idx, goods_no, future = pending.popleft()
+                    try:
+                        reviews = await future
+                        logger.info(f"[{idx + 1}/{total}] 상품 {goods_no}: {len(reviews)}개 리뷰 수집")
+                    except Exception as e:
+                        logger.error(f"상품 {goods_no} 리뷰 수집 실패: {e}")
+                        reviews = []
+                    
+                    schedule_next()
+                    yield reviews
+            finally:
+                # 중간에 중단되면 아직 시작하지 않은 작업 취소
+                for _, _, future in pending:
+                    future.cancel()
+    
+    def collect_reviews_for_products(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int] = None,
+        sort_sources: Optional[List[str]] = None,
+        delta: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 상품의 리뷰 수집
+        
+        Args:
+            products: 상품 정보 리스트 (goods_no 포함)
+            top_n: 상위 N개 상품만 수집 (list_rank 기준)
+            sort_sources: 수집할 정렬 소스 리스트
+            delta: True면 워터마크 이후 신규 리뷰만 수집
+            
+        Returns:
+            모든 수집된 리뷰 리스트
+        """
+        return list(self.iter_reviews_for_products(products, top_n, sort_sources, delta))
+    
+    async def collect_reviews_for_products_async(
+        self,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int] = None,
+        sort_sources: Optional[List[str]] = None,
+        delta: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 상품의 리뷰 동시 수집 (aiter_product_batches 결과를 모두 모음)
         
+        Returns:
+            모든 수집된 리뷰 리스트 (상품 순서는 순차 모드와 동일)
+        """
+        all_reviews = [
+            review
+            async for reviews in self.aiter_product_batches(products, top_n, sort_sources, delta)
+            for review in reviews
+        ]
+        self._finish_run()
         logger.info(f"리뷰 수집 완료: 총 {len(all_reviews)}개 리뷰")
         return all_reviews
+    
+    def seed_frontier(
+        self,
+        frontier: CrawlFrontier,
+        products: List[Dict[str, Any]],
+        top_n: Optional[int] = None
+    ) -> int:
+        """
+        상위 N개 상품 x 정렬의 첫 페이지 단위를 프론티어에 등록
+        
+        Args:
+            frontier: 수집 프론티어
+            products: 상품 정보 리스트
+            top_n: 상위 N개 상품만 등록 (list_rank 기준)
+            
+        Returns:
+            새로 등록된 단위 수
+        """
+        return frontier.seed(self._select_products(products, top_n), list(self._frontier_limits()))
+    
+    def _frontier_limits(self) -> Dict[str, int]:
+        """프론티어 정렬 소스 -> 한도 (조립 단계와 같은 기본 정렬 순서)"""
+        return {
+            s: self.sort_limits.get(s, 20) for s in DEFAULT_SORT_SOURCES if s in self.sort_types
+        }
+    
+    def work_frontier(self, frontier: CrawlFrontier, poll_interval: float = 5.0) -> int:
+        """
+        수집 프론티어에서 단위를 임대하여 수집 (남은 단위가 없을 때까지)
+        
+        단위를 완료할 때마다 프론티어가 상품의 완료된 페이지를 순차 수집 규칙으로
+        재생하여, 정렬 간 중복을 뺀 고유 리뷰 수가 정렬별 한도(sort_limits)에 못
+        미치면 다음 페이지 단위를 등록합니다. 리뷰 레코드 조립과 워터마크 갱신은
+        모든 단위가 끝난 뒤 조립 단계(stream_reviews_to_disk)에서 요청 없이
+        처리됩니다.
+        
+        Args:
+            frontier: 수집 프론티어
+            poll_interval: 다른 워커가 임대 중인 단위만 남았을 때 재확인 간격 (초)
+            
+        Returns:
+            이 워커가 완료한 단위 수
+        """
+        worker_id = self.worker_id or 'worker'
+        limits = self._frontier_limits()
+        completed = 0
+        logger.info(f"프론티어 워커 시작: {worker_id} ({frontier.path})")
+        
+        try:
+            while True:
+                items = frontier.lease(worker_id)
+                if not items:
+                    if frontier.active_count() == 0:
+                        break
+                    # 임대 중인 단위가 끝나면 다음 페이지가 생기거나, 만료되면 다시 임대 가능
+                    time.sleep(poll_interval)
+                    continue
+                
+                for item in items:
+                    sort_type = self.sort_types.get(item.sort_source)
+                    if sort_type is None:
+                        frontier.fail(item, worker_id, f"알 수 없는 정렬 소스: {item.sort_source}")
+                        continue
+                    
+                    page_reviews = self._collect_page(item.goods_no, item.sort_source, sort_type, item.page)
+                    if page_reviews is None:
+                        frontier.fail(item, worker_id, '요청 실패')
+                        continue
+                    
+                    if frontier.complete(item, page_reviews, limits, self.page_size):
+                        completed += 1
+                    
+                    if completed % 100 == 0 and completed:
+                        logger.info(f"프론티어 진행: {worker_id} {completed}개 단위 완료 ({frontier.stats()})")
+                    self._random_delay()
+        finally:
+            if self.payloads is not None:
+                self.payloads.close()
+            if self.rate_limiter is not None:
+                self.rate_limiter.save()
+        
+        logger.info(f"프론티어 워커 종료: {worker_id} ({completed}개 단위 완료)")
+        return completed
+
+
+def iter_reviews(
+    config: Dict[str, Any],
+    products: List[Dict[str, Any]],
+    top_n: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delta: bool = False,
+    journal: Optional[CrawlJournal] = None,
+    ref_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    리뷰 스트리밍 수집 헬퍼 함수
+    
+    Args:
+        config: 설정 딕셔너리
+        products: 상품 정보 리스트
+        top_n: 상위 N개 상품만 수집
+        concurrency: 동시 요청 수 (기본: request.concurrency)
+        delta: True면 워터마크 이후 신규 리뷰만 수집
+        journal: 체크포인트 저널 (중단 후 재개용)
+        ref_sink: 상품 간 반복 리뷰의 참조 행을 받을 함수
+        
+    Yields:
+        수집된 리뷰
+    """
+    collector = ReviewCollector(config, concurrency=concurrency, journal=journal, ref_sink=ref_sink)
+    yield from collector.iter_reviews_for_products(products, top_n, delta=delta)
 
 
 def collect_reviews(
     config: Dict[str, Any],
     products: List[Dict[str, Any]],
-    top_n: Optional[int] = None
+    top_n: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delta: bool = False,
+    journal: Optional[CrawlJournal] = None
 ) -> List[Dict[str, Any]]:
     """
     리뷰 수집 헬퍼 함수
@@ -325,9 +952,11 @@ def collect_reviews(
         config: 설정 딕셔너리
         products: 상품 정보 리스트
         top_n: 상위 N개 상품만 수집
+        concurrency: 동시 요청 수 (기본: request.concurrency)
+        delta: True면 워터마크 이후 신규 리뷰만 수집
+        journal: 체크포인트 저널 (중단 후 재개용)
         
     Returns:
         수집된 리뷰 리스트
     """
-    collector = ReviewCollector(config)
-    return collector.collect_reviews_for_products(products, top_n)
+    return list(iter_reviews(config, products, top_n, concurrency, delta, journal))
@@ -0,0 +1,183 @@
+"""
+다중 카테고리 수집 스케줄러
+
+catalog.disp_cat_no에 여러 카테고리(선크림, 쿠션, 토너, 선스틱 등)를 두면
+카테고리마다 카탈로그 → 리뷰 수집을 하나의 레인으로 보고 여러 레인을 함께 실행합니다.
+
+- 모든 레인의 요청은 호스트별 공유 제한기(ratelimit.get_rate_limiter) 하나를 거치므로
+  카테고리 수와 무관하게 전체 요청 속도는 request.rate_limit(또는 적응형 속도)를 넘지 않습니다.
+- 제한기는 대기 중인 요청을 도착 순서대로 통과시키므로, 동시 요청 수가 같은 레인들은
+  요청 슬롯을 번갈아 나눠 쓰고, 한 카테고리의 카탈로그 수집과 다른 카테고리의 리뷰
+  수집이 같은 시간대에 섞여 진행됩니다. 먼저 끝난 레인의 몫은 남은 레인이 가져갑니다.
+- 응답 대기와 딜레이가 겹치므로 전체 갱신 시간은 카테고리별 수집 시간의 합이 아니라
+  가장 큰 카테고리의 수집 시간에 가까워집니다 (전체 요청 속도 상한에 닿기 전까지).
+
+레인의 출력(원본/가공/리포트 폴더, 체크포인트/워터마크/원본 페이로드 파일)은
+category=<이름> 하위 폴더로 나뉩니다. 리뷰 데이터셋(output.dataset)은 category 파티션을
+직접 가지므로 모든 레인이 같은 데이터셋에 커밋합니다.
+"""
+
+import os
+import copy
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# 카테고리별로 나누는 출력 폴더 (log_dir은 공유)
+PARTITIONED_DIRS = (
+    ('raw_dir', 'data/raw'),
+    ('processed_dir', 'data/processed'),
+    ('report_dir', 'report'),
+)
+
+
+def partition_path(path: str, name: str) -> str:
+    """파일 경로를 같은 폴더의 category=<name> 하위 경로로 변환"""
+    return os.path.join(os.path.dirname(path), f"category={name}", os.path.basename(path))
+
+
+def category_config(config: Dict[str, Any], category: Dict[str, str]) -> Dict[str, Any]:
+    """
+    카테고리 레인용 설정 생성
+
+    출력 폴더와 카테고리별 상태 파일 경로를 category=<name> 파티션으로 바꾸고,
+    순차 모드에서도 랜덤 딜레이 대신 호스트별 공유 제한기를 쓰도록 합니다.
+    속도 상태(pacing.state_file)와 응답 캐시는 호스트 단위이므로 공유합니다.
+
+    Args:
+        config: 설정 딕셔너리
+        category: {'name', 'disp_cat_no'} (catalog.get_categories 결과 항목)
+
+    Returns:
+        레인 설정 딕셔너리 (원본은 변경하지 않음)
+    """
+    name = category['name']
+    lane = copy.deepcopy(config)
+
+    lane.setdefault('catalog', {})['disp_cat_no'] = [dict(category)]
+    lane.setdefault('request', {})['shared_limiter'] = True
+
+    # 리뷰 데이터셋은 category 파티션을 직접 가지므로 모든 레인이 같은 루트를 공유
+    output = lane.setdefault('output', {})
+    dataset = output.setdefault('dataset', {})
+    if not dataset.get('dir'):
+        dataset['dir'] = os.path.join(output.get('processed_dir', 'data/processed'), 'reviews')
+    for key, default in PARTITIONED_DIRS:
+        output[key] = os.path.join(output.get(key, default), f"category={name}")
+
+    # 명시된 상태 파일 경로 (지정하지 않으면 raw_dir 기준 기본값이라 이미 나뉨)
+    reviews = lane.setdefault('reviews', {})
+    if reviews.get('checkpoint_file'):
+        reviews['checkpoint_file'] = partition_path(reviews['checkpoint_file'], name)
+    for block, key in (('delta', 'watermark_file'), ('payload_store', 'file')):
+        if reviews.get(block, {}).get(key):
+            reviews[block][key] = partition_path(reviews[block][key], name)
+    if lane.get('frontier', {}).get('file'):
+        lane['frontier']['file'] = partition_path(lane['frontier']['file'], name)
+
+    return lane
+
+
+@dataclass
+class CategoryRun:
+    """카테고리 레인 실행 결과"""
+
+    name: str
+    disp_cat_no: str
+    config: Dict[str, Any]
+    result: Any = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+class CategoryScheduler:
+    """카테고리 레인을 함께 실행하는 스케줄러"""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        categories: List[Dict[str, str]],
+        max_parallel: int = 0
+    ):
+        """
+        Args:
+            config: 설정 딕셔너리
+            categories: 실행할 카테고리 목록 (catalog.get_categories 결과)
+            max_parallel: 동시에 실행할 최대 레인 수 (0이면 전체 카테고리 동시 실행,
+                나머지는 설정 순서대로 앞 레인이 끝나는 대로 시작)
+        """
+        self.config = config
+        self.categories = categories
+        self.max_parallel = max_parallel if max_parallel > 0 else len(categories)
+
+    def run(self, task: Callable[[Dict[str, Any], CategoryRun], Any]) -> List[CategoryRun]:
+        """
+        모든 카테고리 레인 실행
+
+        Args:
+            task: 레인 작업 함수 (레인 설정, CategoryRun) -> 결과.
+                예외가 나면 해당 레인만 실패로 기록하고 다른 레인은 계속 진행
+
+        Returns:
+            CategoryRun 리스트 (설정 순서)
+        """
+        runs = [
+            CategoryRun(c['name'], c['disp_cat_no'], category_config(self.config, c))
+            for c in self.categories
+        ]
+        if not runs:
+            return runs
+
+        logger.info(
+            f"다중 카테고리 수집 시작: {len(runs)}개 카테고리, 동시 {min(self.max_parallel, len(runs))}개 레인"
+        )
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix='category') as executor:
+            futures = [executor.submit(self._run_lane, task, run) for run in runs]
+            for future in futures:
+                future.result()
+
+        elapsed = time.monotonic() - started
+        longest = max(runs, key=lambda r: r.seconds)
+        failed = [run.name for run in runs if run.error]
+        logger.info(
+            f"다중 카테고리 수집 완료: {elapsed:.1f}초 "
+            f"(가장 긴 카테고리 {longest.name} {longest.seconds:.1f}초, "
+            f"카테고리별 합계 {sum(r.seconds for r in runs):.1f}초)"
+        )
+        if failed:
+            logger.error(f"실패한 카테고리: {', '.join(failed)}")
+
+        return runs
+
+    def _run_lane(self, task: Callable[[Dict[str, Any], CategoryRun], Any], run: CategoryRun) -> None:
+        """레인 하나 실행 (실패는 기록만 하고 예외를 올리지 않음)"""
+        logger.info(f"[{run.name}] 카테고리 수집 시작 (dispCatNo={run.disp_cat_no})")
+        started = time.monotonic()
+        try:
+            run.result = task(run.config, run)
+        except Exception as e:
+            logger.exception(f"[{run.name}] 카테고리 수집 실패: {e}")
+            run.error = str(e)
+        run.seconds = time.monotonic() - started
+        logger.info(f"[{run.name}] 카테고리 수집 종료 ({run.seconds:.1f}초)")
+
+
+def get_scheduler(config: Dict[str, Any], categories: List[Dict[str, str]]) -> CategoryScheduler:
+    """
+    설정에 따라 다중 카테고리 스케줄러 생성
+
+    Args:
+        config: 설정 딕셔너리 (scheduler 블록 사용)
+        categories: 실행할 카테고리 목록
+
+    Returns:
+        CategoryScheduler 인스턴스
+    """
+    scheduler_config = config.get('scheduler', {})
+    return CategoryScheduler(config, categories, max_parallel=scheduler_config.get('max_parallel', 0))
@@ -0,0 +1,548 @@
+"""
+단계별 Parquet 스키마 레지스트리
+
+수집(reviews)부터 분석 피벗까지 각 단계가 저장하는 컬럼의 Arrow 타입을 한곳에서 정의합니다.
+같은 이름의 컬럼은 모든 단계에서 같은 타입을 가집니다.
+
+- 값 종류가 적은 문자열(goods_no, 정렬 소스, 평점 구간, 계절, 버킷, aspect, polarity,
+  피부 정보 등)은 dictionary 인코딩으로 저장하고 pandas category로 읽습니다.
+  문자열을 행마다 들고 있지 않으므로 메모리가 줄고, groupby는 정수 코드로 묶습니다.
+- 평점/플래그는 int8, 연도는 int16, 건수는 int32 고정 폭 정수를 씁니다.
+- 쓸 때(write_stage)와 읽을 때(read_stage) 모두 적용하므로, 이전에 string/int64로 저장된
+  파일도 같은 타입으로 읽힙니다. 레지스트리에 없는 컬럼은 pandas 추론 타입을 그대로 씁니다.
+
+category 컬럼은 카테고리를 사전순으로 정렬해 두므로 sort_values/groupby 결과 순서는
+문자열 컬럼과 같습니다. groupby에는 observed=True를 지정해 없는 조합이 생기지 않게 합니다.
+
+IPC 캐시 (ipc_cache=True)
+    Parquet(보관용) 옆에 압축하지 않은 Arrow IPC 파일(<이름>.arrow)을 함께 씁니다.
+    다음 단계는 이 파일을 메모리 맵으로 열어 압축 해제/디코딩 없이 읽고, 요청한 컬럼의
+    페이지만 실제로 읽힙니다. IPC 파일에는 원본 Parquet의 크기/수정 시각을 기록해 두고,
+    Parquet가 바뀌었으면(캐시 없이 다시 쓴 경우 등) 캐시를 무시하고 Parquet를 읽습니다.
+
+저장 프로필 (WRITE_PROFILES)
+    단계마다 config.yaml output.parquet_profiles에서 Parquet 저장 옵션 묶음을 고릅니다.
+    scratch는 다음 단계가 바로 읽는 중간 산출물용(lz4), archive는 오래 보관하는 파일용
+    (zstd 고압축 + dictionary 인코딩), analytics는 goods_no/aspect 순으로 정렬한 작은
+    row group에 통계/페이지 인덱스를 남겨 필터 조회 시 관계없는 구간을 건너뛰게 합니다.
+    정렬은 저장 파일에만 적용하며, 다음 단계가 행 순서에 의존하는 산출물에는 쓰지 않습니다.
+"""
+
+import os
+import json
+import time
+import logging
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# 값 종류가 적은 문자열 (pandas category)
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+STRING_LIST = pa.list_(pa.string())
+
+# 컬럼 이름 -> Arrow 타입 (모든 단계 공통)
+COLUMN_TYPES: Dict[str, pa.DataType] = {
+    # 수집 리뷰
+    'review_id': pa.string(),
+    'goods_no': DICT_STRING,
+    'product_id': DICT_STRING,
+    'sort_source': DICT_STRING,
+    'rating': pa.int8(),
+    'review_date': pa.string(),
+    'skin_type_raw': DICT_STRING,
+    'skin_tone_raw': DICT_STRING,
+    'skin_trouble_raw': STRING_LIST,
+    'review_text': pa.string(),
+    'helpful_count': pa.int32(),
+    'has_images': pa.bool_(),
+    'image_count': pa.int32(),
+    'review_type': DICT_STRING,
+    'is_trial': pa.int8(),
+    'is_low_info': pa.int8(),
+    'source': DICT_STRING,
+    'sort_sources_all': STRING_LIST,
+
+    # 데이터셋 파티션
+    'crawl_date': DICT_STRING,
+    'category': DICT_STRING,
+
+    # Step 3-0 baseline
+    'review_date_parsed': pa.date32(),
+    'review_month': DICT_STRING,
+    'review_year': pa.int16(),
+    'season': DICT_STRING,
+    'rating_bucket': DICT_STRING,
+    'review_text_clean': pa.string(),
+    'text_len_chars': pa.int32(),
+    'text_len_words': pa.int32(),
+    'has_text': pa.bool_(),
+
+    # Step 3-0.5 dedup
+    'goods_no_all': STRING_LIST,
+    'sort_sources_str': DICT_STRING,
+    'sort_count': pa.int32(),
+    'primary_sort': DICT_STRING,
+    'dup_count': pa.int32(),
+    'dup_conflict': pa.bool_(),
+    'conflict_cols': STRING_LIST,
+
+    # Step 3-0.7 near-duplicate
+    'near_dup_cluster_id': pa.string(),
+    'near_dup_size': pa.int32(),
+
+    # Step 3-1 tagging
+    'attribute_tags': STRING_LIST,
+    'attribute_tags_str': pa.string(),
+    'context_tags': STRING_LIST,
+    'context_tags_str': pa.string(),
+    'skin_tags': STRING_LIST,
+    'skin_tags_str': pa.string(),
+    'has_conditional': pa.bool_(),
+    'conditional_markers': STRING_LIST,
+    'conditional_markers_str': DICT_STRING,
+    'attribute_mentions': STRING_LIST,
+    'attribute_polarity': pa.string(),
+    'toneup_whitecast_conflict': pa.bool_(),
+    'golden_nugget': pa.bool_(),
+    'has_attribute_tag': pa.bool_(),
+    'has_context_tag': pa.bool_(),
+    'has_skin_tag': pa.bool_(),
+
+    # Step 3-2 LLM queue / 3-3 LLM batch
+    'queue_id': pa.string(),
+    'bucket': DICT_STRING,
+    'priority_score': pa.float64(),
+    'input_text': pa.string(),
+    'meta_json': pa.string(),
+    'created_at': pa.string(),
+    'model_name': DICT_STRING,
+    'extraction_json': pa.string(),
+    'parsed_ok': pa.bool_(),
+    'error_type': DICT_STRING,
+    'error_message': pa.string(),
+    'prompt_tokens': pa.int32(),
+    'output_tokens': pa.int32(),
+    'response_time': pa.float64(),
+    'aspect': DICT_STRING,
+    'expectation': pa.string(),
+    'experience': pa.string(),
+    'polarity': DICT_STRING,
+    'context': pa.string(),
+    'evidence': pa.string(),
+    'confidence': pa.float64(),
+
+    # Step 4-0 join & pivot
+    'polarity_group': DICT_STRING,
+    'context_tag': DICT_STRING,
+    'n_items': pa.int32(),
+    'n_reviews': pa.int32(),
+    'met_cnt': pa.int32(),
+    'unmet_cnt': pa.int32(),
+    'mixed_cnt': pa.int32(),
+    'unknown_cnt': pa.int32(),
+    'unmet_like_cnt': pa.int32(),
+    'met_like_cnt': pa.int32(),
+    'unmet_like_rate': pa.float64(),
+    'goods_cnt_any': pa.int32(),
+    'reviews_any_cnt': pa.int32(),
+    'goods_cnt_unmet_like': pa.int32(),
+    'reviews_unmet_like_cnt': pa.int32(),
+    'goods_repeat_rate': pa.float64(),
+}
+
+_REVIEW_COLUMNS = [
+    'review_id', 'goods_no', 'product_id', 'sort_source', 'rating', 'review_date',
+    'skin_type_raw', 'skin_tone_raw', 'skin_trouble_raw', 'review_text',
+    'helpful_count', 'has_images', 'image_count', 'review_type',
+    'is_trial', 'is_low_info', 'source', 'sort_sources_all',
+]
+
+_DEDUP_COLUMNS = [
+    'review_id', 'goods_no', 'goods_no_all', 'product_id',
+    'rating', 'rating_bucket', 'review_date', 'review_date_parsed',
+    'review_month', 'review_year', 'season',
+    'review_text', 'review_text_clean', 'text_len_chars', 'text_len_words', 'has_text',
+    'helpful_count', 'has_images', 'image_count',
+    'skin_type_raw', 'skin_tone_raw', 'skin_trouble_raw',
+    'review_type', 'is_trial', 'is_low_info', 'source',
+    'sort_sources_all', 'sort_sources_str', 'sort_count', 'primary_sort',
+    'dup_count', 'dup_conflict', 'conflict_cols',
+]
+
+_NEAR_DUP_COLUMNS = ['near_dup_cluster_id', 'near_dup_size']
+
+_TAG_COLUMNS = [
+    'attribute_tags', 'attribute_tags_str', 'context_tags', 'context_tags_str',
+    'skin_tags', 'skin_tags_str', 'has_conditional', 'conditional_markers',
+    'conditional_markers_str', 'attribute_mentions', 'attribute_polarity',
+    'toneup_whitecast_conflict', 'golden_nugget',
+    'has_attribute_tag', 'has_context_tag', 'has_skin_tag',
+]
+
+_UNMET_COLUMNS = ['n_reviews', 'unmet_like_cnt', 'met_like_cnt', 'unmet_like_rate']
+_POLARITY_COUNT_COLUMNS = [
+    'n_items', 'met_cnt', 'unmet_cnt', 'mixed_cnt', 'unknown_cnt', 'unmet_like_cnt', 'unmet_like_rate',
+]
+
+# 단계 이름 -> 출력 컬럼 (저장 순서)
+STAGE_COLUMNS: Dict[str, List[str]] = {
+    'reviews': _REVIEW_COLUMNS,
+    'refs': [
+        'review_id', 'goods_no', 'product_id', 'sort_source', 'sort_sources_all',
+        'rating', 'review_date', 'helpful_count', 'has_images', 'image_count',
+    ],
+    'base': _REVIEW_COLUMNS + [
+        'review_date_parsed', 'review_month', 'review_year', 'season', 'rating_bucket',
+        'review_text_clean', 'text_len_chars', 'text_len_words', 'has_text',
+    ],
+    'dedup': _DEDUP_COLUMNS,
+    'neardup': _DEDUP_COLUMNS + _NEAR_DUP_COLUMNS,
+    'tagged': _DEDUP_COLUMNS + _NEAR_DUP_COLUMNS + _TAG_COLUMNS,
+    'llm_queue': [
+        'queue_id', 'review_id', 'goods_no', 'bucket', 'priority_score',
+        'input_text', 'meta_json', 'created_at',
+    ],
+    'extractions': [
+        'review_id', 'goods_no', 'bucket', 'model_name', 'extraction_json', 'parsed_ok',
+        'error_type', 'error_message', 'prompt_tokens', 'output_tokens', 'response_time', 'created_at',
+    ],
+    'extractions_normalized': [
+        'review_id', 'goods_no', 'bucket', 'aspect', 'expectation', 'experience',
+        'polarity', 'context', 'evidence', 'confidence',
+    ],
+    'master_join': [
+        'review_id', 'goods_no', 'bucket', 'aspect', 'expectation', 'experience',
+        'polarity', 'context', 'evidence', 'confidence',
+        'rating', 'rating_bucket', 'season', 'review_month',
+        'context_tags_str', 'attribute_tags_str', 'skin_tags_str',
+        'has_conditional', 'golden_nugget', 'is_trial', 'is_low_info',
+        'text_len_chars', 'helpful_count', 'primary_sort', 'polarity_group',
+    ],
+    'pivot_overall': ['aspect'] + _POLARITY_COUNT_COLUMNS,
+    'pivot_by_bucket': ['bucket', 'aspect'] + _POLARITY_COUNT_COLUMNS,
+    'pivot_context': ['context_tag', 'aspect'] + _UNMET_COLUMNS,
+    'pivot_season': ['season', 'aspect'] + _UNMET_COLUMNS,
+    'repeatability': [
+        'aspect', 'goods_cnt_any', 'reviews_any_cnt',
+        'goods_cnt_unmet_like', 'reviews_unmet_like_cnt', 'goods_repeat_rate',
+    ],
+}
+
+
+def stage_schema(stage: str) -> pa.Schema:
+    """
+    단계 출력 스키마
+
+    Args:
+        stage: 단계 이름 (STAGE_COLUMNS 키)
+
+    Returns:
+        Arrow 스키마 (STAGE_COLUMNS 순서)
+    """
+    return pa.schema([(name, COLUMN_TYPES[name]) for name in STAGE_COLUMNS[stage]])
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    """category로 변환 (카테고리는 사전순)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        if categories.is_monotonic_increasing:
+            return series
+        return series.cat.reorder_categories(sorted(categories))
+    return series.astype('category')
+
+
+def _as_int(series: pd.Series, arrow_type: pa.DataType) -> pd.Series:
+    """고정 폭 정수로 변환 (결측이 있으면 nullable 정수, 범위를 넘으면 ValueError)"""
+    np_dtype = np.dtype(arrow_type.to_pandas_dtype())
+    if series.dtype == np_dtype:
+        return series
+
+    values = series.dropna()
+    if len(values):
+        info = np.iinfo(np_dtype)
+        low, high = values.min(), values.max()
+        if low < info.min or high > info.max:
+            raise ValueError(f"{series.name}: {arrow_type} 범위를 벗어난 값 ({low} ~ {high})")
+
+    if len(values) < len(series):
+        return series.astype(f"Int{np_dtype.itemsize * 8}")
+    return series.astype(np_dtype)
+
+
+def conform(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    레지스트리 타입에 맞춰 pandas 컬럼 타입 변환
+
+    dictionary 컬럼은 category, 정수 컬럼은 고정 폭 정수(결측이 있으면 nullable)로 바꿉니다.
+    이미 맞는 컬럼과 레지스트리에 없는 컬럼은 그대로 둡니다.
+
+    Args:
+        df: DataFrame (변경하지 않음)
+
+    Returns:
+        타입을 맞춘 DataFrame
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        arrow_type = COLUMN_TYPES.get(col)
+        if arrow_type is None:
+            continue
+        if pa.types.is_dictionary(arrow_type):
+            df[col] = _as_category(df[col])
+        elif pa.types.is_integer(arrow_type):
+            df[col] = _as_int(df[col], arrow_type)
+    return df
+
+
+def conform_table(table: pa.Table) -> pa.Table:
+    """
+    레지스트리 타입에 맞춰 Arrow 테이블 캐스팅 (레지스트리에 없는 컬럼은 그대로)
+
+    Args:
+        table: Arrow 테이블
+
+    Returns:
+        캐스팅한 테이블 (값이 타입 범위를 넘으면 ArrowInvalid)
+    """
+    fields = [
+        field.with_type(COLUMN_TYPES.get(field.name, field.type))
+        for field in table.schema
+    ]
+    target = pa.schema(fields, metadata=table.schema.metadata)
+    if target.equals(table.schema):
+        return table
+    return table.cast(target)
+
+
+def to_table(df: pd.DataFrame) -> pa.Table:
+    """DataFrame을 레지스트리 타입의 Arrow 테이블로 변환 (인덱스 제외)"""
+    return conform_table(pa.Table.from_pandas(conform(df), preserve_index=False))
+
+
+# IPC 캐시 메타데이터 키 (원본 Parquet 식별 정보)
+IPC_SUFFIX = '.arrow'
+IPC_SOURCE_KEY = b'stage_ipc_source'
+
+
+def ipc_cache_path(path: str) -> str:
+    """Parquet 경로에 대응하는 IPC 캐시 경로 (확장자만 .arrow로)"""
+    return os.path.splitext(path)[0] + IPC_SUFFIX
+
+
+def _source_stamp(path: str) -> str:
+    """Parquet 파일 식별 정보 (크기 + 수정 시각)"""
+    stat = os.stat(path)
+    return json.dumps({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+
+
+def write_ipc_cache(table: pa.Table, parquet_path: str) -> str:
+    """
+    압축하지 않은 Arrow IPC 캐시 저장 (Parquet를 다 쓴 뒤 호출)
+
+    Args:
+        table: 저장할 테이블 (Parquet에 쓴 것과 같은 테이블)
+        parquet_path: 원본 Parquet 경로
+
+    Returns:
+        IPC 캐시 경로
+    """
+    path = ipc_cache_path(parquet_path)
+    metadata = dict(table.schema.metadata or {})
+    metadata[IPC_SOURCE_KEY] = _source_stamp(parquet_path).encode()
+    # IPC 파일 형식은 배치 간 dictionary가 같아야 하므로 먼저 통일
+    table = table.unify_dictionaries().replace_schema_metadata(metadata)
+
+    tmp_path = f"{path}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_ipc_cache(parquet_path: str, columns: Optional[List[str]] = None) -> Optional[pa.Table]:
+    """
+    메모리 맵으로 IPC 캐시 로드
+
+    Args:
+        parquet_path: 원본 Parquet 경로
+        columns: 읽을 컬럼 (기본: 전체)
+
+    Returns:
+        Arrow 테이블 (캐시가 없거나 Parquet와 맞지 않으면 None)
+    """
+    path = ipc_cache_path(parquet_path)
+    if not os.path.exists(path) or not os.path.exists(parquet_path):
+        return None
+
+    reader = pa.ipc.open_file(pa.memory_map(path, 'r'))
+    source = (reader.schema.metadata or {}).get(IPC_SOURCE_KEY)
+    if source is None or source.decode() != _source_stamp(parquet_path):
+        logger.info(f"IPC 캐시가 Parquet와 맞지 않아 무시: {path}")
+        return None
+
+    table = reader.read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+# 저장 프로필 이름 -> Parquet 저장 옵션
+#   sort_by: 저장 전 정렬 컬럼 (있는 컬럼만, 파일 메타데이터에 sorting_columns로 기록)
+#   row_group_size: row group 행 수 (pq.write_table 옵션)
+#   그 외: pq.ParquetWriter 옵션 (compression, compression_level, use_dictionary, write_page_index 등)
+WRITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    'default': {},
+    'scratch': {
+        'compression': 'lz4',
+    },
+    'uncompressed': {
+        'compression': 'none',
+    },
+    'archive': {
+        'compression': 'zstd',
+        'compression_level': 19,
+        'use_dictionary': True,
+        'dictionary_pagesize_limit': 4 * 1024 * 1024,
+    },
+    'analytics': {
+        'compression': 'zstd',
+        'compression_level': 3,
+        'sort_by': ['goods_no', 'aspect'],
+        'row_group_size': 2048,
+        'write_page_index': True,
+    },
+}
+
+
+def _profile(name: str) -> Dict[str, Any]:
+    """저장 프로필 옵션 (알 수 없는 이름이면 ValueError)"""
+    if name not in WRITE_PROFILES:
+        raise ValueError(f"알 수 없는 Parquet 저장 프로필: {name} (가능: {', '.join(WRITE_PROFILES)})")
+    return dict(WRITE_PROFILES[name])
+
+
+def writer_options(profile: str = 'default') -> Dict[str, Any]:
+    """
+    pq.ParquetWriter에 넘길 저장 옵션 (스트리밍 저장용, 정렬/row group 크기 제외)
+
+    Args:
+        profile: 저장 프로필 이름
+
+    Returns:
+        ParquetWriter 키워드 인자
+    """
+    options = _profile(profile)
+    options.pop('sort_by', None)
+    options.pop('row_group_size', None)
+    return options
+
+
+def get_write_profile(config: Dict[str, Any], stage: str) -> str:
+    """
+    설정에서 단계의 저장 프로필 이름 조회
+
+    Args:
+        config: 설정 딕셔너리 (output.parquet_profiles 블록 사용)
+        stage: 단계 이름 (reviews, base, dedup, tagged, llm_queue, extractions, ...)
+
+    Returns:
+        프로필 이름 (지정하지 않은 단계는 parquet_profiles.default, 그것도 없으면 default)
+    """
+    profiles = config.get('output', {}).get('parquet_profiles') or {}
+    name = profiles.get(stage, profiles.get('default', 'default'))
+    _profile(name)
+    return name
+
+
+def load_write_profile(stage: str, config_path: str = 'config.yaml') -> str:
+    """
+    config.yaml에서 단계의 저장 프로필 이름 조회 헬퍼 함수 (파일이 없으면 default)
+
+    Args:
+        stage: 단계 이름
+        config_path: 설정 파일 경로
+
+    Returns:
+        프로필 이름
+    """
+    if not os.path.exists(config_path):
+        return 'default'
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return get_write_profile(config, stage)
+
+
+def write_stage(
+    df: pd.DataFrame,
+    path: str,
+    ipc_cache: bool = False,
+    profile: str = 'default'
+) -> str:
+    """
+    단계 출력 Parquet 저장 (레지스트리 타입 적용)
+
+    Args:
+        df: 저장할 DataFrame (정렬하는 프로필이어도 원본은 바꾸지 않음)
+        path: 출력 파일 경로
+        ipc_cache: True면 다음 단계용 IPC 캐시(<이름>.arrow)도 저장
+        profile: 저장 프로필 이름 (WRITE_PROFILES)
+
+    Returns:
+        저장된 파일 경로
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    options = _profile(profile)
+    sort_by = [c for c in options.pop('sort_by', []) if c in df.columns]
+    if sort_by:
+        # category는 사전순 카테고리이므로 문자열 정렬과 같은 순서, 같은 키 안에서는 원래 순서 유지
+        df = df.sort_values(sort_by, kind='stable')
+
+    table = to_table(df)
+    if sort_by:
+        options['sorting_columns'] = [pq.SortingColumn(table.schema.get_field_index(c)) for c in sort_by]
+    pq.write_table(table, path, **options)
+    if ipc_cache:
+        write_ipc_cache(table, path)
+    elif os.path.exists(ipc_cache_path(path)):
+        # 이전 실행의 캐시는 새 Parquet와 맞지 않으므로 제거
+        os.remove(ipc_cache_path(path))
+    return path
+
+
+def read_stage(
+    path: str,
+    columns: Optional[List[str]] = None,
+    ipc_cache: bool = False
+) -> pd.DataFrame:
+    """
+    단계 출력 Parquet 로드 (레지스트리 타입 적용, 이전 형식 파일도 같은 타입으로)
+
+    Args:
+        path: Parquet 파일 경로
+        columns: 읽을 컬럼 (기본: 전체)
+        ipc_cache: True면 IPC 캐시가 있을 때 Parquet 대신 메모리 맵으로 읽음
+
+    Returns:
+        DataFrame
+    """
+    started = time.perf_counter()
+    table = read_ipc_cache(path, columns) if ipc_cache else None
+    source = 'IPC 캐시(mmap)'
+    if table is None:
+        table = pq.read_table(path, columns=columns)
+        source = 'Parquet'
+    loaded = time.perf_counter()
+
+    df = conform(table.to_pandas())
+    logger.info(
+        f"단계 데이터 로드: {path} ({source}, {len(df)}행, "
+        f"읽기 {(loaded - started) * 1000:.0f}ms + 변환 {(time.perf_counter() - loaded) * 1000:.0f}ms)"
+    )
+    return df
@@ -0,0 +1,346 @@
+"""
+수집 텔레메트리 모듈
+
+카탈로그/리뷰 수집기의 요청 단위 계측을 한 실행 동안 모읍니다.
+
+- 엔드포인트별 요청 지연 히스토그램과 상태 코드별 요청 수
+- 내려받은 응답 바이트 수, 캐시 적중 수
+- 실패/재시도 횟수와 원인 (timeout, connection, http_429, http_5xx, ...)
+- 대기(sleep) 시간과 I/O 대기 시간 (요청 지연 합계)
+
+실행이 끝나면 log_dir에 JSON 파일과 Prometheus 텍스트 형식 스냅샷을 저장합니다.
+동시 모드에서는 여러 스레드의 시간이 합산되므로 대기/I/O 시간 합계가
+실행 시간보다 클 수 있습니다 (스레드-초).
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# 요청 지연 히스토그램 버킷 상한 (초, 마지막은 +Inf)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 4) if value is not None else None
+
+
+class LatencyHistogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le 라벨, 누적 개수) 리스트"""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((f"{bound:g}", total))
+        result.append(('+Inf', total + self.counts[-1]))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한으로 근사한 분위수 (+Inf 버킷이면 관측 최대값)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        for (_, total), bound in zip(self.cumulative(), self.buckets + (self.max,)):
+            if total >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum_seconds': round(self.sum, 4),
+            'mean_seconds': round(self.sum / self.count, 4) if self.count else None,
+            'max_seconds': round(self.max, 4),
+            'p50_seconds': _round(self.quantile(0.5)),
+            'p95_seconds': _round(self.quantile(0.95)),
+            'buckets': dict(self.cumulative()),
+        }
+
+
+class CrawlMetrics:
+    """한 실행의 수집 계측 집계기 (스레드 안전)"""
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.requests: Dict[Tuple[str, str], int] = {}       # (endpoint, status) -> 요청 수
+        self.bytes: Dict[str, int] = {}                      # endpoint -> 응답 바이트
+        self.failures: Dict[Tuple[str, str], int] = {}       # (endpoint, cause) -> 실패 수
+        self.retries: Dict[Tuple[str, str], int] = {}        # (endpoint, cause) -> 재시도 수
+        self.cache_hits: Dict[str, int] = {}                 # endpoint -> 캐시 적중 수
+        self.sleep_seconds: Dict[str, float] = {}            # reason -> 대기 시간
+
+    def observe_request(
+        self,
+        endpoint: str,
+        latency: float,
+        status: Optional[int],
+        nbytes: int = 0
+    ) -> None:
+        """
+        요청 1회 기록 (응답을 받았으면 HTTP 상태 코드, 네트워크 오류면 None)
+
+        Args:
+            endpoint: 엔드포인트 이름 (catalog, reviews)
+            latency: 요청 소요 시간 (초, 본문 수신 포함)
+            status: HTTP 상태 코드
+            nbytes: 응답 본문 바이트 수
+        """
+        status_label = str(status) if status is not None else 'error'
+        with self._lock:
+            histogram = self.latency.get(endpoint)
+            if histogram is None:
+                histogram = self.latency[endpoint] = LatencyHistogram()
+            histogram.observe(latency)
+            key = (endpoint, status_label)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.bytes[endpoint] = self.bytes.get(endpoint, 0) + nbytes
+
+    def record_failure(self, endpoint: str, cause: str, retried: bool) -> None:
+        """
+        실패한 시도 기록
+
+        Args:
+            endpoint: 엔드포인트 이름
+            cause: 실패 원인 (failure_cause 참고)
+            retried: 재시도했으면 True (마지막 시도 실패면 False)
+        """
+        with self._lock:
+            key = (endpoint, cause)
+            self.failures[key] = self.failures.get(key, 0) + 1
+            if retried:
+                self.retries[key] = self.retries.get(key, 0) + 1
+
+    def record_cache_hit(self, endpoint: str) -> None:
+        """응답 캐시 적중 기록"""
+        with self._lock:
+            self.cache_hits[endpoint] = self.cache_hits.get(endpoint, 0) + 1
+
+    def add_sleep(self, reason: str, seconds: float) -> None:
+        """
+        대기 시간 기록
+
+        Args:
+            reason: 대기 사유 (pacing: 속도 제한기, delay: 요청 간 딜레이, retry: 재시도 전 딜레이)
+            seconds: 대기 시간 (초)
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.sleep_seconds[reason] = self.sleep_seconds.get(reason, 0.0) + seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 계측을 JSON으로 저장 가능한 딕셔너리로 변환"""
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            io_seconds = sum(h.sum for h in self.latency.values())
+            sleep_seconds = sum(self.sleep_seconds.values())
+
+            endpoints = {}
+            for endpoint in sorted(set(self.latency) | set(self.cache_hits)):
+                histogram = self.latency.get(endpoint, LatencyHistogram())
+                endpoints[endpoint] = {
+                    'latency': histogram.to_dict(),
+                    'requests_by_status': {
+                        status: count for (ep, status), count in sorted(self.requests.items())
+                        if ep == endpoint
+                    },
+                    'bytes_downloaded': self.bytes.get(endpoint, 0),
+                    'failures_by_cause': {
+                        cause: count for (ep, cause), count in sorted(self.failures.items())
+                        if ep == endpoint
+                    },
+                    'retries_by_cause': {
+                        cause: count for (ep, cause), count in sorted(self.retries.items())
+                        if ep == endpoint
+                    },
+                    'cache_hits': self.cache_hits.get(endpoint, 0),
+                }
+
+            return {
+                'started_at': self.started_at.strftime('%Y-%m-%dT%H:%M:%S'),
+                'elapsed_seconds': round(elapsed, 3),
+                'io_wait_seconds': round(io_seconds, 3),
+                'sleep_seconds': round(sleep_seconds, 3),
+                'sleep_by_reason': {k: round(v, 3) for k, v in sorted(self.sleep_seconds.items())},
+                'endpoints': endpoints,
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 스냅샷"""
+        snapshot = self.snapshot()
+        lines = [
+            '# HELP crawl_request_duration_seconds Crawl request latency (including body download).',
+            '# TYPE crawl_request_duration_seconds histogram',
+        ]
+        for endpoint, data in snapshot['endpoints'].items():
+            latency = data['latency']
+            for le, count in latency['buckets'].items():
+                lines.append(f'crawl_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{le}"}} {count}')
+            lines.append(f'crawl_request_duration_seconds_sum{{endpoint="{endpoint}"}} {latency["sum_seconds"]}')
+            lines.append(f'crawl_request_duration_seconds_count{{endpoint="{endpoint}"}} {latency["count"]}')
+
+        counters = [
+            ('crawl_requests_total', 'Crawl requests by HTTP status (error = no response).', 'requests_by_status', 'status'),
+            ('crawl_request_failures_total', 'Failed crawl request attempts by cause.', 'failures_by_cause', 'cause'),
+            ('crawl_retries_total', 'Retried crawl request attempts by cause.', 'retries_by_cause', 'cause'),
+        ]
+        for name, help_text, key, label in counters:
+            lines.extend([f'# HELP {name} {help_text}', f'# TYPE {name} counter'])
+            for endpoint, data in snapshot['endpoints'].items():
+                for value, count in data[key].items():
+                    lines.append(f'{name}{{endpoint="{endpoint}",{label}="{value}"}} {count}')
+
+        lines.extend([
+            '# HELP crawl_response_bytes_total Response body bytes downloaded.',
+            '# TYPE crawl_response_bytes_total counter',
+        ])
+        for endpoint, data in snapshot['endpoints'].items():
+            lines.append(f'crawl_response_bytes_total{{endpoint="{endpoint}"}} {data["bytes_downloaded"]}')
+
+        lines.extend([
+            '# HELP crawl_cache_hits_total Responses served from the local response cache.',
+            '# TYPE crawl_cache_hits_total counter',
+        ])
+        for endpoint, data in snapshot['endpoints'].items():
+            lines.append(f'crawl_cache_hits_total{{endpoint="{endpoint}"}} {data["cache_hits"]}')
+
+        lines.extend([
+            '# HELP crawl_sleep_seconds_total Time spent sleeping by reason (thread-seconds).',
+            '# TYPE crawl_sleep_seconds_total counter',
+        ])
+        for reason, seconds in snapshot['sleep_by_reason'].items():
+            lines.append(f'crawl_sleep_seconds_total{{reason="{reason}"}} {seconds}')
+
+        lines.extend([
+            '# HELP crawl_io_wait_seconds_total Time spent waiting on requests (thread-seconds).',
+            '# TYPE crawl_io_wait_seconds_total counter',
+            f'crawl_io_wait_seconds_total {snapshot["io_wait_seconds"]}',
+            '# HELP crawl_run_duration_seconds Wall-clock duration of the crawl run.',
+            '# TYPE crawl_run_duration_seconds gauge',
+            f'crawl_run_duration_seconds {snapshot["elapsed_seconds"]}',
+        ])
+        return '\n'.join(lines) + '\n'
+
+
+def failure_cause(error: Exception) -> str:
+    """
+    요청 예외를 실패 원인 라벨로 변환
+
+    Returns:
+        http_429, http_5xx, http_4xx, timeout, connection, invalid_json, other 중 하나
+    """
+    response = getattr(error, 'response', None)
+    if response is not None:
+        status = response.status_code
+        if status == 429:
+            return 'http_429'
+        return 'http_5xx' if status >= 500 else 'http_4xx'
+    if isinstance(error, requests.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.ConnectionError):
+        return 'connection'
+    if isinstance(error, ValueError):
+        return 'invalid_json'
+    return 'other'
+
+
+# 실행 단위 공유 집계기 (카탈로그/리뷰 수집기가 함께 기록)
+_METRICS: Optional[CrawlMetrics] = None
+_METRICS_LOCK = threading.Lock()
+
+
+def is_telemetry_enabled(config: Dict[str, Any]) -> bool:
+    """수집 텔레메트리 사용 여부 (기본: 사용)"""
+    return bool(config.get('telemetry', {}).get('enabled', True))
+
+
+def get_crawl_metrics(config: Dict[str, Any]) -> Optional[CrawlMetrics]:
+    """
+    현재 실행의 공유 집계기 반환 (없으면 생성)
+
+    Args:
+        config: 설정 딕셔너리 (telemetry.enabled 사용)
+
+    Returns:
+        CrawlMetrics 인스턴스 또는 None (비활성화 시)
+    """
+    global _METRICS
+
+    if not is_telemetry_enabled(config):
+        return None
+
+    with _METRICS_LOCK:
+        if _METRICS is None:
+            _METRICS = CrawlMetrics()
+        return _METRICS
+
+
+def export_crawl_metrics(config: Dict[str, Any]) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+    """
+    현재 실행의 계측을 JSON/Prometheus 파일로 저장하고 집계기 초기화
+
+    Args:
+        config: 설정 딕셔너리 (output.log_dir 사용)
+
+    Returns:
+        (저장된 파일 경로 딕셔너리, 계측 스냅샷) - 계측이 없으면 ({}, None)
+    """
+    global _METRICS
+
+    with _METRICS_LOCK:
+        metrics, _METRICS = _METRICS, None
+
+    if metrics is None:
+        return {}, None
+
+    log_dir = config.get('output', {}).get('log_dir', 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    stamp = metrics.started_at.strftime('%Y%m%d_%H%M%S')
+
+    snapshot = metrics.snapshot()
+    json_path = os.path.join(log_dir, f"crawl_metrics_{stamp}.json")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+
+    prom_path = os.path.join(log_dir, f"crawl_metrics_{stamp}.prom")
+    with open(prom_path, 'w', encoding='utf-8') as f:
+        f.write(metrics.to_prometheus())
+
+    logger.info(
+        f"수집 텔레메트리 저장: {json_path} (실행 {snapshot['elapsed_seconds']:.1f}s, "
+        f"I/O 대기 {snapshot['io_wait_seconds']:.1f}s, 대기 {snapshot['sleep_seconds']:.1f}s)"
+    )
+    return {'crawl_metrics_json': json_path, 'crawl_metrics_prom': prom_path}, snapshot
@@ -0,0 +1,83 @@
+"""
+리뷰 워터마크 모듈
+
+상품별로 최신순(DATETIME_DESC) 정렬에서 마지막으로 본 가장 최근 리뷰를
+기록합니다. 증분(delta) 수집은 이 워터마크를 만나면 페이지 탐색을 멈춥니다.
+"""
+
+import os
+import json
+import threading
+import logging
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WatermarkStore:
+    """상품별 리뷰 워터마크 저장소 (JSON 파일, 스레드 안전)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 워터마크 JSON 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """파일에서 워터마크 로드"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f) or {}
+            logger.info(f"워터마크 로드: {self.path} ({len(self._data)}개 상품)")
+        except (OSError, ValueError) as e:
+            logger.warning(f"워터마크 파일 로드 실패, 새로 시작: {e}")
+            self._data = {}
+
+    def get(self, goods_no: str) -> Optional[Dict[str, Any]]:
+        """
+        상품 워터마크 조회
+
+        Returns:
+            {'review_id': ..., 'created_at': ...} 또는 None
+        """
+        with self._lock:
+            mark = self._data.get(goods_no)
+            return dict(mark) if mark else None
+
+    def update(self, goods_no: str, review_id: str, created_at: Optional[str]) -> None:
+        """상품 워터마크 갱신"""
+        with self._lock:
+            self._data[goods_no] = {
+                'review_id': review_id,
+                'created_at': created_at,
+            }
+            self._dirty = True
+
+    def save(self) -> Optional[str]:
+        """
+        변경된 워터마크를 파일에 저장 (임시 파일 교체 방식)
+
+        Returns:
+            저장된 파일 경로 (변경 없으면 None)
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+        logger.info(f"워터마크 저장: {self.path} ({len(self._data)}개 상품)")
+        return self.path
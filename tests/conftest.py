@@ -0,0 +1,44 @@
+"""
+공통 테스트 픽스처
+
+수집 테스트는 로컬 대역 서버(src.bench.fake_server)에 요청하고, 작업 디렉토리를 임시 폴더로
+옮겨 config.yaml의 상대 경로(data/raw, data/processed, report, logs)가 모두 그 아래에 쓰이게 합니다.
+"""
+
+import copy
+import os
+
+import pytest
+import yaml
+
+from src.bench.fake_server import FakeCatalog, FakeOliveYoungServer, FaultInjector
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.path.join(REPO_ROOT, 'config.yaml'), 'r', encoding='utf-8') as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+@pytest.fixture
+def fake_server():
+    """지연 없는 작은 대역 서버 (상품 12개, 상품당 리뷰 최대 60개)"""
+    server = FakeOliveYoungServer(
+        catalog=FakeCatalog(product_count=12, max_reviews=60, seed=1),
+        faults=FaultInjector(latency_ms=0, jitter_ms=0),
+    )
+    with server:
+        yield server
+
+
+@pytest.fixture
+def crawl_config(tmp_path, monkeypatch, fake_server):
+    """대역 서버를 보는 config.yaml 사본 (대기 없음, 출력은 임시 폴더의 상대 경로)"""
+    monkeypatch.chdir(tmp_path)
+    config = copy.deepcopy(BASE_CONFIG)
+    config['catalog']['base_url'] = fake_server.catalog_url
+    config['catalog']['parse_workers'] = 0
+    config['reviews']['api_url'] = fake_server.reviews_url
+    config['reviews']['top_n'] = 6
+    config['request'].update(delay_min=0, delay_max=0, max_retries=1, rate_limit=1000, burst=1000)
+    config['request']['pacing']['adaptive'] = False
+    return config
@@ -0,0 +1,26 @@
+"""수집 테스트 공용 함수 (대역 서버 데이터 조회)"""
+
+from typing import Any, Dict, List
+
+from src.catalog import collect_catalog
+from src.watermarks import WatermarkStore
+
+
+def newest_reviews(server, goods_no: str) -> List[Dict[str, Any]]:
+    """대역 서버의 최신순 전체 리뷰 원본"""
+    return server.catalog.review_page(goods_no, 'DATETIME_DESC', 0, 10_000)['data']
+
+
+def product_with_reviews(config: Dict[str, Any], server, minimum: int) -> Dict[str, Any]:
+    """리뷰가 minimum개 이상인 카탈로그 상품 하나"""
+    for product in collect_catalog(config):
+        if len(newest_reviews(server, product['goods_no'])) >= minimum:
+            return product
+    raise AssertionError(f"리뷰 {minimum}개 이상인 상품 없음")
+
+
+def write_watermark(config: Dict[str, Any], goods_no: str, review: Dict[str, Any]) -> None:
+    """상품 워터마크를 주어진 리뷰 원본으로 기록 (이후 리뷰는 신규로 취급)"""
+    store = WatermarkStore(config['reviews']['delta']['watermark_file'])
+    store.update(goods_no, str(review['reviewId']), review['createdDateTime'])
+    store.save()
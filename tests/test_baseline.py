@@ -0,0 +1,82 @@
+"""Step 3-0 Baseline 전처리 (벡터화/스트리밍/멀티프로세스 결과가 기존 구현과 같은지)"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.bench.baseline_engine import rowwise, same_columns, vectorized
+from src.processing.baseline import BaselinePreprocessor, clean_text, clean_texts, parse_review_dates
+from src.schema import read_stage
+
+from conftest import REPO_ROOT
+
+EDGE_TEXTS = [
+    "  앞뒤 공백　", "&quot;따옴표&quot; &amp; &lt;태그&gt;", "줄\r\n바꿈\r끝", "탭\t\t문자",
+    "연속    공백", "줄\n\n\n\n\n바꿈", "  유니코드 공백 ", "", None, "&", "   ",
+]
+EDGE_DATES = [
+    "2023.02.09", "2023-02-09", "2023/02/09", " 2024.12.31 ", "2023.2.9", "2023.13.01",
+    "20230209", "", None, "2020.02.29", "2021.02.29",
+]
+EDGE_RATINGS = [1, 2, 3, 4, 5, None, 3, 5, None, 1, 4]
+
+
+@pytest.fixture(scope='module')
+def reviews() -> pd.DataFrame:
+    """실제 수집 리뷰 일부 + 경계 사례 행"""
+    source = pd.read_parquet(os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')).head(400)
+    edge = source.head(len(EDGE_TEXTS)).copy()
+    edge['review_id'] = [f"edge-{i}" for i in range(len(edge))]
+    edge['review_text'] = EDGE_TEXTS
+    edge['review_date'] = EDGE_DATES
+    edge['rating'] = pd.array(EDGE_RATINGS, dtype='Int64')
+    # 중복 review_id 한 건 (QA 통계 확인용)
+    return pd.concat([source, edge, source.tail(1)], ignore_index=True)
+
+
+def test_clean_texts_matches_clean_text():
+    texts = pd.Series(EDGE_TEXTS, dtype=object)
+    assert clean_texts(texts).tolist() == [clean_text(t) for t in EDGE_TEXTS]
+
+    # 문자열이 아닌 값이 섞이면 행 단위로 처리
+    mixed = pd.Series(["a  b", 3, None], dtype=object)
+    assert clean_texts(mixed).tolist() == ["a b", "", ""]
+
+
+def test_parse_review_dates_keeps_rowwise_failures():
+    parsed = parse_review_dates(pd.Series(EDGE_DATES, dtype=object))
+    assert parsed.notna().tolist() == [True, True, True, True, True, False, False, False, False, True, False]
+
+
+def test_vectorized_matches_rowwise(reviews):
+    df = reviews[['review_text', 'review_date', 'rating']].astype({'rating': 'Int64'})
+    assert same_columns(rowwise(df), vectorized(df)) == []
+
+
+def run_baseline(tmp_path, source: pd.DataFrame, name: str, **options):
+    input_path = tmp_path / 'reviews.parquet'
+    if not input_path.exists():
+        source.to_parquet(input_path, index=False)
+    output_path = tmp_path / name / 'reviews_step3_base.parquet'
+    preprocessor = BaselinePreprocessor(
+        input_path=str(input_path),
+        output_path=str(output_path),
+        report_dir=str(tmp_path / name / 'report'),
+        **options
+    )
+    preprocessor.run()
+    return read_stage(str(output_path)), preprocessor.stats
+
+
+@pytest.mark.parametrize('options', [
+    {'chunk_rows': 97}, {'chunk_rows': 1000}, {'workers': 2}, {'chunk_rows': 150, 'workers': 3},
+])
+def test_streaming_and_sharded_match_in_memory(tmp_path, reviews, options):
+    expected, expected_stats = run_baseline(tmp_path, reviews, 'in_memory')
+    actual, actual_stats = run_baseline(tmp_path, reviews, 'variant', **options)
+
+    # 스트리밍 저장은 배치마다 사전 인코딩하므로 범주 순서만 다를 수 있음
+    pd.testing.assert_frame_equal(actual, expected, check_categorical=False)
+    assert actual_stats == expected_stats
+    assert actual_stats['duplicate_review_ids'] == 2
@@ -0,0 +1,42 @@
+"""카탈로그 수집 (나머지 페이지 동시 요청 + 파싱 프로세스 풀이 순차 수집과 같은 결과인지)"""
+
+import pytest
+
+from src.catalog import collect_catalog
+
+
+def catalog_config(config, concurrency, parse_workers, parser='lxml'):
+    config['catalog'].update(rows_per_page=5, concurrency=concurrency, parse_workers=parse_workers, parser=parser)
+    return config
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'bs4'])
+def test_concurrent_pages_with_parse_pool_match_sequential(crawl_config, fake_server, parser):
+    before = fake_server.stats['catalog_requests']
+    sequential = collect_catalog(catalog_config(crawl_config, 1, 0, parser))
+    sequential_requests = fake_server.stats['catalog_requests'] - before
+
+    before = fake_server.stats['catalog_requests']
+    concurrent = collect_catalog(catalog_config(crawl_config, 3, 2, parser))
+
+    # 상품 12개 / 페이지당 5개 = 3페이지, 각 페이지를 한 번씩만 요청
+    assert sequential_requests == 3
+    assert fake_server.stats['catalog_requests'] - before == 3
+    assert concurrent == sequential
+    assert [p['list_rank'] for p in concurrent] == list(range(1, 13))
+    assert len({p['goods_no'] for p in concurrent}) == 12
+
+
+def test_failed_page_keeps_earlier_pages(crawl_config, fake_server, monkeypatch):
+    catalog_page = fake_server.catalog.catalog_page
+
+    def broken_last_page(page_idx, rows_per_page):
+        if page_idx == 3:
+            return ''
+        return catalog_page(page_idx, rows_per_page)
+
+    monkeypatch.setattr(fake_server.catalog, 'catalog_page', broken_last_page)
+    products = collect_catalog(catalog_config(crawl_config, 3, 2))
+
+    assert [p['list_rank'] for p in products] == list(range(1, 11))
+
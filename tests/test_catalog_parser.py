@@ -0,0 +1,98 @@
+"""카탈로그 HTML 파서 백엔드 (lxml 파서가 bs4 파서와 같은 결과를 내는지)"""
+
+import pytest
+
+from src.bench.catalog_parse import synthetic_page
+from src.catalog_parser import PARSERS, get_catalog_parser
+
+# 대체 셀렉터, 링크에서 goods_no 추출, 필드 누락, 공백/script 텍스트, total_count 클래스
+FALLBACK_PAGE = """
+<html><body>
+<p class="total_count">전체 <b>3</b>개</p>
+<div data-ref-goodsno="B000000000001">
+  <span class="brand"> 브랜드
+    <em>A</em> </span>
+  <a class="prd_name_link" href="#">  이름 <script>ignored()</script>A </a>
+  <p class="price"><span class="num">12,900</span>원</p>
+</div>
+<section class="prd_info extra">
+  <a href="/store/goods/getGoodsDetail.do?goodsNo=B000000000002&amp;dispCatNo=1">상세</a>
+  <span class="brand_name">브랜드 B</span>
+  <p class="tx_name">이름 B</p>
+</section>
+<div data-ref-goodsno="">
+  <p class="tx_name">goods_no 없음</p>
+</div>
+</body></html>
+"""
+
+# 기본 셀렉터와 중첩 카드 (li 안의 div.prd_info도 카드로 잡힘)
+NESTED_PAGE = """
+<html><body>
+<div class="cate_info_tx">총 <span>804</span>개</div>
+<ul class="main-four-guide-list">
+  <li data-ref-goodsno="C000000000001">
+    <div class="prd_info">
+      <a href="https://example.com/getGoodsDetail.do?goodsNo=C000000000001">
+        <span class="tx_brand">브랜드 C</span><p class="tx_name">이름 C</p>
+      </a>
+      <span class="tx_org"><span class="tx_num">30,000</span></span>
+      <span class="tx_cur"><span class="tx_num">21,000</span></span>
+    </div>
+  </li>
+  <li><span class="tx_name">링크 없는 카드</span></li>
+</ul>
+</body></html>
+"""
+
+
+def parse_all(html: str, page_idx: int = 1, rows_per_page: int = 48) -> dict:
+    return {name: get_catalog_parser(name, rows_per_page).parse_page(html, page_idx) for name in PARSERS}
+
+
+@pytest.mark.parametrize('page_idx', [1, 2, 12])
+def test_parsers_agree_on_catalog_pages(page_idx):
+    results = parse_all(synthetic_page(page_idx, rows_per_page=48, total=543), page_idx)
+
+    assert results['lxml'] == results['bs4']
+    total, products = results['lxml']
+    assert total == 543
+    # 12페이지는 마지막 페이지 (543 - 11 * 48 = 15개)
+    expected = 48 if page_idx < 12 else 15
+    assert len({p['goods_no'] for p in products}) == expected
+    first = products[0]
+    assert first['list_rank'] == (page_idx - 1) * 48 + 1
+    assert first['price'] == 15000 + (page_idx - 1) * 48 * 10
+
+
+def test_parsers_agree_on_fallback_markup():
+    results = parse_all(FALLBACK_PAGE, page_idx=3, rows_per_page=10)
+
+    assert results['lxml'] == results['bs4']
+    total, products = results['lxml']
+    assert total == 3
+    assert [(p['goods_no'], p['brand'], p['product_name'], p['price'], p['list_rank']) for p in products] == [
+        ('B000000000001', '브랜드A', '이름A', 12900, 21),
+        ('B000000000002', '브랜드 B', '이름 B', None, 22),
+    ]
+
+
+def test_parsers_agree_on_nested_cards():
+    results = parse_all(NESTED_PAGE)
+
+    assert results['lxml'] == results['bs4']
+    total, products = results['lxml']
+    assert total == 804
+    assert {p['goods_no'] for p in products} == {'C000000000001'}
+    assert all(p['price'] == 21000 for p in products)
+
+
+def test_empty_page():
+    for name in PARSERS:
+        assert get_catalog_parser(name).parse_page('<html><body></body></html>', 1) == (0, [])
+    assert get_catalog_parser('lxml').parse_page('', 1) == (0, [])
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError, match='카탈로그 파서'):
+        get_catalog_parser('html5lib')
@@ -0,0 +1,67 @@
+"""체크포인트 저널 재개 (완료 단위는 요청 없이 재생, 결과는 중단 없는 수집과 같음)"""
+
+from src.catalog import collect_catalog
+from src.checkpoint import CrawlJournal
+from src.reviews import collect_reviews
+
+
+def crawl(config, products, journal):
+    try:
+        return collect_reviews(config, products, top_n=3, concurrency=1, journal=journal)
+    finally:
+        journal.close()
+
+
+def test_resume_replays_completed_pages(crawl_config, fake_server):
+    products = collect_catalog(crawl_config)
+    path = crawl_config['reviews']['checkpoint_file']
+
+    before = fake_server.stats['review_requests']
+    expected = crawl(crawl_config, products, CrawlJournal(path))
+    total_requests = fake_server.stats['review_requests'] - before
+    assert expected
+
+    # 중단 상황: 앞쪽 단위 일부만 기록되고 마지막 줄은 쓰다 만 상태
+    with open(path, 'rb') as f:
+        lines = f.readlines()
+    kept = len(lines) // 2
+    with open(path, 'wb') as f:
+        f.writelines(lines[:kept])
+        f.write(lines[kept][:20])
+
+    before = fake_server.stats['review_requests']
+    resumed = crawl(crawl_config, products, CrawlJournal(path, resume=True))
+
+    assert resumed == expected
+    assert fake_server.stats['review_requests'] - before == total_requests - kept
+    with open(path, 'rb') as f:
+        assert len(f.readlines()) == len(lines)
+
+
+def test_without_resume_starts_over(crawl_config, fake_server):
+    products = collect_catalog(crawl_config)
+    path = crawl_config['reviews']['checkpoint_file']
+    before = fake_server.stats['review_requests']
+    crawl(crawl_config, products, CrawlJournal(path))
+    first_requests = fake_server.stats['review_requests'] - before
+    with open(path, 'rb') as f:
+        first_journal = f.read()
+
+    before = fake_server.stats['review_requests']
+    crawl(crawl_config, products, CrawlJournal(path, resume=False))
+    assert fake_server.stats['review_requests'] - before == first_requests
+    with open(path, 'rb') as f:
+        assert f.read() == first_journal
+
+
+def test_journal_round_trip(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = CrawlJournal(path)
+    reviews = [{'review_id': '1', 'rating': 5, '_raw': {'x': 1}}, {'review_id': '2', 'rating': 1}]
+    journal.record_page('G1', 'helpful', 0, reviews)
+    journal.close()
+
+    reopened = CrawlJournal(path, resume=True)
+    assert reopened.get_page('G1', 'helpful', 0) == [{'review_id': '1', 'rating': 5}, {'review_id': '2', 'rating': 1}]
+    assert reopened.get_page('G1', 'helpful', 1) is None
+    reopened.close()
@@ -0,0 +1,84 @@
+"""동시 리뷰 수집 (순차 수집과 같은 결과, 작업 창 크기, 호스트별 공유 제한기)"""
+
+import threading
+import time
+
+from src.catalog import collect_catalog
+from src.ratelimit import TokenBucket, get_rate_limiter
+from src.reviews import ReviewCollector, collect_reviews
+
+
+def test_concurrent_collection_matches_sequential(crawl_config, fake_server):
+    products = collect_catalog(crawl_config)
+
+    sequential = collect_reviews(crawl_config, products, top_n=6, concurrency=1)
+    before = fake_server.stats['review_requests']
+    concurrent = collect_reviews(crawl_config, products, top_n=6, concurrency=4)
+
+    assert concurrent == sequential
+    assert fake_server.stats['review_requests'] - before > 0
+
+
+def test_in_flight_products_stay_within_window(crawl_config):
+    products = collect_catalog(crawl_config)
+    collector = ReviewCollector(crawl_config, concurrency=2)
+
+    lock = threading.Lock()
+    state = {'running': 0, 'max_running': 0, 'started': 0}
+    collect = collector.collect_reviews_for_product
+
+    def tracked(goods_no, sort_sources=None, delta=False):
+        with lock:
+            state['started'] += 1
+            state['running'] += 1
+            state['max_running'] = max(state['max_running'], state['running'])
+        try:
+            time.sleep(0.01)
+            return collect(goods_no, sort_sources, delta)
+        finally:
+            with lock:
+                state['running'] -= 1
+
+    collector.collect_reviews_for_product = tracked
+    batches = collector._iter_product_batches_concurrent(products, 12, None, False)
+
+    # 첫 상품을 받은 시점에는 concurrency의 2배까지만 예약됨
+    first = next(batches)
+    assert first
+    assert state['started'] <= 2 * 2 + 1
+
+    rest = list(batches)
+    assert len(rest) == 11
+    assert state['started'] == 12
+    assert state['max_running'] <= 2
+
+
+def test_rate_limiter_is_shared_per_host(crawl_config):
+    url = crawl_config['reviews']['api_url']
+    limiter = get_rate_limiter(crawl_config, url)
+
+    assert get_rate_limiter(crawl_config, url + '?page=2') is limiter
+    assert get_rate_limiter(crawl_config, 'http://other.invalid/reviews') is not limiter
+
+
+def test_token_bucket_spaces_concurrent_requests():
+    bucket = TokenBucket(rate=50, burst=1)
+    passed = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                passed.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20건 중 첫 건만 바로 통과하고 나머지는 1/50초 간격
+    assert len(passed) == 20
+    assert max(passed) - started >= 19 / 50 * 0.9
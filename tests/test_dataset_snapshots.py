@@ -0,0 +1,92 @@
+"""여러 수집일이 쌓인 데이터셋 (처리 단계는 카테고리별 최신 스냅샷만 읽는지)"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.dataset import ReviewDataset, latest_snapshots, new_run_id, read_reviews, resolve_crawl_dates
+from src.processing.baseline import BaselinePreprocessor
+from src.processing.deduplication import ReviewDeduplicator
+from src.schema import write_stage
+
+from conftest import REPO_ROOT
+
+REF_COLUMNS = [
+    'review_id', 'goods_no', 'product_id', 'sort_source', 'sort_sources_all',
+    'rating', 'review_date', 'helpful_count', 'has_images', 'image_count',
+]
+
+
+def commit_run(dataset: ReviewDataset, parts: dict, crawl_date: str, category: str, mode: str):
+    """수집 실행 하나의 파일(종류 -> DataFrame)을 한 번에 커밋 (ReviewStreamWriter와 같은 방식)"""
+    run_id = new_run_id()
+    files = []
+    for kind, df in parts.items():
+        path = dataset.part_path(kind, crawl_date, category, run_id)
+        write_stage(df, path)
+        files.append({'kind': kind, 'path': path, 'crawl_date': crawl_date, 'category': category,
+                      'rows': len(df), 'mode': mode})
+    dataset.commit(files, replace=(mode == 'full'))
+
+
+@pytest.fixture
+def two_day_dataset(tmp_path):
+    """카테고리 suncream은 이틀 연속 전체 수집 + 둘째 날 이후 증분, lotion은 첫날 전체 수집만"""
+    source = pd.read_parquet(os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')).head(120)
+    suncream, lotion = source.iloc[:80], source.iloc[80:]
+    refs = suncream.head(10)[REF_COLUMNS].assign(goods_no='A999')
+
+    dataset = ReviewDataset(str(tmp_path / 'reviews'))
+    for crawl_date in ['2025-01-14', '2025-01-15']:
+        commit_run(dataset, {'reviews': suncream.head(70), 'refs': refs}, crawl_date, 'suncream', 'full')
+    commit_run(dataset, {'reviews': suncream.tail(10)}, '2025-01-16', 'suncream', 'delta')
+    commit_run(dataset, {'reviews': lotion}, '2025-01-14', 'lotion', 'full')
+    return dataset
+
+
+def test_latest_is_per_category_snapshot(two_day_dataset):
+    entries = two_day_dataset.entries('reviews', ['latest'])
+    assert sorted((e['category'], e['crawl_date'], e['mode']) for e in entries) == [
+        ('lotion', '2025-01-14', 'full'),
+        ('suncream', '2025-01-15', 'full'),
+        ('suncream', '2025-01-16', 'delta'),
+    ]
+    assert latest_snapshots(two_day_dataset._load()['files']) == {'suncream': '2025-01-15', 'lotion': '2025-01-14'}
+
+    # 전체 수집이 없는 카테고리는 모든 증분 수집
+    assert latest_snapshots([
+        {'category': 'a', 'crawl_date': '2025-01-02', 'mode': 'delta'},
+        {'category': 'a', 'crawl_date': '2025-01-01', 'mode': 'delta'},
+    ]) == {'a': '2025-01-01'}
+
+
+def test_resolve_crawl_dates(two_day_dataset, tmp_path):
+    root = two_day_dataset.root
+    assert resolve_crawl_dates(root, None) == ['latest']
+    assert resolve_crawl_dates(root, ['all']) is None
+    assert resolve_crawl_dates(root, ['2025-01-14']) == ['2025-01-14']
+    assert resolve_crawl_dates(str(tmp_path / 'reviews.parquet'), None) is None
+
+    everything = read_reviews(root, columns=['review_id'], crawl_dates=resolve_crawl_dates(root, ['all']))
+    assert len(everything) == 70 * 2 + 10 + 40
+
+
+def test_baseline_and_dedup_read_one_snapshot(two_day_dataset, tmp_path):
+    root = two_day_dataset.root
+    base_path = tmp_path / 'reviews_step3_base.parquet'
+    BaselinePreprocessor(
+        input_path=root,
+        output_path=str(base_path),
+        report_dir=str(tmp_path / 'report'),
+        crawl_dates=resolve_crawl_dates(root, None),
+    ).run()
+
+    deduplicator = ReviewDeduplicator(input_path=str(base_path), output_path='', refs_path=root)
+    deduplicator.load_data()
+
+    # 스냅샷 하나: 리뷰 120개 + 둘째 날 참조 행 10개만 (첫날 전체 수집/참조 행 제외)
+    assert deduplicator.stats['ref_rows'] == 10
+    assert deduplicator.stats['rows_before'] == 130
+    assert deduplicator.stats['unique_review_ids'] == 120
+    assert len(deduplicator.merge_groups(deduplicator.df)) == 120
@@ -0,0 +1,76 @@
+"""Step 3-0.5 중복 통합 (컬럼 단위 merge_groups가 그룹별 merge_group과 같은 결과인지)"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.bench.dedup_engine import per_group, same_output
+from src.processing.baseline import BaselinePreprocessor
+from src.processing.deduplication import ReviewDeduplicator
+from src.schema import read_stage, write_stage
+
+from conftest import REPO_ROOT
+
+
+def make_duplicates(base: pd.DataFrame, seed: int = 7) -> pd.DataFrame:
+    """일부 리뷰를 다른 상품/정렬/평점/본문으로 반복 (충돌, 동률 최빈값, 결측 포함)"""
+    rng = np.random.default_rng(seed)
+    picked = base.sample(60, random_state=seed)
+    copies = []
+    for k in range(3):
+        copy = picked.iloc[k * 15:].copy()
+        n = len(copy)
+        copy['goods_no'] = np.where(rng.random(n) < 0.5, copy['goods_no'].astype(object), f"A9{k}")
+        copy['sort_source'] = rng.choice(['helpful', 'newest', 'low_rating', 'high_rating'], n)
+        copy['sort_sources_all'] = [
+            None if rng.random() < 0.5 else sorted({s, 'newest'}) for s in copy['sort_source']
+        ]
+        rating = copy['rating'].astype('Int64')
+        changed = rng.random(n) < 0.3
+        copy['rating'] = rating.where(~changed, (rating.fillna(3) % 5) + 1)
+        copy.loc[rng.random(n) < 0.1, 'rating'] = pd.NA
+        copy['review_text'] = np.where(rng.random(n) < 0.2, "다른 본문", copy['review_text'].astype(object))
+        copy['helpful_count'] = copy['helpful_count'] + rng.integers(0, 5, n)
+        copy['has_images'] = rng.random(n) < 0.3
+        copy['is_trial'] = (rng.random(n) < 0.2).astype(int)
+        copies.append(copy)
+    return pd.concat([base, *copies], ignore_index=True)
+
+
+@pytest.fixture(scope='module')
+def baseline_rows(tmp_path_factory) -> str:
+    """Baseline 출력 + 중복 그룹을 저장한 Step 3-0 형식 파일"""
+    tmp_path = tmp_path_factory.mktemp('dedup')
+    source = pd.read_parquet(os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')).head(500)
+    source.to_parquet(tmp_path / 'reviews.parquet', index=False)
+    base_path = tmp_path / 'reviews_step3_base.parquet'
+    BaselinePreprocessor(
+        input_path=str(tmp_path / 'reviews.parquet'),
+        output_path=str(base_path),
+        report_dir=str(tmp_path / 'report'),
+    ).run()
+
+    path = tmp_path / 'reviews_step3_base_dups.parquet'
+    write_stage(make_duplicates(read_stage(str(base_path))), str(path))
+    return str(path)
+
+
+def test_merge_groups_matches_per_group(baseline_rows):
+    deduplicator = ReviewDeduplicator(input_path=baseline_rows, output_path='')
+    deduplicator.load_data()
+    df = deduplicator.df
+    assert df['review_id'].duplicated().sum() > 100
+
+    merged = deduplicator.merge_groups(df)
+    assert merged['dup_conflict'].any()
+    assert same_output(per_group(deduplicator, df), merged)
+
+
+def test_merge_groups_without_duplicates(baseline_rows):
+    deduplicator = ReviewDeduplicator(input_path=baseline_rows, output_path='')
+    deduplicator.load_data()
+    df = deduplicator.df.drop_duplicates('review_id').reset_index(drop=True)
+
+    assert same_output(per_group(deduplicator, df), deduplicator.merge_groups(df))
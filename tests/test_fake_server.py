@@ -0,0 +1,113 @@
+"""로컬 대역 서버와 수집 처리량 벤치마크 (결정적 데이터, 장애 주입, 단계별 통계)"""
+
+import argparse
+
+import requests
+
+from src.bench.crawl_throughput import build_config, run_benchmark
+from src.bench.fake_server import (
+    FakeCatalog, FakeOliveYoungServer, FaultInjector, add_server_arguments, server_from_args,
+)
+
+from conftest import BASE_CONFIG
+
+
+def test_catalog_data_is_deterministic():
+    def reviews(seed):
+        return FakeCatalog(product_count=5, max_reviews=40, seed=seed).review_page('A000000000002', 'DATETIME_DESC', 0, 100)
+
+    assert reviews(3) == reviews(3)
+    assert reviews(3) != reviews(4)
+    assert FakeCatalog(product_count=5).catalog_page(1, 4) == FakeCatalog(product_count=5).catalog_page(1, 4)
+
+
+def test_review_page_sorting_and_paging():
+    catalog = FakeCatalog(product_count=5, max_reviews=60, seed=1)
+    goods_no = next(
+        f"A{i:012d}" for i in range(5)
+        if catalog.review_page(f"A{i:012d}", 'DATETIME_DESC', 0, 1)['totalCount'] >= 20
+    )
+    total = catalog.review_page(goods_no, 'DATETIME_DESC', 0, 1)['totalCount']
+
+    newest = catalog.review_page(goods_no, 'DATETIME_DESC', 0, total)['data']
+    assert [r['createdDateTime'] for r in newest] == sorted((r['createdDateTime'] for r in newest), reverse=True)
+    low = catalog.review_page(goods_no, 'RATING_ASC', 0, total)['data']
+    assert [r['reviewScore'] for r in low] == sorted(r['reviewScore'] for r in low)
+
+    pages = [catalog.review_page(goods_no, 'DATETIME_DESC', p, 7)['data'] for p in range(-(-total // 7) + 1)]
+    assert [r for page in pages for r in page] == newest
+    assert pages[-1] == []
+
+
+def test_fault_injector_bursts_and_errors():
+    burst = FaultInjector(latency_ms=0, jitter_ms=0, burst_every=4, burst_length=2)
+    assert [burst.decide()['status'] for _ in range(8)] == [200, 200, 200, 429, 429, 200, 200, 429]
+
+    assert {FaultInjector(latency_ms=0, jitter_ms=0, error_rate=1.0).decide()['status'] for _ in range(5)} == {503}
+
+    limited = FaultInjector(latency_ms=0, jitter_ms=0, max_rps=3)
+    assert [limited.decide()['status'] for _ in range(5)] == [200, 200, 200, 429, 429]
+
+
+def test_server_sends_retry_after_and_counts_requests():
+    server = FakeOliveYoungServer(
+        catalog=FakeCatalog(product_count=3, max_reviews=5),
+        faults=FaultInjector(latency_ms=0, jitter_ms=0, burst_every=2, burst_length=1, retry_after=0.5),
+    )
+    with server:
+        ok = requests.get(server.catalog_url, params={'pageIdx': 1, 'rowsPerPage': 2}, timeout=5)
+        limited = requests.post(server.reviews_url, json={'goodsNumber': 'A000000000000'}, timeout=5)
+
+    assert ok.status_code == 200 and 'A000000000001' in ok.text
+    assert limited.status_code == 429 and limited.headers['Retry-After'] == '0.5'
+    assert server.stats['catalog_requests'] == 1
+    assert server.stats['review_requests'] == 1
+    assert server.stats['status_429'] == 1
+
+
+def benchmark_args(**overrides) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    add_server_arguments(parser)
+    args = parser.parse_args([
+        '--products', '20', '--max-reviews', '30', '--latency-ms', '0', '--jitter-ms', '0', '--seed', '2',
+    ])
+    defaults = dict(
+        concurrency=2, parse_workers=0, delay_min=0.0, delay_max=0.0, max_retries=4,
+        rate_limit=1000.0, adaptive=False, max_rate=0.0, additive_increase=0.0,
+    )
+    for key, value in {**defaults, **overrides}.items():
+        setattr(args, key, value)
+    return args
+
+
+def test_benchmark_reports_stage_throughput(tmp_path):
+    args = benchmark_args()
+    with server_from_args(args) as server:
+        config = build_config(BASE_CONFIG, server, args, str(tmp_path))
+        results = run_benchmark(config, server, top_n=4)
+
+    catalog, reviews = results['catalog'], results['reviews']
+    assert catalog['items'] == 20
+    assert catalog['requests'] == 1
+    assert reviews['items'] > 0
+    assert reviews['requests'] == server.stats['review_requests']
+    assert reviews['retry_overhead'] == 0.0
+    assert config['output']['raw_dir'].startswith(str(tmp_path))
+    assert config['request']['concurrency'] == 2
+
+
+def test_benchmark_counts_retry_overhead(tmp_path):
+    clean_args = benchmark_args()
+    with server_from_args(clean_args) as server:
+        clean = run_benchmark(build_config(BASE_CONFIG, server, clean_args, str(tmp_path / 'clean')), server, top_n=4)
+
+    args = benchmark_args()
+    args.burst_every, args.burst_length, args.retry_after = 7, 1, 0.01
+    with server_from_args(args) as server:
+        faulty = run_benchmark(build_config(BASE_CONFIG, server, args, str(tmp_path / 'faulty')), server, top_n=4)
+
+    # 429는 재시도로 흡수되어 같은 리뷰를 모으고, 요청 수는 재시도만큼 늘어남
+    assert faulty['reviews']['items'] == clean['reviews']['items']
+    assert faulty['reviews']['status_429'] > 0
+    assert faulty['reviews']['requests'] == clean['reviews']['requests'] + faulty['reviews']['status_429']
+    assert faulty['reviews']['retry_overhead'] > 0
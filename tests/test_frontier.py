@@ -0,0 +1,75 @@
+"""수집 프론티어 (정렬 간 중복을 채우는 추가 페이지는 워커가 등록, 조립은 요청 없이)"""
+
+import os
+
+import pyarrow.parquet as pq
+
+from src.catalog import collect_catalog
+from src.dataset import ReviewDataset
+from src.frontier import open_frontier, plan_pages
+from src.io import DataIO
+from src.pipeline import crawl_worker
+from src.reviews import collect_reviews
+
+
+def test_plan_pages_tops_up_after_sort_overlap():
+    limits = {'helpful': 4, 'newest': 4}
+    pages = {
+        ('helpful', 0): ['a', 'b'],
+        ('helpful', 1): ['c', 'd'],
+        ('newest', 0): ['a', 'b'],
+        ('newest', 1): ['c', 'e'],
+    }
+    # newest는 고유 리뷰 1개뿐이고 마지막 페이지가 가득 차 있으므로 다음 페이지 필요
+    assert plan_pages(pages, limits, page_size=2) == [('newest', 2)]
+
+    # 한도를 채운 정렬, 마지막 페이지가 덜 찬 정렬, 진행 중인 단위는 추가하지 않음
+    pages[('newest', 2)] = None
+    assert plan_pages(pages, limits, page_size=2) == []
+    pages[('newest', 2)] = ['f']
+    assert plan_pages(pages, limits, page_size=2) == []
+
+
+def test_plan_pages_rechecks_later_sorts_as_earlier_sorts_grow():
+    limits = {'helpful': 4, 'newest': 2}
+    pages = {('helpful', 0): ['a', 'b'], ('helpful', 1): None, ('newest', 0): ['c', 'd']}
+    assert plan_pages(pages, limits, page_size=2) == []
+
+    # 앞 정렬의 다음 페이지에 뒤 정렬 리뷰가 나오면 뒤 정렬 한도가 모자라게 됨
+    pages[('helpful', 1)] = ['c', 'd']
+    assert plan_pages(pages, limits, page_size=2) == [('newest', 1)]
+
+
+def dataset_review_ids(config) -> set:
+    dataset = ReviewDataset(config['output']['dataset']['dir'])
+    paths = [os.path.join(dataset.root, e['path']) for e in dataset.entries('reviews')]
+    return {
+        review_id
+        for path in paths
+        for review_id in pq.read_table(path, columns=['review_id']).column('review_id').to_pylist()
+    }
+
+
+def test_frontier_matches_sequential_crawl_without_finalize_requests(crawl_config, fake_server):
+    products = collect_catalog(crawl_config)
+    DataIO(crawl_config).save_products_jsonl(products)
+    crawl_config['reviews']['sort_limits'] = {'helpful': 30, 'newest': 30, 'low_rating': 20, 'high_rating': 20}
+
+    sequential_before = fake_server.stats['review_requests']
+    sequential = collect_reviews(crawl_config, products, top_n=6, concurrency=1)
+    sequential_requests = fake_server.stats['review_requests'] - sequential_before
+
+    worker_before = fake_server.stats['review_requests']
+    crawl_worker(crawl_config, worker_id='w1', seed=True, top_n=6)
+    worker_requests = fake_server.stats['review_requests'] - worker_before
+
+    frontier = open_frontier(crawl_config)
+    assert frontier.stats() == {'done': worker_requests}
+    frontier.close()
+
+    finalize_before = fake_server.stats['review_requests']
+    crawl_worker(crawl_config, finalize=True)
+
+    assert fake_server.stats['review_requests'] == finalize_before
+    assert worker_requests == sequential_requests
+    assert dataset_review_ids(crawl_config) == {review['review_id'] for review in sequential}
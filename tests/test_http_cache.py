@@ -0,0 +1,101 @@
+"""HTTP 응답 캐시 (오프라인 재현, 만료, 용량 정리)"""
+
+import os
+import time
+
+from src.catalog import collect_catalog
+from src.http_cache import ResponseCache
+from src.reviews import collect_reviews
+
+
+def served(server) -> int:
+    return server.stats['catalog_requests'] + server.stats['review_requests']
+
+
+def test_replay_reproduces_crawl_without_requests(crawl_config, fake_server):
+    crawl_config['cache'].update(enabled=True, dir='cache')
+    products = collect_catalog(crawl_config)
+    reviews = collect_reviews(crawl_config, products, top_n=3, concurrency=1)
+    assert reviews
+
+    crawl_config['cache']['replay'] = True
+    before = served(fake_server)
+    replayed_products = collect_catalog(crawl_config)
+    replayed = collect_reviews(crawl_config, replayed_products, top_n=3, concurrency=1)
+
+    assert served(fake_server) == before
+    assert replayed_products == products
+    assert replayed == reviews
+
+
+def test_replay_miss_does_not_reach_network(crawl_config, fake_server):
+    crawl_config['cache'].update(enabled=True, dir='cache')
+    products = collect_catalog(crawl_config)
+    cached = collect_reviews(crawl_config, products, top_n=2, concurrency=1)
+
+    crawl_config['cache']['replay'] = True
+    before = served(fake_server)
+    replayed = collect_reviews(crawl_config, products, top_n=4, concurrency=1)
+
+    # 캐시에 없는 상품 3, 4는 요청 없이 빈 결과
+    assert served(fake_server) == before
+    assert replayed == cached
+
+
+def test_cached_response_reused_within_ttl(crawl_config, fake_server):
+    crawl_config['cache'].update(enabled=True, dir='cache')
+    collect_catalog(crawl_config)
+    before = served(fake_server)
+
+    collect_catalog(crawl_config)
+    assert served(fake_server) == before
+
+
+def put(cache: ResponseCache, name: str, body: str, age: float = 0.0) -> str:
+    key = ResponseCache.make_key('GET', 'http://example.com/' + name, params={'page': 1})
+    cache.put(key, 'http://example.com/' + name, body)
+    if age:
+        path = cache._path(key)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+    return key
+
+
+def test_key_depends_on_request_content():
+    key = ResponseCache.make_key('get', 'http://a', params={'x': 1, 'y': 2})
+    assert key == ResponseCache.make_key('GET', 'http://a', params={'y': 2, 'x': 1})
+    assert key != ResponseCache.make_key('POST', 'http://a', params={'x': 1, 'y': 2})
+    assert key != ResponseCache.make_key('GET', 'http://a', payload={'x': 1, 'y': 2})
+
+
+def test_expired_entries_are_dropped_unless_replaying(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60)
+    fresh = put(cache, 'fresh', '새 응답')
+    stale = put(cache, 'stale', '오래된 응답', age=120)
+
+    assert ResponseCache(str(tmp_path), ttl_seconds=60, replay=True).get(stale) == '오래된 응답'
+    assert cache.get(fresh) == '새 응답'
+    assert cache.get(stale) is None
+    assert not os.path.exists(cache._path(stale))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_size_limit_evicts_oldest_first(tmp_path):
+    body = os.urandom(4096).hex()
+    cache = ResponseCache(str(tmp_path))
+    keys = [put(cache, f"p{i}", body, age=100 - i) for i in range(4)]
+    entry_size = os.path.getsize(cache._path(keys[0]))
+
+    limited = ResponseCache(str(tmp_path), max_bytes=int(entry_size * 2.5))
+
+    assert [limited.get(k) is not None for k in keys] == [False, False, True, True]
+
+
+def test_corrupt_entry_is_removed(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = put(cache, 'broken', 'x')
+    with open(cache._path(key), 'wb') as f:
+        f.write(b'not gzip')
+
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._path(key))
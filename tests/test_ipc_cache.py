@@ -0,0 +1,81 @@
+"""단계 간 Arrow IPC 캐시 (Parquet와 같은 결과, 오래된 캐시 무시, 메모리 맵 읽기)"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.processing.baseline import BaselinePreprocessor
+from src.processing.deduplication import ReviewDeduplicator
+from src.schema import ipc_cache_path, read_ipc_cache, read_stage, write_stage
+
+from conftest import REPO_ROOT
+
+
+@pytest.fixture(scope='module')
+def reviews() -> pd.DataFrame:
+    return pd.read_parquet(os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')).head(2000)
+
+
+def test_cache_read_matches_parquet(tmp_path, reviews):
+    path = write_stage(reviews, str(tmp_path / 'stage.parquet'), ipc_cache=True, profile='archive')
+    assert os.path.exists(ipc_cache_path(path))
+
+    pd.testing.assert_frame_equal(read_stage(path, ipc_cache=True), read_stage(path))
+    columns = ['goods_no', 'rating']
+    pd.testing.assert_frame_equal(read_stage(path, columns, ipc_cache=True), read_stage(path, columns))
+
+
+def test_cache_is_memory_mapped(tmp_path, reviews):
+    path = write_stage(reviews, str(tmp_path / 'stage.parquet'), ipc_cache=True)
+
+    before = pa.total_allocated_bytes()
+    table = read_ipc_cache(path, ['review_text'])
+    # 압축하지 않은 IPC 파일은 새 버퍼 할당 없이 파일 매핑을 그대로 가리킴
+    assert pa.total_allocated_bytes() - before < 64 * 1024
+    assert table.num_rows == len(reviews)
+    assert table.column('review_text').to_pylist()[:3] == reviews['review_text'].head(3).tolist()
+
+
+def test_stale_cache_is_ignored(tmp_path, reviews):
+    path = write_stage(reviews, str(tmp_path / 'stage.parquet'), ipc_cache=True)
+
+    # 캐시 없이 Parquet만 다른 내용으로 교체 (다른 도구로 다시 쓴 경우)
+    pq.write_table(pa.Table.from_pandas(reviews.head(10), preserve_index=False), path)
+
+    assert os.path.exists(ipc_cache_path(path))
+    assert read_ipc_cache(path) is None
+    assert len(read_stage(path, ipc_cache=True)) == 10
+
+
+def test_rewrite_without_cache_removes_old_cache(tmp_path, reviews):
+    path = write_stage(reviews, str(tmp_path / 'stage.parquet'), ipc_cache=True)
+    write_stage(reviews.head(5), path)
+
+    assert not os.path.exists(ipc_cache_path(path))
+    assert read_ipc_cache(path) is None
+    assert len(read_stage(path, ipc_cache=True)) == 5
+
+
+def run_stages(tmp_path, reviews, ipc_cache: bool) -> pd.DataFrame:
+    source = tmp_path / 'reviews.parquet'
+    reviews.to_parquet(source, index=False)
+    base = str(tmp_path / 'base.parquet')
+    dedup = str(tmp_path / 'dedup.parquet')
+
+    BaselinePreprocessor(str(source), base, report_dir=str(tmp_path), ipc_cache=ipc_cache).run()
+    assert os.path.exists(ipc_cache_path(base)) == ipc_cache
+    ReviewDeduplicator(base, dedup, report_dir=str(tmp_path), ipc_cache=ipc_cache).run()
+    return read_stage(dedup)
+
+
+def test_stage_chain_with_cache_matches_parquet_chain(tmp_path, reviews):
+    (tmp_path / 'cached').mkdir()
+    (tmp_path / 'plain').mkdir()
+
+    cached = run_stages(tmp_path / 'cached', reviews, ipc_cache=True)
+    plain = run_stages(tmp_path / 'plain', reviews, ipc_cache=False)
+
+    pd.testing.assert_frame_equal(cached, plain)
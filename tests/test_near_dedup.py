@@ -0,0 +1,124 @@
+"""Step 3-0.7 유사 중복 탐지 (MinHash/LSH 후보, 클러스터, LLM 큐 대표 리뷰 필터)"""
+
+import numpy as np
+import pandas as pd
+
+from src.processing.llm_queue import LLMQueueBuilder
+from src.processing.near_dedup import (
+    MinHasher, NearDuplicateDetector, connected_components, lsh_candidate_pairs,
+    shingle_hashes, signature_similarity,
+)
+from src.schema import write_stage
+
+BASE = (
+    "선크림 바르고 나서 하얗게 뜨지 않고 촉촉해서 좋아요 다만 눈이 조금 시려서 아쉽네요 "
+    "재구매는 고민중인데 여름에는 산뜻한 제형이라 계속 쓸 것 같고 향도 거의 없어서 만족합니다"
+)
+
+
+def edit(text: str, pos: int, char: str = '헿') -> str:
+    return text[:pos] + char + text[pos + 1:]
+
+
+def jaccard(a: str, b: str, ngram: int = 5) -> float:
+    x = {a[i:i + ngram] for i in range(len(a) - ngram + 1)}
+    y = {b[i:i + ngram] for i in range(len(b) - ngram + 1)}
+    return len(x & y) / len(x | y)
+
+
+def test_shingle_hashes_per_review():
+    hashes, counts = shingle_hashes(["abcdef", "xabcde", "abcde"], ngram=5)
+    assert counts.tolist() == [2, 2, 1]
+    # 같은 n-gram은 리뷰가 달라도 같은 해시, 리뷰 경계를 넘는 n-gram은 없음
+    assert hashes[0] == hashes[3] == hashes[4]
+    assert len(set(hashes.tolist())) == 3
+
+
+def test_minhash_estimates_jaccard():
+    texts = [BASE, edit(BASE, 20), "완전히 다른 리뷰 본문입니다 발림성이 좋고 향이 없어서 민감한 피부에도 괜찮아요"]
+    signatures = MinHasher(num_perm=256, ngram=5, seed=1).signatures(texts)
+    assert signatures.shape == (3, 256)
+    assert np.array_equal(MinHasher(num_perm=256, seed=1).signatures([BASE])[0], signatures[0])
+
+    similarity = signature_similarity(signatures, np.array([0, 0]), np.array([1, 2]))
+    assert abs(similarity[0] - jaccard(texts[0], texts[1])) < 0.1
+    assert similarity[1] < 0.1
+
+
+def test_lsh_pairs_all_bucket_members():
+    # 0, 1, 2는 첫 밴드만 같고 3은 어느 밴드도 겹치지 않음
+    signatures = np.arange(4 * 8, dtype=np.uint32).reshape(4, 8)
+    signatures[:3, :2] = 7
+    left, right = lsh_candidate_pairs(signatures, bands=4)
+    # 버킷 첫 리뷰(0)가 아닌 1-2 쌍도 후보
+    assert sorted(zip(left.tolist(), right.tolist())) == [(0, 1), (0, 2), (1, 2)]
+
+
+def test_lsh_bucket_window_caps_large_buckets():
+    signatures = np.zeros((6, 4), dtype=np.uint32)
+    left, right = lsh_candidate_pairs(signatures, bands=2, window=2)
+    pairs = sorted(zip(left.tolist(), right.tolist()))
+    assert pairs == [(i, j) for i in range(6) for j in range(i + 1, min(i + 3, 6))]
+    assert len(lsh_candidate_pairs(signatures, bands=2)[0]) == 15
+
+
+def test_connected_components_transitive():
+    labels = connected_components(6, np.array([3, 1, 4]), np.array([4, 2, 2]))
+    assert labels.tolist() == [0, 1, 1, 1, 1, 5]
+
+
+def run_detector(tmp_path, texts, threshold):
+    df = pd.DataFrame({
+        'review_id': [f"r{i}" for i in range(len(texts))],
+        'goods_no': 'A1',
+        'rating': pd.array([5] * len(texts), dtype='Int64'),
+        'review_text_clean': texts,
+    })
+    write_stage(df, str(tmp_path / 'reviews_step3_dedup.parquet'))
+    detector = NearDuplicateDetector(
+        input_path=str(tmp_path / 'reviews_step3_dedup.parquet'),
+        output_path=str(tmp_path / 'reviews_step3_neardup.parquet'),
+        report_dir=str(tmp_path / 'report'),
+        num_perm=256,
+        bands=64,
+        threshold=threshold,
+    )
+    detector.run()
+    return detector
+
+
+def test_detector_clusters_near_duplicates_transitively(tmp_path):
+    a = BASE
+    b = edit(a, 20)
+    c = edit(b, 70)
+    # a-c는 기준 미만이지만 a-b, b-c가 기준 이상이면 같은 클러스터
+    threshold = 0.86
+    signatures = MinHasher(num_perm=256, ngram=5).signatures([a, b, c])
+    similarity = signature_similarity(signatures, np.array([0, 1, 0]), np.array([1, 2, 2]))
+    assert similarity[0] >= threshold and similarity[1] >= threshold and similarity[2] < threshold
+
+    other = "전혀 관계없는 다른 제품 리뷰라서 겹치는 표현이 거의 없는 긴 문장입니다 정말로요"
+    detector = run_detector(tmp_path, [other, a, "짧은 리뷰", c, b, other + "!"], threshold)
+
+    df = detector.df
+    assert df['near_dup_cluster_id'].tolist() == ['r0', 'r1', 'r2', 'r1', 'r1', 'r0']
+    assert df['near_dup_size'].tolist() == [2, 3, 1, 3, 3, 2]
+    assert detector.stats['clusters'] == 2
+    assert detector.stats['redundant_rows'] == 3
+
+
+def test_llm_queue_keeps_cluster_representatives(tmp_path):
+    df = pd.DataFrame({
+        'review_id': ['r0', 'r1', 'r2', 'r3'],
+        'near_dup_cluster_id': ['r0', 'r0', 'r2', 'r2'],
+        'near_dup_size': np.array([2, 2, 2, 2], dtype=np.int32),
+        'review_text_clean': ['a', 'a', 'b', 'b'],
+    })
+    path = tmp_path / 'reviews_step3_tagged.parquet'
+    write_stage(df, str(path))
+
+    builder = LLMQueueBuilder(input_path=str(path), output_path=str(tmp_path / 'queue.jsonl'), report_dir=str(tmp_path))
+    builder.load_data()
+
+    assert builder.df['review_id'].tolist() == ['r0', 'r2']
+    assert builder.stats['near_dup_skipped'] == 2
@@ -0,0 +1,67 @@
+"""적응형 요청 속도 조절 (감소 사유 로그, 고정 간격보다 느려지지 않는 최소 속도)"""
+
+import logging
+
+from src.pacing import AdaptivePacer
+from src.ratelimit import get_rate_limiter
+
+
+def pacing_config(tmp_path, **pacing):
+    return {
+        'request': {
+            'delay_min': 1.0,
+            'delay_max': 2.0,
+            'rate_limit': 0.67,
+            'pacing': {'adaptive': True, 'state_file': str(tmp_path / 'pacing_state.json'), **pacing},
+        },
+        'output': {'raw_dir': str(tmp_path)},
+    }
+
+
+def test_latency_spike_is_logged_as_spike(caplog):
+    pacer = AdaptivePacer(rate=2.0, min_rate=0.5, max_rate=4.0)
+    pacer.record(0.1, 200)
+
+    with caplog.at_level(logging.INFO, logger='src.pacing'):
+        pacer.record(1.0, 200)
+
+    assert pacer.decreases == 1
+    assert '지연 급증' in caplog.text and 'HTTP 200' not in caplog.text
+
+
+def test_error_reasons(caplog):
+    pacer = AdaptivePacer(rate=4.0, min_rate=0.1, max_rate=4.0)
+    with caplog.at_level(logging.INFO, logger='src.pacing'):
+        pacer.record(0.1, 429)
+    assert 'HTTP 429' in caplog.text
+
+    pacer._last_decrease = 0.0
+    with caplog.at_level(logging.INFO, logger='src.pacing'):
+        pacer.record(0.1, None)
+    assert '네트워크 오류' in caplog.text
+
+
+def test_min_rate_not_below_base_rate(tmp_path):
+    config = pacing_config(tmp_path, min_rate=0.2, max_rate=2.0)
+    pacer = get_rate_limiter(config, 'http://pacing-floor.test/reviews')
+
+    assert pacer.min_rate == 0.67
+    for _ in range(10):
+        pacer._last_decrease = 0.0
+        pacer.record(0.1, 503)
+    assert pacer.rate == 0.67
+
+
+def test_base_rate_from_delays_is_floor(tmp_path):
+    config = pacing_config(tmp_path, min_rate=0.1, max_rate=0.5)
+    del config['request']['rate_limit']
+    pacer = get_rate_limiter(config, 'http://pacing-delay-floor.test/reviews')
+
+    # 평균 딜레이 1.5초 -> 0.67 req/s, max_rate가 더 낮아도 최소 속도까지는 허용
+    assert abs(pacer.min_rate - 2.0 / 3.0) < 1e-9
+    assert pacer.max_rate == pacer.min_rate
+
+
+def test_higher_min_rate_is_kept(tmp_path):
+    config = pacing_config(tmp_path, min_rate=1.0, max_rate=2.0)
+    assert get_rate_limiter(config, 'http://pacing-high-floor.test/reviews').min_rate == 1.0
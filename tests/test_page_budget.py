@@ -0,0 +1,160 @@
+"""적응형 페이지 예산 (페이지 허용 규칙, 수익률, 상품 간 이월, 재생 페이지 비차감)"""
+
+import pytest
+
+from src.catalog import collect_catalog
+from src.checkpoint import CrawlJournal
+from src.page_budget import PageBudget
+from src.reviews import ReviewCollector
+
+
+def make_budget(request_budget=None, **kwargs) -> PageBudget:
+    return PageBudget(request_budget, lambda review: int(review.get('low_info', 0)), **kwargs)
+
+
+def reviews(*ratings, low_info=()) -> list:
+    return [
+        {'review_id': str(i), 'rating': rating, 'low_info': int(i in low_info)}
+        for i, rating in enumerate(ratings)
+    ]
+
+
+def test_allow_page_rules():
+    product = make_budget(min_pages=2, max_pages=4, min_yield=0.3, extend_yield=0.7).open_product('G1')
+
+    # min_pages까지는 수익률과 무관하게 허용
+    product.last_yield['helpful'] = 0.0
+    assert product.allow_page('helpful', 1, collected=0, limit=10)
+    assert not product.allow_page('helpful', 2, collected=0, limit=10)
+
+    # 기본 수량 전에는 min_yield, 채운 뒤에는 extend_yield 기준
+    product.last_yield['helpful'] = 0.5
+    assert product.allow_page('helpful', 2, collected=5, limit=10)
+    assert not product.allow_page('helpful', 2, collected=10, limit=10)
+    product.last_yield['helpful'] = 0.8
+    assert product.allow_page('helpful', 3, collected=10, limit=10)
+    assert not product.allow_page('helpful', 4, collected=10, limit=10)
+
+    # 정렬별 수익률은 따로 관리
+    assert product.allow_page('newest', 2, collected=0, limit=10)
+
+
+def test_allow_page_stops_when_product_share_is_used():
+    budget = make_budget(request_budget=4)
+    budget.start(2)
+    product = budget.open_product('G1')
+    assert product.pages_allowed == 2
+
+    page = reviews(5, 4)
+    product.observe_page('helpful', page, page)
+    assert product.allow_page('helpful', 1, collected=2, limit=10)
+    product.observe_page('helpful', page, page)
+    assert not product.allow_page('helpful', 2, collected=4, limit=10)
+
+
+def test_observe_page_yield_and_signals():
+    product = make_budget(rating_bonus=0.5).open_product('G1')
+
+    page = reviews(5, 5, 5, 1, low_info=(2,))
+    # 0, 1: 정보 리뷰 / 2: 저정보 / 3: 중복 (다른 정렬에서 이미 수집)
+    page_yield = product.observe_page('helpful', page, page[:3])
+
+    # 첫 리뷰는 평점 분포가 비어 보너스 없음, 두 번째는 positive 비중 100%라 보너스 없음
+    assert page_yield == pytest.approx(2 / 4)
+    assert product.last_yield['helpful'] == page_yield
+    signals = product.signals()
+    assert signals['pages'] == 1
+    assert signals['dup_rate'] == pytest.approx(1 / 4)
+    assert signals['low_info_share'] == pytest.approx(1 / 3)
+    assert signals['informative'] == 2
+
+    # 드문 평점 구간(negative) 리뷰는 보너스
+    rare = [{'review_id': 'n1', 'rating': 1}]
+    assert product.observe_page('newest', rare, rare) == pytest.approx(1.5)
+
+
+def test_replayed_page_updates_signals_without_charging():
+    product = make_budget(request_budget=1).open_product('G1')
+    page = reviews(5, 1)
+
+    product.observe_page('helpful', page, page, fetched=False)
+
+    assert product.pages_used == 0
+    assert product.reviews_seen == 2
+    assert product.last_yield['helpful'] > 0
+
+
+def test_unused_share_carries_over_to_next_product():
+    budget = make_budget(request_budget=12)
+    budget.start(3)
+
+    first = budget.open_product('G1')
+    assert first.pages_allowed == pytest.approx(4)
+    first.observe_page('helpful', reviews(5), reviews(5))
+    budget.close_product(first)
+
+    # 남은 8페이지 + 첫 상품이 쓰지 않은 3페이지를 남은 2개 상품이 나눔
+    second = budget.open_product('G2')
+    assert second.pages_allowed == pytest.approx((8 + 3) / 2)
+    budget.close_product(second)
+
+    third = budget.open_product('G3')
+    assert third.pages_allowed == pytest.approx(11)
+
+    summary = budget.summary()
+    assert summary['products'] == 2
+    assert summary['pages_used'] == 1
+
+
+def test_unlimited_budget_never_limits_pages():
+    budget = make_budget(request_budget=None)
+    budget.start(1)
+    product = budget.open_product('G1')
+    for _ in range(50):
+        product.observe_page('helpful', reviews(5), reviews(5))
+    assert product.allow_page('helpful', 0, collected=50, limit=10)
+
+
+@pytest.fixture
+def budget_config(crawl_config):
+    crawl_config['reviews']['adaptive_budget'].update(enabled=True, request_budget=200)
+    return crawl_config
+
+
+def test_journal_replay_is_not_charged(budget_config, fake_server):
+    goods_no = collect_catalog(budget_config)[0]['goods_no']
+    path = budget_config['reviews']['checkpoint_file']
+
+    journal = CrawlJournal(path)
+    first = ReviewCollector(budget_config, concurrency=1, journal=journal)
+    first.page_budget.start(1)
+    expected = first.collect_reviews_for_product(goods_no)
+    journal.close()
+    assert first.page_budget.summary()['pages_used'] > 0
+
+    journal = CrawlJournal(path, resume=True)
+    resumed = ReviewCollector(budget_config, concurrency=1, journal=journal)
+    resumed.page_budget.start(1)
+    before = fake_server.stats['review_requests']
+    assert resumed.collect_reviews_for_product(goods_no) == expected
+    journal.close()
+
+    assert fake_server.stats['review_requests'] == before
+    assert resumed.page_budget.summary()['pages_used'] == 0
+
+
+def test_failed_product_returns_its_share(budget_config):
+    goods_no = collect_catalog(budget_config)[0]['goods_no']
+    collector = ReviewCollector(budget_config, concurrency=1)
+    collector.page_budget.start(2)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("파싱 실패")
+
+    collector._collect_page = fail
+    with pytest.raises(RuntimeError):
+        collector.collect_reviews_for_product(goods_no)
+
+    summary = collector.page_budget.summary()
+    assert summary['products'] == 1
+    assert collector.page_budget.open_product('G2').pages_allowed == pytest.approx(200)
@@ -0,0 +1,68 @@
+"""API 원본 페이로드 저장소 (압축 레코드 기록/재로드, 일반/증분 수집 경로)"""
+
+import os
+
+from src.payload_store import PayloadStore, load_payloads, payload_store_path
+from src.reviews import collect_reviews
+
+from crawl_helpers import newest_reviews, product_with_reviews, write_watermark
+
+
+def test_round_trip_and_reopen(tmp_path):
+    path = str(tmp_path / 'payloads.bin')
+    payloads = {f"r{i}": {'reviewId': f"r{i}", 'content': '백탁 없음 ' * i, 'score': i} for i in range(50)}
+
+    store = PayloadStore(path, compress_level=1)
+    for review_id, payload in payloads.items():
+        assert store.put(review_id, payload)
+    assert not store.put('r0', {'other': True})
+    store.close()
+
+    reopened = PayloadStore(path)
+    assert len(reopened) == len(payloads)
+    assert reopened.get_many(payloads) == payloads
+    assert reopened.get('r0') == payloads['r0']
+    reopened.close()
+
+
+def test_truncated_tail_is_dropped(tmp_path):
+    path = str(tmp_path / 'payloads.bin')
+    store = PayloadStore(path)
+    store.put('a', {'x': 1})
+    store.put('b', {'x': 2})
+    store.close()
+
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 3)
+
+    reopened = PayloadStore(path)
+    assert 'a' in reopened and 'b' not in reopened
+    assert reopened.put('b', {'x': 2})
+    reopened.close()
+    assert PayloadStore(path).get('b') == {'x': 2}
+
+
+def test_full_crawl_stores_raw_payloads(crawl_config, fake_server):
+    product = product_with_reviews(crawl_config, fake_server, 10)
+    reviews = collect_reviews(crawl_config, [product], top_n=1)
+
+    assert reviews and all('_raw' not in r for r in reviews)
+    raw = {str(r['reviewId']): r for r in newest_reviews(fake_server, product['goods_no'])}
+    stored = load_payloads(crawl_config, [r['review_id'] for r in reviews])
+    assert stored == {r['review_id']: raw[r['review_id']] for r in reviews}
+
+
+def test_delta_crawl_stores_raw_payloads(crawl_config, fake_server):
+    product = product_with_reviews(crawl_config, fake_server, 25)
+    raw = newest_reviews(fake_server, product['goods_no'])
+
+    # 최신 리뷰 13개가 워터마크 이후에 새로 달린 상황
+    write_watermark(crawl_config, product['goods_no'], raw[13])
+
+    reviews = collect_reviews(crawl_config, [product], top_n=1, delta=True)
+
+    assert [r['review_id'] for r in reviews] == [str(r['reviewId']) for r in raw[:13]]
+    assert all('_raw' not in r for r in reviews)
+    assert os.path.exists(payload_store_path(crawl_config))
+    stored = load_payloads(crawl_config, [r['review_id'] for r in reviews])
+    assert stored == {str(r['reviewId']): r for r in raw[:13]}
@@ -0,0 +1,43 @@
+"""수집 후 요약 리포트 리뷰 수 (데이터셋 저장 경로를 그대로 다시 읽는지)"""
+
+import os
+import re
+
+import pyarrow.parquet as pq
+
+from src.dataset import ReviewDataset
+from src.io import DataIO
+from src.pipeline import crawl_all
+
+
+def committed_review_paths(config) -> list:
+    dataset = ReviewDataset(config['output']['dataset']['dir'])
+    return [os.path.join(dataset.root, e['path']) for e in dataset.entries('reviews')]
+
+
+def report_review_count(path: str) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        match = re.search(r"총 리뷰 수\*\*: ([\d,]+)개", f.read())
+    assert match, "리포트에 총 리뷰 수 줄이 없음"
+    return int(match.group(1).replace(',', ''))
+
+
+def test_crawl_all_report_counts_dataset_reviews(crawl_config):
+    crawl_all(crawl_config, top_n=4, concurrency=1)
+
+    paths = committed_review_paths(crawl_config)
+    assert paths, "데이터셋에 커밋된 리뷰 파일이 없음"
+    written = sum(pq.ParquetFile(p).metadata.num_rows for p in paths)
+    assert written > 0
+
+    report_path = os.path.join(crawl_config['output']['report_dir'], 'data_summary.md')
+    assert report_review_count(report_path) == written
+
+
+def test_load_reviews_parquet_accepts_saved_path(crawl_config):
+    crawl_all(crawl_config, top_n=2, concurrency=1)
+    io = DataIO(crawl_config)
+    path = committed_review_paths(crawl_config)[0]
+
+    assert not os.path.isabs(path)
+    assert len(io.load_reviews_parquet(path)) == pq.ParquetFile(path).metadata.num_rows
@@ -0,0 +1,78 @@
+"""DuckDB 조회 뷰 (파티션 데이터셋, 단계 산출물, 원본 JSONL)"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+duckdb = pytest.importorskip('duckdb')
+
+from src.dataset import ReviewDataset, new_run_id
+from src.query import connect
+from src.schema import write_stage
+
+from conftest import REPO_ROOT
+
+# 숫자로만 된 카테고리 이름 (모든 카테고리가 숫자면 자동 추론 시 BIGINT가 됨)
+CATEGORY = '100000100110006'
+
+
+def commit_run(dataset: ReviewDataset, parts: dict, crawl_date: str, category: str) -> None:
+    run_id = new_run_id()
+    files = []
+    for kind, df in parts.items():
+        path = dataset.part_path(kind, crawl_date, category, run_id)
+        write_stage(df, path)
+        files.append({'kind': kind, 'path': path, 'crawl_date': crawl_date, 'category': category,
+                      'rows': len(df), 'mode': 'full'})
+    dataset.commit(files, replace=True)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    source = pd.read_parquet(os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')).head(60)
+    data = tmp_path / 'data'
+    dataset = ReviewDataset(str(data / 'processed' / 'reviews'))
+    refs = source.head(5)[['review_id', 'goods_no', 'sort_source', 'rating']].assign(goods_no='A999')
+    commit_run(dataset, {'reviews': source.head(40), 'refs': refs}, '2025-01-15', CATEGORY)
+    commit_run(dataset, {'reviews': source.tail(20)}, '2025-01-16', '100000100110007')
+
+    write_stage(source, str(data / 'processed' / 'reviews_step3_base.parquet'))
+
+    os.makedirs(data / 'raw')
+    with open(data / 'raw' / 'reviews_20250115_000000.jsonl', 'w', encoding='utf-8') as f:
+        for review_id in source['review_id'].head(3):
+            f.write(json.dumps({'review_id': review_id, 'rating': 5}) + '\n')
+    return str(data)
+
+
+def test_dataset_views_keep_partition_types(data_dir):
+    with connect(data_dir) as db:
+        assert {'reviews', 'review_refs', 'reviews_base', 'raw_reviews'} <= set(db.views)
+
+        types = dict(db.con.execute('SELECT column_name, column_type FROM (DESCRIBE reviews)').fetchall())
+        assert types['category'] == 'VARCHAR'
+        assert types['crawl_date'] == 'DATE'
+
+        counts = db.sql(
+            "SELECT category, COUNT(*) AS n FROM reviews WHERE category = ? GROUP BY 1", [CATEGORY]
+        )
+        assert counts.to_dict('records') == [{'category': CATEGORY, 'n': 40}]
+
+        latest = db.sql("SELECT COUNT(*) AS n FROM reviews WHERE crawl_date = DATE '2025-01-16'")
+        assert latest['n'].iloc[0] == 20
+
+        joined = db.sql(
+            "SELECT COUNT(*) AS n FROM review_refs f "
+            "JOIN reviews r ON r.review_id = f.review_id AND r.category = f.category"
+        )
+        assert joined['n'].iloc[0] == 5
+
+
+def test_stage_and_raw_views(data_dir):
+    with connect(data_dir) as db:
+        assert db.sql("SELECT COUNT(*) AS n FROM reviews_base")['n'].iloc[0] == 60
+        assert db.sql("SELECT COUNT(*) AS n FROM raw_reviews")['n'].iloc[0] == 3
+        assert 'review_text' in db.columns('reviews_base')
+        assert 'reviews_tagged' not in db.views
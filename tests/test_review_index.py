@@ -0,0 +1,115 @@
+"""상품 간 반복 리뷰 (review_id 인덱스, 참조 행 기록)"""
+
+import threading
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.catalog import collect_catalog
+from src.dataset import ReviewDataset
+from src.io import DataIO
+from src.review_index import BloomReviewIndex, ExactReviewIndex, make_review_index
+from src.reviews import iter_reviews
+from src.schema import read_stage
+
+from crawl_helpers import newest_reviews
+
+SHARED = 5
+
+
+def test_exact_index_reports_repeats_once_per_thread_race():
+    index = ExactReviewIndex()
+    firsts = []
+    lock = threading.Lock()
+
+    def worker():
+        for i in range(500):
+            if not index.add(f"r{i}"):
+                with lock:
+                    firsts.append(i)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(firsts) == list(range(500))
+    assert len(index) == 500 and 'r0' in index and 'x' not in index
+
+
+def test_bloom_index_has_no_false_negatives_and_bounded_false_positives():
+    index = BloomReviewIndex(capacity=5000, error_rate=1e-3)
+    assert not any(index.add(f"seen-{i}") for i in range(5000))
+    assert all(f"seen-{i}" in index for i in range(5000))
+
+    false_positives = sum(f"new-{i}" in index for i in range(20000))
+    assert false_positives / 20000 < 5e-3
+
+
+def test_make_review_index():
+    assert isinstance(make_review_index({}), ExactReviewIndex)
+    bloom = make_review_index({'reviews': {'dedup_index': {'type': 'bloom', 'capacity': 100, 'error_rate': 0.01}}})
+    assert isinstance(bloom, BloomReviewIndex) and bloom.capacity == 100
+    with pytest.raises(ValueError):
+        make_review_index({'reviews': {'dedup_index': {'type': 'cuckoo'}}})
+    with pytest.raises(ValueError):
+        BloomReviewIndex(capacity=0)
+
+
+@pytest.fixture
+def shared_reviews(crawl_config, fake_server, monkeypatch):
+    """두 번째로 수집되는 상품이 첫 상품의 최신 리뷰 SHARED개를 함께 노출하는 카탈로그"""
+    products = collect_catalog(crawl_config)
+    first, second = [p['goods_no'] for p in products if len(newest_reviews(fake_server, p['goods_no'])) >= SHARED][:2]
+    products = [p for p in products if p['goods_no'] in (first, second)]
+
+    original = fake_server.catalog._product_reviews
+
+    def with_repeats(goods_no):
+        reviews = original(goods_no)
+        if goods_no == second:
+            return reviews + original(first)[:SHARED]
+        return reviews
+
+    monkeypatch.setattr(fake_server.catalog, '_product_reviews', with_repeats)
+    shared_ids = {r['reviewId'] for r in original(first)[:SHARED]}
+    return products, second, shared_ids
+
+
+@pytest.mark.parametrize('concurrency', [1, 2])
+def test_repeats_become_ref_rows(crawl_config, shared_reviews, concurrency):
+    products, second, shared_ids = shared_reviews
+    crawl_config['reviews']['sort_limits'] = {k: 1000 for k in crawl_config['reviews']['sort_limits']}
+    refs = []
+
+    reviews = list(iter_reviews(crawl_config, products, top_n=2, concurrency=concurrency, ref_sink=refs.append))
+
+    ids = [r['review_id'] for r in reviews]
+    assert len(ids) == len(set(ids))
+    assert shared_ids <= set(ids)
+    # 반복 리뷰는 첫 상품에서만 전체 레코드, 두 번째 상품에서는 참조 행
+    assert {r['review_id'] for r in refs} == shared_ids
+    assert {r['goods_no'] for r in refs} == {second}
+    assert all('review_text' not in r for r in refs)
+    assert {r['goods_no'] for r in reviews if r['review_id'] in shared_ids} != {second}
+
+
+def test_stream_writer_commits_refs_with_reviews(crawl_config, shared_reviews):
+    products, second, shared_ids = shared_reviews
+    crawl_config['reviews']['sort_limits'] = {k: 1000 for k in crawl_config['reviews']['sort_limits']}
+
+    with DataIO(crawl_config).open_review_stream() as writer:
+        for review in iter_reviews(crawl_config, products, top_n=2, concurrency=1, ref_sink=writer.write_ref):
+            writer.write(review)
+
+    dataset = ReviewDataset(crawl_config['output']['dataset']['dir'])
+    (reviews_entry,) = dataset.entries('reviews')
+    (refs_entry,) = dataset.entries('refs')
+    assert reviews_entry['rows'] == writer.count
+    assert refs_entry['rows'] == writer.ref_count == SHARED
+
+    refs = read_stage(writer.paths['review_refs_parquet'])
+    assert set(refs['review_id']) == shared_ids
+    assert set(refs['goods_no'].astype(str)) == {second}
+    assert pq.read_schema(writer.paths['review_refs_parquet']).names == list(refs.columns)
@@ -0,0 +1,73 @@
+"""리뷰 JSONL 저장 (스트리밍 중단 시 기존 파일 보존, 증분 추가 시 중복 제외)"""
+
+import json
+import os
+
+import pytest
+
+from src.io import DataIO
+
+
+def review(i: int) -> dict:
+    return {'review_id': f"r{i}", 'goods_no': 'A000000001', 'content': f"리뷰 {i}", 'rating': 5}
+
+
+def read_jsonl(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def io(crawl_config):
+    io = DataIO(crawl_config)
+    with io.open_review_stream() as writer:
+        writer.write(review(0))
+    return io
+
+
+def test_failed_stream_keeps_previous_jsonl(io):
+    writer = io.open_review_stream()
+    path = writer.jsonl_path
+    assert [r['review_id'] for r in read_jsonl(path)] == ['r0']
+
+    with pytest.raises(RuntimeError):
+        with writer:
+            writer.write(review(1))
+            raise RuntimeError("수집 중단")
+
+    assert [r['review_id'] for r in read_jsonl(path)] == ['r0']
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_empty_stream_keeps_previous_jsonl(io):
+    with io.open_review_stream() as writer:
+        pass
+
+    assert [r['review_id'] for r in read_jsonl(writer.jsonl_path)] == ['r0']
+    assert not os.path.exists(f"{writer.jsonl_path}.tmp")
+
+
+def test_successful_stream_replaces_jsonl(io):
+    with io.open_review_stream() as writer:
+        writer.write(review(1))
+        writer.write(review(2))
+
+    assert writer.paths['reviews_jsonl'] == writer.jsonl_path
+    assert [r['review_id'] for r in read_jsonl(writer.jsonl_path)] == ['r1', 'r2']
+    assert not os.path.exists(f"{writer.jsonl_path}.tmp")
+
+
+def test_append_jsonl_skips_reviews_already_written(io):
+    path = io.append_reviews_jsonl([review(1), review(2)])
+    io.append_reviews_jsonl([review(0), review(1), review(2), review(3), review(3)])
+
+    assert [r['review_id'] for r in read_jsonl(path)] == ['r0', 'r1', 'r2', 'r3']
+
+
+def test_append_jsonl_keeps_same_review_id_for_other_product(io):
+    other = dict(review(0), goods_no='A000000002')
+    path = io.append_reviews_jsonl([other])
+
+    assert [(r['review_id'], r['goods_no']) for r in read_jsonl(path)] == [
+        ('r0', 'A000000001'), ('r0', 'A000000002'),
+    ]
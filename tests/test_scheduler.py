@@ -0,0 +1,111 @@
+"""다중 카테고리 스케줄러 (레인별 경로 분리, 공유 데이터셋, 실패 레인 격리)"""
+
+import os
+import threading
+
+import pytest
+
+import src.pipeline as pipeline
+from src.dataset import ReviewDataset
+from src.scheduler import CategoryScheduler, category_config
+
+SUNCREAM = {'name': 'suncream', 'disp_cat_no': '100000100110006'}
+TONER = {'name': 'toner', 'disp_cat_no': '100000100110007'}
+
+
+@pytest.fixture
+def base_config():
+    return {
+        'catalog': {'disp_cat_no': [SUNCREAM, TONER]},
+        'request': {'rate_limit': 5},
+        'reviews': {
+            'checkpoint_file': 'state/crawl_checkpoint.jsonl',
+            'delta': {'watermark_file': 'state/review_watermarks.json'},
+            'payload_store': {'enabled': True, 'file': 'state/review_payloads.bin'},
+        },
+        'frontier': {'file': 'state/crawl_frontier.sqlite'},
+        'output': {'raw_dir': 'out/raw', 'processed_dir': 'out/processed', 'report_dir': 'out/report'},
+    }
+
+
+def test_category_config_partitions_lane_paths(base_config):
+    lane = category_config(base_config, TONER)
+
+    assert lane['catalog']['disp_cat_no'] == [TONER]
+    assert lane['request']['shared_limiter'] is True
+    for key, path in (('raw_dir', 'out/raw'), ('processed_dir', 'out/processed'), ('report_dir', 'out/report')):
+        assert lane['output'][key] == os.path.join(path, 'category=toner')
+
+    reviews = lane['reviews']
+    assert reviews['checkpoint_file'] == os.path.join('state', 'category=toner', 'crawl_checkpoint.jsonl')
+    assert reviews['delta']['watermark_file'] == os.path.join('state', 'category=toner', 'review_watermarks.json')
+    assert reviews['payload_store']['file'] == os.path.join('state', 'category=toner', 'review_payloads.bin')
+    assert lane['frontier']['file'] == os.path.join('state', 'category=toner', 'crawl_frontier.sqlite')
+
+    # 원본 설정은 그대로
+    assert base_config['reviews']['checkpoint_file'] == 'state/crawl_checkpoint.jsonl'
+    assert base_config['output']['raw_dir'] == 'out/raw'
+    assert 'shared_limiter' not in base_config['request']
+
+
+def test_category_config_shares_dataset_root(base_config):
+    suncream, toner = category_config(base_config, SUNCREAM), category_config(base_config, TONER)
+
+    # 데이터셋 경로가 없으면 파티션 전 processed_dir 기준 기본값
+    assert suncream['output']['dataset']['dir'] == os.path.join('out/processed', 'reviews')
+    assert toner['output']['dataset']['dir'] == suncream['output']['dataset']['dir']
+
+    base_config['output']['dataset'] = {'enabled': True, 'dir': 'lake/reviews'}
+    assert category_config(base_config, TONER)['output']['dataset']['dir'] == 'lake/reviews'
+
+
+def test_category_config_keeps_unset_state_files(base_config):
+    del base_config['reviews']['checkpoint_file']
+    del base_config['frontier']
+    lane = category_config(base_config, TONER)
+
+    assert 'checkpoint_file' not in lane['reviews']
+    assert 'file' not in lane.get('frontier', {})
+
+
+def test_failing_lane_does_not_stop_others(base_config):
+    seen = []
+    lock = threading.Lock()
+
+    def task(lane_config, run):
+        with lock:
+            seen.append(run.name)
+        if run.name == 'toner':
+            raise RuntimeError("카탈로그 수집 실패")
+        return lane_config['output']['raw_dir']
+
+    categories = [SUNCREAM, TONER, {'name': 'cushion', 'disp_cat_no': '100000100110008'}]
+    runs = CategoryScheduler(base_config, categories, max_parallel=2).run(task)
+
+    assert sorted(seen) == ['cushion', 'suncream', 'toner']
+    assert [run.name for run in runs] == ['suncream', 'toner', 'cushion']
+    assert runs[1].error == "카탈로그 수집 실패" and runs[1].result is None
+    assert runs[0].error is None and runs[0].result == os.path.join('out/raw', 'category=suncream')
+    assert runs[2].error is None and runs[2].result == os.path.join('out/raw', 'category=cushion')
+
+
+def test_crawl_categories_commits_lanes_to_shared_dataset(crawl_config, monkeypatch):
+    crawl_config['catalog']['disp_cat_no'] = [SUNCREAM, TONER, {'name': 'broken', 'disp_cat_no': '1'}]
+    collect_catalog = pipeline.collect_catalog
+
+    def flaky_catalog(config, disp_cat_no=None):
+        if disp_cat_no == '1':
+            raise RuntimeError("카탈로그 요청 실패")
+        return collect_catalog(config, disp_cat_no)
+
+    monkeypatch.setattr(pipeline, 'collect_catalog', flaky_catalog)
+    pipeline.crawl_categories(crawl_config, pipeline.get_categories(crawl_config), top_n=2, concurrency=1)
+
+    dataset = ReviewDataset(crawl_config['output']['dataset']['dir'])
+    entries = dataset.entries('reviews')
+    assert {e['category'] for e in entries} == {'suncream', 'toner'}
+
+    for name in ('suncream', 'toner'):
+        assert os.path.exists(os.path.join('report', f'category={name}', 'data_summary.md'))
+        assert os.path.exists(os.path.join('data/raw', f'category={name}', 'crawl_checkpoint.jsonl'))
+    assert not os.path.exists(os.path.join('report', 'category=broken', 'data_summary.md'))
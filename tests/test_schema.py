@@ -0,0 +1,113 @@
+"""단계별 스키마 레지스트리와 저장 프로필 (타입 변환, 저장 후 다시 읽기)"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.schema import (
+    COLUMN_TYPES, STAGE_COLUMNS, WRITE_PROFILES, conform, get_write_profile, read_stage, stage_schema,
+    write_stage, writer_options,
+)
+
+from conftest import REPO_ROOT
+
+REVIEWS_PATH = os.path.join(REPO_ROOT, 'data/processed/reviews.parquet')
+
+
+@pytest.fixture(scope='module')
+def legacy_reviews() -> pd.DataFrame:
+    """레지스트리 도입 전 형식(string/int64)으로 저장된 수집 리뷰 일부"""
+    return pd.read_parquet(REVIEWS_PATH).head(3000)
+
+
+def test_read_stage_applies_registry_types_to_legacy_file():
+    assert pq.read_schema(REVIEWS_PATH).field('rating').type == pa.int64()
+
+    df = read_stage(REVIEWS_PATH)
+
+    assert isinstance(df['goods_no'].dtype, pd.CategoricalDtype)
+    assert df['goods_no'].cat.categories.is_monotonic_increasing
+    assert df['rating'].dtype == 'int8'
+    assert df['helpful_count'].dtype == 'int32'
+    assert df['is_low_info'].dtype == 'int8'
+
+
+def test_conform_keeps_missing_values_and_unknown_columns():
+    df = pd.DataFrame({
+        'rating': [5.0, None, 1.0],
+        'goods_no': ['B', 'A', None],
+        'extra': [1.5, 2.5, 3.5],
+    })
+
+    out = conform(df)
+
+    assert out['rating'].dtype == 'Int8'
+    assert out['rating'].isna().tolist() == [False, True, False]
+    assert list(out['goods_no'].cat.categories) == ['A', 'B']
+    assert out['extra'].dtype == 'float64'
+    # 원본은 그대로
+    assert df['rating'].dtype == 'float64'
+
+
+def test_conform_rejects_out_of_range_integers():
+    with pytest.raises(ValueError, match='rating'):
+        conform(pd.DataFrame({'rating': [1, 300]}))
+
+
+def test_round_trip_matches_conformed_frame(tmp_path, legacy_reviews):
+    path = write_stage(legacy_reviews, str(tmp_path / 'reviews.parquet'))
+
+    schema = pq.read_schema(path)
+    assert schema.remove_metadata().equals(stage_schema('reviews'))
+    pd.testing.assert_frame_equal(read_stage(path), conform(legacy_reviews))
+
+
+@pytest.mark.parametrize('profile', sorted(WRITE_PROFILES))
+def test_profiles_round_trip_same_rows(tmp_path, legacy_reviews, profile):
+    path = write_stage(legacy_reviews, str(tmp_path / f'{profile}.parquet'), profile=profile)
+
+    saved = read_stage(path)
+    expected = conform(legacy_reviews)
+    if profile == 'analytics':
+        # 저장 파일만 goods_no 순으로 정렬되고 원본 DataFrame은 그대로
+        assert list(legacy_reviews.index) == list(range(len(legacy_reviews)))
+        expected = expected.sort_values('goods_no', kind='stable').reset_index(drop=True)
+    pd.testing.assert_frame_equal(saved, expected)
+
+
+def test_profile_options_reach_the_file(tmp_path, legacy_reviews):
+    archive = pq.ParquetFile(write_stage(legacy_reviews, str(tmp_path / 'a.parquet'), profile='archive'))
+    assert archive.metadata.row_group(0).column(0).compression == 'ZSTD'
+
+    scratch = pq.ParquetFile(write_stage(legacy_reviews, str(tmp_path / 's.parquet'), profile='scratch'))
+    assert scratch.metadata.row_group(0).column(0).compression == 'LZ4'
+
+    analytics_path = write_stage(legacy_reviews, str(tmp_path / 'x.parquet'), profile='analytics')
+    analytics = pq.ParquetFile(analytics_path)
+    assert analytics.metadata.num_row_groups == -(-len(legacy_reviews) // 2048)
+    sorting = analytics.metadata.row_group(0).sorting_columns
+    assert [analytics.schema_arrow.names[c.column_index] for c in sorting] == ['goods_no']
+
+    # 정렬된 파일에서도 goods_no 필터 결과는 원본과 같음
+    goods_no = analytics.read_row_group(0, columns=['goods_no']).column(0)[0].as_py()
+    filtered = pq.read_table(analytics_path, filters=[('goods_no', '=', goods_no)])
+    assert len(filtered) == (legacy_reviews['goods_no'] == goods_no).sum()
+
+
+def test_write_profile_lookup():
+    config = {'output': {'parquet_profiles': {'reviews': 'archive', 'default': 'scratch'}}}
+
+    assert get_write_profile(config, 'reviews') == 'archive'
+    assert get_write_profile(config, 'tagged') == 'scratch'
+    assert get_write_profile({}, 'tagged') == 'default'
+    assert 'sort_by' not in writer_options('analytics') and 'row_group_size' not in writer_options('analytics')
+    with pytest.raises(ValueError, match='저장 프로필'):
+        get_write_profile({'output': {'parquet_profiles': {'base': 'fast'}}}, 'base')
+
+
+def test_every_stage_column_is_registered():
+    for stage, columns in STAGE_COLUMNS.items():
+        assert set(columns) <= set(COLUMN_TYPES), stage
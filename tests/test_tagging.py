@@ -0,0 +1,34 @@
+"""Step 3-1 태깅 (워커 프로세스로 나눠 실행해도 단일 프로세스와 같은 결과)"""
+
+import os
+
+import pandas as pd
+
+from src.processing.tagging import TaggingPipeline
+from src.schema import read_stage, write_stage
+
+from conftest import REPO_ROOT
+
+
+def run_tagging(tmp_path, name: str, workers: int):
+    output_path = tmp_path / name / 'reviews_step3_tagged.parquet'
+    pipeline = TaggingPipeline(
+        input_path=str(tmp_path / 'reviews_step3_dedup.parquet'),
+        output_path=str(output_path),
+        lexicon_path=os.path.join(REPO_ROOT, 'config/tag_lexicon_v2.yaml'),
+        report_dir=str(tmp_path / name / 'report'),
+        workers=workers,
+    )
+    pipeline.run()
+    return read_stage(str(output_path)), pipeline.stats
+
+
+def test_sharded_tagging_matches_single_process(tmp_path):
+    source = read_stage(os.path.join(REPO_ROOT, 'data/processed/reviews_step3_dedup.parquet')).head(300)
+    write_stage(source, str(tmp_path / 'reviews_step3_dedup.parquet'))
+
+    expected, expected_stats = run_tagging(tmp_path, 'single', workers=1)
+    actual, actual_stats = run_tagging(tmp_path, 'sharded', workers=2)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual_stats == expected_stats
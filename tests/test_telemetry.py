@@ -0,0 +1,112 @@
+"""수집 텔레메트리 (히스토그램, 실패 원인, JSON/Prometheus 스냅샷)"""
+
+import json
+import re
+
+import pytest
+import requests
+
+from src.bench.fake_server import FakeCatalog, FakeOliveYoungServer, FaultInjector
+from src.catalog import collect_catalog
+from src.reviews import collect_reviews
+from src.telemetry import CrawlMetrics, LatencyHistogram, export_crawl_metrics, failure_cause
+
+# Prometheus 텍스트 형식 샘플 줄: 이름{라벨="값",...} 숫자
+SAMPLE_LINE = re.compile(r'^[a-z_]+(\{([a-z]+="[^"]*",?)+\})? -?[0-9.e+-]+$')
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.08, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [('0.1', 2), ('1', 3), ('+Inf', 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 3.0
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_failure_cause_labels():
+    def http_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.HTTPError(response=response)
+
+    assert failure_cause(http_error(429)) == 'http_429'
+    assert failure_cause(http_error(503)) == 'http_5xx'
+    assert failure_cause(http_error(404)) == 'http_4xx'
+    assert failure_cause(requests.Timeout()) == 'timeout'
+    assert failure_cause(requests.ConnectionError()) == 'connection'
+    assert failure_cause(ValueError('bad json')) == 'invalid_json'
+    assert failure_cause(RuntimeError()) == 'other'
+
+
+def test_snapshot_and_prometheus_agree():
+    metrics = CrawlMetrics()
+    metrics.observe_request('reviews', 0.2, 200, nbytes=1000)
+    metrics.observe_request('reviews', 0.7, 429)
+    metrics.observe_request('catalog', 0.01, None)
+    metrics.record_failure('reviews', 'http_429', retried=True)
+    metrics.record_failure('catalog', 'connection', retried=False)
+    metrics.record_cache_hit('catalog')
+    metrics.add_sleep('pacing', 0.5)
+    metrics.add_sleep('retry', 0.0)
+
+    snapshot = metrics.snapshot()
+    reviews, catalog = snapshot['endpoints']['reviews'], snapshot['endpoints']['catalog']
+    assert reviews['requests_by_status'] == {'200': 1, '429': 1}
+    assert reviews['bytes_downloaded'] == 1000
+    assert reviews['retries_by_cause'] == {'http_429': 1}
+    assert catalog['requests_by_status'] == {'error': 1}
+    assert catalog['failures_by_cause'] == {'connection': 1} and catalog['retries_by_cause'] == {}
+    assert catalog['cache_hits'] == 1
+    assert snapshot['sleep_by_reason'] == {'pacing': 0.5}
+    assert snapshot['io_wait_seconds'] == pytest.approx(0.91)
+    json.dumps(snapshot)
+
+    text = metrics.to_prometheus()
+    samples = [line for line in text.splitlines() if not line.startswith('#')]
+    assert all(SAMPLE_LINE.match(line) for line in samples), samples
+    assert 'crawl_request_duration_seconds_bucket{endpoint="reviews",le="+Inf"} 2' in samples
+    assert 'crawl_request_duration_seconds_count{endpoint="reviews"} 2' in samples
+    assert 'crawl_requests_total{endpoint="catalog",status="error"} 1' in samples
+    assert 'crawl_retries_total{endpoint="reviews",cause="http_429"} 1' in samples
+    assert 'crawl_cache_hits_total{endpoint="catalog"} 1' in samples
+    assert 'crawl_sleep_seconds_total{reason="pacing"} 0.5' in samples
+    # 모든 metric에 HELP/TYPE 선언
+    declared = set(re.findall(r'^# TYPE ([a-z_]+)', text, re.M))
+    used = {re.match(r'[a-z_]+', line).group(0) for line in samples}
+    assert {re.sub(r'_(bucket|sum|count)$', '', name) for name in used} <= declared
+
+
+def test_crawl_export_matches_server_counts(crawl_config, tmp_path):
+    export_crawl_metrics(crawl_config)  # 이전 테스트의 집계 초기화
+
+    server = FakeOliveYoungServer(
+        catalog=FakeCatalog(product_count=6, max_reviews=40, seed=5),
+        faults=FaultInjector(latency_ms=0, jitter_ms=0, burst_every=9, burst_length=1, retry_after=0.01),
+    )
+    with server:
+        crawl_config['catalog']['base_url'] = server.catalog_url
+        crawl_config['reviews']['api_url'] = server.reviews_url
+        crawl_config['request']['max_retries'] = 3
+        products = collect_catalog(crawl_config)
+        collect_reviews(crawl_config, products, top_n=3, concurrency=2)
+
+    paths, snapshot = export_crawl_metrics(crawl_config)
+    with open(paths['crawl_metrics_json'], 'r', encoding='utf-8') as f:
+        assert json.load(f) == snapshot
+
+    reviews, catalog = snapshot['endpoints']['reviews'], snapshot['endpoints']['catalog']
+    assert sum(reviews['requests_by_status'].values()) == server.stats['review_requests']
+    assert reviews['latency']['count'] == server.stats['review_requests']
+    limited = reviews['requests_by_status'].get('429', 0) + catalog['requests_by_status'].get('429', 0)
+    assert limited == server.stats['status_429'] > 0
+    assert reviews['retries_by_cause'].get('http_429', 0) == reviews['requests_by_status'].get('429', 0)
+    assert reviews['bytes_downloaded'] > 0
+
+    with open(paths['crawl_metrics_prom'], 'r', encoding='utf-8') as f:
+        prom = f.read()
+    assert f'crawl_requests_total{{endpoint="reviews",status="200"}} {reviews["requests_by_status"]["200"]}' in prom
+    assert export_crawl_metrics(crawl_config) == ({}, None)
@@ -0,0 +1,61 @@
+"""증분 수집 워터마크 (워터마크 리뷰에서 탐색 중단, 최신 리뷰로 갱신)"""
+
+from src.reviews import collect_reviews
+from src.watermarks import WatermarkStore
+
+from crawl_helpers import newest_reviews, product_with_reviews, write_watermark
+
+
+def review_requests(server) -> int:
+    return server.stats['review_requests']
+
+
+def test_delta_stops_at_watermark(crawl_config, fake_server):
+    product = product_with_reviews(crawl_config, fake_server, 35)
+    raw = newest_reviews(fake_server, product['goods_no'])
+    write_watermark(crawl_config, product['goods_no'], raw[13])
+
+    before = review_requests(fake_server)
+    reviews = collect_reviews(crawl_config, [product], top_n=1, delta=True)
+
+    # 워터마크가 두 번째 페이지(10개씩)에 있으므로 두 페이지만 요청
+    assert review_requests(fake_server) - before == 2
+    assert [r['review_id'] for r in reviews] == [str(r['reviewId']) for r in raw[:13]]
+    assert {r['sort_source'] for r in reviews} == {'newest'}
+
+    mark = WatermarkStore(crawl_config['reviews']['delta']['watermark_file']).get(product['goods_no'])
+    assert mark == {'review_id': str(raw[0]['reviewId']), 'created_at': raw[0]['createdDateTime']}
+
+
+def test_delta_without_new_reviews(crawl_config, fake_server):
+    product = product_with_reviews(crawl_config, fake_server, 15)
+    raw = newest_reviews(fake_server, product['goods_no'])
+    write_watermark(crawl_config, product['goods_no'], raw[0])
+
+    before = review_requests(fake_server)
+    assert collect_reviews(crawl_config, [product], top_n=1, delta=True) == []
+    assert review_requests(fake_server) - before == 1
+
+
+def test_delta_stops_at_older_date(crawl_config, fake_server):
+    """워터마크 리뷰가 삭제되어도 더 오래된 작성일을 만나면 중단"""
+    product = product_with_reviews(crawl_config, fake_server, 35)
+    raw = newest_reviews(fake_server, product['goods_no'])
+    write_watermark(crawl_config, product['goods_no'], {
+        'reviewId': 'deleted-review', 'createdDateTime': raw[4]['createdDateTime'],
+    })
+
+    reviews = collect_reviews(crawl_config, [product], top_n=1, delta=True)
+
+    # 작성일이 워터마크와 같은 리뷰까지는 신규로 취급
+    assert [r['review_id'] for r in reviews] == [str(r['reviewId']) for r in raw[:5]]
+
+
+def test_product_without_watermark_gets_full_crawl(crawl_config, fake_server):
+    product = product_with_reviews(crawl_config, fake_server, 35)
+
+    reviews = collect_reviews(crawl_config, [product], top_n=1, delta=True)
+
+    assert len({r['sort_source'] for r in reviews}) > 1
+    mark = WatermarkStore(crawl_config['reviews']['delta']['watermark_file']).get(product['goods_no'])
+    assert mark is not None and mark['review_id'] == str(newest_reviews(fake_server, product['goods_no'])[0]['reviewId'])